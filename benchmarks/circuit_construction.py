@@ -14,6 +14,8 @@
 import itertools
 from collections.abc import Sequence
 
+import numpy as np
+
 import cirq
 
 
@@ -134,3 +136,64 @@ class XOnAllQubitsCircuit:
     def time_circuit_construction(self, N: int, D: int) -> cirq.Circuit:
         q = cirq.LineQubit.range(N)
         return cirq.Circuit(cirq.Moment(cirq.X.on_each(*q)) for _ in range(D))
+
+
+class SparseCircuitQueries:
+    pretty_name = "Moment queries on a deep circuit with one CZ per moment."
+    params = [[10, 100], [100, 1000]]
+    param_names = ["Number of Qubits(N)", "Depth(D)"]
+
+    def setup(self, N: int, D: int) -> None:
+        prng = np.random.RandomState(0)
+        self.qubits = cirq.LineQubit.range(N)
+        self.circuit = cirq.Circuit(
+            cirq.Moment(cirq.CZ(*(self.qubits[i] for i in prng.choice(N, 2, replace=False))))
+            for _ in range(D)
+        )
+        self.circuit.next_moment_operating_on(self.qubits)
+
+    def time_next_and_prev_moment_operating_on(self, N: int, D: int) -> None:
+        for start in range(0, D, 10):
+            for q in self.qubits:
+                self.circuit.next_moment_operating_on([q], start)
+                self.circuit.prev_moment_operating_on([q], start)
+
+    def time_findall_operations_between(self, N: int, D: int) -> None:
+        start = {q: 0 for q in self.qubits}
+        end = {q: D for q in self.qubits}
+        _ = self.circuit.findall_operations_between(start, end)
+
+    def time_append_and_query(self, N: int, D: int) -> None:
+        for q in self.qubits:
+            self.circuit.append(cirq.X(q))
+            self.circuit.next_moment_operating_on([q])
+
+
+class TrotterCircuitInterning:
+    pretty_name = "Interning a Trotter circuit built one operation at a time."
+    params = [[10, 100], [10, 100]]
+    param_names = ["Number of Qubits(N)", "Number of Steps(S)"]
+
+    def setup(self, N: int, S: int) -> None:
+        qubits = cirq.LineQubit.range(N)
+        circuit = cirq.Circuit()
+        for _ in range(S):
+            circuit.append(cirq.ZZ(a, b) ** 0.1 for a, b in zip(qubits, qubits[1:]))
+            circuit.append(cirq.X(q) ** 0.2 for q in qubits)
+        self.circuit = circuit.freeze()
+        self.other = circuit.freeze()
+        interner = cirq.CircuitInterner()
+        self.interned = interner.intern(circuit)
+        self.other_interned = interner.intern(circuit.copy())
+
+    def time_intern(self, N: int, S: int) -> None:
+        _ = cirq.CircuitInterner().intern(self.circuit)
+
+    def time_equality(self, N: int, S: int) -> None:
+        _ = self.circuit == self.other
+
+    def time_equality_interned(self, N: int, S: int) -> None:
+        _ = self.interned == self.other_interned
+
+    def time_structural_hash_interned(self, N: int, S: int) -> None:
+        _ = cirq.FrozenCircuit(self.interned.moments).structural_hash()
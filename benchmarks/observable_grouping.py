@@ -0,0 +1,71 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+from cirq.work.observable_measurement import _GROUPING_FUNCS
+
+
+def _random_observables(
+    num_qubits: int, num_observables: int, weight: int
+) -> list[cirq.PauliString]:
+    prng = np.random.RandomState(1234)
+    qubits = cirq.LineQubit.range(num_qubits)
+    return [
+        cirq.PauliString(
+            {
+                qubits[i]: (cirq.X, cirq.Y, cirq.Z)[prng.randint(3)]
+                for i in prng.choice(num_qubits, weight, replace=False)
+            }
+        )
+        for _ in range(num_observables)
+    ]
+
+
+class GroupSettings:
+    params = ([20, 50], [1000, 5000], ['greedy', 'largest_first', 'dsatur'])
+    param_names = ["num_qubits", "num_observables", "grouper"]
+    timeout = 300
+
+    def setup(self, num_qubits: int, num_observables: int, _) -> None:
+        observables = _random_observables(num_qubits, num_observables, weight=4)
+        self.settings = list(
+            cirq.work.observables_to_settings(observables, cirq.LineQubit.range(num_qubits))
+        )
+
+    def time_group_settings(self, _, __, grouper: str) -> None:
+        _GROUPING_FUNCS[grouper](self.settings)
+
+    def track_num_groups(self, _, __, grouper: str) -> int:
+        return len(_GROUPING_FUNCS[grouper](self.settings))
+
+
+class GroupPauliStrings:
+    params = ([1000, 5000], [True, False], ['largest_first', 'dsatur'])
+    param_names = ["num_observables", "qubit_wise", "strategy"]
+    timeout = 300
+
+    def setup(self, num_observables: int, *_) -> None:
+        self.observables = _random_observables(12, num_observables, weight=8)
+
+    def time_group_pauli_strings(self, _, qubit_wise: bool, strategy: str) -> None:
+        cirq.work.group_pauli_strings(self.observables, qubit_wise=qubit_wise, strategy=strategy)
+
+    def track_num_groups(self, _, qubit_wise: bool, strategy: str) -> int:
+        return len(
+            cirq.work.group_pauli_strings(
+                self.observables, qubit_wise=qubit_wise, strategy=strategy
+            )
+        )
@@ -0,0 +1,50 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from concurrent import futures
+
+import cirq
+
+
+class ParallelizeOverComponents:
+    """Compiles a wide circuit of disconnected qubit pairs to the CZ gateset."""
+
+    params = [[20, 120], [None, 1, 4]]
+    param_names = ["qubits", "workers"]
+
+    def setup(self, qubits: int, workers: int | None) -> None:
+        q = cirq.LineQubit.range(qubits)
+        self.circuit = cirq.Circuit(
+            [cirq.H(q[i]), cirq.SWAP(q[i], q[i + 1]), cirq.ISWAP(q[i], q[i + 1]) ** 0.3]
+            for _ in range(5)
+            for i in range(0, qubits, 2)
+        )
+        self.to_cz = functools.partial(
+            cirq.optimize_for_target_gateset, gateset=cirq.CZTargetGateset()
+        )
+        self.executor = None if workers is None else futures.ProcessPoolExecutor(workers)
+
+    def time_whole_circuit(self, *_) -> None:
+        _ = self.to_cz(self.circuit)
+
+    def time_parallelized(self, qubits: int, workers: int | None) -> None:
+        parallel = cirq.parallelize_over_components(
+            self.to_cz, executor=self.executor, num_parts=workers
+        )
+        _ = parallel(self.circuit)
+
+    def teardown(self, *_) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
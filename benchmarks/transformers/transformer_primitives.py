@@ -63,3 +63,9 @@ class MapLargeExpandedCircuit:
             return [op, op]
 
         _ = cirq.map_operations_and_unroll(circuit=self.circuit, map_func=map_func)
+
+    def time_columnar_circuit_round_trip(self, *_) -> None:
+        _ = cirq.ColumnarCircuit(self.circuit).to_circuit()
+
+    def time_drop_negligible_operations(self, *_) -> None:
+        _ = cirq.drop_negligible_operations(self.circuit)
@@ -68,7 +68,10 @@ from cirq.circuits import (
     AbstractCircuit as AbstractCircuit,
     Alignment as Alignment,
     Circuit as Circuit,
+    CircuitInterner as CircuitInterner,
     CircuitOperation as CircuitOperation,
+    ColumnarCircuit as ColumnarCircuit,
+    CompiledParameterizedCircuit as CompiledParameterizedCircuit,
     FrozenCircuit as FrozenCircuit,
     InsertStrategy as InsertStrategy,
     Moment as Moment,
@@ -211,6 +214,7 @@ from cirq.ops import (
     CZSWAP as CZSWAP,
     CZPowGate as CZPowGate,
     DensePauliString as DensePauliString,
+    DensePauliStringBatch as DensePauliStringBatch,
     depolarize as depolarize,
     DepolarizingChannel as DepolarizingChannel,
     DiagonalGate as DiagonalGate,
@@ -317,6 +321,7 @@ from cirq.ops import (
     SWAP as SWAP,
     SwapPowGate as SwapPowGate,
     SumOfProducts as SumOfProducts,
+    SymplecticPauliSum as SymplecticPauliSum,
     T as T,
     TaggedOperation as TaggedOperation,
     ThreeQubitDiagonalGate as ThreeQubitDiagonalGate,
@@ -347,6 +352,7 @@ from cirq.transformers import (
     add_dynamical_decoupling as add_dynamical_decoupling,
     align_left as align_left,
     align_right as align_right,
+    CachedTransformer as CachedTransformer,
     CompilationTargetGateset as CompilationTargetGateset,
     CZTargetGateset as CZTargetGateset,
     compute_cphase_exponents_for_fsim_decomposition as compute_cphase_exponents_for_fsim_decomposition,  # noqa: E501
@@ -383,6 +389,7 @@ from cirq.transformers import (
     merge_single_qubit_gates_to_phxz_symbolized as merge_single_qubit_gates_to_phxz_symbolized,
     merge_single_qubit_moments_to_phxz as merge_single_qubit_moments_to_phxz,
     optimize_for_target_gateset as optimize_for_target_gateset,
+    parallelize_over_components as parallelize_over_components,
     parameterized_2q_op_to_sqrt_iswap_operations as parameterized_2q_op_to_sqrt_iswap_operations,
     prepare_two_qubit_state_using_cz as prepare_two_qubit_state_using_cz,
     prepare_two_qubit_state_using_iswap as prepare_two_qubit_state_using_iswap,
@@ -401,6 +408,7 @@ from cirq.transformers import (
     symbolize_single_qubit_gates_by_indexed_tags as symbolize_single_qubit_gates_by_indexed_tags,
     synchronize_terminal_measurements as synchronize_terminal_measurements,
     TRANSFORMER as TRANSFORMER,
+    TransformerCache as TransformerCache,
     TransformerContext as TransformerContext,
     TransformerLogger as TransformerLogger,
     three_qubit_matrix_to_operations as three_qubit_matrix_to_operations,
@@ -482,6 +490,7 @@ from cirq.sim import (
     SimulationProductState as SimulationProductState,
     SimulationState as SimulationState,
     SimulationStateBase as SimulationStateBase,
+    SimulationStatePool as SimulationStatePool,
     SimulationTrialResult as SimulationTrialResult,
     SimulationTrialResultBase as SimulationTrialResultBase,
     Simulator as Simulator,
@@ -500,6 +509,7 @@ from cirq.sim import (
 )
 
 from cirq.study import (
+    batch_value_of as batch_value_of,
     Concat as Concat,
     dict_to_product_sweep as dict_to_product_sweep,
     dict_to_zip_sweep as dict_to_zip_sweep,
@@ -687,6 +697,7 @@ from cirq.vis import (
 
 from cirq.work import (
     CircuitSampleJob as CircuitSampleJob,
+    ParallelSampler as ParallelSampler,
     PauliSumCollector as PauliSumCollector,
     Sampler as Sampler,
     Collector as Collector,
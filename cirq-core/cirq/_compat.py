@@ -134,6 +134,18 @@ def _method_cache_name(func: Callable) -> str:
     return f'_method_cache_{func.__name__}'
 
 
+def _cached_hashes_differ(a: Any, b: Any) -> bool:
+    """Returns whether both objects have a `cached_method` hash and the hashes differ.
+
+    Objects with different hashes are unequal, so this lets `__eq__` return early without
+    computing any hash.
+    """
+    cache_name = _method_cache_name(type(a).__hash__)
+    a_hash = a.__dict__.get(cache_name)
+    b_hash = b.__dict__.get(cache_name)
+    return a_hash is not None and b_hash is not None and a_hash != b_hash
+
+
 def proper_repr(value: Any) -> str:
     """Overrides sympy and numpy returning repr strings that don't parse."""
 
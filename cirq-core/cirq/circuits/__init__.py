@@ -23,11 +23,17 @@ from cirq.circuits.circuit import (
     Circuit as Circuit,
 )
 from cirq.circuits.circuit_operation import CircuitOperation as CircuitOperation
+from cirq.circuits.columnar_circuit import ColumnarCircuit as ColumnarCircuit
+from cirq.circuits.compiled_parameterized_circuit import (
+    CompiledParameterizedCircuit as CompiledParameterizedCircuit,
+)
 from cirq.circuits.frozen_circuit import FrozenCircuit as FrozenCircuit
 from cirq.circuits.insert_strategy import InsertStrategy as InsertStrategy
 
 from cirq.circuits.moment import Moment as Moment
 
+from cirq.circuits.circuit_interner import CircuitInterner as CircuitInterner
+
 from cirq.circuits.optimization_pass import (
     PointOptimizer as PointOptimizer,
     PointOptimizationSummary as PointOptimizationSummary,
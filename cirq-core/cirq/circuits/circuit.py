@@ -22,6 +22,7 @@ Moment the Operations must all act on distinct Qubits.
 from __future__ import annotations
 
 import abc
+import bisect
 import enum
 import html
 import itertools
@@ -329,6 +330,16 @@ class AbstractCircuit(abc.ABC):
             + '</pre>'
         )
 
+    def _qubit_timeline(self, build: bool = True) -> _QubitTimeline | None:
+        """Returns an index of the moments operating on each qubit, if the circuit keeps one.
+
+        Args:
+            build: Whether to build the index if it does not exist yet. Queries
+                that only look at a few moments pass False, since scanning them
+                is cheaper than building the index.
+        """
+        return None
+
     def _first_moment_operating_on(
         self, qubits: Iterable[cirq.Qid], indices: Iterable[int]
     ) -> int | None:
@@ -367,6 +378,11 @@ class AbstractCircuit(abc.ABC):
         else:
             max_distance = min(max_distance, max_circuit_distance)
 
+        timeline = self._qubit_timeline(build=max_distance > _QUBIT_TIMELINE_MIN_SCAN)
+        if timeline is not None:
+            return timeline.next_moment(
+                qubits, max(start_moment_index, 0), start_moment_index + max_distance
+            )
         return self._first_moment_operating_on(
             qubits, range(start_moment_index, start_moment_index + max_distance)
         )
@@ -434,6 +450,11 @@ class AbstractCircuit(abc.ABC):
         if max_distance <= 0:
             return None
 
+        timeline = self._qubit_timeline(build=max_distance > _QUBIT_TIMELINE_MIN_SCAN)
+        if timeline is not None:
+            return timeline.prev_moment(
+                qubits, max(end_moment_index - max_distance, 0), end_moment_index
+            )
         return self._first_moment_operating_on(
             qubits, (end_moment_index - k - 1 for k in range(max_distance))
         )
@@ -657,9 +678,11 @@ class AbstractCircuit(abc.ABC):
         result = BucketPriorityQueue[ops.Operation](drop_duplicate_entries=True)
 
         involved_qubits = set(start_frontier.keys()) | set(end_frontier.keys())
+        timeline = self._qubit_timeline()
         # Note: only sorted to ensure a deterministic result ordering.
         for q in sorted(involved_qubits):
-            for i in range(start_frontier.get(q, 0), end_frontier.get(q, len(self))):
+            start, end = start_frontier.get(q, 0), end_frontier.get(q, len(self))
+            for i in range(start, end) if timeline is None else timeline.moments_on(q, start, end):
                 op = self.operation_at(q, i)
                 if op is None:
                     continue
@@ -1829,6 +1852,7 @@ class Circuit(AbstractCircuit):
                 also restrict the tags to be JSON serializable.
         """
         self._placement_cache: _PlacementCache | None = _PlacementCache()
+        self._qubit_timeline_index: _QubitTimeline | None = None
         self._moments: list[cirq.Moment] = []
         self._tags = tuple(tags)
 
@@ -1853,7 +1877,7 @@ class Circuit(AbstractCircuit):
             else:
                 self.append(flattened_contents, strategy=strategy)
 
-    def _mutated(self, *, preserve_placement_cache=False) -> None:
+    def _mutated(self, *, preserve_placement_cache=False, preserve_qubit_timeline=False) -> None:
         """Clear cached properties in response to this circuit being mutated."""
         self._all_qubits = None
         self._frozen = None
@@ -1862,6 +1886,13 @@ class Circuit(AbstractCircuit):
         self._parameter_names = None
         if not preserve_placement_cache:
             self._placement_cache = None
+        if not preserve_qubit_timeline:
+            self._qubit_timeline_index = None
+
+    def _qubit_timeline(self, build: bool = True) -> _QubitTimeline | None:
+        if self._qubit_timeline_index is None and build:
+            self._qubit_timeline_index = _QubitTimeline(self._moments)
+        return self._qubit_timeline_index
 
     @classmethod
     def _from_moments(cls, moments: Iterable[cirq.Moment], tags: Sequence[Hashable]) -> Circuit:
@@ -2189,6 +2220,7 @@ class Circuit(AbstractCircuit):
         if strategy != InsertStrategy.EARLIEST or k != len(self._moments):
             self._placement_cache = None
         mops = list(ops.flatten_to_ops_or_moments(moment_or_operation_tree))
+        timeline = self._qubit_timeline_index
         if self._placement_cache:
             batches = [mops]  # Any grouping would work here; this just happens to be the fastest.
         elif strategy is InsertStrategy.NEW:
@@ -2208,6 +2240,8 @@ class Circuit(AbstractCircuit):
                 )
             ):
                 self._moments.insert(k, Moment())
+                if timeline is not None:
+                    timeline.insert_moments(k, 1)
                 if strategy is InsertStrategy.INLINE:
                     k += 1
             max_p = 0
@@ -2219,6 +2253,8 @@ class Circuit(AbstractCircuit):
                     p = k
                 elif strategy in (InsertStrategy.NEW, InsertStrategy.NEW_THEN_INLINE):
                     self._moments.insert(k, Moment())
+                    if timeline is not None:
+                        timeline.insert_moments(k, 1)
                     p = k
                 elif strategy is InsertStrategy.INLINE:
                     p = k - 1
@@ -2227,17 +2263,21 @@ class Circuit(AbstractCircuit):
                 # Place
                 if isinstance(moment_or_op, Moment):
                     self._moments.insert(p, moment_or_op)
+                    if timeline is not None:
+                        timeline.insert_moments(p, 1)
                 elif p == len(self._moments):
                     self._moments.append(Moment(moment_or_op))
                 else:
                     self._moments[p] = self._moments[p].with_operation(moment_or_op)
+                if timeline is not None:
+                    timeline.add(p, moment_or_op.qubits)
                 # Iterate
                 max_p = max(p, max_p)
                 if strategy is InsertStrategy.NEW_THEN_INLINE:
                     strategy = InsertStrategy.INLINE
                     k += 1
             k = max(k, max_p + 1)
-        self._mutated(preserve_placement_cache=True)
+        self._mutated(preserve_placement_cache=True, preserve_qubit_timeline=True)
         return k
 
     def insert_into_range(self, operations: cirq.OP_TREE, start: int, end: int) -> int:
@@ -2390,6 +2430,18 @@ class Circuit(AbstractCircuit):
 
         return frontier
 
+    def _update_qubit_timeline(
+        self, new_moments: Sequence[cirq.Moment], changed_moments: Iterable[int]
+    ) -> None:
+        """Updates the qubit timeline, if any, for a batch edit that keeps moment indices."""
+        timeline = self._qubit_timeline_index
+        if timeline is None:
+            return
+        for i in changed_moments:
+            old_qubits, new_qubits = self._moments[i].qubits, new_moments[i].qubits
+            timeline.remove(i, old_qubits - new_qubits)
+            timeline.add(i, new_qubits - old_qubits)
+
     def batch_remove(self, removals: Iterable[tuple[int, cirq.Operation]]) -> None:
         """Removes several operations from a circuit.
 
@@ -2404,14 +2456,17 @@ class Circuit(AbstractCircuit):
             IndexError: Deleted from a moment that doesn't exist.
         """
         copy = self.copy()
+        changed_moments = set()
         for i, op in removals:
             if op not in copy._moments[i].operations:
                 raise ValueError(f"Can't remove {op} @ {i} because it doesn't exist.")
             copy._moments[i] = Moment(
                 old_op for old_op in copy._moments[i].operations if op != old_op
             )
+            changed_moments.add(i)
+        self._update_qubit_timeline(copy._moments, changed_moments)
         self._moments = copy._moments
-        self._mutated()
+        self._mutated(preserve_qubit_timeline=True)
 
     def batch_replace(
         self, replacements: Iterable[tuple[int, cirq.Operation, cirq.Operation]]
@@ -2429,14 +2484,17 @@ class Circuit(AbstractCircuit):
             IndexError: Replaced in a moment that doesn't exist.
         """
         copy = self.copy()
+        changed_moments = set()
         for i, op, new_op in replacements:
             if op not in copy._moments[i].operations:
                 raise ValueError(f"Can't replace {op} @ {i} because it doesn't exist.")
             copy._moments[i] = Moment(
                 old_op if old_op != op else new_op for old_op in copy._moments[i].operations
             )
+            changed_moments.add(i)
+        self._update_qubit_timeline(copy._moments, changed_moments)
         self._moments = copy._moments
-        self._mutated()
+        self._mutated(preserve_qubit_timeline=True)
 
     def batch_insert_into(self, insert_intos: Iterable[tuple[int, cirq.OP_TREE]]) -> None:
         """Inserts operations into empty spaces in existing moments.
@@ -2454,10 +2512,13 @@ class Circuit(AbstractCircuit):
             IndexError: Inserted into a moment index that doesn't exist.
         """
         copy = self.copy()
+        changed_moments = set()
         for i, insertions in insert_intos:
             copy._moments[i] = copy._moments[i].with_operations(insertions)
+            changed_moments.add(i)
+        self._update_qubit_timeline(copy._moments, changed_moments)
         self._moments = copy._moments
-        self._mutated()
+        self._mutated(preserve_qubit_timeline=True)
 
     def batch_insert(self, insertions: Iterable[tuple[int, cirq.OP_TREE]]) -> None:
         """Applies a batched insert operation to the circuit.
@@ -2482,6 +2543,8 @@ class Circuit(AbstractCircuit):
         """
         # Work on a copy in case validation fails halfway through.
         copy = self.copy()
+        if self._qubit_timeline_index is not None:
+            copy._qubit_timeline_index = self._qubit_timeline_index.copy()
         shift = 0
         # Note: python `sorted` is guaranteed to be stable. This matters.
         insertions = sorted(insertions, key=lambda e: e[0])
@@ -2492,7 +2555,8 @@ class Circuit(AbstractCircuit):
             if next_index > insert_index:
                 shift += next_index - insert_index
         self._moments = copy._moments
-        self._mutated()
+        self._qubit_timeline_index = copy._qubit_timeline_index
+        self._mutated(preserve_qubit_timeline=True)
 
     def append(
         self,
@@ -3062,3 +3126,83 @@ class _PlacementCache:
         )
         self._length = max(self._length, index + 1)
         return index
+
+
+# Queries without a qubit timeline scan at most this many moments before building one.
+_QUBIT_TIMELINE_MIN_SCAN = 16
+
+
+class _QubitTimeline:
+    """Maintains the sorted indices of the moments operating on each qubit.
+
+    This turns "which moment touches these qubits next" queries into a binary
+    search per qubit instead of a scan over moments. `FrozenCircuit` builds it
+    once, while `Circuit` builds it on the first query and keeps it up to date
+    through `insert` (and so `append`) and the `batch_*` edits. Any other
+    mutation drops it.
+    """
+
+    def __init__(self, moments: Iterable[cirq.Moment] = ()) -> None:
+        self._moment_indices: defaultdict[cirq.Qid, list[int]] = defaultdict(list)
+        for i, moment in enumerate(moments):
+            for q in moment.qubits:
+                self._moment_indices[q].append(i)
+
+    def copy(self) -> _QubitTimeline:
+        new = _QubitTimeline()
+        for q, indices in self._moment_indices.items():
+            new._moment_indices[q] = indices.copy()
+        return new
+
+    def next_moment(self, qubits: Iterable[cirq.Qid], start: int, end: int) -> int | None:
+        """Returns the first moment in `[start, end)` operating on any of the qubits."""
+        found = end
+        for q in qubits:
+            indices = self._moment_indices.get(q)
+            if indices:
+                k = bisect.bisect_left(indices, start)
+                if k < len(indices) and indices[k] < found:
+                    found = indices[k]
+        return found if found < end else None
+
+    def prev_moment(self, qubits: Iterable[cirq.Qid], start: int, end: int) -> int | None:
+        """Returns the last moment in `[start, end)` operating on any of the qubits."""
+        found = start - 1
+        for q in qubits:
+            indices = self._moment_indices.get(q)
+            if indices:
+                k = bisect.bisect_left(indices, end) - 1
+                if k >= 0 and indices[k] > found:
+                    found = indices[k]
+        return found if found >= start else None
+
+    def moments_on(self, qubit: cirq.Qid, start: int, end: int) -> list[int]:
+        """Returns the moments in `[start, end)` operating on the qubit, in order."""
+        indices = self._moment_indices.get(qubit, [])
+        return indices[bisect.bisect_left(indices, start) : bisect.bisect_left(indices, end)]
+
+    def add(self, moment_index: int, qubits: Iterable[cirq.Qid]) -> None:
+        """Records that the moment now operates on the given qubits."""
+        for q in qubits:
+            indices = self._moment_indices[q]
+            if not indices or indices[-1] < moment_index:
+                indices.append(moment_index)
+                continue
+            k = bisect.bisect_left(indices, moment_index)
+            if indices[k] != moment_index:
+                indices.insert(k, moment_index)
+
+    def remove(self, moment_index: int, qubits: Iterable[cirq.Qid]) -> None:
+        """Records that the moment no longer operates on the given qubits."""
+        for q in qubits:
+            indices = self._moment_indices[q]
+            k = bisect.bisect_left(indices, moment_index)
+            if k < len(indices) and indices[k] == moment_index:
+                del indices[k]
+
+    def insert_moments(self, index: int, count: int) -> None:
+        """Shifts the moments at or after `index` by `count` for newly inserted moments."""
+        for indices in self._moment_indices.values():
+            k = bisect.bisect_left(indices, index)
+            if k < len(indices):
+                indices[k:] = [i + count for i in indices[k:]]
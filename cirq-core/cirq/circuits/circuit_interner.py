@@ -0,0 +1,131 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hash-consing of circuits, moments and operations."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from cirq.circuits.circuit_operation import CircuitOperation
+from cirq.circuits.frozen_circuit import FrozenCircuit
+from cirq.circuits.moment import Moment
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class CircuitInterner:
+    """Makes equal operations, moments and subcircuits share one instance.
+
+    `intern` returns a `cirq.FrozenCircuit` equal to its input in which every
+    operation, moment and `cirq.CircuitOperation` body is the first equal one
+    this interner has seen. Circuits with repeated structure, such as Trotter
+    steps built one operation at a time, then hold each distinct object once.
+    Comparing interned objects is an identity check, and since hashes are
+    cached on moments and frozen circuits, unequal ones are told apart by
+    their hashes without walking their operations.
+
+    The interner keeps every object it has seen alive. Use one interner per
+    family of related circuits and drop or `clear` it when done.
+
+    >>> q = cirq.LineQubit.range(3)
+    >>> def trotter_step():
+    ...     return [cirq.CZ(q[0], q[1]), cirq.CZ(q[1], q[2]), [cirq.X(x) ** 0.1 for x in q]]
+    >>> circuit = cirq.Circuit(trotter_step() for _ in range(50))
+    >>> interned = cirq.CircuitInterner().intern(circuit)
+    >>> interned == circuit
+    True
+    >>> interned[0] is interned[3]
+    True
+    """
+
+    def __init__(self) -> None:
+        # Moment equality ignores tags, so keys also hold the tags of all nested moments.
+        self._operations: dict[Hashable, cirq.Operation] = {}
+        self._moments: dict[Hashable, cirq.Moment] = {}
+        self._circuits: dict[Hashable, cirq.FrozenCircuit] = {}
+
+    def __len__(self) -> int:
+        """The number of distinct operations, moments and circuits held."""
+        return len(self._operations) + len(self._moments) + len(self._circuits)
+
+    def clear(self) -> None:
+        """Forgets every interned object."""
+        self._operations.clear()
+        self._moments.clear()
+        self._circuits.clear()
+
+    def intern(self, circuit: cirq.AbstractCircuit) -> cirq.FrozenCircuit:
+        """Returns the shared instance of a circuit equal to `circuit`.
+
+        Operations may be replaced by an equal operation written differently,
+        such as `cirq.CZ(b, a)` for `cirq.CZ(a, b)`.
+
+        Raises:
+            TypeError: If an operation is not hashable.
+        """
+        frozen = circuit.freeze()
+        key = (frozen, _circuit_tags(frozen))
+        interned = self._circuits.get(key)
+        if interned is not None:
+            return interned
+        moments = tuple(self._intern_moment(moment) for moment in frozen.moments)
+        if any(new is not old for new, old in zip(moments, frozen.moments)):
+            frozen = FrozenCircuit._from_moments(moments, frozen.tags)
+        self._circuits[key] = frozen
+        return frozen
+
+    def _intern_moment(self, moment: cirq.Moment) -> cirq.Moment:
+        key = (moment, _moment_tags(moment))
+        interned = self._moments.get(key)
+        if interned is not None:
+            return interned
+        operations = tuple(self._intern_operation(op) for op in moment.operations)
+        if any(new is not old for new, old in zip(operations, moment.operations)):
+            moment = Moment.from_ops(*operations, tags=moment.tags)
+        self._moments[key] = moment
+        return moment
+
+    def _intern_operation(self, op: cirq.Operation) -> cirq.Operation:
+        untagged = op.untagged
+        key: Hashable = op
+        if isinstance(untagged, CircuitOperation):
+            key = (op, _circuit_tags(untagged.circuit))
+        interned = self._operations.get(key)
+        if interned is not None:
+            return interned
+        if isinstance(untagged, CircuitOperation):
+            body = self.intern(untagged.circuit)
+            if body is not untagged.circuit:
+                op = untagged.replace(circuit=body).with_tags(*op.tags)
+        self._operations[key] = op
+        return op
+
+
+def _moment_tags(moment: cirq.Moment) -> Hashable:
+    """Returns the tags of the moment and of the moments of its subcircuits."""
+    return (
+        moment.tags,
+        *(
+            _circuit_tags(op.untagged.circuit)
+            for op in moment
+            if isinstance(op.untagged, CircuitOperation)
+        ),
+    )
+
+
+def _circuit_tags(circuit: cirq.FrozenCircuit) -> Hashable:
+    return tuple(_moment_tags(moment) for moment in circuit.moments)
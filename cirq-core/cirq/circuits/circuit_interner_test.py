@@ -0,0 +1,99 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import cast
+
+import cirq
+
+
+def _trotter_circuit(steps: int) -> cirq.Circuit:
+    q = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit()
+    for _ in range(steps):
+        circuit.append(cirq.ZZ(q[i], q[i + 1]) ** 0.1 for i in range(3))
+        circuit.append(cirq.X(x) ** 0.2 for x in q)
+    return circuit
+
+
+def test_shares_equal_objects() -> None:
+    circuit = _trotter_circuit(10)
+    interner = cirq.CircuitInterner()
+    interned = interner.intern(circuit)
+    assert interned == circuit
+    assert isinstance(interned, cirq.FrozenCircuit)
+    assert len({id(m) for m in interned}) == len(set(circuit.moments))
+    assert len({id(op) for op in interned.all_operations()}) == 7
+
+    assert interner.intern(_trotter_circuit(10)) is interned
+    assert interner.intern(interned) is interned
+    assert interner.intern(_trotter_circuit(3)).moments[0] is interned.moments[0]
+    assert len(interner) == 7 + len(set(circuit.moments)) + 2
+    interner.clear()
+    assert len(interner) == 0
+    assert interner.intern(circuit) is not interned
+
+
+def test_keeps_tags() -> None:
+    a, b = cirq.LineQubit.range(2)
+    interner = cirq.CircuitInterner()
+    plain = interner.intern(cirq.Circuit(cirq.Moment(cirq.X(a)), cirq.Moment(cirq.X(a))))
+    assert plain[0] is plain[1]
+    tagged = interner.intern(
+        cirq.Circuit(cirq.Moment(cirq.X(a)).with_tags('m'), cirq.Moment(cirq.X(a).with_tags('o')))
+    )
+    assert tagged != plain
+    assert tagged[0].tags == ('m',)
+    assert tagged[0].operations[0] is plain[0].operations[0]
+    assert tagged[1].operations[0].tags == ('o',)
+    circuit_tagged = interner.intern(cirq.FrozenCircuit(plain.moments, tags=('c',)))
+    assert circuit_tagged.tags == ('c',)
+    assert circuit_tagged[0] is plain[0]
+
+    # Circuits and subcircuits whose moments differ only in their tags are not merged.
+    moment_tagged = interner.intern(cirq.Circuit(cirq.Moment(cirq.X(a)).with_tags('m'), plain[1]))
+    assert moment_tagged == plain
+    assert moment_tagged is not plain
+    assert moment_tagged[0].tags == ('m',)
+    op = cast(
+        cirq.CircuitOperation,
+        interner.intern(cirq.Circuit(cirq.CircuitOperation(plain)))[0].operations[0],
+    )
+    op_moment_tagged = interner.intern(cirq.Circuit(cirq.CircuitOperation(moment_tagged)))
+    assert cast(cirq.CircuitOperation, op_moment_tagged[0].operations[0]).circuit is moment_tagged
+    assert op.circuit is plain
+    assert interner.intern(cirq.Circuit(cirq.X(b), cirq.CZ(a, b))) != plain
+
+
+def test_shares_subcircuits() -> None:
+    a, b = cirq.LineQubit.range(2)
+    interner = cirq.CircuitInterner()
+    body = cirq.FrozenCircuit(cirq.X(a), cirq.CZ(a, b))
+    first = interner.intern(cirq.Circuit(cirq.CircuitOperation(body).with_tags('t')))
+    second = interner.intern(
+        cirq.Circuit(
+            cirq.CircuitOperation(body.unfreeze().freeze(), repetitions=3),
+            cirq.CircuitOperation(cirq.FrozenCircuit(cirq.Moment(cirq.X(a)), body[1])),
+        )
+    )
+    first_op = first[0].operations[0]
+    assert first_op.tags == ('t',)
+    first_circuit = cast(cirq.CircuitOperation, first_op.untagged).circuit
+    assert first_circuit is interner.intern(body)
+    second_ops = [cast(cirq.CircuitOperation, second[i].operations[0]) for i in range(2)]
+    assert second_ops[0].circuit is first_circuit
+    assert second_ops[1].circuit is first_circuit
+    assert second_ops[0].repetitions == 3
+    assert interner.intern(body)[0] is interner.intern(cirq.Circuit(cirq.X(a)))[0]
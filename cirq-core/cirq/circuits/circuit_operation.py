@@ -453,7 +453,12 @@ class CircuitOperation(ops.Operation):
     # Methods for string representation of the operation.
 
     def __repr__(self):
-        args = f'\ncircuit={self.circuit!r},\n'
+        args = f'\ncircuit={self.circuit!r},\n' + self._repr_args_without_circuit()
+        indented_args = args.replace('\n', '\n    ')
+        return f'cirq.CircuitOperation({indented_args[:-4]})'
+
+    def _repr_args_without_circuit(self) -> str:
+        args = ''
         if self.repetitions != 1:
             args += f'repetitions={self.repetitions},\n'
         if self.qubit_map:
@@ -469,8 +474,14 @@ class CircuitOperation(ops.Operation):
             args += f'repetition_ids={proper_repr(self.repetition_ids)},\n'
         if self.repeat_until:
             args += f'repeat_until={self.repeat_until!r},\n'
-        indented_args = args.replace('\n', '\n    ')
-        return f'cirq.CircuitOperation({indented_args[:-4]})'
+        return args
+
+    @cached_method
+    def _structural_hash_(self) -> int:
+        """Combines the structural hash of the circuit with the other arguments."""
+        return circuits.moment._structural_hash(
+            'CircuitOperation', self.circuit.structural_hash(), self._repr_args_without_circuit()
+        )
 
     def __str__(self):
         # TODO: support out-of-line subcircuit definition in string format.
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import itertools
 import os
+import pickle
 import time
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
@@ -1223,6 +1224,103 @@ def test_prev_moment_operating_on_distance(circuit_cls) -> None:
         c.prev_moment_operating_on([a], 6, max_distance=-1)
 
 
+def _assert_qubit_timeline_queries_match_scans(circuit: cirq.AbstractCircuit) -> None:
+    qubits = sorted(circuit.all_qubits())
+    n = len(circuit)
+    timeline = circuit._qubit_timeline()
+    assert timeline is not None
+    expected = circuits.circuit._QubitTimeline(circuit.moments)
+    for q in qubits:
+        assert timeline.moments_on(q, 0, n) == expected.moments_on(q, 0, n)
+    for start in [-1, 0, 1, n // 3, n - 1, n, n + 2]:
+        for qs in [qubits[:1], qubits[1:3], qubits]:
+            for distance in [None, 0, 1, 5]:
+                if distance is None:
+                    scan = range(max(start, 0), n)
+                else:
+                    scan = range(max(start, 0), min(start + distance, n))
+                assert circuit.next_moment_operating_on(qs, start, distance) == next(
+                    (i for i in scan if circuit.moments[i].operates_on(qs)), None
+                )
+                end = min(start, n)
+                lo = 0 if distance is None else max(start - distance, 0)
+                assert circuit.prev_moment_operating_on(qs, start, distance) == next(
+                    (i for i in reversed(range(lo, end)) if circuit.moments[i].operates_on(qs)),
+                    None,
+                )
+
+
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_qubit_timeline_queries(circuit_cls, monkeypatch) -> None:
+    monkeypatch.setattr(circuits.circuit, '_QUBIT_TIMELINE_MIN_SCAN', 0)
+    circuit = circuit_cls(
+        cirq.testing.random_circuit(qubits=5, n_moments=40, op_density=0.4, random_state=1)
+    )
+    _assert_qubit_timeline_queries_match_scans(circuit)
+    assert circuit._qubit_timeline() is circuit._qubit_timeline()
+
+
+def test_qubit_timeline_is_built_lazily() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.Moment(op) for op in [cirq.X(a), cirq.Y(b)] * 20)
+    assert circuit.next_moment_operating_on([a], 1, max_distance=2) == 2
+    assert circuit._qubit_timeline(build=False) is None
+    assert circuit.next_moment_operating_on([b], 2) == 3
+    assert circuit._qubit_timeline(build=False) is not None
+    circuit[0] = cirq.Moment()
+    assert circuit._qubit_timeline(build=False) is None
+    assert circuits.AbstractCircuit._qubit_timeline(circuit) is None
+
+    frozen = circuit.freeze()
+    frozen._qubit_timeline()
+    assert frozen.with_tags('t')._qubit_timeline(build=False) is frozen._qubit_timeline()
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    assert unpickled == frozen
+    assert unpickled._qubit_timeline(build=False) is None
+    assert unpickled.next_moment_operating_on([b], 2) == 3
+
+
+def test_qubit_timeline_follows_edits(monkeypatch) -> None:
+    monkeypatch.setattr(circuits.circuit, '_QUBIT_TIMELINE_MIN_SCAN', 0)
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(
+        qubits=[a, b, c, d], n_moments=20, op_density=0.5, random_state=2
+    ).unfreeze()
+
+    def check() -> None:
+        assert circuit._qubit_timeline(build=False) is not None
+        _assert_qubit_timeline_queries_match_scans(circuit)
+
+    circuit._qubit_timeline()
+    circuit.append([cirq.X(a), cirq.CZ(b, c), cirq.Y(d)])
+    check()
+    for strategy in cirq.InsertStrategy.NEW, cirq.InsertStrategy.INLINE:
+        circuit.insert(5, [cirq.H(a), cirq.H(b)], strategy=strategy)
+        check()
+    circuit.insert(7, [cirq.CZ(a, d), cirq.X(b)], strategy=cirq.InsertStrategy.NEW_THEN_INLINE)
+    check()
+    circuit.insert(3, cirq.Moment(cirq.CZ(c, d)))
+    check()
+    circuit.insert(0, [cirq.X(c), cirq.X(c)])
+    check()
+    circuit.batch_insert([(4, cirq.Z(a)), (10, [cirq.Z(b), cirq.Z(c)]), (10, cirq.Z(d))])
+    check()
+    removals = [(i, op) for i, op in circuit.findall_operations(lambda op: op.gate == cirq.Z)]
+    circuit.batch_remove(removals)
+    check()
+    empty_slots = [(i, cirq.T(a)) for i, m in enumerate(circuit) if not m.operates_on([a])]
+    circuit.batch_insert_into(empty_slots[:3])
+    check()
+    replacements = [
+        (i, op, cirq.T(op.qubits[0])) for i, op in circuit.findall_operations(lambda op: True)
+    ]
+    circuit.batch_replace(replacements[::2])
+    check()
+    with pytest.raises(ValueError):
+        circuit.batch_remove([(0, cirq.CZ(a, b).with_tags('missing'))])
+    check()
+
+
 def test_earliest_available_moment() -> None:
     q = cirq.LineQubit.range(3)
     c = cirq.Circuit(
@@ -0,0 +1,331 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A circuit stored as flat arrays with one entry per operation."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+from cirq import ops, protocols
+from cirq.circuits.circuit import Circuit
+from cirq.circuits.frozen_circuit import FrozenCircuit
+from cirq.circuits.moment import Moment
+
+if TYPE_CHECKING:
+    import cirq
+
+OperationKind = Union['cirq.Gate', 'cirq.Operation']
+
+
+class ColumnarCircuit:
+    """A circuit stored as NumPy columns instead of `cirq.Moment` and `cirq.Operation` objects.
+
+    Every operation is an entry of a few flat arrays:
+
+    * `moment_indices[k]` is the moment of operation `k`,
+    * `kind_ids[k]` indexes `kinds`, a table of the distinct gates of the
+      circuit. Operations that are not plain `cirq.GateOperation`s, such as
+      tagged operations or circuit operations, are stored in the table as is.
+    * `qubit_indices[qubit_offsets[k]:qubit_offsets[k + 1]]` index `qubits`
+      and list the qubits of operation `k`, in order.
+
+    Operations appear in moment order, and in their order within each moment.
+
+    Passes that decide what to do with an operation from its gate alone, like
+    dropping negligible gates or replacing one gate with another, evaluate
+    their decision once per distinct kind and apply it to all operations with
+    NumPy. Only `to_circuit` creates operations and moments again, reusing
+    operations that occur several times, e.g. in repeated layers.
+
+    >>> q0, q1 = cirq.LineQubit.range(2)
+    >>> circuit = cirq.Circuit([cirq.H(q0), cirq.Z(q1) ** 1e-9, cirq.CZ(q0, q1)] * 2)
+    >>> columnar = cirq.ColumnarCircuit(circuit)
+    >>> columnar.kinds
+    (cirq.H, (cirq.Z**1e-09), cirq.CZ)
+    >>> columnar.kind_ids
+    array([0, 1, 2, 0, 1, 2], dtype=int32)
+    >>> print(columnar.drop_negligible().drop_empty_moments().to_circuit())
+    0: ───H───@───H───@───
+              │       │
+    1: ───────@───────@───
+    """
+
+    def __init__(self, circuit: cirq.AbstractCircuit) -> None:
+        """Converts a circuit to columns.
+
+        Args:
+            circuit: The circuit to convert.
+        """
+        qubits = sorted(circuit.all_qubits())
+        qubit_index = {q: i for i, q in enumerate(qubits)}
+        kinds: list[OperationKind] = []
+        # Keyed by type too, since gates of different types can compare equal.
+        kind_index: dict[tuple[type, OperationKind], int] = {}
+        # Gates are often shared between operations, and hashing them can be slow. The
+        # circuit keeps every gate alive, so object ids are stable during the conversion.
+        kind_index_by_id: dict[int, int] = {}
+        moment_indices: list[int] = []
+        kind_ids: list[int] = []
+        qubit_counts: list[int] = []
+        qubit_indices: list[int] = []
+        for i, moment in enumerate(circuit.moments):
+            for op in moment.operations:
+                kind: OperationKind = op.gate if type(op) is ops.GateOperation else op
+                kind_id = kind_index_by_id.get(id(kind))
+                if kind_id is None:
+                    try:
+                        kind_id = kind_index.setdefault((type(kind), kind), len(kinds))
+                    except TypeError:  # pragma: no cover
+                        # Unhashable kinds are not deduplicated.
+                        kind_id = len(kinds)
+                    if kind_id == len(kinds):
+                        kinds.append(kind)
+                    kind_index_by_id[id(kind)] = kind_id
+                op_qubits = op.qubits
+                moment_indices.append(i)
+                kind_ids.append(kind_id)
+                qubit_counts.append(len(op_qubits))
+                qubit_indices.extend(map(qubit_index.__getitem__, op_qubits))
+        self._init_columns(
+            qubits=tuple(qubits),
+            kinds=tuple(kinds),
+            moment_indices=np.array(moment_indices, dtype=np.int32),
+            kind_ids=np.array(kind_ids, dtype=np.int32),
+            qubit_offsets=np.concatenate([[0], np.cumsum(qubit_counts, dtype=np.int64)]),
+            qubit_indices=np.array(qubit_indices, dtype=np.int32),
+            moment_tags=tuple(moment.tags for moment in circuit.moments),
+            tags=tuple(circuit.tags),
+        )
+
+    def _init_columns(
+        self,
+        *,
+        qubits: tuple[cirq.Qid, ...],
+        kinds: tuple[OperationKind, ...],
+        moment_indices: np.ndarray,
+        kind_ids: np.ndarray,
+        qubit_offsets: np.ndarray,
+        qubit_indices: np.ndarray,
+        moment_tags: tuple[tuple[Hashable, ...], ...],
+        tags: tuple[Hashable, ...],
+    ) -> None:
+        self._qubits = qubits
+        self._kinds = kinds
+        self._moment_indices = moment_indices
+        self._kind_ids = kind_ids
+        self._qubit_offsets = qubit_offsets
+        self._qubit_indices = qubit_indices
+        self._moment_tags = moment_tags
+        self._tags = tags
+        for column in (moment_indices, kind_ids, qubit_offsets, qubit_indices):
+            column.flags.writeable = False
+
+    def _replace(self, **columns) -> ColumnarCircuit:
+        """Returns a copy with some columns replaced; the others are shared."""
+        new = ColumnarCircuit.__new__(ColumnarCircuit)
+        new._init_columns(
+            **{
+                'qubits': self._qubits,
+                'kinds': self._kinds,
+                'moment_indices': self._moment_indices,
+                'kind_ids': self._kind_ids,
+                'qubit_offsets': self._qubit_offsets,
+                'qubit_indices': self._qubit_indices,
+                'moment_tags': self._moment_tags,
+                'tags': self._tags,
+                **columns,
+            }
+        )
+        return new
+
+    @property
+    def qubits(self) -> tuple[cirq.Qid, ...]:
+        """The qubits of the circuit, indexed by `qubit_indices`."""
+        return self._qubits
+
+    @property
+    def kinds(self) -> tuple[OperationKind, ...]:
+        """The distinct gates, or operations stored as is, indexed by `kind_ids`."""
+        return self._kinds
+
+    @property
+    def moment_indices(self) -> np.ndarray:
+        """The moment of each operation."""
+        return self._moment_indices
+
+    @property
+    def kind_ids(self) -> np.ndarray:
+        """The index into `kinds` of each operation."""
+        return self._kind_ids
+
+    @property
+    def qubit_offsets(self) -> np.ndarray:
+        """Operation `k` acts on `qubit_indices[qubit_offsets[k]:qubit_offsets[k + 1]]`."""
+        return self._qubit_offsets
+
+    @property
+    def qubit_indices(self) -> np.ndarray:
+        """The indices into `qubits` of the qubits of all operations, concatenated."""
+        return self._qubit_indices
+
+    @property
+    def num_moments(self) -> int:
+        return len(self._moment_tags)
+
+    @property
+    def tags(self) -> tuple[Hashable, ...]:
+        """The tags of the circuit."""
+        return self._tags
+
+    def __len__(self) -> int:
+        """The number of operations."""
+        return len(self._kind_ids)
+
+    def kind_counts(self) -> dict[OperationKind, int]:
+        """Returns the number of operations of each kind that occurs in the circuit."""
+        counts = np.bincount(self._kind_ids, minlength=len(self._kinds))
+        return {self._kinds[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def filter(self, keep: np.ndarray) -> ColumnarCircuit:
+        """Keeps only some operations.
+
+        Args:
+            keep: A boolean array marking the operations to keep.
+
+        Returns:
+            A circuit with the same moments, holding the kept operations.
+
+        Raises:
+            ValueError: If `keep` does not have one entry per operation.
+        """
+        keep = np.asarray(keep, dtype=bool)
+        if keep.shape != (len(self),):
+            raise ValueError(f'Expected a mask of shape {(len(self),)}, got {keep.shape}.')
+        counts = np.diff(self._qubit_offsets)
+        qubit_keep = np.repeat(keep, counts)
+        return self._replace(
+            moment_indices=self._moment_indices[keep],
+            kind_ids=self._kind_ids[keep],
+            qubit_offsets=np.concatenate([[0], np.cumsum(counts[keep], dtype=np.int64)]),
+            qubit_indices=self._qubit_indices[qubit_keep],
+        )
+
+    def map_kinds(self, func: Callable[[OperationKind], OperationKind | None]) -> ColumnarCircuit:
+        """Replaces every operation kind, calling `func` once per kind.
+
+        Args:
+            func: Maps each kind to a replacement, or to None to drop all
+                operations of that kind. A gate must be replaced by a gate on
+                the same number of qubits, and an operation by an operation on
+                the same qubits.
+
+        Returns:
+            The mapped circuit.
+
+        Raises:
+            ValueError: If a replacement does not act on the same qubits.
+        """
+        new_kinds = [func(kind) for kind in self._kinds]
+        for kind, new_kind in zip(self._kinds, new_kinds):
+            if new_kind is None:
+                continue
+            if isinstance(kind, ops.Gate):
+                same_qubits = isinstance(new_kind, ops.Gate) and protocols.num_qubits(
+                    new_kind
+                ) == protocols.num_qubits(kind)
+            else:
+                same_qubits = isinstance(new_kind, ops.Operation) and new_kind.qubits == kind.qubits
+            if not same_qubits:
+                raise ValueError(f'{new_kind!r} does not act on the same qubits as {kind!r}.')
+        dropped = np.array([new_kind is None for new_kind in new_kinds], dtype=bool)
+        mapped = self._replace(kinds=tuple(new_kinds))
+        if not np.any(dropped):
+            return mapped
+        return mapped.filter(~dropped[self._kind_ids])
+
+    def drop_negligible(
+        self, atol: float = 1e-8, *, tags_to_ignore: Iterable[Hashable] = ()
+    ) -> ColumnarCircuit:
+        """Drops operations with tiny effects, as `cirq.drop_negligible_operations` does.
+
+        Args:
+            atol: Operations whose `cirq.trace_distance_bound` is at most
+                `atol` are dropped.
+            tags_to_ignore: Operations with any of these tags are kept.
+
+        Returns:
+            The circuit without negligible operations. Empty moments are kept.
+        """
+        tags_to_ignore = set(tags_to_ignore)
+
+        def is_negligible(kind: OperationKind) -> bool:
+            if isinstance(kind, ops.Operation) and tags_to_ignore.intersection(kind.tags):
+                return False
+            return not (
+                protocols.num_qubits(kind) > 10
+                or protocols.is_measurement(kind)
+                or protocols.trace_distance_bound(kind) > atol
+            )
+
+        negligible = np.array([is_negligible(kind) for kind in self._kinds], dtype=bool)
+        if not np.any(negligible):
+            return self
+        return self.filter(~negligible[self._kind_ids])
+
+    def drop_empty_moments(self) -> ColumnarCircuit:
+        """Removes moments without operations, renumbering the others."""
+        occupied = np.zeros(self.num_moments, dtype=bool)
+        occupied[self._moment_indices] = True
+        new_index = np.cumsum(occupied, dtype=np.int32) - 1
+        return self._replace(
+            moment_indices=new_index[self._moment_indices],
+            moment_tags=tuple(t for t, o in zip(self._moment_tags, occupied) if o),
+        )
+
+    def _moments(self) -> list[cirq.Moment]:
+        bounds = np.searchsorted(self._moment_indices, np.arange(self.num_moments + 1))
+        kind_ids = self._kind_ids.tolist()
+        offsets = self._qubit_offsets.tolist()
+        qubit_indices = self._qubit_indices.tolist()
+        made: dict[tuple[int, ...], cirq.Operation] = {}
+
+        def make_op(k: int) -> cirq.Operation:
+            kind = self._kinds[kind_ids[k]]
+            if isinstance(kind, ops.Operation):
+                return kind
+            key = (kind_ids[k], *qubit_indices[offsets[k] : offsets[k + 1]])
+            op = made.get(key)
+            if op is None:
+                op = made[key] = kind.on(*(self._qubits[i] for i in key[1:]))
+            return op
+
+        return [
+            Moment.from_ops(*(make_op(k) for k in range(start, stop)), tags=moment_tags)
+            for start, stop, moment_tags in zip(bounds[:-1], bounds[1:], self._moment_tags)
+        ]
+
+    def to_circuit(self) -> cirq.Circuit:
+        """Converts back to a `cirq.Circuit`."""
+        return Circuit._from_moments(self._moments(), tags=self._tags)
+
+    def to_frozen_circuit(self) -> cirq.FrozenCircuit:
+        """Converts back to a `cirq.FrozenCircuit`."""
+        return FrozenCircuit._from_moments(self._moments(), tags=self._tags)
+
+    def __repr__(self) -> str:
+        return f'cirq.ColumnarCircuit({self.to_frozen_circuit()!r})'
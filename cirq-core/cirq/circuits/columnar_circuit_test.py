@@ -0,0 +1,142 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def _mixed_circuit() -> cirq.Circuit:
+    a, b, c = cirq.LineQubit.range(3)
+    subcircuit = cirq.FrozenCircuit(cirq.CZ(a, b), cirq.X(a) ** 1e-10)
+    return cirq.Circuit(
+        cirq.Moment(cirq.H(a), cirq.Z(c) ** 1e-10).with_tags('layer'),
+        cirq.Moment(cirq.CZ(a, b), cirq.X(c).with_tags('keep')),
+        cirq.Moment(),
+        cirq.Moment(cirq.CircuitOperation(subcircuit), cirq.Y(c) ** 1e-10),
+        cirq.Moment(cirq.H(a), cirq.measure(b, c, key='m')),
+        tags=('circuit',),
+    )
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_round_trip(seed) -> None:
+    circuit = cirq.testing.random_circuit(qubits=6, n_moments=20, op_density=0.8, random_state=seed)
+    columnar = cirq.ColumnarCircuit(circuit)
+    assert len(columnar) == len(list(circuit.all_operations()))
+    assert columnar.num_moments == len(circuit)
+    assert columnar.to_circuit() == circuit
+    assert columnar.to_frozen_circuit() == circuit.freeze()
+
+
+def test_columns() -> None:
+    circuit = _mixed_circuit()
+    a, b, c = cirq.LineQubit.range(3)
+    columnar = cirq.ColumnarCircuit(circuit)
+    assert columnar.qubits == (a, b, c)
+    assert columnar.tags == ('circuit',)
+    assert columnar.kinds[:4] == (cirq.H, cirq.Z**1e-10, cirq.CZ, cirq.X(c).with_tags('keep'))
+    np.testing.assert_array_equal(columnar.moment_indices, [0, 0, 1, 1, 3, 3, 4, 4])
+    np.testing.assert_array_equal(columnar.kind_ids, [0, 1, 2, 3, 4, 5, 0, 6])
+    np.testing.assert_array_equal(columnar.qubit_offsets, [0, 1, 2, 4, 5, 7, 8, 9, 11])
+    np.testing.assert_array_equal(columnar.qubit_indices, [0, 2, 0, 1, 2, 0, 1, 2, 0, 1, 2])
+    assert columnar.kind_counts()[cirq.H] == 2
+    with pytest.raises(ValueError):
+        columnar.kind_ids[0] = 1
+
+    round_trip = columnar.to_circuit()
+    assert round_trip == circuit
+    assert round_trip[0].tags == ('layer',)
+    assert round_trip.tags == ('circuit',)
+    cirq.testing.assert_equivalent_repr(columnar.to_frozen_circuit())
+    assert repr(columnar) == f'cirq.ColumnarCircuit({circuit.freeze()!r})'
+
+
+def test_filter_and_drop_empty_moments() -> None:
+    a, b = cirq.LineQubit.range(2)
+    columnar = cirq.ColumnarCircuit(_mixed_circuit())
+    filtered = columnar.filter(columnar.moment_indices != 3)
+    assert filtered.num_moments == 5
+    assert filtered.to_circuit()[3] == cirq.Moment()
+    dense = filtered.drop_empty_moments()
+    assert dense.to_circuit() == cirq.Circuit(
+        _mixed_circuit()[:2], _mixed_circuit()[4:], tags=('circuit',)
+    )
+    assert dense.to_circuit()[0].tags == ('layer',)
+    with pytest.raises(ValueError, match='shape'):
+        _ = columnar.filter(np.ones(3, dtype=bool))
+
+
+def test_map_kinds() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit([cirq.H(a), cirq.CZ(a, b), cirq.T(b)] * 3)
+    calls = []
+
+    def func(kind):
+        calls.append(kind)
+        if kind == cirq.T:
+            return None
+        return cirq.Y if kind == cirq.H else kind
+
+    mapped = cirq.ColumnarCircuit(circuit).map_kinds(func)
+    assert calls == [cirq.H, cirq.CZ, cirq.T]
+    assert mapped.to_circuit() == cirq.Circuit([cirq.Y(a), cirq.CZ(a, b), cirq.Moment()] * 3)
+    assert cirq.ColumnarCircuit(circuit).map_kinds(lambda k: k).to_circuit() == circuit
+
+    with pytest.raises(ValueError, match='same qubits'):
+        _ = cirq.ColumnarCircuit(circuit).map_kinds(lambda k: cirq.X)
+    tagged = cirq.ColumnarCircuit(cirq.Circuit(cirq.X(a).with_tags('t')))
+    with pytest.raises(ValueError, match='same qubits'):
+        _ = tagged.map_kinds(lambda k: cirq.X(b))
+    assert tagged.map_kinds(lambda k: cirq.Y(a)).to_circuit() == cirq.Circuit(cirq.Y(a))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_drop_negligible_matches_transformer(seed) -> None:
+    prng = np.random.RandomState(seed)
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(
+        cirq.Moment(
+            cirq.PhasedXZGate(
+                x_exponent=prng.choice([0, 1e-9, 0.5]),
+                z_exponent=prng.choice([0, 1e-9]),
+                axis_phase_exponent=0,
+            ).on(q)
+            for q in qubits
+        )
+        for _ in range(20)
+    )
+    circuit += cirq.Moment(cirq.CZ(*qubits[:2]) ** 1e-9, cirq.measure(*qubits[2:]))
+    context = cirq.TransformerContext(deep=True)
+    expected = cirq.drop_negligible_operations(circuit, context=context, atol=1e-6)
+    actual = cirq.ColumnarCircuit(circuit).drop_negligible(atol=1e-6).to_circuit()
+    assert actual == expected
+    assert cirq.drop_negligible_operations(circuit, atol=1e-6) == expected
+
+
+def test_drop_negligible_tags_to_ignore() -> None:
+    columnar = cirq.ColumnarCircuit(_mixed_circuit())
+    assert columnar.drop_negligible(atol=1e-20) is columnar
+    kept = columnar.drop_negligible(tags_to_ignore=['keep']).to_circuit()
+    a, b, c = cirq.LineQubit.range(3)
+    assert cirq.X(c).with_tags('keep') in kept.all_operations()
+    assert cirq.Z(c) ** 1e-10 not in kept.all_operations()
+    assert len(kept) == 5
+    dropped = columnar.map_kinds(
+        lambda k: None if isinstance(k, cirq.Operation) and 'keep' in k.tags else k
+    )
+    assert cirq.X(c).with_tags('keep') not in dropped.to_circuit().all_operations()
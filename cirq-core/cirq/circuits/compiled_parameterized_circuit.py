@@ -0,0 +1,194 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A parameterized circuit prepared for fast resolution over many sweep points."""
+
+from __future__ import annotations
+
+import numbers
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, TYPE_CHECKING, TypeVar
+
+import sympy
+
+from cirq import protocols, study
+from cirq._compat import proper_repr
+from cirq.circuits.circuit import AbstractCircuit
+from cirq.circuits.moment import Moment
+from cirq.study.resolver import _to_param_value
+
+if TYPE_CHECKING:
+    import cirq
+
+CIRCUIT_TYPE = TypeVar('CIRCUIT_TYPE', bound=AbstractCircuit)
+
+
+class CompiledParameterizedCircuit(Generic[CIRCUIT_TYPE]):
+    """A parameterized circuit prepared once for resolution at many parameter values.
+
+    `cirq.resolve_parameters` walks every moment and operation of a circuit and
+    evaluates every sympy expression through `cirq.ParamResolver.value_of` each
+    time it is called. When the same circuit is resolved at every point of a
+    large sweep, most of that work is repeated. This class does it once:
+
+    * the parameterized operations are located up front, so that resolving
+      only touches those operations and reuses every other moment as is, and
+    * the sympy expressions used by those operations are lambdified into a
+      single NumPy function of the sweep keys, so that each point evaluates
+      all of them in one call instead of walking the expression trees.
+
+    Example:
+        >>> q = cirq.LineQubit(0)
+        >>> t = sympy.Symbol('t')
+        >>> circuit = cirq.Circuit(cirq.X(q) ** (2 * t), cirq.measure(q))
+        >>> compiled = cirq.CompiledParameterizedCircuit(circuit)
+        >>> print(compiled.resolve({'t': 0.25}))
+        0: ───X^0.5───M───
+    """
+
+    def __init__(self, circuit: CIRCUIT_TYPE, keys: Iterable[cirq.TParamKey] | None = None) -> None:
+        """Compiles the circuit.
+
+        Args:
+            circuit: The parameterized circuit.
+            keys: The parameters that will be assigned by each resolver, for
+                example `sweep.keys`. Defaults to all parameters of the
+                circuit. Expressions depending on other parameters are
+                resolved through the resolver as usual.
+        """
+        self._circuit = circuit
+        self._moments = tuple(circuit.moments)
+        self._slots = {
+            i: [j for j, op in enumerate(moment.operations) if protocols.is_parameterized(op)]
+            for i, moment in enumerate(self._moments)
+            if protocols.is_parameterized(moment)
+        }
+        self._parameterized_tags = any(protocols.is_parameterized(tag) for tag in circuit.tags)
+
+        if keys is None:
+            keys = sorted(protocols.parameter_names(circuit))
+        self._symbols = tuple(sympy.Symbol(k) if isinstance(k, str) else k for k in keys)
+        recorder = _ExpressionRecorder()
+        for i, op_indices in self._slots.items():
+            for j in op_indices:
+                try:
+                    protocols.resolve_parameters(self._moments[i].operations[j], recorder)
+                except (TypeError, ValueError, ZeroDivisionError):  # pragma: no cover
+                    # Operations whose resolution needs real values are resolved as usual.
+                    pass
+        free_symbols = set(self._symbols)
+        self._expressions = tuple(e for e in recorder.expressions if e.free_symbols <= free_symbols)
+        self._evaluate: Callable[..., list[Any]] | None = (
+            sympy.lambdify(self._symbols, list(self._expressions), modules='numpy')
+            if self._expressions
+            else None
+        )
+
+    @property
+    def circuit(self) -> CIRCUIT_TYPE:
+        """The original, unresolved circuit."""
+        return self._circuit
+
+    @property
+    def keys(self) -> tuple[sympy.Symbol, ...]:
+        """The parameters whose expressions are precomputed for each resolver."""
+        return self._symbols
+
+    def resolve(self, param_resolver: cirq.ParamResolverOrSimilarType) -> CIRCUIT_TYPE:
+        """Resolves the circuit with the given resolver.
+
+        This gives the same result as `cirq.resolve_parameters(circuit, resolver)`,
+        up to floating point rounding in the evaluation of expressions.
+
+        Args:
+            param_resolver: The resolver to resolve the circuit with.
+
+        Returns:
+            The resolved circuit. Moments without parameterized operations are
+            shared with the original circuit.
+        """
+        resolver = study.ParamResolver(param_resolver)
+        if not resolver:
+            return self._circuit
+        if self._evaluate is not None:
+            args = [resolver.value_of(symbol) for symbol in self._symbols]
+            if all(isinstance(arg, numbers.Number) for arg in args):
+                values = self._evaluate(*args)
+                resolver = _PrecomputedParamResolver(
+                    resolver.param_dict,
+                    {e: _to_param_value(v) for e, v in zip(self._expressions, values)},
+                )
+
+        moments = list(self._moments)
+        for i, op_indices in self._slots.items():
+            operations = list(moments[i].operations)
+            for j in op_indices:
+                operations[j] = protocols.resolve_parameters(operations[j], resolver)
+            moments[i] = Moment.from_ops(*operations, tags=moments[i].tags)
+        tags = self._circuit.tags
+        if self._parameterized_tags:
+            tags = tuple(protocols.resolve_parameters(tag, resolver) for tag in tags)
+        return self._circuit._from_moments(moments, tags)
+
+    def __repr__(self) -> str:
+        keys = ', '.join(proper_repr(symbol) for symbol in self._symbols)
+        return f'cirq.CompiledParameterizedCircuit({self._circuit!r}, keys=[{keys}])'
+
+
+class _ExpressionRecorder(study.ParamResolver):
+    """Records the compound expressions an object asks to resolve.
+
+    All values resolve to zero: the recorder is only used to find out which
+    expressions will be evaluated, not to produce a resolved object.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.expressions: dict[sympy.Basic, None] = {}
+
+    def __bool__(self) -> bool:
+        return True
+
+    def value_of(
+        self, value: cirq.TParamKey | cirq.TParamValComplex, recursive: bool = True
+    ) -> cirq.TParamValComplex:
+        if isinstance(value, sympy.Basic) and not isinstance(value, sympy.Symbol):
+            if value.free_symbols:
+                self.expressions[value] = None
+        return 0.0
+
+
+class _PrecomputedParamResolver(study.ParamResolver):
+    """A resolver that looks up precomputed values of known expressions."""
+
+    def __new__(cls, *args, **kwargs):
+        # Unlike `ParamResolver`, never return an existing resolver unchanged.
+        return object.__new__(cls)
+
+    def __init__(
+        self,
+        param_dict: cirq.ParamMappingType,
+        expression_values: dict[sympy.Basic, float | complex],
+    ) -> None:
+        super().__init__(dict(param_dict))
+        self._expression_values = expression_values
+
+    def value_of(
+        self, value: cirq.TParamKey | cirq.TParamValComplex, recursive: bool = True
+    ) -> cirq.TParamValComplex:
+        if isinstance(value, sympy.Basic) and not isinstance(value, sympy.Symbol):
+            precomputed = self._expression_values.get(value)
+            if precomputed is not None:
+                return precomputed
+        return super().value_of(value, recursive)
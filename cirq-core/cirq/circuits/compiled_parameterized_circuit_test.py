@@ -0,0 +1,110 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+a, b = sympy.symbols('a b')
+
+
+def _circuit() -> cirq.Circuit:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    return cirq.Circuit.from_moments(
+        cirq.H.on_each(q0, q1, q2),
+        [
+            cirq.rx(2 * a + b).on(q0),
+            cirq.Z(q1) ** (a / 2),
+            cirq.PhasedXZGate(x_exponent=a, z_exponent=b**2, axis_phase_exponent=0.25).on(q2),
+        ],
+        cirq.CZ(q0, q1),
+        cirq.Moment(cirq.X(q1) ** b).with_tags('tagged'),
+        cirq.measure(q0, q1, q2, key='m'),
+    )
+
+
+@pytest.mark.parametrize('circuit_type', [cirq.Circuit, cirq.FrozenCircuit])
+def test_resolve_matches_resolve_parameters(circuit_type) -> None:
+    circuit = circuit_type(_circuit())
+    compiled = cirq.CompiledParameterizedCircuit(circuit)
+    assert compiled.circuit is circuit
+    assert compiled.keys == (a, b)
+    for resolver in cirq.to_resolvers(cirq.Linspace(a, -1, 1, 3) * cirq.Points('b', [0.5, 2])):
+        resolved = compiled.resolve(resolver)
+        assert isinstance(resolved, circuit_type)
+        assert not cirq.is_parameterized(resolved)
+        assert cirq.approx_eq(resolved, cirq.resolve_parameters(circuit, resolver))
+
+
+def test_resolve_reuses_unparameterized_moments() -> None:
+    circuit = _circuit()
+    resolved = cirq.CompiledParameterizedCircuit(circuit).resolve({'a': 0.1, 'b': 0.2})
+    assert resolved[0] is circuit[0]
+    assert resolved[-1] is circuit[-1]
+    assert resolved[1] is not circuit[1]
+    assert resolved[2] is circuit[2]
+    assert resolved[3].tags == ('tagged',)
+
+
+def test_expressions_are_precomputed() -> None:
+    compiled = cirq.CompiledParameterizedCircuit(_circuit())
+    assert set(compiled._expressions) == {(2 * a + b) / sympy.pi, a / 2, b**2}
+    resolved = compiled.resolve({'a': 0.5, 'b': 3})
+    np.testing.assert_allclose(cast(cirq.Rx, resolved[1].operations[0].gate)._rads, 4.0)
+    assert cast(cirq.PhasedXZGate, resolved[1].operations[2].gate).z_exponent == 9
+
+
+def test_partial_keys_and_unresolved_parameters() -> None:
+    compiled = cirq.CompiledParameterizedCircuit(_circuit(), keys=['a'])
+    assert compiled.keys == (a,)
+    # Expressions with parameters outside the keys are resolved as usual.
+    assert set(compiled._expressions) == {a / 2}
+    resolved = compiled.resolve({'a': 1, 'b': 0})
+    assert cirq.approx_eq(resolved, cirq.resolve_parameters(_circuit(), {'a': 1, 'b': 0}))
+
+    partial = cirq.CompiledParameterizedCircuit(_circuit()).resolve({'a': 1})
+    assert cirq.parameter_names(partial) == {'b'}
+    assert compiled.resolve({}) is compiled.circuit
+
+
+def test_complex_and_chained_values() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.GlobalPhaseGate(sympy.exp(sympy.I * a)).on())
+    compiled = cirq.CompiledParameterizedCircuit(circuit)
+    resolved = compiled.resolve({'a': np.pi / 2})
+    gate = cast(cirq.GlobalPhaseGate, resolved[0].operations[0].gate)
+    np.testing.assert_allclose(gate.coefficient, 1j, atol=1e-12)
+
+    circuit = cirq.Circuit(cirq.X(q) ** (a + 1))
+    resolved = cirq.CompiledParameterizedCircuit(circuit).resolve({'a': 'b', 'b': 0.5})
+    assert cirq.approx_eq(resolved, cirq.Circuit(cirq.X(q) ** 1.5))
+
+
+def test_parameterized_circuit_tags() -> None:
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)) ** a).with_tags(a, 'x')
+    resolved = cirq.CompiledParameterizedCircuit(circuit).resolve({'a': 0.5})
+    assert resolved.tags == (0.5, 'x')
+
+
+def test_repr() -> None:
+    compiled = cirq.CompiledParameterizedCircuit(cirq.Circuit(), keys=['a'])
+    assert repr(compiled) == (
+        'cirq.CompiledParameterizedCircuit(cirq.Circuit(), keys=[sympy.Symbol(\'a\')])'
+    )
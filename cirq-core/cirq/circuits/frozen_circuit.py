@@ -23,7 +23,9 @@ from typing import TYPE_CHECKING
 
 from cirq import _compat, protocols
 from cirq.circuits import AbstractCircuit, Alignment, Circuit
+from cirq.circuits.circuit import _QubitTimeline
 from cirq.circuits.insert_strategy import InsertStrategy
+from cirq.circuits.moment import _structural_hash
 
 if TYPE_CHECKING:
     import numpy as np
@@ -64,6 +66,7 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         base = Circuit(contents, strategy=strategy)
         self._moments = tuple(base.moments)
         self._tags = tuple(tags)
+        self._qubit_timeline_index: _QubitTimeline | None = None
 
     @classmethod
     def _from_moments(
@@ -99,6 +102,7 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
             return self
         new_circuit = FrozenCircuit(tags=self.tags + new_tags)
         new_circuit._moments = self._moments
+        new_circuit._qubit_timeline_index = self.__dict__.get('_qubit_timeline_index')
         return new_circuit
 
     @_compat.cached_method
@@ -106,6 +110,29 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         # Explicitly cached for performance
         return hash((self.moments, self.tags))
 
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenCircuit) and _compat._cached_hashes_differ(self, other):
+            return False
+        return super().__eq__(other)
+
+    @_compat.cached_method
+    def structural_hash(self) -> int:
+        """Returns a 128-bit hash of the circuit that is the same in every process.
+
+        Unlike `hash`, this can key caches shared between processes. It is a
+        digest of the `cirq.Moment.structural_hash` of each moment and the
+        repr of the tags, and is computed once per circuit. A
+        `cirq.CircuitOperation` contributes the structural hash of its
+        circuit, so shared subcircuits are only hashed once.
+        Equal circuits whose operations are written differently can have
+        different structural hashes, and operations or tags without a
+        deterministic repr make the hash differ between processes, as
+        described in `cirq.Moment.structural_hash`.
+        """
+        return _structural_hash(
+            'FrozenCircuit', *(m.structural_hash() for m in self._moments), repr(self._tags)
+        )
+
     def __getstate__(self):
         # Don't save hash when pickling; see #3777.
         state = self.__dict__
@@ -113,8 +140,17 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         if hash_attr in state:
             state = state.copy()
             del state[hash_attr]
+        if state.get('_qubit_timeline_index') is not None:
+            state = {**state, '_qubit_timeline_index': None}
         return state
 
+    def _qubit_timeline(self, build: bool = True) -> _QubitTimeline | None:
+        # Unpickled circuits may predate the index attribute.
+        timeline = self.__dict__.get('_qubit_timeline_index')
+        if timeline is None and build:
+            timeline = self._qubit_timeline_index = _QubitTimeline(self._moments)
+        return timeline
+
     @_compat.cached_method
     def _num_qubits_(self) -> int:
         return len(self.all_qubits())
@@ -18,6 +18,8 @@ Behavior shared with Circuit is tested with parameters in circuit_test.py.
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 import sympy
 
@@ -142,3 +144,53 @@ def test_tagged_circuits() -> None:
     assert (
         circuit2.concat_ragged(tagged_circuit).tags == ()
     )  # We only preserve the tags for the first one
+
+
+def test_equality_short_circuits_on_cached_hashes(monkeypatch) -> None:
+    a, b = cirq.LineQubit.range(2)
+    c1 = cirq.FrozenCircuit([cirq.X(a), cirq.CZ(a, b)] * 10)
+    c2 = cirq.FrozenCircuit([cirq.X(a), cirq.CZ(a, b)] * 9, cirq.X(a), cirq.CZ(b, a) ** 0.5)
+    assert c1 != c2
+    assert c1 == c1.unfreeze()
+    _ = hash(c1), hash(c2)
+    monkeypatch.setattr(cirq.Moment, '__eq__', None)
+    assert c1 != c2
+    assert not c1.__eq__(c2)
+
+
+def test_structural_hash() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.FrozenCircuit(cirq.X(a), cirq.CZ(a, b), tags=('t',))
+    assert circuit.structural_hash() == 0xF85B1C326477C8564DDD9DBAB631053B
+    assert (
+        circuit.structural_hash()
+        == cirq.FrozenCircuit(circuit.moments, tags=('t',)).structural_hash()
+    )
+    assert circuit.structural_hash() != circuit.untagged.structural_hash()
+    assert (
+        circuit.structural_hash()
+        != cirq.FrozenCircuit(cirq.X(a), cirq.CZ(a, b) ** 0.5).structural_hash()
+    )
+
+    def circuit_op_hash(op: cirq.Operation) -> int:
+        return cirq.FrozenCircuit(op).structural_hash()
+
+    op = cirq.CircuitOperation(circuit)
+    assert circuit_op_hash(op) == circuit_op_hash(
+        cirq.CircuitOperation(circuit.unfreeze().freeze())
+    )
+    assert (
+        len(
+            {
+                circuit_op_hash(op),
+                circuit_op_hash(op.repeat(2)),
+                circuit_op_hash(op.with_tags('u')),
+                circuit_op_hash(op.with_qubit_mapping({a: b, b: a})),
+                circuit_op_hash(cirq.CircuitOperation(circuit.untagged)),
+            }
+        )
+        == 5
+    )
+
+    unpickled = pickle.loads(pickle.dumps(circuit))
+    assert unpickled.structural_hash() == circuit.structural_hash()
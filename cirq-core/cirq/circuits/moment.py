@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
 from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence, Set
 from functools import cached_property
@@ -39,6 +40,27 @@ text_diagram_drawer = LazyLoader(
 )
 
 
+def _structural_hash(*parts: str | int) -> int:
+    """Returns a 128-bit digest of 128-bit integers and strings."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.to_bytes(16, 'big') if isinstance(part, int) else part.encode()
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return int.from_bytes(digest.digest(), 'big')
+
+
+def _operation_structural_hash(op: cirq.Operation) -> int:
+    """Returns the structural hash of an operation, reusing that of a wrapped subcircuit."""
+    untagged = op.untagged
+    structural_hash = getattr(untagged, '_structural_hash_', None)
+    if structural_hash is None:
+        return _structural_hash(repr(op))
+    if untagged is op:
+        return structural_hash()
+    return _structural_hash(structural_hash(), repr(op.tags))
+
+
 def _default_breakdown(qid: cirq.Qid) -> tuple[Any, Any]:
     # Attempt to convert into a position on the complex plane.
     try:
@@ -379,7 +401,11 @@ class Moment:
         if not isinstance(other, type(self)):
             return NotImplemented
 
-        return self is other or self._sorted_operations_() == other._sorted_operations_()
+        if self is other:
+            return True
+        if _compat._cached_hashes_differ(self, other):
+            return False
+        return self._sorted_operations_() == other._sorted_operations_()
 
     def _approx_eq_(self, other: Any, atol: float) -> bool:
         """See `cirq.protocols.SupportsApproximateEquality`."""
@@ -397,6 +423,29 @@ class Moment:
     def __hash__(self):
         return hash((Moment, self._sorted_operations_()))
 
+    @_compat.cached_method
+    def structural_hash(self) -> int:
+        """Returns a 128-bit hash of the moment that is the same in every process.
+
+        Python salts the hashes of strings per process, so `hash` cannot key
+        caches that outlive a process. This hash is instead a digest of the
+        reprs of the operations and tags. It is computed once per moment and
+        reused by `cirq.FrozenCircuit.structural_hash`.
+
+        Equal moments written differently, such as with `cirq.CZ(a, b)` and
+        `cirq.CZ(b, a)`, can have different structural hashes. Moments that
+        differ only in their tags are equal, but have different structural
+        hashes. The hash is only the same across processes for operations and
+        tags whose repr is: objects using the default `object.__repr__`
+        include their memory address in it, so they hash differently in
+        every process.
+        """
+        return _structural_hash(
+            'Moment',
+            *(_operation_structural_hash(op) for op in self._sorted_operations_()),
+            repr(self._tags),
+        )
+
     def __getstate__(self) -> dict[str, Any]:
         # clear cached hash value when pickling, see #6674
         state = self.__dict__
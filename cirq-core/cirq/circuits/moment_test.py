@@ -71,6 +71,31 @@ def test_equality() -> None:
     eq.make_equality_group(lambda: cirq.Moment([cirq.CZ(a, c), cirq.CZ(b, d)]))
 
 
+def test_equality_short_circuits_on_cached_hashes(monkeypatch) -> None:
+    a, b = cirq.LineQubit.range(2)
+    m1 = cirq.Moment(cirq.X(a), cirq.Y(b))
+    m2 = cirq.Moment(cirq.X(a), cirq.Z(b))
+    assert m1 != m2
+    _ = hash(m1), hash(m2)
+    monkeypatch.setattr(cirq.Moment, '_sorted_operations_', None)
+    assert m1 != m2
+
+
+def test_structural_hash() -> None:
+    a, b = cirq.LineQubit.range(2)
+    moment = cirq.Moment(cirq.X(a), cirq.CZ(a + 2, b + 2))
+    assert (
+        moment.structural_hash() == cirq.Moment(cirq.CZ(a + 2, b + 2), cirq.X(a)).structural_hash()
+    )
+    assert moment.structural_hash() == 0x199FABE196A307851683263EF045A5E2
+    assert 0 <= moment.structural_hash() < 1 << 128
+    assert moment.structural_hash() != cirq.Moment(cirq.X(a)).structural_hash()
+    assert moment.structural_hash() != moment.with_tags('t').structural_hash()
+    assert cirq.Moment(cirq.X(a).with_tags('t')).structural_hash() != (
+        cirq.Moment(cirq.X(a)).structural_hash()
+    )
+
+
 def test_approx_eq() -> None:
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
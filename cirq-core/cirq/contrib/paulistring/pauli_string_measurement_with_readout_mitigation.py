@@ -16,7 +16,6 @@
 
 from __future__ import annotations
 
-import itertools
 import time
 from collections.abc import Sequence
 from typing import cast, TYPE_CHECKING
@@ -70,28 +69,6 @@ class CircuitToPauliStringsMeasurementResult:
     results: list[PauliStringMeasurementResult]
 
 
-def _commute_or_identity(
-    op1: ops.Pauli | ops.IdentityGate, op2: ops.Pauli | ops.IdentityGate
-) -> bool:
-    if op1 == ops.I or op2 == ops.I:
-        return True
-    return op1 == op2
-
-
-def _are_two_pauli_strings_qubit_wise_commuting(
-    pauli_str1: ops.PauliString,
-    pauli_str2: ops.PauliString,
-    all_qubits: list[ops.Qid] | frozenset[ops.Qid],
-) -> bool:
-    for qubit in all_qubits:
-        op1 = pauli_str1.get(qubit, default=ops.I)
-        op2 = pauli_str2.get(qubit, default=ops.I)
-
-        if not _commute_or_identity(op1, op2):
-            return False
-    return True
-
-
 def _validate_group_paulis_qwc(
     pauli_strs: list[ops.PauliString], all_qubits: list[ops.Qid] | frozenset[ops.Qid]
 ):
@@ -107,10 +84,13 @@ def _validate_group_paulis_qwc(
     """
     if len(pauli_strs) <= 1:
         return True
-    for p1, p2 in itertools.combinations(pauli_strs, 2):
-        if not _are_two_pauli_strings_qubit_wise_commuting(p1, p2, all_qubits):
-            return False
-    return True
+    qubits = list(all_qubits)
+    qubit_set = set(qubits)
+    paulis = ops.DensePauliStringBatch.from_pauli_strings(
+        (ops.PauliString({q: p for q, p in ps.items() if q in qubit_set}) for ps in pauli_strs),
+        qubits,
+    )
+    return bool(np.all(paulis.qubit_wise_commutes()))
 
 
 def _validate_single_pauli_string(pauli_str: ops.PauliString):
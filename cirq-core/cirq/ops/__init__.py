@@ -28,6 +28,8 @@ from cirq.ops.dense_pauli_string import (
     MutableDensePauliString as MutableDensePauliString,
 )
 
+from cirq.ops.dense_pauli_string_batch import DensePauliStringBatch as DensePauliStringBatch
+
 from cirq.ops.boolean_hamiltonian import BooleanHamiltonianGate as BooleanHamiltonianGate
 
 from cirq.ops.common_channels import (
@@ -123,6 +125,8 @@ from cirq.ops.linear_combinations import (
 
 from cirq.ops.mixed_unitary_channel import MixedUnitaryChannel as MixedUnitaryChannel
 
+from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum as SymplecticPauliSum
+
 from cirq.ops.pauli_sum_exponential import PauliSumExponential as PauliSumExponential
 
 from cirq.ops.pauli_measurement_gate import PauliMeasurementGate as PauliMeasurementGate
@@ -0,0 +1,296 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Many dense Pauli strings stored as one mask array."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload, TYPE_CHECKING
+
+import numpy as np
+import sympy
+
+from cirq import value
+from cirq._compat import proper_repr
+from cirq.ops import pauli_string
+from cirq.ops.dense_pauli_string import _as_pauli_mask, DensePauliString
+from cirq.ops.symplectic_pauli_sum import _I_POWERS
+
+if TYPE_CHECKING:
+    import cirq
+
+
+# Upper bound on the number of (string, string, qubit) entries materialized at once when
+# building a product table.
+_PRODUCT_CHUNK = 1 << 22
+
+
+@value.value_equality(approximate=True, unhashable=True)
+class DensePauliStringBatch:
+    """A batch of dense Pauli strings of equal length.
+
+    Row `k` of `pauli_masks` is the `pauli_mask` of a `cirq.DensePauliString`
+    (I=0, X=1, Y=2, Z=3) whose coefficient is `coefficients[k]`. Pairwise
+    commutation matrices, product tables and weight histograms of all strings
+    are computed with a handful of NumPy calls instead of one Python call per
+    pair. Coefficients must be numbers.
+
+    >>> batch = cirq.DensePauliStringBatch(['XX', 'ZZ', 'ZI'])
+    >>> batch.commutes()
+    array([[ True,  True, False],
+           [ True,  True,  True],
+           [False,  True,  True]])
+    >>> batch.qubit_wise_commutes()
+    array([[ True, False, False],
+           [False,  True,  True],
+           [False,  True,  True]])
+    >>> print(batch.products(batch[:1]))
+    +II
+    -YY
+    1j*YX
+    """
+
+    def __init__(
+        self,
+        pauli_masks: Iterable[Iterable[cirq.PAULI_GATE_LIKE]] | np.ndarray,
+        *,
+        coefficients: np.ndarray | Sequence[complex] | None = None,
+    ) -> None:
+        """Initializes the batch.
+
+        Args:
+            pauli_masks: A `(num_strings, num_qubits)` array of Pauli indices,
+                or one specification per string in any form accepted by
+                `cirq.DensePauliString`, such as "IXYZ".
+            coefficients: The coefficient of each string. Defaults to 1.
+
+        Raises:
+            ValueError: If the strings have different lengths or the number of
+                coefficients does not match the number of strings.
+        """
+        if isinstance(pauli_masks, np.ndarray):
+            masks = np.asarray(pauli_masks, dtype=np.uint8)
+        else:
+            rows = [_as_pauli_mask(mask) for mask in pauli_masks]
+            if len({len(row) for row in rows}) > 1:
+                raise ValueError('All Pauli strings of a batch must have the same length.')
+            masks = np.array(rows, dtype=np.uint8).reshape(len(rows), -1 if rows else 0)
+        if masks.ndim != 2:
+            raise ValueError(f'Expected a 2-dimensional pauli mask array, got shape {masks.shape}.')
+        if coefficients is None:
+            coefficients = np.ones(len(masks), dtype=np.complex128)
+        self._pauli_masks = masks
+        self._pauli_masks.flags.writeable = False
+        self._coefficients = np.asarray(coefficients, dtype=np.complex128)
+        if self._coefficients.shape != (len(masks),):
+            raise ValueError(
+                f'Expected {len(masks)} coefficients, got shape {self._coefficients.shape}.'
+            )
+
+    @classmethod
+    def from_dense_pauli_strings(
+        cls, strings: Iterable[cirq.BaseDensePauliString]
+    ) -> DensePauliStringBatch:
+        """Stacks dense Pauli strings, padding shorter ones with identities.
+
+        Raises:
+            TypeError: If a coefficient is symbolic.
+        """
+        strings = list(strings)
+        if any(isinstance(s.coefficient, sympy.Basic) for s in strings):
+            raise TypeError('DensePauliStringBatch does not support symbolic coefficients.')
+        masks = np.zeros((len(strings), max((len(s) for s in strings), default=0)), np.uint8)
+        for row, s in zip(masks, strings):
+            row[: len(s)] = s.pauli_mask
+        return cls(masks, coefficients=[complex(s.coefficient) for s in strings])
+
+    @classmethod
+    def from_pauli_strings(
+        cls, pauli_strings: Iterable[cirq.PauliString], qubits: Sequence[cirq.Qid]
+    ) -> DensePauliStringBatch:
+        """Lays out sparse Pauli strings over the given qubits.
+
+        Args:
+            pauli_strings: The strings to convert.
+            qubits: The qubit of each column. Must include every qubit the
+                strings act on.
+
+        Raises:
+            ValueError: If a string acts on a qubit missing from `qubits`.
+            TypeError: If a coefficient is symbolic.
+        """
+        pauli_strings = list(pauli_strings)
+        if any(isinstance(ps.coefficient, sympy.Basic) for ps in pauli_strings):
+            raise TypeError('DensePauliStringBatch does not support symbolic coefficients.')
+        index = {q: i for i, q in enumerate(qubits)}
+        to_index = pauli_string.PAULI_GATE_LIKE_TO_INDEX_MAP
+        masks = np.zeros((len(pauli_strings), len(index)), dtype=np.uint8)
+        for row, ps in zip(masks, pauli_strings):
+            for q, pauli in ps.items():
+                if q not in index:
+                    raise ValueError(f'Qubit {q} of {ps} is not in {qubits}.')
+                row[index[q]] = to_index[pauli]
+        return cls(masks, coefficients=[complex(ps.coefficient) for ps in pauli_strings])
+
+    @property
+    def pauli_masks(self) -> np.ndarray:
+        """A read-only `(num_strings, num_qubits)` uint8 array of Pauli indices."""
+        return self._pauli_masks
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """The complex coefficient of each string."""
+        return self._coefficients
+
+    @property
+    def num_qubits(self) -> int:
+        """The length of every string in the batch."""
+        return self._pauli_masks.shape[1]
+
+    def weights(self) -> np.ndarray:
+        """The number of non-identity Paulis in each string."""
+        return np.count_nonzero(self._pauli_masks, axis=1)
+
+    def weight_histogram(self) -> np.ndarray:
+        """Entry `w` counts the strings with exactly `w` non-identity Paulis."""
+        return np.bincount(self.weights(), minlength=self.num_qubits + 1)
+
+    def commutes(self, other: DensePauliStringBatch | None = None) -> np.ndarray:
+        """Returns whether each string commutes with each string of `other`.
+
+        Args:
+            other: The strings to compare against. Defaults to this batch.
+                Shorter strings are padded with identities.
+
+        Returns:
+            A `(len(self), len(other))` boolean array.
+        """
+        return self._anticommuting_sites(other) % 2 == 0
+
+    def qubit_wise_commutes(self, other: DensePauliStringBatch | None = None) -> np.ndarray:
+        """Returns whether each pair of strings commutes on every single qubit.
+
+        Qubit-wise commuting strings can be measured together in a product
+        basis.
+
+        Args:
+            other: The strings to compare against. Defaults to this batch.
+                Shorter strings are padded with identities.
+
+        Returns:
+            A `(len(self), len(other))` boolean array.
+        """
+        return self._anticommuting_sites(other) == 0
+
+    def products(self, other: DensePauliStringBatch | None = None) -> DensePauliStringBatch:
+        """Multiplies every string of this batch with every string of `other`.
+
+        Args:
+            other: The right hand factors. Defaults to this batch. Shorter
+                strings are padded with identities.
+
+        Returns:
+            A batch whose entry `i * len(other) + j` is `self[i] * other[j]`.
+        """
+        a, b = self._aligned(other)
+        num_qubits = a.shape[1]
+        masks = np.empty((len(a), len(b), num_qubits), dtype=np.uint8)
+        exponents = np.empty((len(a), len(b)), dtype=np.int64)
+        chunk = max(1, _PRODUCT_CHUNK // max(1, len(b) * num_qubits))
+        for start in range(0, len(a), chunk):
+            lhs = a[start : start + chunk, np.newaxis, :]
+            rhs = b[np.newaxis, :, :]
+            np.bitwise_xor(lhs, rhs, out=masks[start : start + chunk])
+            exponents[start : start + chunk] = _mul_phase_exponents(lhs, rhs)
+        other_coefficients = self._coefficients if other is None else other._coefficients
+        coefficients = np.outer(self._coefficients, other_coefficients) * _I_POWERS[exponents % 4]
+        return DensePauliStringBatch(
+            masks.reshape(-1, num_qubits), coefficients=coefficients.reshape(-1)
+        )
+
+    def _aligned(self, other: DensePauliStringBatch | None) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the masks of both batches, padded with identities to a common length."""
+        if other is None:
+            return self._pauli_masks, self._pauli_masks
+        num_qubits = max(self.num_qubits, other.num_qubits)
+
+        def pad(masks: np.ndarray) -> np.ndarray:
+            return np.pad(masks, ((0, 0), (0, num_qubits - masks.shape[1])))
+
+        return pad(self._pauli_masks), pad(other._pauli_masks)
+
+    def _anticommuting_sites(self, other: DensePauliStringBatch | None) -> np.ndarray:
+        """Counts the qubits on which each pair of strings has anticommuting Paulis.
+
+        Two single-qubit Paulis anticommute when both are non-identity and they
+        differ, so the counts for all pairs are the number of sites where both
+        strings are non-identity minus the number where they hold the same
+        Pauli. Both are matrix products of one-hot encodings.
+        """
+        a, b = self._aligned(other)
+        # float32 matrix products are exact for counts below 2**24.
+        a_paulis = (a[:, :, np.newaxis] == np.arange(1, 4)).reshape(len(a), 3 * a.shape[1])
+        b_paulis = (b[:, :, np.newaxis] == np.arange(1, 4)).reshape(len(b), 3 * b.shape[1])
+        a_support = (a != 0).astype(np.float32)
+        b_support = (b != 0).astype(np.float32)
+        both = a_support @ b_support.T
+        same = a_paulis.astype(np.float32) @ b_paulis.astype(np.float32).T
+        return (both - same).astype(np.int64)
+
+    def _value_equality_values_(self) -> Any:
+        return tuple(self)
+
+    def __len__(self) -> int:
+        return len(self._coefficients)
+
+    @overload
+    def __getitem__(self, item: int) -> DensePauliString:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice | np.ndarray) -> DensePauliStringBatch:
+        pass
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return DensePauliString(self._pauli_masks[item], coefficient=self._coefficients[item])
+        return DensePauliStringBatch(self._pauli_masks[item], coefficients=self._coefficients[item])
+
+    def __iter__(self) -> Iterator[DensePauliString]:
+        for k in range(len(self)):
+            yield self[k]
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.DensePauliStringBatch({proper_repr(self._pauli_masks)}, '
+            f'coefficients={proper_repr(self._coefficients)})'
+        )
+
+    def __str__(self) -> str:
+        return '\n'.join(str(s) for s in self)
+
+
+def _mul_phase_exponents(lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Returns the exponents of i picked up by multiplying broadcast pauli masks.
+
+    The per-qubit exponents follow `dense_pauli_string._vectorized_pauli_mul_phase`
+    and are summed over the last axis.
+    """
+    t = (rhs * (lhs != 0)).astype(np.int8)
+    t -= lhs * (rhs != 0)
+    t += 1
+    t %= 3
+    t -= 1
+    return np.asarray(np.sum(t, axis=-1, dtype=np.int64))
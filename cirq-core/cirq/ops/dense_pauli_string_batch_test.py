@@ -0,0 +1,119 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.ops import dense_pauli_string_batch
+
+
+def _random_batch(num_strings: int, num_qubits: int, seed: int) -> cirq.DensePauliStringBatch:
+    prng = np.random.RandomState(seed)
+    return cirq.DensePauliStringBatch(
+        prng.randint(4, size=(num_strings, num_qubits)),
+        coefficients=prng.randn(num_strings) + 1j * prng.randn(num_strings),
+    )
+
+
+def _qubit_wise_commutes(a: cirq.DensePauliString, b: cirq.DensePauliString) -> bool:
+    return all(p == 0 or q == 0 or p == q for p, q in zip(a.pauli_mask, b.pauli_mask))
+
+
+def test_construction() -> None:
+    batch = cirq.DensePauliStringBatch(['XYZI', 'IIIZ'], coefficients=[2, -1])
+    np.testing.assert_array_equal(batch.pauli_masks, [[1, 2, 3, 0], [0, 0, 0, 3]])
+    assert batch.num_qubits == 4
+    assert len(batch) == 2
+    assert batch[0] == cirq.DensePauliString('XYZI', coefficient=2)
+    assert list(batch) == [
+        cirq.DensePauliString('XYZI', coefficient=2),
+        cirq.DensePauliString('IIIZ', coefficient=-1),
+    ]
+    assert batch[1:] == cirq.DensePauliStringBatch(['IIIZ'], coefficients=[-1])
+    assert str(batch) == '(2+0j)*XYZI\n-IIIZ'
+    cirq.testing.assert_equivalent_repr(batch)
+    with pytest.raises(ValueError):
+        batch.pauli_masks[0, 0] = 2
+    empty = cirq.DensePauliStringBatch([])
+    assert len(empty) == 0
+    assert empty.commutes().shape == empty.qubit_wise_commutes().shape == (0, 0)
+
+
+def test_conversions() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    batch = cirq.DensePauliStringBatch.from_pauli_strings(
+        [2 * cirq.X(a) * cirq.Z(c), cirq.Y(b)], [a, b, c]
+    )
+    assert batch == cirq.DensePauliStringBatch(['XIZ', 'IYI'], coefficients=[2, 1])
+    assert batch == cirq.DensePauliStringBatch.from_dense_pauli_strings(
+        [cirq.DensePauliString('XIZ', coefficient=2), cirq.MutableDensePauliString('IY')]
+    )
+
+
+def test_invalid_inputs() -> None:
+    a, b = cirq.LineQubit.range(2)
+    with pytest.raises(ValueError, match='same length'):
+        _ = cirq.DensePauliStringBatch(['XX', 'X'])
+    with pytest.raises(ValueError, match='2-dimensional'):
+        _ = cirq.DensePauliStringBatch(np.zeros(3))
+    with pytest.raises(ValueError, match='coefficients'):
+        _ = cirq.DensePauliStringBatch(['X'], coefficients=[1, 2])
+    with pytest.raises(ValueError, match='not in'):
+        _ = cirq.DensePauliStringBatch.from_pauli_strings([cirq.X(a) * cirq.X(b)], [a])
+    t = sympy.Symbol('t')
+    with pytest.raises(TypeError, match='symbolic'):
+        _ = cirq.DensePauliStringBatch.from_pauli_strings(
+            [cirq.PauliString(cirq.X(a), coefficient=t)], [a]
+        )
+    with pytest.raises(TypeError, match='symbolic'):
+        _ = cirq.DensePauliStringBatch.from_dense_pauli_strings(
+            [cirq.DensePauliString('X', coefficient=t)]
+        )
+
+
+def test_commutation_matrices() -> None:
+    batch = _random_batch(40, 5, seed=1)
+    other = _random_batch(30, 3, seed=2)
+    commutes = batch.commutes(other)
+    qubit_wise_commutes = batch.qubit_wise_commutes(other)
+    assert commutes.shape == qubit_wise_commutes.shape == (40, 30)
+    for i, s in enumerate(batch):
+        for j, t in enumerate(other):
+            assert commutes[i, j] == cirq.commutes(s, t)
+            assert qubit_wise_commutes[i, j] == _qubit_wise_commutes(s, t)
+    np.testing.assert_array_equal(batch.commutes(), batch.commutes(batch))
+    np.testing.assert_array_equal(batch.qubit_wise_commutes(), batch.qubit_wise_commutes().T)
+
+
+@pytest.mark.parametrize('chunk', [1, 7, 1 << 22])
+def test_products(chunk, monkeypatch) -> None:
+    monkeypatch.setattr(dense_pauli_string_batch, '_PRODUCT_CHUNK', chunk)
+    batch = _random_batch(6, 4, seed=3)
+    other = _random_batch(5, 6, seed=4)
+    products = batch.products(other)
+    assert len(products) == 30
+    expected = [s * t for s in batch for t in other]
+    for actual, want in zip(products, expected):
+        assert cirq.approx_eq(actual, want)
+    assert cirq.approx_eq(batch.products(), batch.products(batch))
+
+
+def test_weights() -> None:
+    batch = cirq.DensePauliStringBatch(['III', 'XII', 'IYZ', 'ZZI', 'XYZ'])
+    np.testing.assert_array_equal(batch.weights(), [0, 1, 2, 2, 3])
+    np.testing.assert_array_equal(batch.weight_histogram(), [1, 1, 2, 1])
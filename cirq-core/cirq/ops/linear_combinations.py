@@ -17,7 +17,7 @@ from __future__ import annotations
 import numbers
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Set
-from typing import Any, TYPE_CHECKING, Union
+from typing import Any, Literal, overload, TYPE_CHECKING, Union
 
 import numpy as np
 import sympy
@@ -32,6 +32,7 @@ from cirq.ops.projector import ProjectorString
 from cirq.value.linear_dict import _format_terms
 
 if TYPE_CHECKING:
+    import scipy.sparse.linalg
     from scipy.sparse import csr_matrix
 
     import cirq
@@ -429,6 +430,9 @@ class PauliSum:
     def _value_equality_values_(self):
         return self._linear_dict
 
+    def _is_numeric(self) -> bool:
+        return not any(isinstance(c, sympy.Basic) for c in self._linear_dict.values())
+
     @staticmethod
     def wrap(val: PauliSumLike) -> PauliSum:
         """Convert a `cirq.PauliSumLike` object to a PauliSum
@@ -563,7 +567,21 @@ class PauliSum:
         factory = type(self)
         return factory(self._linear_dict.copy())
 
-    def matrix(self, qubits: Iterable[raw_types.Qid] | None = None) -> np.ndarray:
+    @overload
+    def matrix(
+        self, qubits: Iterable[raw_types.Qid] | None = None, *, sparse: Literal[False] = False
+    ) -> np.ndarray:
+        pass
+
+    @overload
+    def matrix(
+        self, qubits: Iterable[raw_types.Qid] | None = None, *, sparse: Literal[True]
+    ) -> csr_matrix:
+        pass
+
+    def matrix(
+        self, qubits: Iterable[raw_types.Qid] | None = None, *, sparse: bool = False
+    ) -> np.ndarray | csr_matrix:
         """Returns the matrix of this PauliSum in computational basis of qubits.
 
         Args:
@@ -572,15 +590,23 @@ class PauliSum:
                 be computed. If none is provided the default ordering of
                 `self.qubits` is used.  Qubits present in `qubits` but absent from
                 `self.qubits` are acted on by the identity.
+            sparse: If True, returns a `scipy.sparse.csr_matrix` built directly
+                from the X and Z masks of the terms, without forming any dense
+                Kronecker products. `qubits` must then include `self.qubits`.
 
         Returns:
-            np.ndarray representing the matrix of this PauliSum expression.
+            np.ndarray, or a sparse matrix if `sparse` is True, representing the
+            matrix of this PauliSum expression.
 
         Raises:
             TypeError: if any of the gates in self does not provide a unitary.
         """
 
         qubits = self.qubits if qubits is None else tuple(qubits)
+        if sparse:
+            from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum
+
+            return SymplecticPauliSum.from_pauli_sum(self).sparse_matrix(qubits)
         num_qubits = len(qubits)
         num_dim = 2**num_qubits
         result = np.zeros((num_dim, num_dim), dtype=np.complex128)
@@ -589,6 +615,24 @@ class PauliSum:
             result += coeff * op.matrix(qubits)
         return result
 
+    def linear_operator(
+        self, qubits: Iterable[raw_types.Qid] | None = None
+    ) -> scipy.sparse.linalg.LinearOperator:
+        """Returns this PauliSum as a matrix-free `scipy.sparse.linalg.LinearOperator`.
+
+        The operator can be passed to iterative solvers such as
+        `scipy.sparse.linalg.eigsh` for Hamiltonians too large to store as a
+        matrix. See `cirq.SymplecticPauliSum.linear_operator`.
+
+        Args:
+            qubits: Ordered collection of qubits that determine the basis of
+                the operator. Defaults to `self.qubits`.
+        """
+        from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum
+
+        qubits = self.qubits if qubits is None else tuple(qubits)
+        return SymplecticPauliSum.from_pauli_sum(self).linear_operator(qubits)
+
     def _has_unitary_(self) -> bool:
         return linalg.is_unitary(self.matrix())
 
@@ -670,8 +714,11 @@ class PauliSum:
                 dtype=state_vector.dtype,
                 atol=atol,
             )
-        return sum(
-            p._expectation_from_state_vector_no_validation(state_vector, qubit_map) for p in self
+        from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum
+
+        array_sum = SymplecticPauliSum.from_pauli_sum(self)
+        return float(
+            np.real(array_sum.expectation_from_state_vector(state_vector.reshape(-1), qubit_map))
         )
 
     def expectation_from_density_matrix(
@@ -733,7 +780,12 @@ class PauliSum:
                 dtype=state.dtype,
                 atol=atol,
             )
-        return sum(p._expectation_from_density_matrix_no_validation(state, qubit_map) for p in self)
+        from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum
+
+        array_sum = SymplecticPauliSum.from_pauli_sum(self)
+        return float(
+            np.real(array_sum.expectation_from_density_matrix(state.reshape(dim, dim), qubit_map))
+        )
 
     def __iter__(self):
         for vec, coeff in self._linear_dict.items():
@@ -801,6 +853,14 @@ class PauliSum:
             temp = PauliSum.from_pauli_strings([term * other for term in self])
             self._linear_dict = temp._linear_dict
         elif isinstance(other, PauliSum):
+            if self._is_numeric() and other._is_numeric():
+                from cirq.ops.symplectic_pauli_sum import SymplecticPauliSum
+
+                product = SymplecticPauliSum.from_pauli_sum(
+                    self
+                ) * SymplecticPauliSum.from_pauli_sum(other)
+                self._linear_dict = product.to_pauli_sum()._linear_dict
+                return self
             temp = PauliSum.from_pauli_strings(
                 [term * other_term for term in self for other_term in other]
             )
@@ -1078,6 +1078,51 @@ def test_pauli_sum_matrix() -> None:
     assert np.allclose(H3, paulisum.matrix([q[1], q[2], q[0]]))
 
 
+def test_pauli_sum_sparse_matrix() -> None:
+    q = cirq.LineQubit.range(4)
+    paulisum = cirq.X(q[0]) * cirq.X(q[1]) + 0.5j * cirq.Y(q[1]) * cirq.Z(q[3]) - cirq.Z(q[0]) + 2
+    for qubits in (None, q, q[::-1], [q[2], q[0], q[3], q[1], cirq.LineQubit(5)]):
+        np.testing.assert_allclose(
+            paulisum.matrix(qubits, sparse=True).toarray(), paulisum.matrix(qubits), atol=1e-12
+        )
+    # Terms sharing an X support share one entry per row.
+    assert paulisum.matrix(sparse=True).nnz == 3 * 2**3
+    # Terms that cancel leave no explicit zeros behind.
+    assert (cirq.X(q[0]) * cirq.Z(q[1]) + cirq.Y(q[0])).matrix(sparse=True).count_nonzero() == 4
+    assert cirq.PauliSum().matrix([q[0]], sparse=True).nnz == 0
+    with pytest.raises(ValueError, match='not in'):
+        _ = paulisum.matrix(q[:2], sparse=True)
+
+
+def test_pauli_sum_linear_operator() -> None:
+    import scipy.sparse.linalg
+
+    q = cirq.LineQubit.range(8)
+    heisenberg = cirq.PauliSum()
+    for a, b in zip(q, q[1:]):
+        heisenberg += cirq.X(a) * cirq.X(b) + cirq.Y(a) * cirq.Y(b) + 0.5 * cirq.Z(a) * cirq.Z(b)
+    heisenberg += 0.3 * cirq.X(q[0]) + 0.1j * cirq.Y(q[2]) * cirq.X(q[3])
+    operator = heisenberg.linear_operator()
+    dense = heisenberg.matrix()
+    vector = cirq.testing.random_superposition(2**8, random_state=1)
+    np.testing.assert_allclose(operator.matvec(vector), dense @ vector, atol=1e-12)
+    np.testing.assert_allclose(operator.rmatvec(vector), dense.conj().T @ vector, atol=1e-12)
+    np.testing.assert_allclose(
+        operator.matmat(np.stack([vector, vector.conj()], axis=1)),
+        dense @ np.stack([vector, vector.conj()], axis=1),
+        atol=1e-12,
+    )
+    hermitian = heisenberg - 0.1j * cirq.Y(q[2]) * cirq.X(q[3])
+    ground_energy = scipy.sparse.linalg.eigsh(
+        hermitian.linear_operator(), k=1, which='SA', return_eigenvectors=False
+    )[0]
+    assert np.isclose(ground_energy, np.linalg.eigvalsh(hermitian.matrix())[0])
+    reversed_operator = heisenberg.linear_operator(q[::-1])
+    np.testing.assert_allclose(
+        reversed_operator.matvec(vector), heisenberg.matrix(q[::-1]) @ vector, atol=1e-12
+    )
+
+
 def test_pauli_sum_repr() -> None:
     q = cirq.LineQubit.range(2)
     pstr1 = cirq.X(q[0]) * cirq.X(q[1])
@@ -29,7 +29,7 @@ from collections.abc import (
     ValuesView,
 )
 from types import NotImplementedType
-from typing import Any, cast, Generic, overload, TYPE_CHECKING, TypeVar, Union
+from typing import Any, cast, Generic, Literal, overload, TYPE_CHECKING, TypeVar, Union
 
 import numpy as np
 import sympy
@@ -51,10 +51,15 @@ from cirq.ops import (
 )
 
 if TYPE_CHECKING:
+    import scipy.sparse
+
     import cirq
 
 # Lazy imports to break circular dependencies.
 linear_combinations = LazyLoader("linear_combinations", globals(), "cirq.ops.linear_combinations")
+symplectic_pauli_sum = LazyLoader(
+    "symplectic_pauli_sum", globals(), "cirq.ops.symplectic_pauli_sum"
+)
 
 TDefault = TypeVar('TDefault')
 TKey = TypeVar('TKey', bound=raw_types.Qid)
@@ -450,7 +455,21 @@ class PauliString(raw_types.Operation, Generic[TKey]):
 
         return prefix + '*'.join(factors)
 
-    def matrix(self, qubits: Iterable[TKey] | None = None) -> np.ndarray:
+    @overload
+    def matrix(
+        self, qubits: Iterable[TKey] | None = None, *, sparse: Literal[False] = False
+    ) -> np.ndarray:
+        pass
+
+    @overload
+    def matrix(
+        self, qubits: Iterable[TKey] | None = None, *, sparse: Literal[True]
+    ) -> scipy.sparse.csr_matrix:
+        pass
+
+    def matrix(
+        self, qubits: Iterable[TKey] | None = None, *, sparse: bool = False
+    ) -> np.ndarray | scipy.sparse.csr_matrix:
         """Returns the matrix of self in computational basis of qubits.
 
         Args:
@@ -458,15 +477,22 @@ class PauliString(raw_types.Operation, Generic[TKey]):
                 in which the matrix representation of the Pauli string is to
                 be computed. Qubits absent from `self.qubits` are acted on by
                 the identity. Defaults to `self.qubits`.
+            sparse: If True, returns a `scipy.sparse.csr_matrix` built directly
+                from the signed permutation the Pauli string applies, which
+                must then act only on `qubits`.
 
         Raises:
             NotImplementedError: If this PauliString is parameterized.
         """
-        qubits = self.qubits if qubits is None else qubits
+        qubits = self.qubits if qubits is None else tuple(qubits)
         factors = [self.get(q, default=identity.I) for q in qubits]
         if protocols.is_parameterized(self):
             raise NotImplementedError('Cannot express as matrix when parameterized')
         assert isinstance(self.coefficient, complex)
+        if sparse:
+            pauli_sum = linear_combinations.PauliSum.from_pauli_strings(self)
+            array_sum = symplectic_pauli_sum.SymplecticPauliSum.from_pauli_sum(pauli_sum, qubits)
+            return array_sum.sparse_matrix()
         return linalg.kron(self.coefficient, *[protocols.unitary(f) for f in factors])
 
     def _has_unitary_(self) -> bool:
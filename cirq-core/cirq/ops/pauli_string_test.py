@@ -857,6 +857,17 @@ def test_matrix(pauli_string, qubits, expected_matrix) -> None:
     assert np.allclose(pauli_string.matrix(qubits), expected_matrix)
 
 
+@pytest.mark.parametrize('pauli_string, qubits, expected_matrix', _pauli_string_matrix_cases())
+def test_sparse_matrix(pauli_string, qubits, expected_matrix) -> None:
+    if qubits is not None and not set(pauli_string.qubits) <= set(qubits):
+        with pytest.raises(ValueError, match='not in'):
+            _ = pauli_string.matrix(qubits, sparse=True)
+        return
+    matrix = pauli_string.matrix(qubits, sparse=True)
+    assert matrix.nnz == len(expected_matrix)
+    np.testing.assert_allclose(matrix.toarray(), expected_matrix)
+
+
 def test_unitary_matrix() -> None:
     a, b = cirq.LineQubit.range(2)
     assert not cirq.has_unitary(2 * cirq.X(a) * cirq.Z(b))
@@ -0,0 +1,583 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Array backed Pauli sums for bulk Pauli algebra."""
+
+from __future__ import annotations
+
+import numbers
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+import sympy
+
+from cirq import value
+from cirq._compat import proper_repr
+from cirq.ops import pauli_gates
+from cirq.ops.linear_combinations import PauliSum
+
+if TYPE_CHECKING:
+    import cirq
+
+# Powers of i, indexed by the exponent mod 4.
+_I_POWERS = np.array([1, 1j, -1, -1j])
+
+# Upper bound on the number of (term, term, word) entries materialized at once when
+# multiplying two sums.
+_PRODUCT_CHUNK = 1 << 22
+
+# Number of terms whose Z signs are evaluated together when computing expectation values,
+# matrices and products with vectors.
+_TERM_CHUNK = 1 << 12
+
+
+@value.value_equality(approximate=True, unhashable=True)
+class SymplecticPauliSum:
+    """A sum of Pauli strings stored as packed symplectic bit arrays.
+
+    Term `k` is `coefficients[k]` times the tensor product over `qubits[j]` of
+    I, X, Z or Y, according to whether bits `j` of `xs[k]` and `zs[k]` are
+    (0, 0), (1, 0), (0, 1) or (1, 1). Bit `j` is stored in bit `j % 64` of
+    word `j // 64`. Products, sums and commutation checks operate on all terms
+    at once, which is much faster than `cirq.PauliSum` for sums with many
+    terms. Coefficients must be numbers; `cirq.PauliSum` is needed for
+    symbolic coefficients.
+
+    >>> a, b = cirq.LineQubit.range(2)
+    >>> x = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a) * cirq.X(b) + 0.5 * cirq.Z(a))
+    >>> z = cirq.SymplecticPauliSum.from_pauli_sum(cirq.Z(a) * cirq.Z(b) + cirq.Z(b))
+    >>> print(x * z)
+    0.500*Z(q(1))+0.500*Z(q(0))*Z(q(1))-1.000j*X(q(0))*Y(q(1))-1.000*Y(q(0))*Y(q(1))
+    >>> x.commutes(z)
+    array([[ True, False],
+           [ True,  True]])
+    """
+
+    def __init__(
+        self,
+        qubits: Iterable[cirq.Qid],
+        xs: np.ndarray,
+        zs: np.ndarray,
+        coefficients: np.ndarray | Sequence[complex],
+    ) -> None:
+        """Initializes the sum from packed bit arrays.
+
+        Args:
+            qubits: The qubits the bits refer to, in bit order.
+            xs: A `uint64` array of shape `(num_terms, num_words)` holding the
+                X bits of each term.
+            zs: A `uint64` array of the same shape holding the Z bits.
+            coefficients: The coefficient of each term.
+
+        Raises:
+            ValueError: If the arrays do not have matching shapes.
+        """
+        self._qubits = tuple(qubits)
+        self._xs = np.asarray(xs, dtype=np.uint64)
+        self._zs = np.asarray(zs, dtype=np.uint64)
+        self._coefficients = np.asarray(coefficients, dtype=np.complex128)
+        shape = (len(self._coefficients), _num_words(len(self._qubits)))
+        if self._xs.shape != shape or self._zs.shape != shape:
+            raise ValueError(
+                f'Expected xs and zs of shape {shape}, got {self._xs.shape} and {self._zs.shape}.'
+            )
+
+    @classmethod
+    def from_bits(
+        cls,
+        qubits: Iterable[cirq.Qid],
+        x_bits: np.ndarray,
+        z_bits: np.ndarray,
+        coefficients: np.ndarray | Sequence[complex],
+    ) -> SymplecticPauliSum:
+        """Returns a sum built from unpacked boolean arrays of shape `(num_terms, num_qubits)`."""
+        return cls(qubits, _pack(np.asarray(x_bits)), _pack(np.asarray(z_bits)), coefficients)
+
+    @classmethod
+    def from_pauli_sum(
+        cls, pauli_sum: cirq.PauliSumLike, qubits: Iterable[cirq.Qid] | None = None
+    ) -> SymplecticPauliSum:
+        """Converts a `cirq.PauliSum` (or anything `cirq.PauliSum.wrap` accepts).
+
+        Args:
+            pauli_sum: The sum to convert.
+            qubits: The qubits of the result, in bit order. Defaults to the
+                sorted qubits of `pauli_sum`. Must include all of them.
+
+        Raises:
+            ValueError: If `qubits` misses a qubit of the sum.
+            TypeError: If a coefficient is symbolic.
+        """
+        terms = list(PauliSum.wrap(pauli_sum)._linear_dict.items())
+        if any(isinstance(c, sympy.Basic) for _, c in terms):
+            raise TypeError('SymplecticPauliSum does not support symbolic coefficients.')
+        if qubits is None:
+            qubits = sorted({q for unit, _ in terms for q, _ in unit})
+        qubits = tuple(qubits)
+        index = {q: i for i, q in enumerate(qubits)}
+        x_bits = np.zeros((len(terms), len(qubits)), dtype=bool)
+        z_bits = np.zeros((len(terms), len(qubits)), dtype=bool)
+        rows, columns, xs, zs = [], [], [], []
+        for k, (unit, _) in enumerate(terms):
+            for q, pauli in unit:
+                if q not in index:
+                    raise ValueError(f'Qubit {q} of the Pauli sum is not in {qubits}.')
+                rows.append(k)
+                columns.append(index[q])
+                xs.append(pauli != pauli_gates.Z)
+                zs.append(pauli != pauli_gates.X)
+        x_bits[rows, columns] = xs
+        z_bits[rows, columns] = zs
+        return cls.from_bits(qubits, x_bits, z_bits, [c for _, c in terms])
+
+    def to_pauli_sum(self) -> cirq.PauliSum:
+        """Converts back to a `cirq.PauliSum`, combining repeated terms."""
+        simplified = self.simplify()
+        paulis = [None, pauli_gates.X, pauli_gates.Z, pauli_gates.Y]
+        codes = simplified.x_bits() + 2 * simplified.z_bits().astype(np.int8)
+        rows, columns = np.nonzero(codes)
+        factors = [(self._qubits[j], paulis[c]) for j, c in zip(columns, codes[rows, columns])]
+        ends = np.searchsorted(rows, np.arange(1, len(simplified) + 1)).tolist()
+        terms: dict[frozenset, complex] = {}
+        start = 0
+        for end, coefficient in zip(ends, simplified.coefficients.tolist()):
+            terms[frozenset(factors[start:end])] = coefficient
+            start = end
+        return PauliSum(value.LinearDict(terms))
+
+    @property
+    def qubits(self) -> tuple[cirq.Qid, ...]:
+        return self._qubits
+
+    @property
+    def xs(self) -> np.ndarray:
+        """The packed X bits, one row of `uint64` words per term."""
+        return self._xs
+
+    @property
+    def zs(self) -> np.ndarray:
+        """The packed Z bits, one row of `uint64` words per term."""
+        return self._zs
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    def x_bits(self) -> np.ndarray:
+        """Returns the X bits as a boolean array of shape `(num_terms, num_qubits)`."""
+        return _unpack(self._xs, len(self._qubits))
+
+    def z_bits(self) -> np.ndarray:
+        """Returns the Z bits as a boolean array of shape `(num_terms, num_qubits)`."""
+        return _unpack(self._zs, len(self._qubits))
+
+    def with_qubits(self, qubits: Iterable[cirq.Qid]) -> SymplecticPauliSum:
+        """Returns the same sum laid out over `qubits`, which must include all of its qubits.
+
+        Raises:
+            ValueError: If `qubits` misses a qubit of this sum.
+        """
+        qubits = tuple(qubits)
+        if qubits == self._qubits:
+            return self
+        index = {q: i for i, q in enumerate(qubits)}
+        missing = [q for q in self._qubits if q not in index]
+        if missing:
+            raise ValueError(f'Qubits {missing} of the sum are not in {qubits}.')
+        columns = [index[q] for q in self._qubits]
+        x_bits = np.zeros((len(self), len(qubits)), dtype=bool)
+        z_bits = np.zeros((len(self), len(qubits)), dtype=bool)
+        x_bits[:, columns] = self.x_bits()
+        z_bits[:, columns] = self.z_bits()
+        return SymplecticPauliSum.from_bits(qubits, x_bits, z_bits, self._coefficients)
+
+    def simplify(self, atol: float = 0) -> SymplecticPauliSum:
+        """Combines repeated terms and drops terms with coefficients of magnitude atol or less.
+
+        The terms of the result are sorted by their bits.
+        """
+        if not len(self):
+            return self
+        keys = np.concatenate([self._xs, self._zs], axis=1)
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate([[True], np.any(keys[1:] != keys[:-1], axis=1)]))
+        coefficients = np.add.reduceat(self._coefficients[order], starts)
+        keep = np.abs(coefficients) > atol
+        num_words = self._xs.shape[1]
+        return SymplecticPauliSum(
+            self._qubits,
+            keys[starts[keep], :num_words],
+            keys[starts[keep], num_words:],
+            coefficients[keep],
+        )
+
+    def expectation_from_state_vector(
+        self, state_vector: np.ndarray, qubit_map: Mapping[cirq.Qid, int]
+    ) -> np.ndarray:
+        """Returns the expectation value of this sum for one or many state vectors.
+
+        Terms are grouped by their X support. Each group costs one pass over
+        the state with the axes in its X mask flipped, after which the Z signs
+        of all the terms in the group are evaluated together with bit tricks.
+        The state is not validated.
+
+        Args:
+            state_vector: An array of shape `(..., 2**n)` holding one state
+                vector per leading index.
+            qubit_map: A map from the qubits of the sum to the indices of the
+                qubits that the state vectors are defined over.
+
+        Returns:
+            A complex array with the leading shape of `state_vector`.
+        """
+        num_qubits = state_vector.shape[-1].bit_length() - 1
+        states = state_vector.reshape((-1,) + (2,) * num_qubits)
+
+        def weights(x_mask: int) -> np.ndarray:
+            # <psi|X^x Z^z|psi> = sum_c conj(psi[c ^ x]) psi[c] (-1)^(z.c). Flipping the
+            # axes in the X mask permutes the state without copying it.
+            flipped = states[(slice(None),) + _flips(x_mask, num_qubits)]
+            return (flipped.conj() * states).reshape(len(states), -1)
+
+        values = self._expectations(weights, qubit_map, num_qubits, len(states))
+        return values.reshape(state_vector.shape[:-1])
+
+    def expectation_from_density_matrix(
+        self, state: np.ndarray, qubit_map: Mapping[cirq.Qid, int]
+    ) -> np.ndarray:
+        """Returns the expectation value of this sum for one or many density matrices.
+
+        See `expectation_from_state_vector`.
+
+        Args:
+            state: An array of shape `(..., 2**n, 2**n)` holding one density
+                matrix per leading index.
+            qubit_map: A map from the qubits of the sum to the indices of the
+                qubits that the density matrices are defined over.
+
+        Returns:
+            A complex array with the leading shape of `state`.
+        """
+        num_qubits = state.shape[-1].bit_length() - 1
+        states = state.reshape(-1, 2**num_qubits, 2**num_qubits)
+        indices = np.arange(2**num_qubits)
+
+        def weights(x_mask: int) -> np.ndarray:
+            # tr(X^x Z^z rho) = sum_c rho[c, c ^ x] (-1)^(z.c).
+            return states[:, indices, indices ^ x_mask]
+
+        values = self._expectations(weights, qubit_map, num_qubits, len(states))
+        return values.reshape(state.shape[:-2])
+
+    def _expectations(
+        self,
+        weights: Callable[[int], np.ndarray],
+        qubit_map: Mapping[cirq.Qid, int],
+        num_qubits: int,
+        num_states: int,
+    ) -> np.ndarray:
+        result = np.zeros(num_states, dtype=np.complex128)
+        for x_mask, z_masks, scales in self._x_groups(qubit_map, num_qubits):
+            w = weights(x_mask)
+            if len(z_masks) > 32 * num_qubits:
+                # The transform evaluates the Z sums of all 2**n masks in n passes.
+                result += _walsh_hadamard(w, num_qubits)[:, z_masks] @ scales
+                continue
+            for start in range(0, len(z_masks), _TERM_CHUNK):
+                chunk = slice(start, start + _TERM_CHUNK)
+                result += _signed_sums(w, z_masks[chunk], num_qubits) @ scales[chunk]
+        return result
+
+    def sparse_matrix(self, qubits: Iterable[cirq.Qid] | None = None) -> scipy.sparse.csr_matrix:
+        """Returns the matrix of this sum as a `scipy.sparse.csr_matrix`.
+
+        Each Pauli string is a signed permutation matrix, so the matrix has at
+        most one nonzero entry per row for each distinct X support.
+
+        Args:
+            qubits: Ordered collection of qubits that determine the basis of
+                the matrix. Defaults to `self.qubits`.
+
+        Raises:
+            ValueError: If `qubits` misses a qubit that a term acts on.
+        """
+        qubits = self._qubits if qubits is None else tuple(qubits)
+        num_qubits = len(qubits)
+        indices = np.arange(2**num_qubits)
+        columns, values = [], []
+        for x_mask, diagonal in self._x_group_diagonals(qubits):
+            # Row b of X^x Z^z has its entry in column b ^ x.
+            columns.append(indices ^ x_mask)
+            values.append(diagonal[indices ^ x_mask])
+        if not columns:
+            return scipy.sparse.csr_matrix((len(indices), len(indices)), dtype=np.complex128)
+        matrix = scipy.sparse.csr_matrix(
+            (
+                np.stack(values, axis=1).ravel(),
+                np.stack(columns, axis=1).ravel(),
+                np.arange(0, len(columns) * len(indices) + 1, len(columns)),
+            ),
+            shape=(len(indices), len(indices)),
+        )
+        matrix.sort_indices()
+        matrix.eliminate_zeros()
+        return matrix
+
+    def linear_operator(
+        self, qubits: Iterable[cirq.Qid] | None = None
+    ) -> scipy.sparse.linalg.LinearOperator:
+        """Returns this sum as a matrix-free `scipy.sparse.linalg.LinearOperator`.
+
+        Products with vectors cost one signed permutation of the vector per
+        distinct X support, and never hold more than a few vectors in memory,
+        which makes iterative solvers such as `scipy.sparse.linalg.eigsh`
+        usable well beyond the sizes that fit a dense or sparse matrix.
+
+        Args:
+            qubits: Ordered collection of qubits that determine the basis of
+                the operator. Defaults to `self.qubits`.
+
+        Raises:
+            ValueError: If `qubits` misses a qubit that a term acts on.
+        """
+        qubits = self._qubits if qubits is None else tuple(qubits)
+        num_qubits = len(qubits)
+        adjoint = SymplecticPauliSum(self._qubits, self._xs, self._zs, self._coefficients.conj())
+
+        def apply(pauli_sum: SymplecticPauliSum, vector: np.ndarray) -> np.ndarray:
+            vector = np.asarray(vector).reshape(-1)
+            result = np.zeros((2,) * num_qubits, dtype=np.complex128)
+            for x_mask, diagonal in pauli_sum._x_group_diagonals(qubits):
+                signed = (diagonal * vector).reshape((2,) * num_qubits)
+                result += signed[_flips(x_mask, num_qubits)]
+            return result.reshape(-1)
+
+        return scipy.sparse.linalg.LinearOperator(
+            shape=(2**num_qubits, 2**num_qubits),
+            matvec=lambda vector: apply(self, vector),
+            rmatvec=lambda vector: apply(adjoint, vector),
+            dtype=np.complex128,
+        )
+
+    def _x_groups(
+        self, qubit_map: Mapping[cirq.Qid, int], num_qubits: int
+    ) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+        """Yields the basis state X mask, Z masks and scales of terms sharing an X support.
+
+        Term `k` contributes `scales[k] * X^x Z^z` with `X^x Z^z |c> = (-1)^(z.c) |c ^ x>`.
+        """
+        if not len(self):
+            return
+        x_masks, z_masks = self._basis_masks(qubit_map, num_qubits)
+        # P(x, z) = i^(x.z) X^x Z^z.
+        scales = self._coefficients * _I_POWERS[_popcount(self._xs & self._zs) % 4]
+        order = np.argsort(x_masks, kind='stable')
+        starts = np.flatnonzero(np.diff(x_masks[order], prepend=-1))
+        for group in np.split(order, starts[1:]):
+            yield int(x_masks[group[0]]), z_masks[group], scales[group]
+
+    def _x_group_diagonals(self, qubits: tuple[cirq.Qid, ...]) -> Iterator[tuple[int, np.ndarray]]:
+        """Yields each X mask with d[c] = sum_k scales[k] (-1)^(z_k.c) over its group."""
+        num_qubits = len(qubits)
+        low_bits = num_qubits // 2
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        for x_mask, z_masks, scales in self._x_groups(qubit_map, num_qubits):
+            diagonal = np.zeros((2 ** (num_qubits - low_bits), 2**low_bits), dtype=np.complex128)
+            for start in range(0, len(z_masks), _TERM_CHUNK):
+                chunk = slice(start, start + _TERM_CHUNK)
+                low_signs = _parity_signs(z_masks[chunk], low_bits)
+                high_signs = _parity_signs(z_masks[chunk] >> low_bits, num_qubits - low_bits)
+                diagonal += (high_signs.T * scales[chunk]) @ low_signs
+            yield x_mask, diagonal.reshape(-1)
+
+    def _basis_masks(
+        self, qubit_map: Mapping[cirq.Qid, int], num_qubits: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the X and Z bits of each term as big endian basis state masks."""
+        x_bits, z_bits = self.x_bits(), self.z_bits()
+        used = np.flatnonzero(np.any(x_bits | z_bits, axis=0))
+        missing = [self._qubits[j] for j in used if self._qubits[j] not in qubit_map]
+        if missing:
+            raise ValueError(f'Qubits {missing} are not in the qubit map.')
+        shifts = np.array([num_qubits - 1 - qubit_map[self._qubits[j]] for j in used], dtype=int)
+        weights = np.left_shift(1, shifts)
+        return x_bits[:, used] @ weights, z_bits[:, used] @ weights
+
+    def commutes(self, other: SymplecticPauliSum) -> np.ndarray:
+        """Returns a boolean matrix telling whether term `i` commutes with term `j` of `other`.
+
+        Raises:
+            ValueError: If the sums are on different qubits.
+        """
+        if self._qubits != other._qubits:
+            raise ValueError('Sums must be on the same qubits; use with_qubits to align them.')
+        x1, z1 = self._xs[:, np.newaxis, :], self._zs[:, np.newaxis, :]
+        x2, z2 = other._xs[np.newaxis, :, :], other._zs[np.newaxis, :, :]
+        return _popcount((x1 & z2) ^ (z1 & x2)) % 2 == 0
+
+    def _aligned(self, other: SymplecticPauliSum) -> tuple[SymplecticPauliSum, SymplecticPauliSum]:
+        if self._qubits == other._qubits:
+            return self, other
+        qubits = tuple(sorted(set(self._qubits) | set(other._qubits)))
+        return self.with_qubits(qubits), other.with_qubits(qubits)
+
+    def _value_equality_values_(self) -> Any:
+        return self.to_pauli_sum()
+
+    def __len__(self) -> int:
+        return len(self._coefficients)
+
+    def __add__(self, other: Any) -> SymplecticPauliSum:
+        if isinstance(other, numbers.Complex):
+            other = SymplecticPauliSum.from_pauli_sum(complex(other), self._qubits)
+        if not isinstance(other, SymplecticPauliSum):
+            return NotImplemented
+        a, b = self._aligned(other)
+        return SymplecticPauliSum(
+            a._qubits,
+            np.concatenate([a._xs, b._xs]),
+            np.concatenate([a._zs, b._zs]),
+            np.concatenate([a._coefficients, b._coefficients]),
+        ).simplify()
+
+    def __radd__(self, other: Any) -> SymplecticPauliSum:
+        return self.__add__(other)
+
+    def __neg__(self) -> SymplecticPauliSum:
+        return SymplecticPauliSum(self._qubits, self._xs, self._zs, -self._coefficients)
+
+    def __sub__(self, other: Any) -> SymplecticPauliSum:
+        if not isinstance(other, (numbers.Complex, SymplecticPauliSum)):
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other: Any) -> SymplecticPauliSum:
+        return -self + other
+
+    def __mul__(self, other: Any) -> SymplecticPauliSum:
+        if isinstance(other, numbers.Complex):
+            return SymplecticPauliSum(
+                self._qubits, self._xs, self._zs, self._coefficients * complex(other)
+            ).simplify()
+        if not isinstance(other, SymplecticPauliSum):
+            return NotImplemented
+        a, b = self._aligned(other)
+        # With P(x, z) = i^(x.z) X^x Z^z, moving Z^z1 past X^x2 gives
+        # P(x1, z1) P(x2, z2) = i^(x1.z1 + x2.z2 + 2 z1.x2 - x3.z3) P(x1 ^ x2, z1 ^ z2).
+        if not len(a) or not len(b):
+            return SymplecticPauliSum(a._qubits, a._xs[:0], a._zs[:0], [])
+        x2, z2 = b._xs[np.newaxis], b._zs[np.newaxis]
+        phase2 = _popcount(b._xs & b._zs)[np.newaxis]
+        rows_per_chunk = max(1, _PRODUCT_CHUNK // max(1, x2.size))
+        xs, zs, coefficients = [], [], []
+        for start in range(0, len(a), rows_per_chunk):
+            chunk = slice(start, start + rows_per_chunk)
+            x1, z1 = a._xs[chunk, np.newaxis], a._zs[chunk, np.newaxis]
+            x3, z3 = x1 ^ x2, z1 ^ z2
+            phase = _popcount(x1 & z1) + phase2 + 2 * _popcount(z1 & x2) - _popcount(x3 & z3)
+            products = np.multiply.outer(a._coefficients[chunk], b._coefficients)
+            xs.append(x3.reshape(-1, x3.shape[-1]))
+            zs.append(z3.reshape(-1, z3.shape[-1]))
+            coefficients.append((products * _I_POWERS[phase % 4]).ravel())
+        return SymplecticPauliSum(
+            a._qubits, np.concatenate(xs), np.concatenate(zs), np.concatenate(coefficients)
+        ).simplify()
+
+    def __rmul__(self, other: Any) -> SymplecticPauliSum:
+        if isinstance(other, numbers.Complex):
+            return self.__mul__(other)
+        return NotImplemented
+
+    def __truediv__(self, other: Any) -> SymplecticPauliSum:
+        if isinstance(other, numbers.Complex):
+            return self.__mul__(1 / complex(other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.SymplecticPauliSum(qubits={self._qubits!r}, '
+            f'xs={proper_repr(self._xs)}, zs={proper_repr(self._zs)}, '
+            f'coefficients={proper_repr(self._coefficients)})'
+        )
+
+    def __str__(self) -> str:
+        return str(self.to_pauli_sum())
+
+
+def _num_words(num_qubits: int) -> int:
+    return max(1, -(-num_qubits // 64))
+
+
+def _pack(bits: np.ndarray) -> np.ndarray:
+    num_terms, num_qubits = bits.shape
+    padded = np.zeros((num_terms, 64 * _num_words(num_qubits)), dtype=bool)
+    padded[:, :num_qubits] = bits
+    packed = np.packbits(padded, axis=1, bitorder='little')
+    return packed.view(np.dtype('<u8')).astype(np.uint64)
+
+
+def _unpack(words: np.ndarray, num_qubits: int) -> np.ndarray:
+    octets = np.ascontiguousarray(words.astype(np.dtype('<u8'))).view(np.uint8)
+    return np.unpackbits(octets, axis=1, count=num_qubits, bitorder='little').astype(bool)
+
+
+def _flips(x_mask: int, num_qubits: int) -> tuple[slice, ...]:
+    """Returns the slices that flip the tensor axes of the qubits in a big endian mask.
+
+    Indexing a `(2,) * num_qubits` shaped state with them maps entry c to c ^ x_mask
+    without copying.
+    """
+    return tuple(
+        slice(None, None, -1) if x_mask >> (num_qubits - 1 - k) & 1 else slice(None)
+        for k in range(num_qubits)
+    )
+
+
+def _signed_sums(w: np.ndarray, z_masks: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Returns sum_c w[..., c] (-1)^(popcount(z & c)) for each z in z_masks.
+
+    The sign of basis state c = h * 2**m + l factors into the signs of its high
+    bits h and its low bits l, so the sums are one matrix product against the
+    low signs followed by a contraction with the high signs.
+    """
+    low_bits = num_qubits // 2
+    low_signs = _parity_signs(z_masks, low_bits).astype(w.dtype)
+    high_signs = _parity_signs(z_masks >> low_bits, num_qubits - low_bits)
+    partial = w.reshape(len(w), 2 ** (num_qubits - low_bits), 2**low_bits) @ low_signs.T
+    return np.einsum('bhk,kh->bk', partial, high_signs)
+
+
+def _parity_signs(masks: np.ndarray, num_bits: int) -> np.ndarray:
+    """Returns (-1)^(popcount(mask & c)) for each mask and each c < 2**num_bits."""
+    parities = np.bitwise_count(masks[:, np.newaxis] & np.arange(2**num_bits)) & 1
+    return 1 - 2 * parities.astype(np.int8)
+
+
+def _walsh_hadamard(w: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Returns sum_c w[..., c] (-1)^(popcount(z & c)) for every z, along the last axis."""
+    transformed = w.reshape(len(w), -1).copy()
+    for k in range(num_qubits):
+        pairs = transformed.reshape(len(w), 2**k, 2, -1)
+        low = pairs[:, :, 0].copy()
+        pairs[:, :, 0] += pairs[:, :, 1]
+        np.subtract(low, pairs[:, :, 1], out=pairs[:, :, 1])
+    return transformed
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
@@ -0,0 +1,216 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.ops import symplectic_pauli_sum
+
+
+def _random_pauli_sum(
+    qubits: Sequence[cirq.Qid], num_terms: int, prng: np.random.RandomState
+) -> cirq.PauliSum:
+    terms: list[cirq.PauliString] = []
+    for _ in range(num_terms):
+        support = prng.choice(len(qubits), prng.randint(min(len(qubits), 5) + 1), replace=False)
+        paulis = {qubits[i]: (cirq.X, cirq.Y, cirq.Z)[prng.randint(3)] for i in support}
+        terms.append(cirq.PauliString(paulis, complex(prng.randn(), prng.randn())))
+    return cirq.PauliSum.from_pauli_strings(terms)
+
+
+@pytest.mark.parametrize('num_qubits', [1, 3, 70])
+def test_conversion_round_trip(num_qubits) -> None:
+    prng = np.random.RandomState(num_qubits)
+    qubits = cirq.LineQubit.range(num_qubits)
+    psum = _random_pauli_sum(qubits, 20, prng) + 0.5
+    array_sum = cirq.SymplecticPauliSum.from_pauli_sum(psum, qubits)
+    assert array_sum.xs.shape == (len(psum), -(-num_qubits // 64))
+    assert array_sum.to_pauli_sum() == psum
+    assert array_sum == cirq.SymplecticPauliSum.from_pauli_sum(psum, array_sum.qubits[::-1])
+
+
+def test_bits_layout() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    array_sum = cirq.SymplecticPauliSum.from_pauli_sum(2 * cirq.X(a) * cirq.Y(b) * cirq.Z(c))
+    assert array_sum.qubits == (a, b, c)
+    np.testing.assert_array_equal(array_sum.xs, [[0b011]])
+    np.testing.assert_array_equal(array_sum.zs, [[0b110]])
+    np.testing.assert_array_equal(array_sum.x_bits(), [[True, True, False]])
+    np.testing.assert_array_equal(array_sum.z_bits(), [[False, True, True]])
+    np.testing.assert_array_equal(array_sum.coefficients, [2])
+    cirq.testing.assert_equivalent_repr(array_sum)
+    assert str(array_sum) == '2.000*X(q(0))*Y(q(1))*Z(q(2))'
+
+
+@pytest.mark.parametrize('num_qubits', [2, 5, 70])
+def test_arithmetic_matches_pauli_sum(num_qubits) -> None:
+    prng = np.random.RandomState(num_qubits)
+    qubits = cirq.LineQubit.range(num_qubits)
+    for _ in range(5):
+        a = _random_pauli_sum(qubits[: num_qubits // 2 + 1], 10, prng)
+        b = _random_pauli_sum(qubits[num_qubits // 2 :], 7, prng)
+        x = cirq.SymplecticPauliSum.from_pauli_sum(a)
+        y = cirq.SymplecticPauliSum.from_pauli_sum(b)
+        expected_product = cirq.PauliSum.from_pauli_strings([s * t for s in a for t in b])
+        assert cirq.approx_eq((x * y).to_pauli_sum(), expected_product, atol=1e-9)
+        assert cirq.approx_eq((x + y).to_pauli_sum(), a + b, atol=1e-9)
+        assert cirq.approx_eq((x - y).to_pauli_sum(), a - b, atol=1e-9)
+        assert cirq.approx_eq((2 - x / 2).to_pauli_sum(), 2 - a / 2, atol=1e-9)
+        assert cirq.approx_eq((3j * x + 1).to_pauli_sum(), 3j * a + 1, atol=1e-9)
+
+
+def test_product_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(symplectic_pauli_sum, '_PRODUCT_CHUNK', 3)
+    prng = np.random.RandomState(0)
+    qubits = cirq.LineQubit.range(4)
+    a, b = _random_pauli_sum(qubits, 6, prng), _random_pauli_sum(qubits, 5, prng)
+    x, y = cirq.SymplecticPauliSum.from_pauli_sum(a), cirq.SymplecticPauliSum.from_pauli_sum(b)
+    expected = cirq.PauliSum.from_pauli_strings([s * t for s in a for t in b])
+    assert cirq.approx_eq((x * y).to_pauli_sum(), expected, atol=1e-9)
+
+
+def test_simplify() -> None:
+    a, b = cirq.LineQubit.range(2)
+    x = cirq.SymplecticPauliSum.from_bits(
+        (a, b),
+        np.array([[1, 0], [0, 0], [1, 0], [0, 0]]),
+        np.array([[0, 0], [0, 1], [0, 0], [0, 0]]),
+        [1, 2, -1, 1e-12],
+    )
+    assert len(x.simplify()) == 2
+    assert x.simplify().to_pauli_sum() == 2 * cirq.Z(b) + 1e-12
+    assert x.simplify(atol=1e-9) == cirq.SymplecticPauliSum.from_pauli_sum(2 * cirq.Z(b))
+    empty = cirq.SymplecticPauliSum.from_pauli_sum(cirq.PauliSum())
+    assert len(empty.simplify()) == 0
+    assert len(empty * x) == len(x * empty) == 0
+
+
+def test_commutes() -> None:
+    a, b = cirq.LineQubit.range(2)
+    x = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a) * cirq.X(b) + cirq.Z(a), (a, b))
+    y = cirq.SymplecticPauliSum.from_pauli_sum(
+        cirq.Z(a) * cirq.Z(b) + cirq.Y(b) + cirq.PauliString(), (a, b)
+    )
+    np.testing.assert_array_equal(x.commutes(y), [[True, False, True], [True, True, True]])
+    with pytest.raises(ValueError, match='same qubits'):
+        _ = x.commutes(cirq.SymplecticPauliSum.from_pauli_sum(cirq.Z(a)))
+
+
+def test_with_qubits() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    x = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a) * cirq.Y(c))
+    assert x.with_qubits((a, c)) is x
+    wide = x.with_qubits((c, b, a))
+    np.testing.assert_array_equal(wide.x_bits(), [[True, False, True]])
+    np.testing.assert_array_equal(wide.z_bits(), [[True, False, False]])
+    assert wide == x
+    with pytest.raises(ValueError, match='not in'):
+        _ = x.with_qubits((a, b))
+
+
+def test_invalid_inputs() -> None:
+    a = cirq.LineQubit(0)
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.SymplecticPauliSum((a,), np.zeros((2, 1)), np.zeros((1, 1)), [1, 2])
+    with pytest.raises(ValueError, match='not in'):
+        _ = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a), ())
+    with pytest.raises(TypeError, match='symbolic'):
+        _ = cirq.SymplecticPauliSum.from_pauli_sum(
+            cirq.PauliSum.from_pauli_strings(
+                cirq.PauliString(cirq.X(a), coefficient=sympy.Symbol('t'))
+            )
+        )
+    x = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a))
+    for op in ('__add__', '__sub__', '__mul__', '__rmul__', '__truediv__'):
+        assert getattr(x, op)('a') is NotImplemented
+
+
+def test_pauli_sum_product_keeps_symbolic_coefficients() -> None:
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    product = cirq.PauliSum.from_pauli_strings(
+        [cirq.PauliString(cirq.X(a), coefficient=t), cirq.PauliString(cirq.Z(b))]
+    ) * (cirq.X(a) + cirq.Z(b))
+    assert len(product) == 2
+    for pauli_string in product:
+        assert sympy.simplify(pauli_string.coefficient - (t + 1)) == 0
+        assert dict(pauli_string) in ({}, {a: cirq.X, b: cirq.Z})
+
+
+@pytest.mark.parametrize('num_qubits, num_terms', [(1, 3), (3, 40), (5, 200)])
+def test_expectation_values_match_pauli_strings(num_qubits, num_terms) -> None:
+    prng = np.random.RandomState(num_qubits)
+    qubits = cirq.LineQubit.range(num_qubits)
+    psum = _random_pauli_sum(qubits, num_terms, prng)
+    qubit_map: dict[cirq.Qid, int] = {
+        q: int(i) for q, i in zip(qubits, prng.permutation(num_qubits))
+    }
+    array_sum = cirq.SymplecticPauliSum.from_pauli_sum(psum)
+    states = np.array(
+        [cirq.testing.random_superposition(2**num_qubits, random_state=prng) for _ in range(3)]
+    )
+    expected = [
+        sum(p._expectation_from_state_vector_no_validation(state, qubit_map) for p in psum)
+        for state in states
+    ]
+    np.testing.assert_allclose(array_sum.expectation_from_state_vector(states, qubit_map), expected)
+    np.testing.assert_allclose(
+        array_sum.expectation_from_state_vector(states[0], qubit_map), expected[0]
+    )
+    densities = np.array(
+        [cirq.testing.random_density_matrix(2**num_qubits, random_state=prng) for _ in range(2)]
+    ).reshape((2, 1) + (2**num_qubits,) * 2)
+    matrix = psum.matrix(sorted(qubits, key=qubit_map.__getitem__))
+    expected = [[np.trace(matrix @ rho)] for rho in densities[:, 0]]
+    np.testing.assert_allclose(
+        array_sum.expectation_from_density_matrix(densities, qubit_map), expected
+    )
+
+
+def test_expectation_of_large_diagonal_group() -> None:
+    qubits = cirq.LineQubit.range(2)
+    psum = 1 + 2 * cirq.Z(qubits[0]) - 3 * cirq.Z(qubits[0]) * cirq.Z(qubits[1])
+    array_sum = cirq.SymplecticPauliSum.from_pauli_sum(psum * psum * psum)
+    state = cirq.testing.random_superposition(4, random_state=1)
+    expected = psum.matrix(qubits) @ psum.matrix(qubits) @ psum.matrix(qubits)
+    assert np.isclose(
+        array_sum.expectation_from_state_vector(state, {q: i for i, q in enumerate(qubits)}),
+        state.conj() @ expected @ state,
+    )
+
+
+def test_walsh_hadamard_matches_signed_sums() -> None:
+    w = np.random.RandomState(0).randn(2, 32) + 0j
+    np.testing.assert_allclose(
+        symplectic_pauli_sum._walsh_hadamard(w, 5),
+        symplectic_pauli_sum._signed_sums(w, np.arange(32), 5),
+    )
+
+
+def test_expectation_qubit_map() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    array_sum = cirq.SymplecticPauliSum.from_pauli_sum(cirq.X(a) + cirq.Z(b)).with_qubits((a, b, c))
+    state = np.zeros(4, dtype=complex)
+    state[1] = 1
+    assert array_sum.expectation_from_state_vector(state, {a: 0, b: 1}) == -1
+    with pytest.raises(ValueError, match='not in the qubit map'):
+        _ = array_sum.expectation_from_state_vector(state, {a: 0, c: 1})
+    empty = cirq.SymplecticPauliSum.from_pauli_sum(cirq.PauliSum())
+    assert empty.expectation_from_state_vector(state, {}) == 0
@@ -34,6 +34,7 @@ TestSpec = ModuleJsonTestSpec(
         'CircuitSampleJob',
         'CliffordSimulatorStepResult',
         'CliffordTrialResult',
+        'DensePauliStringBatch',
         'DensityMatrixSimulator',
         'DensityMatrixStepResult',
         'DensityMatrixTrialResult',
@@ -58,6 +59,7 @@ TestSpec = ModuleJsonTestSpec(
         'Timestamp',
         'TwoQubitGateTabulationResult',
         'StateVectorTrialResult',
+        'SymplecticPauliSum',
         'ZerosSampler',
     ],
     should_not_be_serialized=[
@@ -88,6 +90,8 @@ TestSpec = ModuleJsonTestSpec(
         'DecompositionContext',
         'TransformerLogger',
         'TransformerContext',
+        'CachedTransformer',
+        'TransformerCache',
         # Routing utilities
         'HardCodedInitialMapper',
         'LineInitialMapper',
@@ -166,6 +170,11 @@ TestSpec = ModuleJsonTestSpec(
         'ParamMappingType',
         # utility:
         'CliffordSimulator',
+        'CircuitInterner',
+        'ColumnarCircuit',
+        'CompiledParameterizedCircuit',
+        'ParallelSampler',
+        'SimulationStatePool',
         'Simulator',
         'StabilizerSampler',
         'DEFAULT_RESOLVERS',
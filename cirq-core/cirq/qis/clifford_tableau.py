@@ -142,6 +142,14 @@ class CliffordTableau(StabilizerState):
 
     Each row of the arrays represents a Pauli string, P, that is
     an eigenoperator of the state vector with eigenvalue one: P|psi> = |psi>.
+
+    Measurements pack the rows of xs and zs into 64-bit words, so that the
+    rowsums they need are computed for all rows at once with a few bitwise
+    operations and popcounts per word. The tableau keeps the packed words
+    until xs or zs are accessed again, so that simulating a circuit does
+    not convert between the two representations after every measurement.
+    Views of xs and zs taken before a measurement may therefore be out of
+    date after it and should be taken again.
     """
 
     def __init__(
@@ -166,6 +174,9 @@ class CliffordTableau(StabilizerState):
         self._rs = self._reconstruct_rs(rs)
         self._xs = self._reconstruct_xs(xs)
         self._zs = self._reconstruct_zs(zs)
+        # The rows of _xs and _zs packed into 64-bit words by _packed_words.
+        # While set, these are the up to date values and _xs, _zs are stale.
+        self._words: tuple[np.ndarray, np.ndarray] | None = None
 
     def _reconstruct_rs(self, rs: np.ndarray | None) -> np.ndarray:
         if rs is None:
@@ -232,20 +243,24 @@ class CliffordTableau(StabilizerState):
 
     @property
     def xs(self) -> np.ndarray:
+        self._unpack_words()
         return self._xs[:-1, :]
 
     @xs.setter
     def xs(self, new_xs: np.ndarray) -> None:
         assert np.shape(new_xs) == (2 * self.n, self.n)
+        self._unpack_words()
         self._xs[:-1, :] = np.array(new_xs).astype(bool)
 
     @property
     def zs(self) -> np.ndarray:
+        self._unpack_words()
         return self._zs[:-1, :]
 
     @zs.setter
     def zs(self, new_zs: np.ndarray) -> None:
         assert np.shape(new_zs) == (2 * self.n, self.n)
+        self._unpack_words()
         self._zs[:-1, :] = np.array(new_zs).astype(bool)
 
     @property
@@ -257,6 +272,46 @@ class CliffordTableau(StabilizerState):
         assert np.shape(new_rs) == (2 * self.n,)
         self._rs[:-1] = np.array(new_rs).astype(bool)
 
+    def _packed_words(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the rows of xs and zs, including the scratch row, as 64-bit words.
+
+        Bit `j % 64` of word `j // 64` of a row is the entry of qubit `j`.
+        Until xs or zs are accessed again, the words are the state of the
+        tableau and must be updated in place.
+        """
+        if self._words is None:
+            self._words = (_pack_rows(self._xs), _pack_rows(self._zs))
+        return self._words
+
+    def _unpack_words(self) -> None:
+        if self._words is not None:
+            xs_words, zs_words = self._words
+            self._words = None
+            self._xs[...] = _unpack_rows(xs_words, self.n)
+            self._zs[...] = _unpack_rows(zs_words, self.n)
+
+    def _columns(self, axis: int) -> tuple[np.ndarray, np.ndarray]:
+        """Returns copies of the x and z columns of a qubit, including the scratch row."""
+        if self._words is None:
+            return self._xs[:, axis].copy(), self._zs[:, axis].copy()
+        word, bit = divmod(axis, 64)
+        xs_words, zs_words = self._words
+        return (
+            ((xs_words[:, word] >> bit) & 1).astype(bool),
+            ((zs_words[:, word] >> bit) & 1).astype(bool),
+        )
+
+    def _set_columns(self, axis: int, xs: np.ndarray, zs: np.ndarray) -> None:
+        if self._words is None:
+            self._xs[:, axis] = xs
+            self._zs[:, axis] = zs
+            return
+        word, bit = divmod(axis, 64)
+        mask = ~np.uint64(1 << bit)
+        for words, column in zip(self._words, (xs, zs)):
+            words[:, word] &= mask
+            words[:, word] |= column.astype(np.uint64) << bit
+
     def matrix(self) -> np.ndarray:
         """Returns the 2n * 2n matrix representation of the Clifford tableau."""
         return np.concatenate([self.xs, self.zs], axis=1)
@@ -294,6 +349,10 @@ class CliffordTableau(StabilizerState):
 
     def copy(self, deep_copy_buffers: bool = True) -> CliffordTableau:
         state = CliffordTableau(self.n)
+        if self._words is not None:
+            state._rs = self._rs.copy()
+            state._words = (self._words[0].copy(), self._words[1].copy())
+            return state
         state.rs = self.rs.copy()
         state.xs = self.xs.copy()
         state.zs = self.zs.copy()
@@ -302,9 +361,9 @@ class CliffordTableau(StabilizerState):
     def __repr__(self) -> str:
         return (
             f"cirq.CliffordTableau({self.n},"
-            f"rs={proper_repr(np.delete(self._rs, len(self._rs)-1))}, "
-            f"xs={proper_repr(np.delete(self._xs, len(self._xs)-1, axis=0))},"
-            f"zs={proper_repr(np.delete(self._zs, len(self._zs)-1, axis=0))}, "
+            f"rs={proper_repr(self.rs.copy())}, "
+            f"xs={proper_repr(self.xs.copy())},"
+            f"zs={proper_repr(self.zs.copy())}, "
             f"initial_state={self.initial_state})"
         )
 
@@ -462,27 +521,11 @@ class CliffordTableau(StabilizerState):
         """Implements the "rowsum" routine defined by
         Aaronson and Gottesman.
         Multiplies the stabilizer in row q1 by the stabilizer in row q2."""
-
-        def g(x1, z1, x2, z2):
-            if not x1 and not z1:
-                return 0
-            elif x1 and z1:
-                return int(z2) - int(x2)
-            elif x1 and not z1:
-                return int(z2) * (2 * int(x2) - 1)
-            else:
-                return int(x2) * (1 - 2 * int(z2))
-
-        r = 2 * int(self._rs[q1]) + 2 * int(self._rs[q2])
-        for j in range(self.n):
-            r += g(self._xs[q2, j], self._zs[q2, j], self._xs[q1, j], self._zs[q1, j])
-
-        r %= 4
-
-        self._rs[q1] = bool(r)
-
-        self._xs[q1, :] ^= self._xs[q2, :]
-        self._zs[q1, :] ^= self._zs[q2, :]
+        xs, zs = self._packed_words()
+        phase = _rowsum_phases(xs[q2], zs[q2], xs[q1], zs[q1])
+        self._rs[q1] = (2 * int(self._rs[q1]) + 2 * int(self._rs[q2]) + int(phase)) % 4 != 0
+        xs[q1] ^= xs[q2]
+        zs[q1] ^= zs[q2]
 
     def _row_to_dense_pauli(self, i: int) -> cirq.DensePauliString:
         """Return a dense Pauli string for the given row in the tableau.
@@ -526,41 +569,57 @@ class CliffordTableau(StabilizerState):
     def _measure(self, q, prng: np.random.RandomState) -> int:
         """Performs a projective measurement on the q'th qubit.
 
+        All rowsums of the measurement are computed at once on the packed
+        rows of the tableau.
+
         Returns: the result (0 or 1) of the measurement.
         """
-        is_commuting = True
-        for i in range(self.n, 2 * self.n):
-            if self.xs[i, q]:
-                p = i
-                is_commuting = False
-                break
-
-        if is_commuting:
-            self._xs[2 * self.n, :] = False
-            self._zs[2 * self.n, :] = False
-            self._rs[2 * self.n] = False
-
-            for i in range(self.n):
-                if self.xs[i, q]:
-                    self._rowsum(2 * self.n, self.n + i)
-            return int(self._rs[2 * self.n])
-
-        for i in range(2 * self.n):
-            if i != p and self.xs[i, q]:
-                self._rowsum(i, p)
-
-        self.xs[p - self.n, :] = self.xs[p, :].copy()
-        self.zs[p - self.n, :] = self.zs[p, :].copy()
-        self.rs[p - self.n] = self.rs[p]
-
-        self.xs[p, :] = False
-        self.zs[p, :] = False
-
-        self.zs[p, q] = True
-
-        self.rs[p] = bool(prng.randint(2))
-
-        return int(self.rs[p])
+        n = self.n
+        xs, zs = self._packed_words()
+        word, bit = divmod(q, 64)
+        anticommuting = (xs[: 2 * n, word] >> bit) & 1 != 0
+        stabilizers = np.flatnonzero(anticommuting[n:])
+
+        if not len(stabilizers):
+            # The outcome is the sign of the product of the stabilizers whose
+            # destabilizers anticommute with Z_q. Multiplying them one by one
+            # into the scratch row is the same as multiplying each of them
+            # into the product of the ones before it.
+            rows = n + np.flatnonzero(anticommuting[:n])
+            phase = 2 * int(np.count_nonzero(self._rs[rows]))
+            product_xs = np.zeros_like(xs[0])
+            product_zs = np.zeros_like(zs[0])
+            for block in _row_blocks(rows, xs.shape[1]):
+                block_xs = np.bitwise_xor.accumulate(xs[block], axis=0)
+                block_zs = np.bitwise_xor.accumulate(zs[block], axis=0)
+                block_xs ^= product_xs
+                block_zs ^= product_zs
+                previous_xs = np.concatenate([product_xs[None], block_xs[:-1]])
+                previous_zs = np.concatenate([product_zs[None], block_zs[:-1]])
+                phase += int(_rowsum_phases(xs[block], zs[block], previous_xs, previous_zs).sum())
+                product_xs, product_zs = block_xs[-1], block_zs[-1]
+            return int(phase % 4 != 0)
+
+        p = n + int(stabilizers[0])
+        rows = np.flatnonzero(anticommuting)
+        rows = rows[rows != p]
+        for block in _row_blocks(rows, xs.shape[1]):
+            phases = _rowsum_phases(xs[p], zs[p], xs[block], zs[block])
+            self._rs[block] = (2 * self._rs[block] + 2 * int(self._rs[p]) + phases) % 4 != 0
+            xs[block] ^= xs[p]
+            zs[block] ^= zs[p]
+
+        xs[p - n] = xs[p]
+        zs[p - n] = zs[p]
+        self._rs[p - n] = self._rs[p]
+
+        xs[p] = 0
+        zs[p] = 0
+        zs[p, word] = np.uint64(1 << bit)
+
+        self._rs[p] = bool(prng.randint(2))
+
+        return int(self._rs[p])
 
     def apply_x(self, axis: int, exponent: float = 1, global_shift: float = 0) -> None:
         if exponent % 2 == 0:
@@ -568,14 +627,16 @@ class CliffordTableau(StabilizerState):
         if exponent % 0.5 != 0.0:
             raise ValueError('X exponent must be half integer')  # pragma: no cover
         effective_exponent = exponent % 2
+        xs, zs = self._columns(axis)
         if effective_exponent == 0.5:
-            self.xs[:, axis] ^= self.zs[:, axis]
-            self.rs[:] ^= self.xs[:, axis] & self.zs[:, axis]
+            xs ^= zs
+            self._rs ^= xs & zs
+            self._set_columns(axis, xs, zs)
         elif effective_exponent == 1:
-            self.rs[:] ^= self.zs[:, axis]
+            self._rs ^= zs
         elif effective_exponent == 1.5:
-            self.rs[:] ^= self.xs[:, axis] & self.zs[:, axis]
-            self.xs[:, axis] ^= self.zs[:, axis]
+            self._rs ^= xs & zs
+            self._set_columns(axis, xs ^ zs, zs)
 
     def apply_y(self, axis: int, exponent: float = 1, global_shift: float = 0) -> None:
         if exponent % 2 == 0:
@@ -583,20 +644,15 @@ class CliffordTableau(StabilizerState):
         if exponent % 0.5 != 0.0:
             raise ValueError('Y exponent must be half integer')  # pragma: no cover
         effective_exponent = exponent % 2
+        xs, zs = self._columns(axis)
         if effective_exponent == 0.5:
-            self.rs[:] ^= self.xs[:, axis] & (~self.zs[:, axis])
-            (self.xs[:, axis], self.zs[:, axis]) = (
-                self.zs[:, axis].copy(),
-                self.xs[:, axis].copy(),
-            )
+            self._rs ^= xs & (~zs)
+            self._set_columns(axis, zs, xs)
         elif effective_exponent == 1:
-            self.rs[:] ^= self.xs[:, axis] ^ self.zs[:, axis]
+            self._rs ^= xs ^ zs
         elif effective_exponent == 1.5:
-            self.rs[:] ^= ~(self.xs[:, axis]) & self.zs[:, axis]
-            (self.xs[:, axis], self.zs[:, axis]) = (
-                self.zs[:, axis].copy(),
-                self.xs[:, axis].copy(),
-            )
+            self._rs ^= ~xs & zs
+            self._set_columns(axis, zs, xs)
 
     def apply_z(self, axis: int, exponent: float = 1, global_shift: float = 0) -> None:
         if exponent % 2 == 0:
@@ -604,14 +660,15 @@ class CliffordTableau(StabilizerState):
         if exponent % 0.5 != 0.0:
             raise ValueError('Z exponent must be half integer')  # pragma: no cover
         effective_exponent = exponent % 2
+        xs, zs = self._columns(axis)
         if effective_exponent == 0.5:
-            self.rs[:] ^= self.xs[:, axis] & self.zs[:, axis]
-            self.zs[:, axis] ^= self.xs[:, axis]
+            self._rs ^= xs & zs
+            self._set_columns(axis, xs, zs ^ xs)
         elif effective_exponent == 1:
-            self.rs[:] ^= self.xs[:, axis]
+            self._rs ^= xs
         elif effective_exponent == 1.5:
-            self.rs[:] ^= self.xs[:, axis] & (~self.zs[:, axis])
-            self.zs[:, axis] ^= self.xs[:, axis]
+            self._rs ^= xs & (~zs)
+            self._set_columns(axis, xs, zs ^ xs)
 
     def apply_h(self, axis: int, exponent: float = 1, global_shift: float = 0) -> None:
         if exponent % 2 == 0:
@@ -628,23 +685,15 @@ class CliffordTableau(StabilizerState):
             return
         if exponent % 1 != 0:
             raise ValueError('CZ exponent must be integer')  # pragma: no cover
-        (self.xs[:, target_axis], self.zs[:, target_axis]) = (
-            self.zs[:, target_axis].copy(),
-            self.xs[:, target_axis].copy(),
-        )
-        self.rs[:] ^= self.xs[:, target_axis] & self.zs[:, target_axis]
-        self.rs[:] ^= (
-            self.xs[:, control_axis]
-            & self.zs[:, target_axis]
-            & (~(self.xs[:, target_axis] ^ self.zs[:, control_axis]))
-        )
-        self.xs[:, target_axis] ^= self.xs[:, control_axis]
-        self.zs[:, control_axis] ^= self.zs[:, target_axis]
-        (self.xs[:, target_axis], self.zs[:, target_axis]) = (
-            self.zs[:, target_axis].copy(),
-            self.xs[:, target_axis].copy(),
-        )
-        self.rs[:] ^= self.xs[:, target_axis] & self.zs[:, target_axis]
+        control_xs, control_zs = self._columns(control_axis)
+        target_zs, target_xs = self._columns(target_axis)
+        self._rs ^= target_xs & target_zs
+        self._rs ^= control_xs & target_zs & (~(target_xs ^ control_zs))
+        target_xs ^= control_xs
+        control_zs ^= target_zs
+        self._rs ^= target_xs & target_zs
+        self._set_columns(control_axis, control_xs, control_zs)
+        self._set_columns(target_axis, target_zs, target_xs)
 
     def apply_cx(
         self, control_axis: int, target_axis: int, exponent: float = 1, global_shift: float = 0
@@ -653,13 +702,11 @@ class CliffordTableau(StabilizerState):
             return
         if exponent % 1 != 0:
             raise ValueError('CX exponent must be integer')  # pragma: no cover
-        self.rs[:] ^= (
-            self.xs[:, control_axis]
-            & self.zs[:, target_axis]
-            & (~(self.xs[:, target_axis] ^ self.zs[:, control_axis]))
-        )
-        self.xs[:, target_axis] ^= self.xs[:, control_axis]
-        self.zs[:, control_axis] ^= self.zs[:, target_axis]
+        control_xs, control_zs = self._columns(control_axis)
+        target_xs, target_zs = self._columns(target_axis)
+        self._rs ^= control_xs & target_zs & (~(target_xs ^ control_zs))
+        self._set_columns(control_axis, control_xs, control_zs ^ target_zs)
+        self._set_columns(target_axis, target_xs ^ control_xs, target_zs)
 
     def apply_global_phase(self, coefficient: linear_dict.Scalar) -> None:
         pass
@@ -681,3 +728,47 @@ class CliffordTableau(StabilizerState):
             state = state.copy()
             del state[hash_attr]
         return state
+
+
+# The number of 64-bit words of the rows processed together in a measurement.
+_BLOCK_WORDS = 1 << 18
+
+
+def _row_blocks(rows: np.ndarray, num_words: int) -> list[np.ndarray]:
+    """Splits row indices into blocks that bound the size of temporary arrays."""
+    size = max(1, _BLOCK_WORDS // max(1, num_words))
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+def _pack_rows(bits: np.ndarray) -> np.ndarray:
+    """Packs the rows of a boolean matrix into little endian 64-bit words."""
+    num_rows, num_bits = bits.shape
+    packed = np.zeros((num_rows, 8 * -(-num_bits // 64)), dtype=np.uint8)
+    packed[:, : -(-num_bits // 8)] = np.packbits(bits, axis=1, bitorder='little')
+    return packed.view(np.dtype('<u8'))
+
+
+def _unpack_rows(words: np.ndarray, num_bits: int) -> np.ndarray:
+    """Inverse of `_pack_rows`."""
+    return np.unpackbits(words.view(np.uint8), axis=1, count=num_bits, bitorder='little').view(bool)
+
+
+def _rowsum_phases(
+    xs1: np.ndarray, zs1: np.ndarray, xs2: np.ndarray, zs2: np.ndarray
+) -> np.ndarray:
+    """Returns the power of i picked up by multiplying packed Pauli rows.
+
+    This is the sum over qubits of the function g of Aaronson and Gottesman
+    for the rows `(xs1, zs1)` multiplied into the rows `(xs2, zs2)`, with
+    the two sets of rows broadcast against each other. Each qubit
+    contributes +1, -1 or 0, so the sum is computed from the popcounts of
+    the words marking the qubits contributing +1 and -1.
+    """
+    y1 = xs1 & zs1
+    x1 = xs1 & ~zs1
+    z1 = ~xs1 & zs1
+    plus = (y1 & zs2 & ~xs2) | (x1 & zs2 & xs2) | (z1 & xs2 & ~zs2)
+    minus = (y1 & xs2 & ~zs2) | (x1 & zs2 & ~xs2) | (z1 & xs2 & zs2)
+    return np.bitwise_count(plus).sum(axis=-1, dtype=np.int64) - np.bitwise_count(minus).sum(
+        axis=-1, dtype=np.int64
+    )
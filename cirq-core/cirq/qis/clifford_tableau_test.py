@@ -195,6 +195,56 @@ def test_measurement() -> None:
     assert sum(np.asarray(res) == 3) >= (repetitions / 4 * 0.9)
 
 
+@pytest.mark.parametrize('flip', [False, True])
+def test_measurement_of_many_qubits(flip) -> None:
+    # Measures a GHZ state on qubits spread over several 64-bit words in the
+    # X basis. The parity of the outcomes depends on the signs of the rows.
+    num_qubits = 150
+    prng = np.random.RandomState(seed=1234)
+    for _ in range(5):
+        t = cirq.CliffordTableau(num_qubits=num_qubits)
+        t.apply_h(0)
+        for q in range(num_qubits - 1):
+            t.apply_cx(q, q + 1)
+        if flip:
+            t.apply_z(100)
+        for q in range(num_qubits):
+            t.apply_h(q)
+        res = t.measure(range(num_qubits), prng)
+        assert sum(res) % 2 == flip
+        assert t.measure(range(num_qubits), prng) == res
+        assert t._validate()
+
+        t = cirq.CliffordTableau(num_qubits=num_qubits)
+        t.apply_h(3)
+        for q in range(num_qubits - 1):
+            t.apply_cx(3, q + 1 if q >= 3 else q)
+        res = t.measure(range(num_qubits - 1, -1, -1), prng)
+        assert len(set(res)) == 1
+
+
+def test_measurement_keeps_tableau_usable() -> None:
+    prng = np.random.RandomState(seed=5)
+    t = cirq.CliffordTableau(num_qubits=70)
+    t.apply_h(65)
+    t.apply_cx(65, 2)
+    t.measure([2], prng)
+    copy = t.copy()
+    assert copy == t
+    t.apply_x(2)
+    copy.apply_x(2)
+    assert copy == t
+    cirq.testing.assert_equivalent_repr(t)
+    assert t.measure([65], prng) != t.measure([2], prng)
+
+    # Changes made through xs, zs and rs after a measurement are kept.
+    assert t.measure([69], prng) == [0]
+    _H(t, 69)
+    t.apply_z(69)
+    _H(t, 69)
+    assert t.measure([69], prng) == [1]
+
+
 def test_validate_tableau() -> None:
     num_qubits = 4
     for i in range(2**num_qubits):
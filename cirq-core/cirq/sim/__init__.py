@@ -55,6 +55,8 @@ from cirq.sim.simulation_state import SimulationState as SimulationState
 
 from cirq.sim.simulation_state_base import SimulationStateBase as SimulationStateBase
 
+from cirq.sim.simulation_state_pool import SimulationStatePool as SimulationStatePool
+
 from cirq.sim.simulator import (
     SimulatesAmplitudes as SimulatesAmplitudes,
     SimulatesExpectationValues as SimulatesExpectationValues,
@@ -38,9 +38,10 @@ from typing import Any
 import numpy as np
 
 import cirq
-from cirq import protocols, value
+from cirq import protocols, study, value
 from cirq.protocols import act_on
 from cirq.sim import clifford, simulator_base
+from cirq.sim.clifford.pauli_frame_sampling import sample_pauli_frames
 
 
 class CliffordSimulator(
@@ -53,7 +54,10 @@ class CliffordSimulator(
     """An efficient simulator for Clifford circuits."""
 
     def __init__(
-        self, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None, split_untangled_states: bool = False
+        self,
+        seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+        split_untangled_states: bool = False,
+        frame_sampling: bool = False,
     ):
         """Creates instance of `CliffordSimulator`.
 
@@ -61,10 +65,36 @@ class CliffordSimulator(
             seed: The random seed to use for this simulator.
             split_untangled_states: Optimizes simulation by running separable
                 states independently and merging those states at the end.
+            frame_sampling: If True, `run` samples all repetitions of circuits
+                made of Clifford gates, computational basis measurements,
+                resets and Pauli channels at once by propagating Pauli frames.
+                This is much faster for many repetitions, but draws different
+                samples for a given seed than simulating each repetition.
         """
         self.init = True
+        self._frame_sampling = frame_sampling
         super().__init__(seed=seed, split_untangled_states=split_untangled_states)
 
+    def _run(
+        self, circuit: cirq.AbstractCircuit, param_resolver: cirq.ParamResolver, repetitions: int
+    ) -> dict[str, np.ndarray]:
+        """See definition in `cirq.SimulatesSamples`.
+
+        With `frame_sampling`, circuits whose measurements can be sampled with
+        Pauli frames are sampled for all repetitions at once, without
+        simulating each of them.
+        """
+        if not self._frame_sampling:
+            return super()._run(circuit, param_resolver, repetitions)
+        resolved_circuit = protocols.resolve_parameters(
+            circuit, param_resolver or study.ParamResolver({})
+        )
+        if not protocols.is_parameterized(resolved_circuit):
+            records = sample_pauli_frames(resolved_circuit, repetitions, self._prng)
+            if records is not None:
+                return records
+        return super()._run(circuit, param_resolver, repetitions)
+
     @staticmethod
     def is_supported_operation(op: cirq.Operation) -> bool:
         """Checks whether given operation can be simulated by this simulator."""
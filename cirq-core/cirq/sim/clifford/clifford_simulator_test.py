@@ -70,6 +70,30 @@ def test_run_correlations() -> None:
         assert bits[0] == bits[1]
 
 
+def test_run_mid_circuit_measurements() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    simulator = cirq.CliffordSimulator(seed=1, frame_sampling=True)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.measure(q0, key='m'),
+        cirq.CNOT(q0, q1),
+        cirq.H(q0),
+        cirq.measure(q0, key='x'),
+        cirq.measure(q1, key='m'),
+    )
+    result = simulator.run(circuit, repetitions=1000)
+    records = result.records['m']
+    assert records.shape == (1000, 2, 1)
+    np.testing.assert_array_equal(records[:, 0], records[:, 1])
+    assert 400 < np.sum(records[:, 0]) < 600
+    assert 400 < np.sum(result.records['x'] ^ records[:, :1]) < 600
+
+    # Classical control is simulated one repetition at a time.
+    circuit += [cirq.X(q1).with_classical_controls('m'), cirq.measure(q1, key='c')]
+    result = simulator.run(circuit, repetitions=10)
+    assert not np.any(result.records['c'])
+
+
 def test_run_parameters_not_resolved() -> None:
     a = cirq.LineQubit(0)
     simulator = cirq.CliffordSimulator()
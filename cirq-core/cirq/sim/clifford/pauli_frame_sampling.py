@@ -0,0 +1,379 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Samples many shots of a stabilizer circuit at once by propagating Pauli frames.
+
+A single reference shot of the circuit is simulated with a Clifford tableau.
+Every shot then differs from the reference by a Pauli operator, its frame,
+which is propagated through the circuit for all shots at once, with the
+shots packed into the bits of 64-bit words. Measurement outcomes are the
+reference outcomes flipped by the X part of the frames, and Pauli noise is
+sampled directly into the frames.
+
+To give random measurements their correct distribution, frames start as
+random Z operators, which stabilize the initial state, and qubits are given
+a random Z after every measurement and reset, which stabilizes the state
+they are left in. See [Gidney, Stim: a fast stabilizer circuit
+simulator](https://arxiv.org/abs/2103.02202).
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import functools
+import math
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cirq import circuits, devices, ops, protocols
+from cirq.qis import clifford_tableau
+from cirq.sim.clifford import clifford_tableau_simulation_state
+
+if TYPE_CHECKING:
+    import cirq
+
+# The number of shots whose frames are propagated together.
+_BATCH_SHOTS = 1 << 16
+
+
+@dataclasses.dataclass
+class _Clifford:
+    """Clifford gates with the same action on frames, on disjoint qubits."""
+
+    matrix: np.ndarray
+    axes: list[tuple[int, ...]]
+
+
+@dataclasses.dataclass
+class _Measure:
+    axes: tuple[int, ...]
+    key: str
+    reference: np.ndarray
+
+
+@dataclasses.dataclass
+class _Reset:
+    axes: list[int]
+
+
+@dataclasses.dataclass
+class _PauliChannel:
+    """A Pauli channel, as the probabilities and bits of its non-identity terms."""
+
+    probabilities: np.ndarray
+    xs: np.ndarray
+    zs: np.ndarray
+
+
+@dataclasses.dataclass
+class _PauliNoise:
+    """Pauli channels with the same terms, on disjoint qubits."""
+
+    channel: _PauliChannel
+    axes: list[tuple[int, ...]]
+
+
+_Instruction = _Clifford | _Measure | _Reset | _PauliNoise
+
+
+def sample_pauli_frames(
+    circuit: cirq.AbstractCircuit, repetitions: int, prng: np.random.RandomState
+) -> dict[str, np.ndarray] | None:
+    """Samples the measurements of a stabilizer circuit with Pauli frames.
+
+    Args:
+        circuit: The circuit to sample, which must have no parameters.
+        repetitions: The number of shots to sample.
+        prng: The random number generator to use.
+
+    Returns:
+        A map from measurement key to an array of shape
+        `(repetitions, instances, qubits)` in the format of
+        `cirq.SimulatorBase._run`, or None if the circuit has operations that
+        cannot be sampled with Pauli frames. These are operations that are not
+        Clifford, measurements other than `cirq.MeasurementGate`s without a
+        confusion map, classically controlled operations and channels other
+        than resets and mixtures of Pauli operators.
+    """
+    qubits = sorted(circuit.all_qubits())
+    state = clifford_tableau_simulation_state.CliffordTableauSimulationState(
+        clifford_tableau.CliffordTableau(len(qubits)), qubits=qubits, prng=prng
+    )
+    instructions: list[_Instruction] = []
+    if not _compile(circuit, state, instructions):
+        return None
+
+    rng = np.random.default_rng(prng.randint(2**63, dtype=np.int64))
+    measures = [instruction for instruction in instructions if isinstance(instruction, _Measure)]
+    instances = collections.Counter(measure.key for measure in measures)
+    records = {
+        measure.key: np.empty((repetitions, instances[measure.key], len(measure.axes)), np.uint8)
+        for measure in measures
+    }
+    # The output of each measurement is a view of the records of its key.
+    outputs: list[np.ndarray] = []
+    for measure in reversed(measures):
+        instances[measure.key] -= 1
+        outputs.append(records[measure.key][:, instances[measure.key]])
+    outputs.reverse()
+
+    for start in range(0, repetitions, _BATCH_SHOTS):
+        shots = min(_BATCH_SHOTS, repetitions - start)
+        frames = _Frames(len(qubits), shots, rng)
+        measurements = iter(outputs)
+        for instruction in instructions:
+            if isinstance(instruction, _Clifford):
+                frames.apply_clifford(instruction.matrix, instruction.axes)
+            elif isinstance(instruction, _Measure):
+                output = next(measurements)[start : start + shots]
+                output[...] = frames.measure(instruction.axes)
+                output ^= instruction.reference
+            elif isinstance(instruction, _Reset):
+                frames.reset(instruction.axes)
+            else:
+                frames.apply_noise(instruction)
+
+    return records
+
+
+def _compile(
+    circuit: cirq.AbstractCircuit,
+    state: cirq.CliffordTableauSimulationState,
+    instructions: list[_Instruction],
+) -> bool:
+    """Simulates the reference shot and appends the instructions for the frames.
+
+    Returns:
+        Whether all operations of the circuit are supported.
+    """
+    for moment in circuit:
+        cliffords: dict[Hashable, _Clifford] = {}
+        noises: dict[Hashable, _PauliNoise] = {}
+        resets = _Reset([])
+        for op in moment:
+            if protocols.control_keys(op):
+                return False
+            if isinstance(op.untagged, circuits.CircuitOperation):
+                if op.untagged.repeat_until is not None:
+                    return False
+                if not _compile(op.untagged.mapped_circuit(deep=False), state, instructions):
+                    return False
+                continue
+            axes = tuple(state.qubit_map[q] for q in op.qubits)
+            gate = op.gate
+            if isinstance(gate, ops.MeasurementGate):
+                if gate.confusion_map:
+                    return False
+                protocols.act_on(op, state)
+                key = str(gate.mkey)
+                reference = np.array(state.log_of_measurement_results[key], dtype=np.uint8)
+                instructions.append(_Measure(axes, key, reference))
+            elif protocols.is_measurement(op):
+                return False
+            elif isinstance(gate, ops.ResetChannel):
+                protocols.act_on(op, state)
+                resets.axes.extend(axes)
+            elif protocols.has_unitary(op):
+                if not protocols.has_stabilizer_effect(op):
+                    return False
+                protocols.act_on(op, state)
+                if not axes:
+                    continue
+                group = _group_key(gate if gate is not None else op.untagged)
+                if gate is not None and _is_hashable(gate):
+                    matrix = _frame_matrix(gate, len(axes))
+                else:
+                    matrix = _op_frame_matrix(op)
+                if matrix is None:
+                    return False
+                if not np.array_equal(matrix, np.eye(2 * len(axes), dtype=bool)):
+                    cliffords.setdefault(group, _Clifford(matrix, [])).axes.append(axes)
+            else:
+                group = _group_key(gate if gate is not None else op.untagged)
+                if gate is not None and _is_hashable(gate):
+                    channel = _gate_pauli_channel(gate)
+                else:
+                    channel = _pauli_channel(gate if gate is not None else op)
+                if channel is None:
+                    return False
+                if channel.probabilities.size:
+                    noises.setdefault(group, _PauliNoise(channel, [])).axes.append(axes)
+        if resets.axes:
+            instructions.append(resets)
+        instructions.extend(cliffords.values())
+        instructions.extend(noises.values())
+    return True
+
+
+def _is_hashable(val: object) -> bool:
+    try:
+        hash(val)
+    except TypeError:
+        return False
+    return True
+
+
+def _group_key(val: cirq.Gate | cirq.Operation) -> Hashable:
+    """Returns the key grouping operations with the same action in a moment.
+
+    Unhashable gates, such as channels defined by matrices, are grouped by
+    identity instead.
+    """
+    return val if _is_hashable(val) else (id(val),)
+
+
+@functools.lru_cache(maxsize=256)
+def _frame_matrix(gate: cirq.Gate, num_qubits: int) -> np.ndarray | None:
+    return _op_frame_matrix(gate.on(*[devices.LineQubit(i) for i in range(num_qubits)]))
+
+
+def _op_frame_matrix(op: cirq.Operation) -> np.ndarray | None:
+    """Returns the action of a Clifford operation on Pauli frames, ignoring signs.
+
+    Row `i` of the matrix holds the x and z bits of the image of the i'th
+    input bit, where the first half of the input bits are the x bits of the
+    qubits and the second half are the z bits.
+    """
+    try:
+        gate = ops.CliffordGate.from_op_list([op], op.qubits)
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    return gate.clifford_tableau.matrix()
+
+
+@functools.lru_cache(maxsize=256)
+def _gate_pauli_channel(gate: cirq.Gate) -> _PauliChannel | None:
+    return _pauli_channel(gate)
+
+
+def _pauli_channel(val: cirq.Gate | cirq.Operation) -> _PauliChannel | None:
+    mixture = protocols.mixture(val, None)
+    if mixture is None:
+        return None
+    num_qubits = protocols.num_qubits(val)
+    probabilities, xs, zs = [], [], []
+    for probability, unitary in mixture:
+        bits = _pauli_bits(unitary, num_qubits)
+        if bits is None:
+            return None
+        if probability > 0 and (bits[0].any() or bits[1].any()):
+            probabilities.append(probability)
+            xs.append(bits[0])
+            zs.append(bits[1])
+    return _PauliChannel(
+        np.array(probabilities, dtype=float),
+        np.array(xs, dtype=bool).reshape(-1, num_qubits),
+        np.array(zs, dtype=bool).reshape(-1, num_qubits),
+    )
+
+
+def _pauli_bits(unitary: np.ndarray, num_qubits: int) -> tuple[np.ndarray, np.ndarray] | None:
+    """Returns the x and z bits of a Pauli product given as a unitary, up to phase.
+
+    The unitary of `X**x Z**z` maps basis state `j` to basis state `j ^ x`
+    with the sign `(-1)**popcount(j & z)`, where the bits of `x` and `z` are
+    in big-endian order.
+    """
+    dim = 1 << num_qubits
+    if unitary.shape != (dim, dim):
+        return None  # pragma: no cover
+    columns = np.arange(dim)
+    x = int(np.argmax(np.abs(unitary[:, 0])))
+    if not np.isclose(abs(unitary[x, 0]), 1):
+        return None
+    phases = unitary[columns ^ x, columns] / unitary[x, 0]
+    z = sum(1 << b for b in range(num_qubits) if phases[1 << b].real < 0)
+    signs = 1 - 2 * (np.bitwise_count(columns & z).astype(int) & 1)
+    if not np.allclose(phases, signs, atol=1e-8):
+        return None
+    digits = 1 << np.arange(num_qubits - 1, -1, -1)
+    return (x & digits) != 0, (z & digits) != 0
+
+
+class _Frames:
+    """The Pauli frames of a batch of shots, with one bit per shot."""
+
+    def __init__(self, num_qubits: int, shots: int, rng: np.random.Generator) -> None:
+        self._shots = shots
+        self._rng = rng
+        num_words = -(-shots // 64)
+        self._xs = np.zeros((num_qubits, num_words), dtype=np.uint64)
+        self._zs = self._random_words((num_qubits, num_words))
+
+    def _random_words(self, shape: tuple[int, ...]) -> np.ndarray:
+        return self._rng.integers(
+            0, np.iinfo(np.uint64).max, size=shape, dtype=np.uint64, endpoint=True
+        )
+
+    def apply_clifford(self, matrix: np.ndarray, axes: list[tuple[int, ...]]) -> None:
+        num_qubits = len(axes[0])
+        index = np.array(axes).T
+        inputs = np.concatenate([self._xs[index], self._zs[index]])
+        for j in range(2 * num_qubits):
+            column = matrix[:, j]
+            if column[j] and np.count_nonzero(column) == 1:
+                continue
+            frames = self._xs if j < num_qubits else self._zs
+            frames[index[j % num_qubits]] = np.bitwise_xor.reduce(inputs[column], axis=0)
+
+    def measure(self, axes: tuple[int, ...]) -> np.ndarray:
+        """Returns the outcome flips of measuring qubits, with one row per shot."""
+        # Transposing the packed bytes and then unpacking them is much faster
+        # than transposing the unpacked bits.
+        data = np.ascontiguousarray(self._xs[list(axes)].view(np.uint8).T)
+        flips = (data[:, None, :] >> np.arange(8, dtype=np.uint8)[:, None]) & 1
+        flips = flips.reshape(-1, len(axes))[: self._shots]
+        self._zs[list(axes)] ^= self._random_words((len(axes), self._zs.shape[1]))
+        return flips
+
+    def reset(self, axes: list[int]) -> None:
+        self._xs[axes] = 0
+        self._zs[axes] = self._random_words((len(axes), self._zs.shape[1]))
+
+    def apply_noise(self, noise: _PauliNoise) -> None:
+        channel = noise.channel
+        index = np.array(noise.axes)
+        probability = float(channel.probabilities.sum())
+        # Sample all shots of all channels together, with the shots of the
+        # i'th channel numbered from i * self._shots.
+        hits = self._sample_hits(probability, len(index) * self._shots)
+        if len(channel.probabilities) == 1:
+            terms = np.zeros(len(hits), dtype=int)
+        else:
+            terms = self._rng.choice(
+                len(channel.probabilities), size=len(hits), p=channel.probabilities / probability
+            )
+        for term in range(len(channel.probabilities)):
+            channels, shots = np.divmod(hits[terms == term], self._shots)
+            words = shots >> 6
+            bits = np.left_shift(np.uint64(1), (shots & 63).astype(np.uint64))
+            for frames, term_bits in ((self._xs, channel.xs[term]), (self._zs, channel.zs[term])):
+                for i in np.flatnonzero(term_bits):
+                    np.bitwise_xor.at(frames, (index[channels, i], words), bits)
+
+    def _sample_hits(self, probability: float, size: int) -> np.ndarray:
+        """Returns the sorted indices of the events of the given probability among `size`."""
+        if probability > 0.25:
+            return np.flatnonzero(self._rng.random(size) < probability)
+        # Sample the gaps between hits, which are geometrically distributed.
+        expected = size * probability
+        chunk = int(expected + 5 * math.sqrt(expected)) + 16
+        hits = np.cumsum(self._rng.geometric(probability, size=chunk)) - 1
+        while hits[-1] < size:
+            gaps = self._rng.geometric(probability, size=chunk)
+            hits = np.concatenate([hits, hits[-1] + np.cumsum(gaps)])
+        return hits[hits < size]
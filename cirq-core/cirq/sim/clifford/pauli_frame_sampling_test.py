@@ -0,0 +1,198 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.sim.clifford import pauli_frame_sampling
+
+
+def _sample(circuit: cirq.AbstractCircuit, repetitions: int, seed: int = 1):
+    return pauli_frame_sampling.sample_pauli_frames(
+        circuit, repetitions, np.random.RandomState(seed)
+    )
+
+
+@pytest.mark.parametrize('batch_shots', [64, 100, 1 << 16])
+def test_correlations_of_random_measurements(batch_shots, monkeypatch) -> None:
+    monkeypatch.setattr(pauli_frame_sampling, '_BATCH_SHOTS', batch_shots)
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, key='a'),
+        cirq.S(b),
+        cirq.H(b),
+        cirq.S(b),
+        cirq.measure(b, key='b'),
+        cirq.CNOT(b, c),
+        cirq.measure(a, b, c, key='abc'),
+    )
+    records = _sample(circuit, 1000)
+    assert records is not None
+    assert {k: v.shape for k, v in records.items()} == {
+        'a': (1000, 1, 1),
+        'b': (1000, 1, 1),
+        'abc': (1000, 1, 3),
+    }
+    # a is random, and b, measured in the Y basis, is random and independent of a.
+    assert 400 < np.sum(records['a']) < 600
+    assert 400 < np.sum(records['b']) < 600
+    assert 400 < np.sum(records['a'] ^ records['b']) < 600
+    abc = records['abc'][:, 0]
+    np.testing.assert_array_equal(abc[:, 0], records['a'][:, 0, 0])
+    np.testing.assert_array_equal(abc[:, 1], records['b'][:, 0, 0])
+    np.testing.assert_array_equal(abc[:, 2], abc[:, 1])
+
+
+def test_deterministic_measurements() -> None:
+    q = cirq.LineQubit.range(70)
+    circuit = cirq.Circuit(
+        cirq.X(q[1]),
+        cirq.H(q[5]),
+        cirq.S(q[5]),
+        cirq.S(q[5]),
+        cirq.H(q[5]),
+        cirq.CNOT(q[1], q[69]),
+        cirq.measure(*q, key='m', invert_mask=(True,)),
+        cirq.reset(q[69]),
+        cirq.measure(q[69], key='r'),
+    )
+    records = _sample(circuit, 200)
+    assert records is not None
+    expected = np.zeros(70, dtype=np.uint8)
+    expected[[0, 1, 5, 69]] = 1
+    np.testing.assert_array_equal(records['m'][:, 0], np.tile(expected, (200, 1)))
+    assert not np.any(records['r'])
+
+
+@pytest.mark.parametrize(
+    'channel, flip_probability',
+    [
+        (cirq.bit_flip(0.1), 0.1),
+        (cirq.phase_flip(0.3), 0),
+        (cirq.depolarize(0.3), 0.2),
+        (cirq.asymmetric_depolarize(0.1, 0.05, 0.3), 0.15),
+        (cirq.bit_flip(0.6), 0.6),
+    ],
+)
+def test_pauli_noise(channel, flip_probability) -> None:
+    q = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        channel.on_each(*q), cirq.measure(q[0], key='a'), cirq.measure(q[1], key='b')
+    )
+    repetitions = 20000
+    records = _sample(circuit, repetitions)
+    assert records is not None
+    for key in 'ab':
+        assert np.mean(records[key]) == pytest.approx(flip_probability, abs=0.015)
+
+
+def test_two_qubit_pauli_noise() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.depolarize(0.3, n_qubits=2).on(a, b), cirq.measure(a, b, key='m'))
+    records = _sample(circuit, 20000)
+    assert records is not None
+    m = records['m'][:, 0]
+    # 4 of the 15 non-identity Paulis flip only a, 4 only b and 4 both.
+    a_flips, b_flips = m[:, 0] == 1, m[:, 1] == 1
+    assert np.mean(a_flips & ~b_flips) == pytest.approx(0.08, abs=0.015)
+    assert np.mean(~a_flips & b_flips) == pytest.approx(0.08, abs=0.015)
+    assert np.mean(a_flips & b_flips) == pytest.approx(0.08, abs=0.015)
+
+
+def test_repeated_keys_and_subcircuits() -> None:
+    q = cirq.LineQubit(0)
+    subcircuit = cirq.FrozenCircuit(cirq.X(q), cirq.measure(q, key='m'))
+    circuit = cirq.Circuit(
+        cirq.CircuitOperation(subcircuit, repetitions=3, use_repetition_ids=False),
+        cirq.CircuitOperation(subcircuit, repetitions=2, use_repetition_ids=True),
+    )
+    records = _sample(circuit, 10)
+    assert records is not None
+    assert records['m'].shape == (10, 3, 1)
+    np.testing.assert_array_equal(records['m'][:, :, 0], np.tile([1, 0, 1], (10, 1)))
+    np.testing.assert_array_equal(records['0:m'][:, 0, 0], np.zeros(10))
+    np.testing.assert_array_equal(records['1:m'][:, 0, 0], np.ones(10))
+
+
+@pytest.mark.parametrize(
+    'sampler',
+    [
+        cirq.StabilizerSampler(seed=1, frame_sampling=True),
+        cirq.CliffordSimulator(seed=1, frame_sampling=True),
+    ],
+)
+def test_unhashable_gates(sampler) -> None:
+    q = cirq.LineQubit.range(2)
+    flip = cirq.MixedUnitaryChannel([(0.5, np.eye(2)), (0.5, cirq.unitary(cirq.X))])
+    circuit = cirq.Circuit(flip.on_each(*q), cirq.measure(*q, key='m'))
+    records = _sample(circuit, 2000)
+    assert records is not None
+    assert np.mean(records['m']) == pytest.approx(0.5, abs=0.05)
+    result = sampler.run(circuit, repetitions=2000)
+    assert np.mean(result.measurements['m']) == pytest.approx(0.5, abs=0.05)
+
+
+def test_same_seed_gives_same_samples() -> None:
+    q = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H.on_each(*q), cirq.depolarize(0.1).on_each(*q), cirq.measure(*q))
+    records = _sample(circuit, 100, seed=5)
+    assert records is not None
+    np.testing.assert_array_equal(
+        records['q(0),q(1),q(2)'], _sample(circuit, 100, seed=5)['q(0),q(1),q(2)']
+    )
+
+
+@pytest.mark.parametrize(
+    'op',
+    [
+        cirq.T(cirq.LineQubit(0)),
+        cirq.amplitude_damp(0.1).on(cirq.LineQubit(0)),
+        cirq.X(cirq.LineQubit(0)).with_classical_controls('m'),
+        cirq.measure(
+            cirq.LineQubit(0), key='c', confusion_map={(0,): np.array([[0.9, 0.1], [0.1, 0.9]])}
+        ),
+        cirq.PauliMeasurementGate(cirq.DensePauliString('X'), key='p').on(cirq.LineQubit(0)),
+        cirq.MixedUnitaryChannel([(0.5, np.eye(2)), (0.5, cirq.unitary(cirq.X))], key='k').on(
+            cirq.LineQubit(0)
+        ),
+        cirq.KrausChannel([np.eye(2)], key='k').on(cirq.LineQubit(0)),
+        cirq.CircuitOperation(
+            cirq.FrozenCircuit(cirq.measure(cirq.LineQubit(0), key='m')),
+            repeat_until=cirq.KeyCondition(cirq.MeasurementKey('m')),
+            use_repetition_ids=False,
+        ),
+    ],
+)
+def test_unsupported_operations(op) -> None:
+    circuit = cirq.Circuit(cirq.measure(cirq.LineQubit(0), key='m'), op)
+    assert _sample(circuit, 10) is None
+
+
+def test_pauli_bits() -> None:
+    def bits(val):
+        x, z = pauli_frame_sampling._pauli_bits(cirq.unitary(val), cirq.num_qubits(val))
+        return x.tolist(), z.tolist()
+
+    assert bits(cirq.I) == ([False], [False])
+    assert bits(cirq.X) == ([True], [False])
+    assert bits(cirq.Y) == ([True], [True])
+    assert bits(cirq.Z) == ([False], [True])
+    assert bits(cirq.DensePauliString('XZY')) == ([True, False, True], [False, True, True])
+    assert pauli_frame_sampling._pauli_bits(cirq.unitary(cirq.H), 1) is None
+    assert pauli_frame_sampling._pauli_bits(cirq.unitary(cirq.S), 1) is None
@@ -22,19 +22,35 @@ import cirq
 from cirq import protocols, value
 from cirq.qis.clifford_tableau import CliffordTableau
 from cirq.sim.clifford.clifford_tableau_simulation_state import CliffordTableauSimulationState
+from cirq.sim.clifford.pauli_frame_sampling import sample_pauli_frames
 from cirq.work import sampler
 
 
 class StabilizerSampler(sampler.Sampler):
-    """An efficient sampler for stabilizer circuits."""
+    """An efficient sampler for stabilizer circuits.
 
-    def __init__(self, *, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None):
+    With `frame_sampling`, circuits made of Clifford gates, computational
+    basis measurements, resets and Pauli channels such as `cirq.depolarize`
+    and `cirq.bit_flip` are sampled by simulating one reference shot and
+    propagating the differences of all other shots from it as Pauli frames,
+    which takes about as long as simulating a few shots. Other circuits are
+    simulated with a Clifford tableau once per repetition.
+    """
+
+    def __init__(
+        self, *, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None, frame_sampling: bool = False
+    ):
         """Inits StabilizerSampler.
 
         Args:
             seed: The random seed or generator to use when sampling.
+            frame_sampling: If True, sample supported circuits with Pauli
+                frames. This is much faster for many repetitions, but draws
+                different samples for a given seed than simulating each
+                repetition.
         """
         self.init = True
+        self._frame_sampling = frame_sampling
         self._prng = value.parse_random_state(seed)
 
     def run_sweep(
@@ -48,6 +64,12 @@ class StabilizerSampler(sampler.Sampler):
         return results
 
     def _run(self, circuit: cirq.AbstractCircuit, repetitions: int) -> dict[str, np.ndarray]:
+        records = (
+            sample_pauli_frames(circuit, repetitions, self._prng) if self._frame_sampling else None
+        )
+        if records is not None:
+            # Like the log of measurement results, keep the last instance of each key.
+            return {k: v[:, -1, :] for k, v in records.items()}
 
         measurements: dict[str, list[np.ndarray]] = {
             key: [] for key in protocols.measurement_key_names(circuit)
@@ -37,3 +37,32 @@ def test_reset() -> None:
     assert sampler.sample(c)['q(0)'][0] == 0
     c = cirq.Circuit(cirq.reset(q), cirq.measure(q))
     assert sampler.sample(c)['q(0)'][0] == 0
+
+
+def test_noise_and_mid_circuit_measurements() -> None:
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, key='a'),
+        cirq.bit_flip(0.2).on(b),
+        cirq.measure(b, key='b'),
+        cirq.measure(a, key='a'),
+    )
+    result = cirq.StabilizerSampler(seed=1, frame_sampling=True).run(c, repetitions=10000)
+    assert result.measurements['a'].shape == (10000, 1)
+    assert 0.45 < np.mean(result.measurements['a']) < 0.55
+    assert 0.18 < np.mean(result.measurements['a'] ^ result.measurements['b']) < 0.22
+
+
+def test_classically_controlled_operations() -> None:
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.measure(a, key='a'),
+        cirq.X(b).with_classical_controls('a'),
+        cirq.measure(b, key='b'),
+    )
+    result = cirq.StabilizerSampler(seed=1, frame_sampling=True).sample(c, repetitions=100)
+    assert 5 < sum(result['a']) < 95
+    assert np.all(result['a'] == result['b'])
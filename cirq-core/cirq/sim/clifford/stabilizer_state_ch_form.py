@@ -108,31 +108,51 @@ class StabilizerStateChForm(qis.StabilizerState):
     def inner_product_of_state_and_x(self, x: int) -> complex:
         """Returns the amplitude of x'th element of
         the state vector, i.e. <x|psi>"""
-        if type(x) == int:
-            y = cirq.big_endian_int_to_bits(x, bit_count=self.n)
-
-        mu = sum(y * self.gamma)
-
-        u = np.zeros(self.n, dtype=bool)
-        for p in range(self.n):
-            if y[p]:
-                u ^= self.F[p, :]
-                mu += 2 * (sum(self.M[p, :] & u) % 2)
-        return (
-            self.omega
-            * 2 ** (-sum(self.v) / 2)
-            * 1j**mu
-            * (-1) ** sum(self.v & u & self.s)
-            * bool(np.all(self.v | (u == self.s)))
-        )
+        y = np.array(cirq.big_endian_int_to_bits(x, bit_count=self.n), dtype=bool)
+        return complex(self.amplitudes(y[np.newaxis, :])[0])
 
-    def state_vector(self) -> np.ndarray:
-        wf = np.zeros(2**self.n, dtype=complex)
+    def amplitudes(self, bitstrings: np.ndarray) -> np.ndarray:
+        """Returns the amplitudes <x|psi> of many computational basis states.
+
+        Args:
+            bitstrings: Either a 2D array of shape `(k, n)` whose rows are the
+                bits of the basis states, or a 1D integer array of `k` basis
+                state indices in big endian order.
+
+        Returns:
+            A complex array of shape `(k,)` with the amplitude of each basis
+            state.
 
-        for x in range(2**self.n):
-            wf[x] = self.inner_product_of_state_and_x(x)
+        Raises:
+            ValueError: If the bitstrings do not match the number of qubits.
+        """
+        bitstrings = np.asarray(bitstrings)
+        if bitstrings.ndim == 1:
+            if self.n > 63:
+                raise ValueError('Use bit arrays for basis states of more than 63 qubits.')
+            shifts = np.arange(self.n - 1, -1, -1, dtype=np.int64)
+            bitstrings = (bitstrings.astype(np.int64)[:, np.newaxis] >> shifts) & 1
+        if bitstrings.ndim != 2 or bitstrings.shape[1] != self.n:
+            raise ValueError(
+                f'Expected bitstrings of shape (k, {self.n}) or (k,), got {bitstrings.shape}.'
+            )
+        # All products below are sums of at most n zeros and ones, which float32 holds
+        # exactly, so BLAS does the GF(2) arithmetic.
+        y = bitstrings.astype(np.float32)
+        u = (y @ self.F.astype(np.float32)) % 2 == 1
+        # The M terms pick up M[p] . (y[0] F[0] ^ ... ^ y[p] F[p]) for every set bit p,
+        # which is y[p] times row p of the lower triangle of M F^T applied to y.
+        mf = np.tril((self.M.astype(np.float32) @ self.F.T.astype(np.float32)) % 2)
+        m_terms = (y @ mf.T) % 2
+        mu = y @ self.gamma.astype(np.float32) + 2 * np.sum(y * m_terms, axis=1)
+        mu += 2 * np.count_nonzero(self.v & u & self.s, axis=1)
+        phases = np.array([1, 1j, -1, -1j])[mu.astype(np.int64) % 4]
+        support = np.all(self.v | (u == self.s), axis=1)
+        norm = 2 ** (-np.count_nonzero(self.v) / 2)
+        return self.omega * norm * phases * support
 
-        return wf
+    def state_vector(self) -> np.ndarray:
+        return self.to_state_vector()
 
     def _S_right(self, q):
         r"""Right multiplication version of S gate."""
@@ -164,18 +184,28 @@ class StabilizerStateChForm(qis.StabilizerState):
         set1 = np.where(self.v & (t ^ u))[0]
 
         # implement Vc
+        # The CNOTs and CZs all share the qubit q and never modify a column they
+        # read from another gate, so each batch is applied in one step.
         if len(set0) > 0:
             q = set0[0]
-            for i in set0:
-                if i != q:
-                    self._CNOT_right(q, i)
-            for i in set1:
-                self._CZ_right(q, i)
+            rest = set0[1:]
+            # _CNOT_right(q, i) for i in rest.
+            self.G[:, q] ^= np.bitwise_xor.reduce(self.G[:, rest], axis=1)
+            self.F[:, rest] ^= self.F[:, q, np.newaxis]
+            self.M[:, q] ^= np.bitwise_xor.reduce(self.M[:, rest], axis=1)
+            # _CZ_right(q, i) for i in set1.
+            f_set1 = self.F[:, set1]
+            self.M[:, q] ^= np.bitwise_xor.reduce(f_set1, axis=1)
+            self.M[:, set1] ^= self.F[:, q, np.newaxis]
+            parity = np.count_nonzero(f_set1, axis=1) % 2
+            self.gamma[:] = (self.gamma + 2 * (self.F[:, q] * parity)) % 4
         elif len(set1) > 0:
             q = set1[0]
-            for i in set1:
-                if i != q:
-                    self._CNOT_right(i, q)
+            rest = set1[1:]
+            # _CNOT_right(i, q) for i in rest.
+            self.G[:, rest] ^= self.G[:, q, np.newaxis]
+            self.F[:, q] ^= np.bitwise_xor.reduce(self.F[:, rest], axis=1)
+            self.M[:, rest] ^= self.M[:, q, np.newaxis]
 
         e = np.zeros(self.n, dtype=bool)
         e[q] = True
@@ -235,8 +265,9 @@ class StabilizerStateChForm(qis.StabilizerState):
     def to_state_vector(self) -> np.ndarray:
         arr = np.zeros(2**self.n, dtype=complex)
 
-        for x in range(len(arr)):
-            arr[x] = self.inner_product_of_state_and_x(x)
+        for start in range(0, len(arr), _AMPLITUDE_CHUNK):
+            indices = np.arange(start, min(start + _AMPLITUDE_CHUNK, len(arr)))
+            arr[indices] = self.amplitudes(indices)
 
         return arr
 
@@ -248,10 +279,8 @@ class StabilizerStateChForm(qis.StabilizerState):
         Returns: Computational basis measurement as 0 or 1.
         """
         w = self.s.copy()
-        for i, v_i in enumerate(self.v):
-            if v_i == 1:
-                w[i] = bool(prng.randint(2))
-        x_i = sum(w & self.G[q, :]) % 2
+        w[self.v] = prng.randint(2, size=np.count_nonzero(self.v)).astype(bool)
+        x_i = int(np.count_nonzero(w & self.G[q, :]) % 2)
         # Project the state to the above measurement outcome.
         self.project_Z(q, x_i)
         return x_i
@@ -263,7 +292,7 @@ class StabilizerStateChForm(qis.StabilizerState):
         """
         t = self.s.copy()
         u = (self.G[q, :] & self.v) ^ self.s
-        delta = (2 * sum((self.G[q, :] & (~self.v)) & self.s) + 2 * z) % 4
+        delta = (2 * np.count_nonzero(self.G[q, :] & ~self.v & self.s) + 2 * z) % 4
 
         if np.all(t == u):
             self.omega /= np.sqrt(2)
@@ -347,10 +376,10 @@ class StabilizerStateChForm(qis.StabilizerState):
             # Equations 48, 49 and Proposition 4
             t = self.s ^ (self.G[axis, :] & self.v)
             u = self.s ^ (self.F[axis, :] & (~self.v)) ^ (self.M[axis, :] & self.v)
-            alpha = sum(self.G[axis, :] & (~self.v) & self.s) % 2
-            beta = sum(self.M[axis, :] & (~self.v) & self.s)
-            beta += sum(self.F[axis, :] & self.v & self.M[axis, :])
-            beta += sum(self.F[axis, :] & self.v & self.s)
+            g, f, m = self.G[axis, :], self.F[axis, :], self.M[axis, :]
+            alpha = np.count_nonzero(g & ~self.v & self.s) % 2
+            beta = np.count_nonzero(m & ~self.v & self.s)
+            beta += np.count_nonzero(f & self.v & (m ^ self.s))
             beta %= 2
             delta = (self.gamma[axis] + 2 * (alpha + beta)) % 4
             self.update_sum(t, u, delta=delta, alpha=alpha)
@@ -379,7 +408,7 @@ class StabilizerStateChForm(qis.StabilizerState):
             self.gamma[control_axis] = (
                 self.gamma[control_axis]
                 + self.gamma[target_axis]
-                + 2 * (sum(self.M[control_axis, :] & self.F[target_axis, :]) % 2)
+                + 2 * (np.count_nonzero(self.M[control_axis, :] & self.F[target_axis, :]) % 2)
             ) % 4
             self.G[target_axis, :] ^= self.G[control_axis, :]
             self.F[control_axis, :] ^= self.F[target_axis, :]
@@ -395,5 +424,9 @@ class StabilizerStateChForm(qis.StabilizerState):
         return [self._measure(axis, random_state.parse_random_state(seed)) for axis in axes]
 
 
+# Number of basis states whose amplitudes are evaluated together in `to_state_vector`.
+_AMPLITUDE_CHUNK = 1 << 16
+
+
 def _phase(exponent, global_shift):
     return np.exp(1j * np.pi * global_shift * exponent)
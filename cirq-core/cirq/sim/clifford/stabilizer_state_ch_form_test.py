@@ -77,3 +77,68 @@ def test_run() -> None:
         measurements = {str(k): list(v[-1]) for k, v in classical_data.records.items()}
         assert measurements['q(1)'] == [1]
         assert measurements['q(0)'] != measurements['q(2)']
+
+
+def _random_clifford_state(num_qubits: int, seed: int) -> cirq.StabilizerStateChForm:
+    prng = np.random.RandomState(seed)
+    state = cirq.StabilizerStateChForm(num_qubits)
+    for _ in range(10 * num_qubits):
+        gate = prng.randint(4)
+        a, b = prng.choice(num_qubits, 2, replace=False)
+        if gate == 0:
+            state.apply_h(a)
+        elif gate == 1:
+            state.apply_z(a, 0.5)
+        elif gate == 2:
+            state.apply_cx(a, b)
+        else:
+            state.apply_cz(a, b)
+    return state
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_amplitudes_match_state_vector(seed) -> None:
+    state = _random_clifford_state(5, seed)
+    state_vector = state.state_vector()
+    assert np.isclose(np.linalg.norm(state_vector), 1)
+    indices = np.arange(32)
+    np.testing.assert_allclose(state.amplitudes(indices), state_vector)
+    bits = np.array([cirq.big_endian_int_to_bits(int(i), bit_count=5) for i in indices])
+    np.testing.assert_allclose(state.amplitudes(bits), state_vector)
+    for i in (0, 7, 31):
+        assert np.isclose(state.inner_product_of_state_and_x(i), state_vector[i])
+
+
+def test_amplitudes_agree_with_simulated_circuit() -> None:
+    q = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*q), cirq.CZ(q[0], q[1]), cirq.S(q[2]), cirq.CNOT(q[2], q[3]), cirq.Y(q[1])
+    )
+    state = cirq.StabilizerStateChForm(4)
+    for op in circuit.all_operations():
+        cirq.act_on(
+            op,
+            cirq.StabilizerChFormSimulationState(qubits=q, initial_state=state),
+            allow_decompose=True,
+        )
+    np.testing.assert_allclose(state.to_state_vector(), cirq.final_state_vector(circuit), atol=1e-8)
+
+
+def test_amplitudes_of_many_qubits() -> None:
+    state = cirq.StabilizerStateChForm(100)
+    state.apply_h(0)
+    for i in range(99):
+        state.apply_cx(i, i + 1)
+    bits = np.zeros((3, 100), dtype=bool)
+    bits[1] = True
+    bits[2, 50] = True
+    np.testing.assert_allclose(state.amplitudes(bits), [2**-0.5, 2**-0.5, 0])
+    assert np.isclose(state.inner_product_of_state_and_x(2**100 - 1), 2**-0.5)
+    with pytest.raises(ValueError, match='more than 63 qubits'):
+        _ = state.amplitudes(np.array([0]))
+
+
+def test_amplitudes_shape_mismatch() -> None:
+    state = cirq.StabilizerStateChForm(3)
+    with pytest.raises(ValueError, match='shape'):
+        _ = state.amplitudes(np.zeros((2, 4), dtype=bool))
@@ -33,7 +33,12 @@ if TYPE_CHECKING:
 class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
     """Contains the density matrix and buffers for efficient state evolution."""
 
-    def __init__(self, density_matrix: np.ndarray, buffer: list[np.ndarray] | None = None):
+    def __init__(
+        self,
+        density_matrix: np.ndarray,
+        buffer: list[np.ndarray] | None = None,
+        pool: cirq.SimulationStatePool | None = None,
+    ):
         """Initializes the object with the inputs.
 
         This initializer creates the buffer if necessary.
@@ -43,12 +48,15 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
                 checked for validity here due to performance concerns.
             buffer: Optional, must be length 3 and same shape as the density matrix. If not
                 provided, a buffer will be created automatically.
+            pool: Optional pool to take the buffers, and the density matrices of copies and
+                Kronecker products, from.
         Raises:
             ValueError: If the array is not the shape of a density matrix.
         """
         self._density_matrix = density_matrix
+        self._pool = pool
         if buffer is None:
-            buffer = [np.empty_like(density_matrix) for _ in range(3)]
+            buffer = [self._empty_like(density_matrix) for _ in range(3)]
         self._buffer = buffer
         if len(density_matrix.shape) % 2 != 0:  # pragma: no cover
             raise ValueError('The dimension of target_tensor is not divisible by 2.')
@@ -62,6 +70,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         qid_shape: tuple[int, ...] | None = None,
         dtype: type[np.complexfloating] | None = None,
         buffer: list[np.ndarray] | None = None,
+        pool: cirq.SimulationStatePool | None = None,
     ):
         """Creates a buffered density matrix with the requested state.
 
@@ -71,9 +80,22 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
             dtype: The desired dtype of the density matrix.
             buffer: Optional, must be length 3 and same shape as the density matrix. If not
                 provided, a buffer will be created automatically.
+            pool: Optional pool to take the density matrix and buffers from. Computational basis
+                states are then written into a pooled array in place.
         Raises:
             ValueError: If initial state is provided as integer, but qid_shape is not provided.
         """
+        if (
+            pool is not None
+            and isinstance(initial_state, (int, np.integer))
+            and qid_shape is not None
+            and 0 <= initial_state < np.prod(qid_shape, dtype=np.int64)
+        ):
+            size = int(np.prod(qid_shape, dtype=np.int64))
+            density_matrix = pool.empty(qid_shape * 2, dtype or np.complex64)
+            density_matrix.fill(0)
+            density_matrix.reshape(size, size)[initial_state, initial_state] = 1
+            return cls(density_matrix, buffer, pool)
         if not isinstance(initial_state, np.ndarray):
             if qid_shape is None:
                 raise ValueError('qid_shape must be provided if initial_state is not ndarray')
@@ -92,7 +114,21 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
             if np.may_share_memory(density_matrix, initial_state):
                 density_matrix = density_matrix.copy()
         density_matrix = density_matrix.astype(dtype, copy=False)
-        return cls(density_matrix, buffer)
+        if pool is not None:
+            pooled = pool.empty(density_matrix.shape, density_matrix.dtype)
+            np.copyto(pooled, density_matrix)
+            density_matrix = pooled
+        return cls(density_matrix, buffer, pool)
+
+    def _empty_like(self, array: np.ndarray) -> np.ndarray:
+        if self._pool is not None:
+            return self._pool.empty(array.shape, array.dtype)
+        return np.empty_like(array)
+
+    def _copy_of(self, array: np.ndarray) -> np.ndarray:
+        result = self._empty_like(array)
+        np.copyto(result, array)
+        return result
 
     def copy(self, deep_copy_buffers: bool = True) -> _BufferedDensityMatrix:
         """Copies the object.
@@ -102,9 +138,16 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         Returns:
             A copy of the object.
         """
+        if deep_copy_buffers:
+            buffer = [self._copy_of(b) for b in self._buffer]
+        elif self._pool is not None:
+            # Operations that swap the density matrix with a buffer update the list in place,
+            # which must not hand this copy's pooled density matrix to the original.
+            buffer = list(self._buffer)
+        else:
+            buffer = self._buffer
         return _BufferedDensityMatrix(
-            density_matrix=self._density_matrix.copy(),
-            buffer=[b.copy() for b in self._buffer] if deep_copy_buffers else self._buffer,
+            density_matrix=self._copy_of(self._density_matrix), buffer=buffer, pool=self._pool
         )
 
     def kron(self, other: _BufferedDensityMatrix) -> _BufferedDensityMatrix:
@@ -115,10 +158,20 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         Returns:
             The Kronecker product of the two density matrices.
         """
-        density_matrix = transformations.density_matrix_kronecker_product(
-            self._density_matrix, other._density_matrix
-        )
-        return _BufferedDensityMatrix(density_matrix=density_matrix)
+        if self._pool is not None:
+            n, m = self._density_matrix.ndim // 2, other._density_matrix.ndim // 2
+            density_matrix = self._pool.empty(
+                (self._qid_shape + other._qid_shape) * 2,
+                np.result_type(self._density_matrix, other._density_matrix),
+            )
+            # View the result with the axes in the order of the outer product of the inputs.
+            out = np.moveaxis(density_matrix, range(n, n + m), range(2 * n, 2 * n + m))
+            np.multiply.outer(self._density_matrix, other._density_matrix, out=out)
+        else:
+            density_matrix = transformations.density_matrix_kronecker_product(
+                self._density_matrix, other._density_matrix
+            )
+        return _BufferedDensityMatrix(density_matrix=density_matrix, pool=self._pool)
 
     def factor(
         self, axes: Sequence[int], *, validate=True, atol=1e-07
@@ -140,8 +193,8 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         extracted_tensor, remainder_tensor = transformations.factor_density_matrix(
             self._density_matrix, axes, validate=validate, atol=atol
         )
-        extracted = _BufferedDensityMatrix(density_matrix=extracted_tensor)
-        remainder = _BufferedDensityMatrix(density_matrix=remainder_tensor)
+        extracted = _BufferedDensityMatrix(density_matrix=extracted_tensor, pool=self._pool)
+        remainder = _BufferedDensityMatrix(density_matrix=remainder_tensor, pool=self._pool)
         return extracted, remainder
 
     def reindex(self, axes: Sequence[int]) -> _BufferedDensityMatrix:
@@ -156,7 +209,7 @@ class _BufferedDensityMatrix(qis.QuantumStateRepresentation):
         new_tensor = transformations.transpose_density_matrix_to_axis_order(
             self._density_matrix, axes
         )
-        return _BufferedDensityMatrix(density_matrix=new_tensor)
+        return _BufferedDensityMatrix(density_matrix=new_tensor, pool=self._pool)
 
     def apply_channel(self, action: Any, axes: Sequence[int]) -> bool:
         """Apply channel to state.
@@ -252,6 +305,7 @@ class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
         initial_state: np.ndarray | cirq.STATE_VECTOR_LIKE = 0,
         dtype: type[np.complexfloating] = np.complex64,
         classical_data: cirq.ClassicalDataStore | None = None,
+        state_pool: cirq.SimulationStatePool | None = None,
     ):
         """Inits DensityMatrixSimulationState.
 
@@ -272,6 +326,9 @@ class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
                 `target_tenson` is None.
             classical_data: The shared classical data container for this
                 simulation.
+            state_pool: If given, the density matrix and buffers are taken
+                from this pool, and so are those of copies and of merged
+                states.
 
         Raises:
             ValueError: If `initial_state` is provided as integer, but `qubits`
@@ -282,6 +339,7 @@ class DensityMatrixSimulationState(SimulationState[_BufferedDensityMatrix]):
             qid_shape=tuple(q.dimension for q in qubits) if qubits is not None else None,
             dtype=dtype,
             buffer=available_buffer,
+            pool=state_pool,
         )
         super().__init__(state=state, prng=prng, qubits=qubits, classical_data=classical_data)
 
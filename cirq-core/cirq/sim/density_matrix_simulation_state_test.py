@@ -125,3 +125,23 @@ def test_initial_state_bad_shape() -> None:
         cirq.DensityMatrixSimulationState(
             qubits=qubits, initial_state=np.full((2, 2, 2, 2), 1 / 4), dtype=np.complex64
         )
+
+
+def test_state_pool() -> None:
+    pool = cirq.SimulationStatePool()
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    args = cirq.DensityMatrixSimulationState(qubits=[q0, q1], initial_state=2, state_pool=pool)
+    other = cirq.DensityMatrixSimulationState(
+        qubits=[q2], initial_state=np.array([0.6, 0.8]), state_pool=pool
+    )
+    assert pool.allocations == 8
+    merged = args.kronecker_product(other).copy(deep_copy_buffers=False)
+    assert pool.allocations == 13
+    assert merged.available_buffer is not args.available_buffer
+    np.testing.assert_allclose(
+        merged.target_tensor.reshape(8, 8),
+        cirq.density_matrix_from_state_vector(
+            np.kron(cirq.one_hot(index=2, shape=4, dtype=np.complex64), [0.6, 0.8])
+        ),
+        atol=1e-6,
+    )
@@ -124,6 +124,7 @@ class DensityMatrixSimulator(
         noise: cirq.NOISE_MODEL_LIKE = None,
         seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
         split_untangled_states: bool = True,
+        state_pool: cirq.SimulationStatePool | None = None,
     ):
         """Density matrix simulator.
 
@@ -135,6 +136,10 @@ class DensityMatrixSimulator(
             split_untangled_states: If True, optimizes simulation by running
                 unentangled qubit sets independently and merging those states
                 at the end.
+            state_pool: If given, density matrices and buffers are taken
+                from this pool, and `run` gives them back when it is done, so
+                that repeatedly running circuits on the same qubits reuses
+                them instead of allocating new ones.
 
         Raises:
             ValueError: If the supplied dtype is not `np.complex64` or
@@ -149,6 +154,7 @@ class DensityMatrixSimulator(
         )
         if dtype not in {np.complex64, np.complex128}:
             raise ValueError(f'dtype must be complex64 or complex128, was {dtype}')
+        self._state_pool = state_pool
 
     def _create_partial_simulation_state(
         self,
@@ -180,6 +186,7 @@ class DensityMatrixSimulator(
             classical_data=classical_data,
             initial_state=initial_state,
             dtype=self._dtype,
+            state_pool=self._state_pool,
         )
 
     def _can_be_in_run_prefix(self, val: Any):
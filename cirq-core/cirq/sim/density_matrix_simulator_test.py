@@ -1589,3 +1589,29 @@ def test_sweep_unparameterized_prefix_not_repeated_even_non_unitaries() -> None:
     simulator.simulate_sweep(program=circuit, params=params)
     assert op1.count == 1
     assert op2.count == 2
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_state_pool(split: bool) -> None:
+    pool = cirq.SimulationStatePool()
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.amplitude_damp(0.3).on(q0),
+        cirq.CNOT(q0, q1),
+        cirq.measure(q0, key='a'),
+        cirq.H(q0),
+        cirq.measure(q0, q1, key='b'),
+    )
+    for seed in range(3):
+        result = cirq.DensityMatrixSimulator(
+            state_pool=pool, split_untangled_states=split, seed=seed
+        ).run(circuit, repetitions=10)
+        expected = cirq.DensityMatrixSimulator(split_untangled_states=split, seed=seed).run(
+            circuit, repetitions=10
+        )
+        assert result == expected
+        if seed == 0:
+            allocations = pool.allocations
+    assert pool.allocations == allocations
+    assert pool.reuses > 0
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from collections import abc
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
 from typing import Any, Generic, TYPE_CHECKING
 
 import numpy as np
@@ -139,6 +139,58 @@ class SimulationProductState(
                 self._sim_states[q] = op_args
         return True
 
+    def _factor_across(
+        self, cuts: Iterable[tuple[cirq.Qid, ...]], partition: Iterable[Collection[cirq.Qid]]
+    ) -> bool:
+        """Splits off groups of qubits that are no longer entangled with their substates.
+
+        An operation on qubits `(a, b, ...)` only changes the entanglement between
+        a group of qubits and the rest of its substate if it acts on qubits both
+        inside and outside of the group. So only the groups of `partition` that
+        are cut in this way by one of `cuts` are tested, and each test falls
+        back to leaving the state merged if it is entangled.
+
+        Args:
+            cuts: The qubits of the recently applied operations that may have
+                disentangled qubits.
+            partition: Disjoint groups of qubits that it is worth keeping in
+                separate substates, e.g. because they will not interact in
+                the near future. Qubits in no group are each considered to be
+                a group of their own.
+
+        Returns:
+            Whether any group was split off.
+        """
+        if not self.split_untangled_states:
+            return False
+        factored = False
+        group_of = {q: i for i, group in enumerate(partition) for q in group}
+        for qubits in cuts:
+            state = self.sim_states[qubits[0]]
+            if len(state.qubits) < 2 or not state.allows_factoring:
+                continue
+            if any(q not in state.qubits for q in qubits):
+                continue
+            groups: dict[Any, list[cirq.Qid]] = {}
+            for q in state.qubits:
+                groups.setdefault(group_of.get(q, q), []).append(q)
+            for group in groups.values():
+                if len(group) == len(state.qubits):
+                    break
+                inside = sum(q in group for q in qubits)
+                if inside in (0, len(qubits)):
+                    continue
+                try:
+                    extracted, state = state.factor(group, validate=True, inplace=True)
+                except ValueError:
+                    continue
+                factored = True
+                for q in group:
+                    self._sim_states[q] = extracted
+            for q in state.qubits:
+                self._sim_states[q] = state
+        return factored
+
     def copy(self, deep_copy_buffers: bool = True) -> cirq.SimulationProductState[TSimulationState]:
         classical_data = self._classical_data.copy()
         copies = {}
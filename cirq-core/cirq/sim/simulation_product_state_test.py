@@ -273,3 +273,51 @@ def test_field_getters() -> None:
     state = create_container(qs2)
     assert state.sim_states.keys() == set(qs2) | {None}
     assert state.split_untangled_states
+
+
+def create_state_vector_container(qubits: Sequence[cirq.Qid]) -> cirq.SimulationProductState:
+    log = cirq.ClassicalDataDictionaryStore()
+    state_map: dict[cirq.Qid | None, cirq.StateVectorSimulationState] = {
+        q: cirq.StateVectorSimulationState(qubits=[q], classical_data=log) for q in qubits
+    }
+    state_map[None] = cirq.StateVectorSimulationState(qubits=(), classical_data=log)
+    return cirq.SimulationProductState(state_map, qubits, True, classical_data=log)
+
+
+def test_factor_across_splits_disentangled_groups() -> None:
+    state = create_state_vector_container(qs3)
+    state.apply_operation(cirq.H(q0))
+    state.apply_operation(cirq.CNOT(q0, q1))
+    state.apply_operation(cirq.CNOT(q0, q2))
+    state.apply_operation(cirq.CNOT(q0, q2))
+    assert state[q0] is state[q1] is state[q2]
+
+    assert state._factor_across([(q0, q2)], [{q0, q1}])
+    assert state[q0] is state[q1]
+    assert state[q0] is not state[q2]
+    assert state[q2].qubits == (q2,)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        state.create_merged_state().target_tensor.reshape(-1),
+        cirq.final_state_vector(cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1)), qubit_order=qs3),
+        atol=1e-6,
+    )
+
+
+def test_factor_across_keeps_entangled_groups() -> None:
+    state = create_state_vector_container(qs3)
+    state.apply_operation(cirq.H(q0))
+    state.apply_operation(cirq.CNOT(q0, q1))
+    state.apply_operation(cirq.CNOT(q1, q2))
+    assert not state._factor_across([(q1, q2)], [{q0, q1}])
+    assert state[q0] is state[q1] is state[q2]
+
+    # Groups not cut by the operation are not tested.
+    state.apply_operation(cirq.CNOT(q1, q2))
+    assert not state._factor_across([(q0, q1)], [{q0, q1}])
+    assert state[q0] is state[q1] is state[q2]
+
+
+def test_factor_across_does_not_split_if_disabled() -> None:
+    state = create_container(qs2, False)
+    assert not state._factor_across([(q0, q1)], [])
+    assert state[q0] is state[q1]
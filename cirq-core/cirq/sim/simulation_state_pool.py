@@ -0,0 +1,158 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A pool of arrays that simulation states can reuse instead of allocating."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+
+class SimulationStatePool:
+    """A pool of state and buffer arrays, keyed by shape and dtype.
+
+    Every simulation allocates a state tensor, and usually buffers, for each
+    group of qubits it simulates. When many small circuits are simulated, for
+    example by a service sampling thousands of circuits per second, these
+    allocations can take a large part of the time. Simulators given a pool
+    take these arrays from it instead, and `run` gives them back when it is
+    done so that the next run can reset them in place. Once the pool has
+    seen a circuit, running circuits of the same shape allocates no arrays,
+    which can be checked with the `allocations` and `reuses` counters.
+
+    Arrays taken from the pool inside of a `lease` context are given back to
+    the pool when the context exits. Arrays taken outside of any lease, for
+    example by `simulate`, whose final states are returned to the caller,
+    are never given back.
+
+    The pool may be shared by simulators running in different threads.
+
+    Example:
+        >>> pool = cirq.SimulationStatePool()
+        >>> simulator = cirq.Simulator(state_pool=pool)
+        >>> q0, q1 = cirq.LineQubit.range(2)
+        >>> circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1))
+        >>> _ = simulator.run(circuit, repetitions=10)
+        >>> allocations = pool.allocations
+        >>> _ = simulator.run(circuit, repetitions=10)
+        >>> pool.allocations - allocations
+        0
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty pool."""
+        self._free: dict[tuple[tuple[int, ...], np.dtype], list[np.ndarray]] = (
+            collections.defaultdict(list)
+        )
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._allocations = 0
+        self._reuses = 0
+
+    @property
+    def allocations(self) -> int:
+        """The number of arrays allocated because no pooled array was available."""
+        return self._allocations
+
+    @property
+    def reuses(self) -> int:
+        """The number of requests for arrays served with a pooled array."""
+        return self._reuses
+
+    def __len__(self) -> int:
+        """The number of arrays currently available in the pool."""
+        with self._lock:
+            return sum(len(arrays) for arrays in self._free.values())
+
+    def empty(self, shape: tuple[int, ...], dtype: DTypeLike) -> np.ndarray:
+        """Returns an uninitialized array, reusing a pooled one if possible.
+
+        Args:
+            shape: The shape of the array.
+            dtype: The dtype of the array.
+
+        Returns:
+            A C-contiguous array with the given shape and dtype. If called
+            inside of a `lease` context, the array is given back to the pool
+            when the innermost lease exits.
+        """
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                array = free.pop()
+                self._reuses += 1
+            else:
+                array = None
+                self._allocations += 1
+        if array is None:
+            array = np.empty(key[0], dtype=key[1])
+        leases = getattr(self._local, 'leases', None)
+        if leases:
+            leases[-1].append(array)
+        return array
+
+    def release(self, arrays: Iterable[np.ndarray]) -> None:
+        """Gives arrays back to the pool.
+
+        The arrays must have been returned by `empty` outside of any lease,
+        and must not be used by the caller afterwards.
+
+        Args:
+            arrays: The arrays to give back.
+        """
+        with self._lock:
+            for array in arrays:
+                self._free[(array.shape, array.dtype)].append(array)
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[None]:
+        """Gives all arrays taken from the pool in this context back to it at exit.
+
+        Leases belong to the thread that opens them, and can be nested, in
+        which case arrays are given back when the innermost lease exits.
+        Nothing using these arrays may outlive the context.
+        """
+        leases = self._local.__dict__.setdefault('leases', [])
+        leased: list[np.ndarray] = []
+        leases.append(leased)
+        try:
+            yield
+        finally:
+            leases.pop()
+            self.release(leased)
+
+    def clear(self) -> None:
+        """Drops all arrays currently available in the pool."""
+        with self._lock:
+            self._free.clear()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pooled arrays are not worth copying to other processes.
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return 'cirq.SimulationStatePool()'
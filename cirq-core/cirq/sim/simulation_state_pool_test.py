@@ -0,0 +1,70 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def test_empty_reuses_released_arrays() -> None:
+    pool = cirq.SimulationStatePool()
+    a = pool.empty((2, 2), np.complex64)
+    assert a.shape == (2, 2) and a.dtype == np.complex64
+    assert (pool.allocations, pool.reuses, len(pool)) == (1, 0, 0)
+
+    pool.release([a])
+    assert len(pool) == 1
+    assert pool.empty((2, 2), np.complex128) is not a
+    assert pool.empty((4,), np.complex64) is not a
+    assert pool.empty((2, 2), np.complex64) is a
+    assert (pool.allocations, pool.reuses, len(pool)) == (3, 1, 0)
+
+    pool.release([a])
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_lease_gives_arrays_back() -> None:
+    pool = cirq.SimulationStatePool()
+    with pool.lease():
+        a = pool.empty((2,), np.complex64)
+        with pool.lease():
+            b = pool.empty((2,), np.complex64)
+        assert len(pool) == 1
+        assert pool.empty((2,), np.complex64) is b
+    assert len(pool) == 2
+    assert {id(pool.empty((2,), np.complex64)) for _ in range(2)} == {id(a), id(b)}
+    assert pool.allocations == 2
+
+
+def test_lease_gives_arrays_back_on_error() -> None:
+    pool = cirq.SimulationStatePool()
+    with pytest.raises(ValueError):
+        with pool.lease():
+            _ = pool.empty((2,), np.complex64)
+            raise ValueError()
+    assert len(pool) == 1
+
+
+def test_pickle_and_repr() -> None:
+    pool = cirq.SimulationStatePool()
+    pool.release([pool.empty((2,), np.complex64)])
+    copy = pickle.loads(pickle.dumps(pool))
+    assert len(copy) == 0 and copy.allocations == 0
+    assert repr(pool) == 'cirq.SimulationStatePool()'
@@ -82,14 +82,22 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         if not program.has_measurements():
             raise ValueError("Circuit has no measurements to sample.")
 
-        for param_resolver in study.to_resolvers(params):
+        program_is_parameterized = protocols.is_parameterized(program)
+        compiled: circuits.CompiledParameterizedCircuit | None = None
+        for i, param_resolver in enumerate(study.to_resolvers(params)):
             records = {}
             if repetitions == 0:
                 for _, op, _ in program.findall_operations_with_gate_type(ops.MeasurementGate):
                     records[protocols.measurement_key_name(op)] = np.empty([0, 1, 1])
             else:
+                # Sweeps with several points resolve a compiled circuit, which only
+                # re-evaluates the parameterized operations for each point.
+                if compiled is None and i > 0 and param_resolver and program_is_parameterized:
+                    compiled = circuits.CompiledParameterizedCircuit(program)
                 records = self._run(
-                    circuit=program, param_resolver=param_resolver, repetitions=repetitions
+                    circuit=program if compiled is None else compiled.resolve(param_resolver),
+                    param_resolver=param_resolver,
+                    repetitions=repetitions,
                 )
             yield study.ResultDict(params=param_resolver, records=records)
 
@@ -585,6 +593,11 @@ class SimulatesIntermediateState(
         """
         qubit_order = ops.QubitOrder.as_qubit_order(qubit_order)
         resolvers = list(study.to_resolvers(params))
+        compiled = (
+            circuits.CompiledParameterizedCircuit(program)
+            if len(resolvers) > 1 and any(resolvers) and protocols.is_parameterized(program)
+            else None
+        )
         for i, param_resolver in enumerate(resolvers):
             state = (
                 initial_state.copy()
@@ -592,7 +605,10 @@ class SimulatesIntermediateState(
                 else initial_state
             )
             all_step_results = self.simulate_moment_steps(
-                program, param_resolver, qubit_order, state
+                program if compiled is None else compiled.resolve(param_resolver),
+                param_resolver,
+                qubit_order,
+                state,
             )
             measurements: dict[str, np.ndarray] = {}
             for step_result in all_step_results:
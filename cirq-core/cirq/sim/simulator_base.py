@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import abc
 import collections
+import contextlib
 from collections.abc import Iterator, Sequence
 from typing import Any, cast, Generic, TYPE_CHECKING, TypeVar
 
@@ -42,6 +43,27 @@ if TYPE_CHECKING:
 
 TStepResultBase = TypeVar('TStepResultBase', bound='StepResultBase')
 
+# Number of upcoming moments whose interactions decide which qubits are worth
+# factoring into separate states when simulating with `split_untangled_states`.
+_LOOKAHEAD_MOMENTS = 8
+
+# Substates with fewer qubits are cheap enough to simulate merged that trying to
+# factor them costs more than it saves.
+_MIN_FACTOR_QUBITS = 10
+
+
+def _interaction_groups(moments: Sequence[Sequence[cirq.Operation]]) -> list[set[cirq.Qid]]:
+    """Returns the connected components of the qubits acted on by the given operations."""
+    group_of: dict[cirq.Qid, set[cirq.Qid]] = {}
+    for moment_ops in moments:
+        for op in moment_ops:
+            merged: set[cirq.Qid] = set()
+            for q in op.qubits:
+                merged |= group_of.get(q, {q})
+            for q in merged:
+                group_of[q] = merged
+    return list({id(group): group for group in group_of.values()}.values())
+
 
 class SimulatorBase(
     Generic[TStepResultBase, TSimulationTrialResult, TSimulationState],
@@ -78,6 +100,10 @@ class SimulatorBase(
     `_core_iterator` and `_run` methods.
     """
 
+    # Subclasses that take the arrays of their simulation states from a pool set this, so that
+    # `_run` can give them back when it is done.
+    _state_pool: cirq.SimulationStatePool | None = None
+
     def __init__(
         self,
         *,
@@ -193,10 +219,20 @@ class SimulatorBase(
             yield self._create_step_result(sim_state)
             return
 
-        noisy_moments = self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
+        noisy_moments = [
+            list(ops.flatten_to_ops(moment))
+            for moment in self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
+        ]
+        factor_ahead = (
+            isinstance(sim_state, SimulationProductState) and sim_state.split_untangled_states
+        )
+        # After failed attempts to factor, the next attempt is postponed, by a number of
+        # moments that doubles with every failure, up to `_LOOKAHEAD_MOMENTS`.
+        failed_factors = 0
+        next_factor = 0
         measured: dict[tuple[cirq.Qid, ...], bool] = collections.defaultdict(bool)
-        for moment in noisy_moments:
-            for op in ops.flatten_to_ops(moment):
+        for i, moment_ops in enumerate(noisy_moments):
+            for op in moment_ops:
                 try:
                     # Preprocess measurements
                     if all_measurements_are_terminal and measured[op.qubits]:
@@ -211,8 +247,32 @@ class SimulatorBase(
                 except TypeError:
                     raise TypeError(f"{self.__class__.__name__} doesn't support {op!r}")
 
+            if factor_ahead and i >= next_factor:
+                # Multi-qubit operations may have disentangled qubits that would otherwise be
+                # kept merged. Try to split them off if they don't interact again soon.
+                product_state = cast(SimulationProductState, sim_state)
+                cuts = [
+                    op.qubits
+                    for op in moment_ops
+                    if len(op.qubits) > 1
+                    and len(product_state.sim_states[op.qubits[0]].qubits) >= _MIN_FACTOR_QUBITS
+                ]
+                if cuts:
+                    if product_state._factor_across(
+                        cuts, _interaction_groups(noisy_moments[i + 1 : i + 1 + _LOOKAHEAD_MOMENTS])
+                    ):
+                        failed_factors = 0
+                    else:
+                        failed_factors += 1
+                        next_factor = i + min(2 ** (failed_factors - 1) + 1, _LOOKAHEAD_MOMENTS)
             yield self._create_step_result(sim_state)
 
+    def _leased_states(self) -> contextlib.AbstractContextManager[None]:
+        """Gives the arrays of states created in this context back to the state pool at exit."""
+        if self._state_pool is None:
+            return contextlib.nullcontext()
+        return self._state_pool.lease()
+
     def _run(
         self, circuit: cirq.AbstractCircuit, param_resolver: cirq.ParamResolver, repetitions: int
     ) -> dict[str, np.ndarray]:
@@ -221,56 +281,93 @@ class SimulatorBase(
         resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
         qubits = tuple(sorted(resolved_circuit.all_qubits()))
-        sim_state = self._create_simulation_state(0, qubits)
+        # No simulation state created here outlives the run, so its arrays can go back to the pool.
+        with self._leased_states():
+            sim_state = self._create_simulation_state(0, qubits)
 
-        prefix, general_suffix = (
-            split_into_matching_protocol_then_general(resolved_circuit, self._can_be_in_run_prefix)
-            if self._can_be_in_run_prefix(self.noise)
-            else (resolved_circuit[0:0], resolved_circuit)
-        )
-        step_result: TStepResultBase | None = None
-        for step_result in self._core_iterator(circuit=prefix, sim_state=sim_state):
-            pass
-        assert step_result is not None
-
-        general_ops = list(general_suffix.all_operations())
-        if all(isinstance(op.gate, ops.MeasurementGate) for op in general_ops):
-            for step_result in self._core_iterator(
-                circuit=general_suffix, sim_state=sim_state, all_measurements_are_terminal=True
-            ):
+            prefix, general_suffix = (
+                split_into_matching_protocol_then_general(
+                    resolved_circuit, self._can_be_in_run_prefix
+                )
+                if self._can_be_in_run_prefix(self.noise)
+                else (resolved_circuit[0:0], resolved_circuit)
+            )
+            step_result: TStepResultBase | None = None
+            for step_result in self._core_iterator(circuit=prefix, sim_state=sim_state):
                 pass
             assert step_result is not None
-            measurement_ops = [cast(ops.GateOperation, op) for op in general_ops]
-            return step_result.sample_measurement_ops(
-                measurement_ops, repetitions, seed=self._prng, _allow_repeated=True
-            )
 
-        records: dict[cirq.MeasurementKey, list[Sequence[Sequence[int]]]] = {}
-        for i in range(repetitions):
-            for step_result in self._core_iterator(
-                general_suffix,
-                sim_state=(
-                    sim_state.copy(deep_copy_buffers=False) if i < repetitions - 1 else sim_state
-                ),
-            ):
-                pass
-            for k, r in step_result._classical_data.records.items():
-                if k not in records:
-                    records[k] = []
-                records[k].append(r)
-            for k, cr in step_result._classical_data.channel_records.items():
-                if k not in records:
-                    records[k] = []
-                records[k].append([cr])
-
-        def pad_evenly(results: Sequence[Sequence[Sequence[int]]]):
-            largest = max(len(result) for result in results)
-            xs = np.zeros((len(results), largest, len(results[0][0])), dtype=np.uint8)
-            for i, result in enumerate(results):
-                xs[i, 0 : len(result), :] = result
-            return xs
-
-        return {str(k): pad_evenly(v) for k, v in records.items()}
+            general_ops = list(general_suffix.all_operations())
+            if all(isinstance(op.gate, ops.MeasurementGate) for op in general_ops):
+                for step_result in self._core_iterator(
+                    circuit=general_suffix, sim_state=sim_state, all_measurements_are_terminal=True
+                ):
+                    pass
+                assert step_result is not None
+                measurement_ops = [cast(ops.GateOperation, op) for op in general_ops]
+                return step_result.sample_measurement_ops(
+                    measurement_ops, repetitions, seed=self._prng, _allow_repeated=True
+                )
+
+            batched_records = self._run_batched_trajectories(general_suffix, sim_state, repetitions)
+            if batched_records is not None:
+                return batched_records
+
+            records: dict[cirq.MeasurementKey, list[Sequence[Sequence[int]]]] = {}
+            for i in range(repetitions):
+                with self._leased_states():
+                    for step_result in self._core_iterator(
+                        general_suffix,
+                        sim_state=(
+                            sim_state.copy(deep_copy_buffers=False)
+                            if i < repetitions - 1
+                            else sim_state
+                        ),
+                    ):
+                        pass
+                for k, r in step_result._classical_data.records.items():
+                    if k not in records:
+                        records[k] = []
+                    records[k].append(r)
+                for k, cr in step_result._classical_data.channel_records.items():
+                    if k not in records:
+                        records[k] = []
+                    records[k].append([cr])
+
+            def pad_evenly(results: Sequence[Sequence[Sequence[int]]]):
+                largest = max(len(result) for result in results)
+                xs = np.zeros((len(results), largest, len(results[0][0])), dtype=np.uint8)
+                for i, result in enumerate(results):
+                    xs[i, 0 : len(result), :] = result
+                return xs
+
+            return {str(k): pad_evenly(v) for k, v in records.items()}
+
+    def _run_batched_trajectories(
+        self,
+        circuit: cirq.AbstractCircuit,
+        sim_state: SimulationStateBase[TSimulationState],
+        repetitions: int,
+    ) -> dict[str, np.ndarray] | None:
+        """Samples all repetitions of a non-unitary circuit suffix at once.
+
+        `_run` calls this before falling back to re-simulating the general
+        suffix once per repetition. Simulators whose state representation can
+        carry many trajectories side by side can override this to evolve the
+        whole batch together, splitting it only at measurements and channels.
+
+        Args:
+            circuit: The general suffix of the circuit being run.
+            sim_state: The state after simulating the prefix. Implementations
+                must not modify it.
+            repetitions: The number of trajectories to sample.
+
+        Returns:
+            A map from measurement key to an array of shape
+            `(repetitions, instances, qubits)` in the same format as `_run`,
+            or None if batched sampling is not supported for this circuit.
+        """
+        return None
 
     def simulate_sweep_iter(
         self,
@@ -16,17 +16,23 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterator, Sequence
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import ops
+from cirq import devices, ops, protocols
 from cirq.sim import simulator, state_vector, state_vector_simulation_state, state_vector_simulator
+from cirq.transformers import merge_k_qubit_gates
 
 if TYPE_CHECKING:
     import cirq
 
+# Upper bound on the number of amplitudes held by a batch of trajectories when
+# sampling with `batch_trajectories=True`.
+_MAX_TRAJECTORY_BATCH_AMPLITUDES = 2**24
+
 
 class Simulator(
     state_vector_simulator.SimulatesIntermediateStateVector['SparseSimulatorStep'],
@@ -132,6 +138,10 @@ class Simulator(
         noise: cirq.NOISE_MODEL_LIKE = None,
         seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
         split_untangled_states: bool = True,
+        batch_trajectories: bool = False,
+        fuse_gates: int = 0,
+        memmap_dir: str | os.PathLike | None = None,
+        state_pool: cirq.SimulationStatePool | None = None,
     ):
         """A sparse matrix simulator.
 
@@ -143,14 +153,76 @@ class Simulator(
             split_untangled_states: If True, optimizes simulation by running
                 unentangled qubit sets independently and merging those states
                 at the end.
+            batch_trajectories: If True, `run` samples circuits with noise or
+                non-terminal measurements by evolving all repetitions together
+                in a stacked `(repetitions, *qid_shape)` tensor instead of
+                re-simulating the circuit once per repetition. Circuits with
+                classically controlled operations, measurement confusion maps
+                or keyed channels are still simulated one repetition at a time.
+            fuse_gates: If positive, connected components of unitary operations
+                acting on at most this many qubits are merged into a single
+                `cirq.MatrixGate` before simulation, so that each component
+                takes one pass over the state vector instead of one pass per
+                gate. Fusion is only applied by `run` and the final state
+                `simulate` methods of noiseless simulators, once per sweep,
+                and parameterized operations are not fused. The most recently
+                fused circuit is cached by the simulator.
+            memmap_dir: If given, state vectors are stored in temporary
+                memory-mapped files in this directory and updated chunk by
+                chunk, so that simulations are limited by disk space rather
+                than memory. Untangled states are not split in this mode.
+            state_pool: If given, state vectors and buffers are taken from
+                this pool, and `run` gives them back when it is done, so that
+                repeatedly running circuits on the same qubits reuses them
+                instead of allocating new ones. Ignored if `memmap_dir` is
+                given.
 
         Raises:
-            ValueError: If the given dtype is not complex.
+            ValueError: If the given dtype is not complex, or if `fuse_gates`
+                is negative.
         """
         if np.dtype(dtype).kind != 'c':
             raise ValueError(f'dtype must be a complex type but was {dtype}')
+        if fuse_gates < 0:
+            raise ValueError(f'fuse_gates must be non-negative but was {fuse_gates}')
         super().__init__(
-            dtype=dtype, noise=noise, seed=seed, split_untangled_states=split_untangled_states
+            dtype=dtype,
+            noise=noise,
+            seed=seed,
+            split_untangled_states=split_untangled_states and memmap_dir is None,
+        )
+        self._batch_trajectories = batch_trajectories
+        self._fuse_gates = fuse_gates
+        self._last_fused: tuple[cirq.FrozenCircuit, cirq.FrozenCircuit] | None = None
+        self._memmap_dir = memmap_dir
+        self._state_pool = state_pool
+
+    def _fused(self, circuit: cirq.AbstractCircuit) -> cirq.AbstractCircuit:
+        """Returns the circuit with small unitary components fused, if enabled."""
+        if not self._fuse_gates or self.noise != devices.NO_NOISE:
+            return circuit
+        frozen = circuit.freeze()
+        if self._last_fused is None or self._last_fused[0] != frozen:
+            fused = merge_k_qubit_gates.merge_k_qubit_unitaries(
+                frozen, k=self._fuse_gates, rewriter=_fuse_component
+            ).freeze()
+            self._last_fused = (frozen, fused)
+        return self._last_fused[1]
+
+    def run_sweep_iter(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
+    ) -> Iterator[cirq.Result]:
+        yield from super().run_sweep_iter(self._fused(program), params, repetitions)
+
+    def simulate_sweep_iter(
+        self,
+        program: cirq.AbstractCircuit,
+        params: cirq.Sweepable,
+        qubit_order: cirq.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+        initial_state: Any = None,
+    ) -> Iterator[cirq.StateVectorTrialResult]:
+        yield from super().simulate_sweep_iter(
+            self._fused(program), params, qubit_order, initial_state
         )
 
     def _create_partial_simulation_state(
@@ -183,6 +255,8 @@ class Simulator(
             classical_data=classical_data,
             initial_state=initial_state,
             dtype=self._dtype,
+            memmap_dir=self._memmap_dir,
+            state_pool=self._state_pool,
         )
 
     def _create_step_result(
@@ -190,6 +264,56 @@ class Simulator(
     ):
         return SparseSimulatorStep(sim_state=sim_state, dtype=self._dtype)
 
+    def _run_batched_trajectories(
+        self,
+        circuit: cirq.AbstractCircuit,
+        sim_state: cirq.SimulationStateBase[cirq.StateVectorSimulationState],
+        repetitions: int,
+    ) -> dict[str, np.ndarray] | None:
+        if not self._batch_trajectories:
+            return None
+        noisy_ops = [
+            op
+            for moment in self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
+            for op in ops.flatten_to_ops(moment)
+        ]
+        measurement_sizes: dict[str, int] = {}
+        for op in noisy_ops:
+            if protocols.control_keys(op):
+                return None
+            if isinstance(op.gate, ops.MeasurementGate):
+                if op.gate.confusion_map:
+                    return None
+                key = str(protocols.measurement_key_obj(op))
+                if measurement_sizes.setdefault(key, len(op.qubits)) != len(op.qubits):
+                    return None
+            elif protocols.is_measurement(op) or not protocols.has_kraus(op):
+                return None
+
+        merged_state = sim_state.create_merged_state()
+        initial_tensor = merged_state.target_tensor
+        batch_size = max(
+            1, min(repetitions, _MAX_TRAJECTORY_BATCH_AMPLITUDES // initial_tensor.size)
+        )
+        chunks: dict[str, list[np.ndarray]] = {key: [] for key in measurement_sizes}
+        for start in range(0, repetitions, batch_size):
+            state = state_vector_simulation_state._BatchedStateVector.broadcast(
+                initial_tensor, min(batch_size, repetitions - start)
+            )
+            records: dict[str, list[np.ndarray]] = {key: [] for key in measurement_sizes}
+            for op in noisy_ops:
+                axes = merged_state.get_axes(op.qubits)
+                if isinstance(op.gate, ops.MeasurementGate):
+                    bits = state.measure(axes, self._prng)
+                    invert = np.array(op.gate.full_invert_mask()) & (bits < 2)
+                    records[str(protocols.measurement_key_obj(op))].append(bits ^ invert)
+                elif not protocols.has_unitary(op) or not state.apply_unitary(op, axes):
+                    if state.apply_mixture(op, axes, self._prng) is None:
+                        state.apply_channel(op, axes, self._prng)
+            for key, instances in records.items():
+                chunks[key].append(np.stack(instances, axis=1).astype(np.uint8))
+        return {key: np.concatenate(arrays) for key, arrays in chunks.items()}
+
     def simulate_expectation_values_sweep_iter(
         self,
         program: cirq.AbstractCircuit,
@@ -218,6 +342,16 @@ class Simulator(
         )
 
 
+def _fuse_component(component: cirq.CircuitOperation) -> cirq.OP_TREE:
+    operations = list(component.circuit.all_operations())
+    if len(operations) == 1:
+        # Keep lone operations, which may have faster `_apply_unitary_` kernels.
+        return operations[0]
+    return ops.MatrixGate(
+        protocols.unitary(component), qid_shape=protocols.qid_shape(component)
+    ).on(*component.qubits)
+
+
 class SparseSimulatorStep(
     state_vector.StateVectorMixin, state_vector_simulator.StateVectorStepResult
 ):
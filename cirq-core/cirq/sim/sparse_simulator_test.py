@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import itertools
 import random
+from typing import cast
 from unittest import mock
 
 import numpy as np
@@ -1469,3 +1471,302 @@ def test_measurement_preserves_phase(split: bool) -> None:
     for _ in range(20):
         result = simulator.simulate(circuit, initial_state=(1, 1, 1), qubit_order=(c1, c2, t))
         assert result.dirac_notation() == '|110⟩'
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+@pytest.mark.parametrize('split', [True, False])
+def test_batch_trajectories_mid_circuit_measurements(
+    dtype: type[np.complexfloating], split: bool
+) -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.measure(q0, key='a'),
+        cirq.CNOT(q0, q1),
+        cirq.measure(q1, key='b'),
+        cirq.H(q1),
+        cirq.measure(q1, key='c', invert_mask=(True,)),
+    )
+    simulator = cirq.Simulator(
+        dtype=dtype, split_untangled_states=split, batch_trajectories=True, seed=1234
+    )
+    meas = simulator.run(circuit, repetitions=1000).measurements
+    assert all(meas[k].shape == (1000, 1) for k in 'abc')
+    np.testing.assert_equal(meas['a'], meas['b'])
+    assert 400 < np.sum(meas['a']) < 600
+    assert 400 < np.sum(meas['c']) < 600
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_batch_trajectories_channels_and_repeated_keys(split: bool) -> None:
+    q0, q1 = cirq.LineQid.for_qid_shape((2, 3))
+    circuit = cirq.Circuit(
+        cirq.X(q0),
+        cirq.XPowGate(dimension=3)(q1) ** 2,
+        cirq.measure(q0, key='m0'),
+        cirq.amplitude_damp(1.0).on(q0),
+        cirq.measure(q0, key='m0'),
+        cirq.bit_flip(1.0).on(q0),
+        cirq.measure(q0, q1, key='m1', invert_mask=(False, True)),
+        cirq.reset(q1),
+        cirq.measure(q1, key='m2'),
+    )
+    simulator = cirq.Simulator(split_untangled_states=split, batch_trajectories=True)
+    result = simulator.run(circuit, repetitions=20)
+    np.testing.assert_equal(result.records['m0'], np.tile([[[1], [0]]], (20, 1, 1)))
+    np.testing.assert_equal(result.records['m1'], np.tile([[[1, 2]]], (20, 1, 1)))
+    np.testing.assert_equal(result.records['m2'], np.zeros((20, 1, 1)))
+
+
+def test_batch_trajectories_matches_exact_distribution() -> None:
+    qubits = cirq.LineQubit.range(3)
+
+    def circuit(mid_measurement):
+        return cirq.Circuit(
+            cirq.H.on_each(*qubits),
+            cirq.CZ(qubits[0], qubits[1]),
+            mid_measurement,
+            cirq.H.on_each(*qubits),
+            cirq.amplitude_damp(0.3).on_each(*qubits),
+        )
+
+    noise = cirq.ConstantQubitNoiseModel(cirq.depolarize(0.1))
+    # An unused mid-circuit measurement fully dephases the measured qubit.
+    expected = np.diag(
+        cirq.final_density_matrix(circuit(cirq.phase_damp(1.0).on(qubits[0])), noise=noise)
+    ).real
+    simulator = cirq.Simulator(noise=noise, batch_trajectories=True, seed=1)
+    repetitions = 10000
+    result = simulator.run(
+        circuit(cirq.measure(qubits[0], key='mid')) + cirq.measure(*qubits, key='end'),
+        repetitions=repetitions,
+    )
+    histogram = result.histogram(key='end')
+    for outcome in range(8):
+        assert abs(histogram[outcome] / repetitions - expected[outcome]) < 0.02
+
+
+def test_batch_trajectories_seeded_runs_are_deterministic() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='a'), cirq.H(q), cirq.measure(q))
+    results = [
+        cirq.Simulator(batch_trajectories=True, seed=5).run(circuit, repetitions=100)
+        for _ in range(2)
+    ]
+    assert results[0] == results[1]
+
+
+def test_batch_trajectories_splits_large_batches() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='a'), cirq.measure(q, key='b'))
+    simulator = cirq.Simulator(batch_trajectories=True)
+    with mock.patch.object(cirq.sim.sparse_simulator, '_MAX_TRAJECTORY_BATCH_AMPLITUDES', 6):
+        meas = simulator.run(circuit, repetitions=10).measurements
+    assert meas['a'].shape == (10, 1)
+    np.testing.assert_equal(meas['a'], meas['b'])
+
+
+def test_batch_trajectories_falls_back_for_unsupported_ops() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    simulator = cirq.Simulator(batch_trajectories=True)
+    circuits = [
+        cirq.Circuit(
+            cirq.H(q0), cirq.measure(q0, key='a'), cirq.X(q1).with_classical_controls('a')
+        ),
+        cirq.Circuit(cirq.H(q0), cirq.measure(q0, key='a', confusion_map={(0,): np.eye(2)})),
+        cirq.Circuit(cirq.KrausChannel(cirq.kraus(cirq.bit_flip(0.5)), key='k').on(q0)),
+        cirq.Circuit(cirq.measure(q0, key='a'), cirq.measure(q0, q1, key='a')),
+    ]
+    for circuit in circuits:
+        with mock.patch.object(
+            cirq.sim.state_vector_simulation_state._BatchedStateVector,
+            'broadcast',
+            side_effect=AssertionError,
+        ):
+            with contextlib.suppress(ValueError):
+                simulator.run(circuit, repetitions=3)
+    result = simulator.run(circuits[0] + cirq.measure(q1), repetitions=50)
+    np.testing.assert_equal(result.measurements['a'], result.measurements['q(1)'])
+
+
+def test_sweeps_resolve_compiled_circuit() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(cirq.X(q0) ** (2 * t), cirq.X(q1) ** (1 - 2 * t), cirq.measure(q0, q1))
+    params = cirq.Points(t, [0, 0.5, 0])
+    simulator = cirq.Simulator()
+    with mock.patch.object(
+        cirq.CompiledParameterizedCircuit,
+        'resolve',
+        autospec=True,
+        side_effect=cirq.CompiledParameterizedCircuit.resolve,
+    ) as resolve:
+        results = simulator.run_sweep(circuit, params)
+        assert resolve.call_count == 2
+        final_states = [r.final_state_vector for r in simulator.simulate_sweep(circuit, params)]
+        assert resolve.call_count == 5
+    np.testing.assert_equal(
+        [r.measurements['q(0),q(1)'] for r in results], [[[0, 1]], [[1, 0]], [[0, 1]]]
+    )
+    np.testing.assert_allclose(np.abs(final_states[1]), [0, 0, 1, 0], atol=1e-6)
+
+
+@pytest.mark.parametrize('k', [1, 2, 3])
+def test_fuse_gates_matches_unfused_simulation(k: int) -> None:
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=20, op_density=0.8, random_state=1234)
+    simulator = cirq.Simulator(dtype=np.complex128, fuse_gates=k)
+    fused = simulator._fused(circuit)
+    assert len(list(fused.all_operations())) < len(list(circuit.all_operations()))
+    for qubit_order in [qubits, qubits[::-1]]:
+        expected = cirq.Simulator(dtype=np.complex128).simulate(circuit, qubit_order=qubit_order)
+        actual = simulator.simulate(circuit, qubit_order=qubit_order)
+        np.testing.assert_allclose(
+            actual.final_state_vector, expected.final_state_vector, atol=1e-8
+        )
+
+
+def test_fuse_gates_run_with_measurements_and_params() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(
+        cirq.X(q0) ** t,
+        cirq.H(q0),
+        cirq.H(q0),
+        cirq.CNOT(q0, q1),
+        cirq.measure(q0, key='a'),
+        cirq.X(q1),
+        cirq.Z(q1),
+        cirq.measure(q1, key='b'),
+    )
+    simulator = cirq.Simulator(fuse_gates=2, seed=1)
+    results = simulator.run_sweep(circuit, cirq.Points(t, [0, 1]), repetitions=10)
+    np.testing.assert_equal(results[0].measurements['a'], 0)
+    np.testing.assert_equal(results[0].measurements['b'], 1)
+    np.testing.assert_equal(results[1].measurements['a'], 1)
+    np.testing.assert_equal(results[1].measurements['b'], 0)
+    assert results[1].params == cirq.ParamResolver({'t': 1})
+    # The unresolved circuit is fused once for the whole sweep.
+    assert simulator._last_fused is not None
+    assert simulator._last_fused[0] == circuit.freeze()
+
+
+def test_fuse_gates_caches_and_skips_noise() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** 0.5, cirq.Y(q) ** 0.5, cirq.Z(q) ** 0.5)
+    simulator = cirq.Simulator(fuse_gates=1)
+    fused = simulator._fused(circuit)
+    assert fused is simulator._fused(circuit.freeze())
+    assert len(list(fused.all_operations())) == 1
+    np.testing.assert_allclose(cirq.unitary(fused), cirq.unitary(circuit), atol=1e-8)
+
+    assert cirq.Simulator()._fused(circuit) is circuit
+    noisy = cirq.Simulator(fuse_gates=1, noise=cirq.depolarize(0.1))
+    assert noisy._fused(circuit) is circuit
+
+
+def test_fuse_gates_negative() -> None:
+    with pytest.raises(ValueError, match='fuse_gates'):
+        cirq.Simulator(fuse_gates=-1)
+
+
+def test_memmap_dir(tmp_path) -> None:
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=10, op_density=0.8, random_state=5)
+    simulator = cirq.Simulator(dtype=np.complex128, memmap_dir=tmp_path)
+    result = simulator.simulate(circuit, initial_state=3)
+    final_state = cast(cirq.StateVectorSimulationState, result._final_simulator_state)
+    assert isinstance(final_state.target_tensor, np.memmap)
+    np.testing.assert_allclose(
+        result.final_state_vector,
+        cirq.Simulator(dtype=np.complex128).simulate(circuit, initial_state=3).final_state_vector,
+        atol=1e-8,
+    )
+
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        cirq.CNOT(*qubits[:2]),
+        cirq.measure(qubits[0], key='a'),
+        cirq.X(qubits[2]),
+        cirq.measure(*qubits[1:3], key='b'),
+    )
+    measurements = cirq.Simulator(memmap_dir=tmp_path, seed=1).run(circuit, repetitions=20)
+    np.testing.assert_equal(
+        measurements.measurements['b'][:, 0], measurements.measurements['a'][:, 0]
+    )
+    np.testing.assert_equal(measurements.measurements['b'][:, 1], 1)
+
+
+def test_split_untangled_states_factors_uncomputed_ancilla(monkeypatch) -> None:
+    monkeypatch.setattr(cirq.sim.simulator_base, '_MIN_FACTOR_QUBITS', 2)
+    a, *qs = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qs),
+        [(cirq.CNOT(q, a), cirq.rz(0.3).on(a), cirq.CNOT(q, a)) for q in qs],
+        cirq.CZ(qs[0], qs[1]),
+    )
+    result = cirq.Simulator(split_untangled_states=True).simulate(circuit)
+    final_state = result._final_simulator_state
+    assert final_state[a].qubits == (a,)
+    assert final_state[qs[2]].qubits == (qs[2],)
+    assert final_state[qs[0]] is final_state[qs[1]]
+    np.testing.assert_allclose(
+        result.final_state_vector,
+        cirq.Simulator(split_untangled_states=False).simulate(circuit).final_state_vector,
+        atol=1e-6,
+    )
+
+
+def test_split_untangled_states_only_factors_large_states() -> None:
+    a, *qs = cirq.LineQubit.range(13)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qs), [(cirq.CNOT(q, a), cirq.rz(0.3).on(a), cirq.CNOT(q, a)) for q in qs]
+    )
+    result = cirq.Simulator(split_untangled_states=True).simulate(circuit)
+    final_state = result._final_simulator_state
+    # Small states are left merged, and larger ones are factored once they are untangled.
+    assert len(final_state[a].qubits) > 1
+    assert max(len(final_state[q].qubits) for q in qs) < cirq.sim.simulator_base._MIN_FACTOR_QUBITS
+    np.testing.assert_allclose(
+        result.final_state_vector,
+        cirq.Simulator(split_untangled_states=False).simulate(circuit).final_state_vector,
+        atol=1e-6,
+    )
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_state_pool(split: bool) -> None:
+    pool = cirq.SimulationStatePool()
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuits = [
+        cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q2), cirq.measure(q0, q1, q2)),
+        cirq.Circuit(
+            cirq.H(q0),
+            cirq.CNOT(q0, q1),
+            cirq.measure(q0, key='a'),
+            cirq.CNOT(q1, q2),
+            cirq.ISWAP(q0, q2) ** 0.5,
+            cirq.measure(q0, q1, q2, key='b'),
+        ),
+    ]
+    for circuit in circuits:
+        for seed in range(3):
+            result = cirq.Simulator(state_pool=pool, split_untangled_states=split, seed=seed).run(
+                circuit, repetitions=10
+            )
+            expected = cirq.Simulator(split_untangled_states=split, seed=seed).run(
+                circuit, repetitions=10
+            )
+            assert result == expected
+            if seed == 0:
+                allocations = pool.allocations
+        assert pool.allocations == allocations
+
+    # States returned by simulate are not given back to the pool.
+    result = cirq.Simulator(state_pool=pool).simulate(circuits[0][:-1])
+    assert len(pool) < pool.allocations
+    np.testing.assert_allclose(
+        result.final_state_vector,
+        cirq.final_state_vector(circuits[0][:-1], dtype=np.complex64),
+        atol=1e-6,
+    )
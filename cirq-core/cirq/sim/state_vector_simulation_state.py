@@ -16,12 +16,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+import functools
+import os
+import tempfile
+from collections.abc import Callable, Iterator, Sequence
 from typing import Any, Self, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import linalg, protocols, qis, sim
+from cirq import linalg, ops, protocols, qis, sim, value
 from cirq._compat import proper_repr
 from cirq.linalg import transformations
 from cirq.sim.simulation_state import SimulationState, strat_act_on_from_apply_decompose
@@ -29,26 +32,75 @@ from cirq.sim.simulation_state import SimulationState, strat_act_on_from_apply_d
 if TYPE_CHECKING:
     import cirq
 
+# Upper bound on the number of amplitudes of a memory-mapped state vector that
+# are held in memory at once.
+_MEMMAP_CHUNK_SIZE = 2**22
+
+# Number of amplitudes updated at once by the in-place single-qubit kernel, chosen
+# so that the temporaries of each block stay in cache.
+_IN_PLACE_BLOCK_SIZE = 2**14
+
+# Gates whose unitaries are applied by the in-place kernels of `_BufferedStateVector`
+# when they are diagonal, permutations up to phases, or act on a single qubit.
+_IN_PLACE_GATE_TYPES: tuple[type[cirq.Gate], ...] = (
+    ops.ZPowGate,
+    ops.CZPowGate,
+    ops.CCZPowGate,
+    ops.DiagonalGate,
+    ops.TwoQubitDiagonalGate,
+    ops.ThreeQubitDiagonalGate,
+    ops.XPowGate,
+    ops.YPowGate,
+    ops.HPowGate,
+    ops.PhasedXPowGate,
+    ops.PhasedXZGate,
+    ops.CXPowGate,
+    ops.CCXPowGate,
+    ops.SwapPowGate,
+    ops.QubitPermutationGate,
+    ops.MatrixGate,
+)
+
 
 class _BufferedStateVector(qis.QuantumStateRepresentation):
     """Contains the state vector and buffer for efficient state evolution."""
 
-    def __init__(self, state_vector: np.ndarray, buffer: np.ndarray | None = None):
+    def __init__(
+        self,
+        state_vector: np.ndarray,
+        buffer: np.ndarray | None = None,
+        pool: cirq.SimulationStatePool | None = None,
+    ):
         """Initializes the object with the inputs.
 
-        This initializer creates the buffer if necessary.
-
         Args:
             state_vector: The state vector, must be correctly formatted. The data is not checked
                 for validity here due to performance concerns.
             buffer: Optional, must be same shape as the state vector. If not provided, a buffer
-                will be created automatically.
+                will be created the first time an operation needs it. Diagonal, permutation and
+                single-qubit gates are applied in place and never need it.
+            pool: Optional pool to take the buffer, and the state vectors of copies and Kronecker
+                products, from.
         """
         self._state_vector = state_vector
-        if buffer is None:
-            buffer = np.empty_like(state_vector)
-        self._buffer = buffer
+        self._lazy_buffer = buffer
         self._qid_shape = state_vector.shape
+        self._pool = pool
+
+    @property
+    def _buffer(self) -> np.ndarray:
+        if self._lazy_buffer is None:
+            self._lazy_buffer = self._allocate_buffer()
+        return self._lazy_buffer
+
+    @_buffer.setter
+    def _buffer(self, buffer: np.ndarray) -> None:
+        self._lazy_buffer = buffer
+
+    def _allocate_buffer(self) -> np.ndarray:
+        if self._pool is not None:
+            return self._pool.empty(self._state_vector.shape, self._state_vector.dtype)
+        return np.empty_like(self._state_vector)
 
     @classmethod
     def create(
@@ -58,6 +110,7 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         qid_shape: tuple[int, ...] | None = None,
         dtype: type[np.complexfloating] | np.dtype[np.complexfloating] | None = None,
         buffer: np.ndarray | None = None,
+        pool: cirq.SimulationStatePool | None = None,
     ):
         """Initializes the object with the inputs.
 
@@ -70,9 +123,21 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             dtype: The dtype of the state vector, if the initial state is provided as an int.
             buffer: Optional, must be length 3 and same shape as the state vector. If not
                 provided, a buffer will be created automatically.
+            pool: Optional pool to take the state vector and buffers from. Computational basis
+                states are then written into a pooled array in place.
         Raises:
             ValueError: If initial state is provided as integer, but qid_shape is not provided.
         """
+        if (
+            pool is not None
+            and isinstance(initial_state, (int, np.integer))
+            and qid_shape is not None
+            and 0 <= initial_state < np.prod(qid_shape, dtype=np.int64)
+        ):
+            state_vector = pool.empty(qid_shape, dtype or np.complex64)
+            state_vector.fill(0)
+            state_vector.reshape(-1)[initial_state] = 1
+            return cls(state_vector, buffer, pool)
         if not isinstance(initial_state, np.ndarray):
             if qid_shape is None:
                 raise ValueError('qid_shape must be provided if initial_state is not ndarray')
@@ -87,7 +152,9 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             if np.may_share_memory(state_vector, initial_state):
                 state_vector = state_vector.copy()
         state_vector = state_vector.astype(dtype, copy=False)
-        return cls(state_vector, buffer)
+        if pool is not None:
+            state_vector = _pooled_copy(pool, state_vector)
+        return cls(state_vector, buffer, pool)
 
     def copy(self, deep_copy_buffers: bool = True) -> _BufferedStateVector:
         """Copies the object.
@@ -97,10 +164,21 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         Returns:
             A copy of the object.
         """
-        return _BufferedStateVector(
-            state_vector=self._state_vector.copy(),
-            buffer=self._buffer.copy() if deep_copy_buffers else self._buffer,
-        )
+        # The contents of the buffer are scratch space, so a deep copy gets a new buffer
+        # when it first needs one rather than a copy of the current one.
+        if deep_copy_buffers:
+            buffer = None
+        elif self._pool is not None:
+            # Sharing a buffer allocated now would tie it to the current lease of the pool,
+            # which may end before this state does.
+            buffer = self._lazy_buffer
+        else:
+            buffer = self._buffer
+        if self._pool is not None:
+            state_vector = _pooled_copy(self._pool, self._state_vector)
+        else:
+            state_vector = self._state_vector.copy()
+        return _BufferedStateVector(state_vector=state_vector, buffer=buffer, pool=self._pool)
 
     def kron(self, other: _BufferedStateVector) -> _BufferedStateVector:
         """Creates the Kronecker product with the other state vector.
@@ -110,10 +188,17 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         Returns:
             The Kronecker product of the two state vectors.
         """
-        target_tensor = transformations.state_vector_kronecker_product(
-            self._state_vector, other._state_vector
-        )
-        return _BufferedStateVector(state_vector=target_tensor, buffer=np.empty_like(target_tensor))
+        if self._pool is not None:
+            target_tensor = self._pool.empty(
+                self._state_vector.shape + other._state_vector.shape,
+                np.result_type(self._state_vector, other._state_vector),
+            )
+            np.multiply.outer(self._state_vector, other._state_vector, out=target_tensor)
+        else:
+            target_tensor = transformations.state_vector_kronecker_product(
+                self._state_vector, other._state_vector
+            )
+        return _BufferedStateVector(state_vector=target_tensor, pool=self._pool)
 
     def factor(
         self, axes: Sequence[int], *, validate=True, atol=1e-07
@@ -135,16 +220,20 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             sub-state vector which corresponds to the axes requested, and with the axes in the
             requested order, and where `remainder` means the sub-state vector on the remaining
             axes, in the same order as the original state vector.
+
+        Raises:
+            EntangledStateError: If validate is True and the state vector is entangled.
         """
+        if validate and _has_entangled_minor(self._state_vector, axes, atol):
+            # Rejects most entangled states without a full pass over the state vector.
+            raise linalg.transformations.EntangledStateError(
+                'The tensor cannot be factored by the requested axes'
+            )
         extracted_tensor, remainder_tensor = transformations.factor_state_vector(
             self._state_vector, axes, validate=validate, atol=atol
         )
-        extracted = _BufferedStateVector(
-            state_vector=extracted_tensor, buffer=np.empty_like(extracted_tensor)
-        )
-        remainder = _BufferedStateVector(
-            state_vector=remainder_tensor, buffer=np.empty_like(remainder_tensor)
-        )
+        extracted = _BufferedStateVector(state_vector=extracted_tensor, pool=self._pool)
+        remainder = _BufferedStateVector(state_vector=remainder_tensor, pool=self._pool)
         return extracted, remainder
 
     def reindex(self, axes: Sequence[int]) -> _BufferedStateVector:
@@ -156,17 +245,32 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             The transposed state vector.
         """
         new_tensor = transformations.transpose_state_vector_to_axis_order(self._state_vector, axes)
-        return _BufferedStateVector(state_vector=new_tensor, buffer=np.empty_like(new_tensor))
+        return _BufferedStateVector(state_vector=new_tensor, pool=self._pool)
 
     def apply_unitary(self, action: Any, axes: Sequence[int]) -> bool:
         """Apply unitary to state.
 
+        Diagonal gates, permutation gates and single-qubit gates listed in
+        `_IN_PLACE_GATE_TYPES` are applied in place by `_apply_in_place`.
+        Other values are applied with `cirq.apply_unitary`, which may write the
+        new state into the buffer, in which case the buffer is swapped in.
+
         Args:
             action: The value with a unitary to apply.
             axes: The axes on which to apply the unitary.
         Returns:
             True if the operation succeeded.
         """
+        gate = getattr(action, 'gate', None)
+        if isinstance(gate, _IN_PLACE_GATE_TYPES) and isinstance(
+            action.untagged, ops.GateOperation
+        ):
+            kernel = _in_place_kernel_for_gate(gate)
+            if kernel is not None and self._apply_in_place(kernel, axes):
+                return True
+        if self._lazy_buffer is None and not protocols.has_unitary(action):
+            # Don't allocate the buffer for channels, which are applied in place.
+            return False
         new_target_tensor = protocols.apply_unitary(
             action,
             protocols.ApplyUnitaryArgs(
@@ -196,6 +300,9 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         probabilities, unitaries = zip(*mixture)
 
         index = prng.choice(range(len(unitaries)), p=probabilities)
+        kernel = _in_place_kernel(unitaries[index])
+        if kernel is not None and self._apply_in_place(kernel, axes):
+            return index
         shape = protocols.qid_shape(action) * 2
         unitary = unitaries[index].astype(self._state_vector.dtype).reshape(shape)
         linalg.targeted_left_multiply(unitary, self._state_vector, axes, out=self._buffer)
@@ -288,6 +395,86 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
             self._state_vector, axes, qid_shape=self._qid_shape, repetitions=repetitions, seed=seed
         )
 
+    def _apply_in_place(self, kernel: _InPlaceKernel, axes: Sequence[int]) -> bool:
+        """Applies a unitary to the state vector without using the buffer.
+
+        Args:
+            kernel: The classified unitary to apply.
+            axes: The axes on which to apply the unitary.
+        Returns:
+            True if the unitary was applied, False if the kernel does not
+            support the shape or memory layout of the state vector.
+        """
+        target = self._state_vector
+        shape = tuple(target.shape[axis] for axis in axes)
+        if shape != kernel.qid_shape:
+            return False
+
+        def subspace(flat_index: int) -> tuple[Any, ...]:
+            index: list[Any] = [slice(None)] * target.ndim
+            for axis, digit in zip(axes, np.unravel_index(flat_index, shape)):
+                index[axis] = int(digit)
+            # The trailing ellipsis makes indexing return a view even if all axes are indexed.
+            return (*index, ...)
+
+        phases = kernel.phases.astype(target.dtype)
+        if kernel.kind == 'diagonal':
+            for i, phase in enumerate(phases):
+                if phase != 1:
+                    target[subspace(i)] *= phase
+            return True
+
+        if kernel.kind == 'permutation':
+            for cycle in kernel.cycles:
+                views = {i: target[subspace(i)] for i in cycle}
+                if len(cycle) == 1:
+                    if phases[cycle[0]] != 1:
+                        views[cycle[0]] *= phases[cycle[0]]
+                    continue
+                # Amplitudes move from each index of the cycle to the next one. This is done
+                # block by block so that the saved amplitudes stay in cache.
+                for block in _block_indices(views[cycle[0]].shape):
+                    last = views[cycle[-1]][block].copy()
+                    for source, destination in zip(cycle[-2::-1], cycle[:0:-1]):
+                        if phases[source] == 1:
+                            views[destination][block] = views[source][block]
+                        else:
+                            np.multiply(
+                                views[source][block], phases[source], out=views[destination][block]
+                            )
+                    if phases[cycle[-1]] != 1:
+                        last *= phases[cycle[-1]]
+                    views[cycle[0]][block] = last
+            return True
+
+        if not target.flags.c_contiguous:
+            return False
+        (axis,) = axes
+        matrix = kernel.matrix.astype(target.dtype)
+        left = int(np.prod(target.shape[:axis], dtype=np.int64))
+        right = int(np.prod(target.shape[axis + 1 :], dtype=np.int64))
+        blocks = target.reshape((left, 2, right))
+        if right >= 16:
+            # Update strided (2, right) views with a small matrix product.
+            rows = max(1, _IN_PLACE_BLOCK_SIZE // (2 * right))
+            columns = min(right, _IN_PLACE_BLOCK_SIZE // 2)
+            for i in range(0, left, rows):
+                for j in range(0, right, columns):
+                    view = blocks[i : i + rows, :, j : j + columns]
+                    view[...] = np.matmul(matrix, view)
+        else:
+            # Matrix products of thin views are slow, combine the two halves directly.
+            rows = max(1, _IN_PLACE_BLOCK_SIZE // (2 * right))
+            for i in range(0, left, rows):
+                zero = blocks[i : i + rows, 0]
+                one = blocks[i : i + rows, 1]
+                old_zero = zero.copy()
+                zero *= matrix[0, 0]
+                zero += matrix[0, 1] * one
+                one *= matrix[1, 1]
+                one += matrix[1, 0] * old_zero
+        return True
+
     def _swap_target_tensor_for(self, new_target_tensor: np.ndarray):
         """Gives a new state vector for the system.
 
@@ -307,6 +494,681 @@ class _BufferedStateVector(qis.QuantumStateRepresentation):
         return True
 
 
+def _pooled_copy(pool: cirq.SimulationStatePool, array: np.ndarray) -> np.ndarray:
+    """Copies an array into an array taken from the pool."""
+    result = pool.empty(array.shape, array.dtype)
+    np.copyto(result, array)
+    return result
+
+
+def _memmap_empty(
+    shape: tuple[int, ...], dtype: Any, directory: str | os.PathLike | None
+) -> np.ndarray:
+    """Creates a zero-initialized array backed by an anonymous temporary file."""
+    # The file is unlinked on creation and deleted once the mapping is released.
+    with tempfile.TemporaryFile(dir=None if directory is None else os.fspath(directory)) as file:
+        return np.memmap(file, dtype=dtype, mode='w+', shape=shape)
+
+
+def _block_indices(shape: tuple[int, ...]) -> Iterator[tuple[Any, ...]]:
+    """Yields indices of the leading axes of `shape` that split it into cache-sized blocks."""
+    size = int(np.prod(shape, dtype=np.int64))
+    outer = 0
+    while outer < len(shape) and size > _IN_PLACE_BLOCK_SIZE:
+        size //= shape[outer]
+        outer += 1
+    for index in np.ndindex(*shape[:outer]):
+        yield (*index, ...)
+
+
+def _has_entangled_minor(
+    state_vector: np.ndarray, axes: Sequence[int], atol: float, size: int = 8
+) -> bool:
+    """Checks whether a sampled submatrix proves that a state is entangled across `axes`.
+
+    A product state, viewed as a matrix with `axes` as rows, has rank one, and so do
+    all of its submatrices. Only a `size` by `size` submatrix is checked, so this
+    can only prove that a state is entangled.
+    """
+    t = np.moveaxis(state_vector, axes, range(len(axes)))
+    rng = np.random.default_rng(0)
+    rows_shape, columns_shape = t.shape[: len(axes)], t.shape[len(axes) :]
+    rows = np.unravel_index(
+        rng.integers(np.prod(rows_shape, dtype=np.int64), size=size), rows_shape
+    )
+    columns = np.unravel_index(
+        rng.integers(np.prod(columns_shape, dtype=np.int64), size=size), columns_shape
+    )
+    minor = t[tuple(r[:, np.newaxis] for r in rows) + tuple(c[np.newaxis, :] for c in columns)]
+    # If the state is within `atol` of a product state, the second singular value of
+    # any `size` by `size` submatrix is at most `size * atol`.
+    return bool(np.linalg.svd(minor, compute_uv=False)[1] > size * atol)
+
+
+class _InPlaceKernel:
+    """A unitary classified by how `_BufferedStateVector` can apply it in place.
+
+    Attributes:
+        kind: One of 'diagonal', 'permutation' or 'matrix'.
+        qid_shape: The shape of the qids the unitary acts on.
+        matrix: The unitary matrix.
+        phases: For 'diagonal', the diagonal. For 'permutation', the nonzero
+            entry of each column.
+        cycles: For 'permutation', the cycles of the permutation of basis
+            states, each listing basis states such that amplitudes move from
+            each state to the next one.
+    """
+
+    def __init__(self, kind: str, qid_shape: tuple[int, ...], matrix: np.ndarray):
+        self.kind = kind
+        self.qid_shape = qid_shape
+        self.matrix = matrix
+        self.phases = np.diagonal(matrix).copy()
+        self.cycles: list[list[int]] = []
+        if kind == 'permutation':
+            destinations = np.argmax(matrix != 0, axis=0)
+            self.phases = matrix[destinations, np.arange(len(matrix))]
+            visited = np.zeros(len(matrix), dtype=bool)
+            for start in range(len(matrix)):
+                cycle = []
+                index = start
+                while not visited[index]:
+                    visited[index] = True
+                    cycle.append(index)
+                    index = int(destinations[index])
+                if cycle:
+                    self.cycles.append(cycle)
+
+
+def _in_place_kernel(
+    matrix: np.ndarray, qid_shape: tuple[int, ...] | None = None
+) -> _InPlaceKernel | None:
+    """Classifies a unitary for in-place application, or returns None."""
+    if qid_shape is None:
+        if matrix.shape[0] & (matrix.shape[0] - 1):
+            return None
+        qid_shape = (2,) * (matrix.shape[0].bit_length() - 1)
+    nonzero = matrix != 0
+    if not np.any(nonzero & ~np.eye(len(matrix), dtype=bool)):
+        return _InPlaceKernel('diagonal', qid_shape, matrix)
+    if np.all(np.sum(nonzero, axis=0) == 1) and np.all(np.sum(nonzero, axis=1) == 1):
+        return _InPlaceKernel('permutation', qid_shape, matrix)
+    if qid_shape == (2,):
+        return _InPlaceKernel('matrix', qid_shape, matrix)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _in_place_kernel_for_gate(gate: cirq.Gate) -> _InPlaceKernel | None:
+    # Gates with many qubits would need large matrices, leave them to `apply_unitary`.
+    if gate.num_qubits() > 4:
+        return None
+    matrix = protocols.unitary(gate, None)
+    if matrix is None:
+        return None
+    return _in_place_kernel(matrix, protocols.qid_shape(gate))
+
+
+class _MemmapStateVector(_BufferedStateVector):
+    """A state vector stored in a memory-mapped temporary file.
+
+    This allows simulating states that do not fit in memory. Operations are
+    applied chunk by chunk: the state is split along the leading axes that the
+    operation does not act on into sub-tensors of at most `chunk_size`
+    amplitudes, which are updated independently. Operations on high-order
+    qubits thus touch a few contiguous blocks of each chunk, and operations on
+    low-order qubits stream through contiguous chunks.
+
+    Only a chunk-sized scratch array is held in memory, so no state-sized
+    buffer is needed. Operations whose `_apply_unitary_` works in place, such
+    as diagonal gates, write directly to the mapped file.
+    """
+
+    def __init__(
+        self,
+        state_vector: np.ndarray,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = _MEMMAP_CHUNK_SIZE,
+    ):
+        """Initializes the object with the inputs.
+
+        Args:
+            state_vector: The memory-mapped state vector, must be correctly
+                formatted. The data is not checked for validity.
+            directory: The directory in which to create the files of new
+                states, e.g. copies of this one. Defaults to the system
+                temporary directory.
+            chunk_size: The maximum number of amplitudes to process at once.
+        """
+        self._state_vector = state_vector
+        self._directory = directory
+        self._chunk_size = chunk_size
+        self._qid_shape = state_vector.shape
+        self._lazy_buffer = None
+        self._pool = None
+
+    @classmethod
+    def create(  # type: ignore[override]
+        cls,
+        *,
+        initial_state: np.ndarray | cirq.STATE_VECTOR_LIKE = 0,
+        qid_shape: tuple[int, ...] | None = None,
+        dtype: type[np.complexfloating] | np.dtype[np.complexfloating] | None = None,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = _MEMMAP_CHUNK_SIZE,
+    ):
+        """Creates a memory-mapped state vector.
+
+        Args:
+            initial_state: The initial state, either as a computational basis
+                state index or as a state vector.
+            qid_shape: The shape of the state vector. Required unless the
+                initial state is provided as an ndarray.
+            dtype: The dtype of the state vector. Defaults to the dtype of an
+                ndarray initial state, or `np.complex64`.
+            directory: The directory in which to create the files.
+            chunk_size: The maximum number of amplitudes to process at once.
+
+        Raises:
+            ValueError: If qid_shape is not provided and the initial state is
+                not an ndarray, or if a basis state index is out of range.
+        """
+        if isinstance(initial_state, np.ndarray):
+            tensor = initial_state if qid_shape is None else initial_state.reshape(qid_shape)
+            qid_shape = tensor.shape
+        elif qid_shape is None:
+            raise ValueError('qid_shape must be provided if initial_state is not ndarray')
+        elif isinstance(initial_state, (int, np.integer)):
+            tensor = None
+            index = int(initial_state)
+            size = int(np.prod(qid_shape, dtype=np.int64))
+            if not 0 <= index < size:
+                raise ValueError(
+                    f'Computational basis state is out of range: {initial_state} not in [0, {size})'
+                )
+        else:
+            tensor = qis.to_valid_state_vector(
+                initial_state, len(qid_shape), qid_shape=qid_shape, dtype=dtype
+            ).reshape(qid_shape)
+        if dtype is None:
+            dtype = np.complex64 if tensor is None else tensor.dtype
+        state_vector = _memmap_empty(tuple(qid_shape), dtype, directory)
+        result = cls(state_vector, directory, chunk_size)
+        if tensor is None:
+            state_vector.reshape(-1)[index] = 1
+        else:
+            result._copy_from(tensor)
+        return result
+
+    def _allocate_buffer(self) -> np.ndarray:
+        # Only needed if accessed directly, e.g. through `available_buffer`.
+        return _memmap_empty(self._qid_shape, self._state_vector.dtype, self._directory)
+
+    def _empty_like(self, shape: tuple[int, ...]) -> _MemmapStateVector:
+        return _MemmapStateVector(
+            _memmap_empty(shape, self._state_vector.dtype, self._directory),
+            self._directory,
+            self._chunk_size,
+        )
+
+    def _copy_from(self, tensor: np.ndarray) -> None:
+        target = self._state_vector.reshape(-1)
+        source = tensor.reshape(-1)
+        for start in range(0, target.size, self._chunk_size):
+            target[start : start + self._chunk_size] = source[start : start + self._chunk_size]
+
+    def _outer_axes(self, axes: Sequence[int]) -> list[int]:
+        """Returns the leading axes, other than `axes`, that the state is chunked along."""
+        size = int(np.prod(self._qid_shape, dtype=np.int64))
+        outer: list[int] = []
+        for axis, dim in enumerate(self._qid_shape):
+            if size <= self._chunk_size:
+                break
+            if axis not in axes:
+                outer.append(axis)
+                size //= dim
+        return outer
+
+    def _chunks(self, axes: Sequence[int]) -> Iterator[tuple[np.ndarray, list[int]]]:
+        """Yields views of the sub-tensors that operations on the given axes act on.
+
+        Args:
+            axes: The axes acted on.
+        Yields:
+            Tuples of a view of a sub-tensor holding at most `chunk_size`
+            amplitudes (or all amplitudes on `axes` if that is larger) and
+            the positions of `axes` within that sub-tensor.
+        """
+        outer = self._outer_axes(axes)
+        local_axes = [axis - sum(o < axis for o in outer) for axis in axes]
+        index: list[Any] = [slice(None)] * len(self._qid_shape)
+        for values in np.ndindex(*(self._qid_shape[axis] for axis in outer)):
+            for axis, v in zip(outer, values):
+                index[axis] = v
+            yield self._state_vector[tuple(index)], local_axes
+
+    def _apply_matrix(
+        self, tensor: np.ndarray, axes: Sequence[int], scale: float | None = None
+    ) -> None:
+        buffer: np.ndarray | None = None
+        for chunk, local_axes in self._chunks(axes):
+            if buffer is None or buffer.shape != chunk.shape:
+                buffer = np.empty(chunk.shape, dtype=chunk.dtype)
+            linalg.targeted_left_multiply(tensor, chunk, local_axes, out=buffer)
+            if scale is not None:
+                buffer *= scale
+            chunk[...] = buffer
+
+    def _norm_squared_after(self, tensor: np.ndarray, axes: Sequence[int]) -> float:
+        total = 0.0
+        buffer: np.ndarray | None = None
+        for chunk, local_axes in self._chunks(axes):
+            if buffer is None or buffer.shape != chunk.shape:
+                buffer = np.empty(chunk.shape, dtype=chunk.dtype)
+            linalg.targeted_left_multiply(tensor, chunk, local_axes, out=buffer)
+            total += float(np.vdot(buffer, buffer).real)
+        return total
+
+    def _probabilities(self, axes: Sequence[int]) -> np.ndarray:
+        meas_shape = tuple(self._qid_shape[axis] for axis in axes)
+        probs = np.zeros(meas_shape, dtype=np.float64)
+        for chunk, local_axes in self._chunks(axes):
+            moved = np.moveaxis(np.abs(chunk) ** 2, local_axes, range(len(axes)))
+            probs += np.sum(moved, axis=tuple(range(len(axes), moved.ndim)))
+        return probs.reshape(-1)
+
+    def copy(self, deep_copy_buffers: bool = True) -> _MemmapStateVector:
+        """Copies the object into a new file.
+
+        Args:
+            deep_copy_buffers: Unused, memory-mapped states have no buffer.
+        Returns:
+            A copy of the object.
+        """
+        result = self._empty_like(self._qid_shape)
+        result._copy_from(self._state_vector)
+        return result
+
+    def kron(self, other: _BufferedStateVector) -> _MemmapStateVector:
+        """Creates the Kronecker product with the other state vector.
+
+        Args:
+            other: The state vector with which to kron.
+        Returns:
+            The Kronecker product of the two state vectors, in a new file.
+        """
+        right = other._state_vector.reshape(-1)
+        result = self._empty_like(self._qid_shape + other._state_vector.shape)
+        source = self._state_vector.reshape(-1)
+        target = result._state_vector.reshape(-1)
+        step = max(1, self._chunk_size // right.size)
+        for start in range(0, source.size, step):
+            stop = min(start + step, source.size)
+            target[start * right.size : stop * right.size] = np.multiply.outer(
+                source[start:stop], right
+            ).reshape(-1)
+        return result
+
+    def reindex(self, axes: Sequence[int]) -> _MemmapStateVector:
+        """Transposes the axes of a state vector to a specified order.
+
+        Args:
+            axes: The desired axis order.
+        Returns:
+            The transposed state vector, in a new file.
+        """
+        source = transformations.transpose_state_vector_to_axis_order(self._state_vector, axes)
+        result = self._empty_like(source.shape)
+        outer = result._outer_axes(())
+        for index in np.ndindex(*source.shape[: len(outer)]):
+            result._state_vector[index] = source[index]
+        return result
+
+    def apply_unitary(self, action: Any, axes: Sequence[int]) -> bool:
+        """Apply unitary to state, chunk by chunk.
+
+        Args:
+            action: The value with a unitary to apply.
+            axes: The axes on which to apply the unitary.
+        Returns:
+            True if the operation succeeded.
+        """
+        buffer: np.ndarray | None = None
+        for chunk, local_axes in self._chunks(axes):
+            if buffer is None or buffer.shape != chunk.shape:
+                buffer = np.empty(chunk.shape, dtype=chunk.dtype)
+            result = protocols.apply_unitary(
+                action,
+                protocols.ApplyUnitaryArgs(
+                    target_tensor=chunk, available_buffer=buffer, axes=local_axes
+                ),
+                allow_decompose=False,
+                default=NotImplemented,
+            )
+            if result is NotImplemented:
+                return False
+            if result is not chunk:
+                chunk[...] = result
+        return True
+
+    def apply_mixture(self, action: Any, axes: Sequence[int], prng) -> int | None:
+        """Apply mixture to state, chunk by chunk.
+
+        Args:
+            action: The value with a mixture to apply.
+            axes: The axes on which to apply the mixture.
+            prng: The pseudo random number generator to use.
+        Returns:
+            The mixture index if the operation succeeded, otherwise None.
+        """
+        mixture = protocols.mixture(action, default=None)
+        if mixture is None:
+            return None
+        probabilities, unitaries = zip(*mixture)
+
+        index = prng.choice(range(len(unitaries)), p=probabilities)
+        shape = protocols.qid_shape(action) * 2
+        self._apply_matrix(unitaries[index].astype(self._state_vector.dtype).reshape(shape), axes)
+        return index
+
+    def apply_channel(self, action: Any, axes: Sequence[int], prng) -> int | None:
+        """Apply channel to state, chunk by chunk.
+
+        Args:
+            action: The value with a channel to apply.
+            axes: The axes on which to apply the channel.
+            prng: The pseudo random number generator to use.
+        Returns:
+            The kraus index if the operation succeeded, otherwise None.
+        """
+        kraus_operators = protocols.kraus(action, default=None)
+        if kraus_operators is None:
+            return None
+
+        shape = protocols.qid_shape(action)
+        kraus_tensors = [
+            e.reshape(shape * 2).astype(self._state_vector.dtype) for e in kraus_operators
+        ]
+        p = prng.random()
+        weight = None
+        fallback_weight = 0.0
+        fallback_weight_index = 0
+        for index in range(len(kraus_tensors)):
+            weight = self._norm_squared_after(kraus_tensors[index], axes)
+
+            if weight > fallback_weight:
+                fallback_weight_index = index
+                fallback_weight = weight
+
+            p -= weight
+            if p < 0:
+                break
+
+        assert weight is not None, "No Kraus operators"
+        if p >= 0 or weight == 0:
+            # Floating point error resulted in a malformed sample.
+            # Fall back to the most likely case.
+            weight = fallback_weight
+            index = fallback_weight_index
+
+        self._apply_matrix(kraus_tensors[index], axes, scale=1 / np.sqrt(weight))
+        return index
+
+    def measure(
+        self, axes: Sequence[int], seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
+    ) -> list[int]:
+        """Measures the state vector, chunk by chunk.
+
+        Args:
+            axes: The axes to measure.
+            seed: The random number seed to use.
+        Returns:
+            The measurements in order.
+        """
+        prng = value.parse_random_state(seed)
+        meas_shape = tuple(self._qid_shape[axis] for axis in axes)
+        probs = self._probabilities(axes)
+        result = prng.choice(len(probs), p=probs / np.sum(probs))
+
+        mask = np.zeros(probs.shape, dtype=self._state_vector.dtype)
+        mask[result] = 1 / np.sqrt(probs[result])
+        for chunk, local_axes in self._chunks(axes):
+            moved = np.moveaxis(chunk, local_axes, range(len(axes)))
+            moved *= mask.reshape(meas_shape + (1,) * (moved.ndim - len(axes)))
+        return [int(bit) for bit in np.unravel_index(result, meas_shape)]
+
+    def sample(
+        self, axes: Sequence[int], repetitions: int = 1, seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None
+    ) -> np.ndarray:
+        """Samples the state vector, chunk by chunk.
+
+        Args:
+            axes: The axes to sample.
+            repetitions: The number of samples to make.
+            seed: The random number seed to use.
+        Returns:
+            The samples in order.
+        """
+        if repetitions == 0 or len(axes) == 0:
+            return np.zeros(shape=(repetitions, len(axes)), dtype=np.uint8)
+        prng = value.parse_random_state(seed)
+        meas_shape = tuple(self._qid_shape[axis] for axis in axes)
+        probs = self._probabilities(axes)
+        result = prng.choice(len(probs), size=repetitions, p=probs / np.sum(probs))
+        return np.stack(np.unravel_index(result, meas_shape), axis=1).astype(np.uint8)
+
+    @property
+    def supports_factor(self) -> bool:
+        # Factoring would materialize the state in memory.
+        return False
+
+
+class _BatchedStateVector:
+    """A stack of independent state vector trajectories evolved together.
+
+    The trajectories are stored in a single `(batch, *qid_shape)` tensor so
+    that unitaries are applied to every trajectory with one call. Only
+    measurements, mixtures and channels, whose outcomes differ between
+    trajectories, are sampled per trajectory.
+
+    Axes passed to the methods of this class refer to the qid axes of a single
+    trajectory; the leading batch axis is accounted for internally.
+    """
+
+    def __init__(self, state_vectors: np.ndarray, buffer: np.ndarray | None = None):
+        """Initializes the object with the inputs.
+
+        Args:
+            state_vectors: The stacked state vectors, of shape
+                `(batch, *qid_shape)`. The data is not checked for validity.
+            buffer: Optional, must be the same shape as the state vectors. If
+                not provided, a buffer will be created automatically.
+        """
+        self._state_vectors = state_vectors
+        if buffer is None:
+            buffer = np.empty_like(state_vectors)
+        self._buffer = buffer
+
+    @classmethod
+    def broadcast(cls, state_vector: np.ndarray, batch_size: int) -> _BatchedStateVector:
+        """Creates a batch holding `batch_size` copies of a single state vector.
+
+        Args:
+            state_vector: The state vector of a single trajectory, shaped with
+                one axis per qid.
+            batch_size: The number of trajectories.
+        Returns:
+            The batched state vector.
+        """
+        state_vectors = np.empty((batch_size, *state_vector.shape), dtype=state_vector.dtype)
+        state_vectors[...] = state_vector
+        return cls(state_vectors)
+
+    @property
+    def batch_size(self) -> int:
+        return self._state_vectors.shape[0]
+
+    def _batch_axes(self, axes: Sequence[int]) -> list[int]:
+        return [axis + 1 for axis in axes]
+
+    def _norms_squared(self, tensor: np.ndarray) -> np.ndarray:
+        tensor = tensor.reshape((tensor.shape[0], -1))
+        return np.einsum('ij,ij->i', tensor.conj(), tensor).real.astype(np.float64)
+
+    def _broadcastable(self, per_trajectory: np.ndarray) -> np.ndarray:
+        return per_trajectory.reshape(
+            (per_trajectory.shape[0],) + (1,) * (self._state_vectors.ndim - 1)
+        )
+
+    def apply_unitary(self, action: Any, axes: Sequence[int]) -> bool:
+        """Apply unitary to every trajectory.
+
+        Args:
+            action: The value with a unitary to apply.
+            axes: The axes on which to apply the unitary.
+        Returns:
+            True if the operation succeeded.
+        """
+        new_target_tensor = protocols.apply_unitary(
+            action,
+            protocols.ApplyUnitaryArgs(
+                target_tensor=self._state_vectors,
+                available_buffer=self._buffer,
+                axes=self._batch_axes(axes),
+            ),
+            default=None,
+        )
+        if new_target_tensor is None:
+            return False
+        self._swap_target_tensor_for(new_target_tensor)
+        return True
+
+    def apply_mixture(self, action: Any, axes: Sequence[int], prng) -> np.ndarray | None:
+        """Apply mixture to the trajectories, sampling one unitary per trajectory.
+
+        Args:
+            action: The value with a mixture to apply.
+            axes: The axes on which to apply the mixture.
+            prng: The pseudo random number generator to use.
+        Returns:
+            The mixture index of each trajectory if the operation succeeded,
+            otherwise None.
+        """
+        mixture = protocols.mixture(action, default=None)
+        if mixture is None:
+            return None
+        probabilities, unitaries = zip(*mixture)
+
+        indices = prng.choice(len(unitaries), size=self.batch_size, p=probabilities)
+        shape = protocols.qid_shape(action) * 2
+        batch_axes = self._batch_axes(axes)
+        for index in np.unique(indices):
+            unitary = unitaries[index]
+            if np.allclose(unitary, np.eye(unitary.shape[0])):
+                continue
+            tensor = unitary.astype(self._state_vectors.dtype).reshape(shape)
+            rows = np.flatnonzero(indices == index)
+            if len(rows) == self.batch_size:
+                linalg.targeted_left_multiply(
+                    tensor, self._state_vectors, batch_axes, out=self._buffer
+                )
+                self._swap_target_tensor_for(self._buffer)
+            else:
+                self._state_vectors[rows] = linalg.targeted_left_multiply(
+                    tensor, self._state_vectors[rows], batch_axes
+                )
+        return indices
+
+    def apply_channel(self, action: Any, axes: Sequence[int], prng) -> np.ndarray | None:
+        """Apply channel to the trajectories, sampling one Kraus operator per trajectory.
+
+        Args:
+            action: The value with a channel to apply.
+            axes: The axes on which to apply the channel.
+            prng: The pseudo random number generator to use.
+        Returns:
+            The kraus index of each trajectory if the operation succeeded,
+            otherwise None.
+        """
+        kraus_operators = protocols.kraus(action, default=None)
+        if kraus_operators is None:
+            return None
+
+        shape = protocols.qid_shape(action)
+        kraus_tensors = [
+            e.reshape(shape * 2).astype(self._state_vectors.dtype) for e in kraus_operators
+        ]
+        batch_axes = self._batch_axes(axes)
+        p = prng.random(self.batch_size)
+        indices = np.full(self.batch_size, -1)
+        fallback_weights = np.zeros(self.batch_size)
+        fallback_indices = np.zeros(self.batch_size, dtype=int)
+        result = np.empty_like(self._state_vectors)
+
+        for index, kraus_tensor in enumerate(kraus_tensors):
+            linalg.targeted_left_multiply(
+                kraus_tensor, self._state_vectors, batch_axes, out=self._buffer
+            )
+            weights = self._norms_squared(self._buffer)
+
+            heavier = weights > fallback_weights
+            fallback_indices[heavier] = index
+            fallback_weights[heavier] = weights[heavier]
+
+            p -= weights
+            selected = (indices < 0) & (p < 0)
+            if np.any(selected):
+                indices[selected] = index
+                result[selected] = self._buffer[selected] / self._broadcastable(
+                    np.sqrt(weights[selected])
+                )
+
+        # Floating point error resulted in malformed samples.
+        # Fall back to the most likely case for those trajectories.
+        for index in np.unique(fallback_indices[indices < 0]):
+            rows = np.flatnonzero((indices < 0) & (fallback_indices == index))
+            indices[rows] = index
+            result[rows] = linalg.targeted_left_multiply(
+                kraus_tensors[index], self._state_vectors[rows], batch_axes
+            ) / self._broadcastable(np.sqrt(fallback_weights[rows]))
+
+        self._buffer = self._state_vectors
+        self._state_vectors = result
+        return indices
+
+    def measure(self, axes: Sequence[int], prng) -> np.ndarray:
+        """Measures every trajectory, collapsing each onto its sampled outcome.
+
+        Args:
+            axes: The axes to measure.
+            prng: The pseudo random number generator to use.
+        Returns:
+            The measurement results, of shape `(batch, len(axes))`.
+        """
+        batch_axes = self._batch_axes(axes)
+        meas_shape = tuple(self._state_vectors.shape[axis] for axis in batch_axes)
+        # View with the measured axes moved right after the batch axis.
+        moved = np.moveaxis(self._state_vectors, batch_axes, range(1, len(axes) + 1))
+        probs: np.ndarray = np.sum(
+            np.abs(moved) ** 2, axis=tuple(range(len(axes) + 1, moved.ndim)), dtype=np.float64
+        ).reshape((self.batch_size, -1))
+
+        cumulative = np.cumsum(probs, axis=1)
+        p = prng.random(self.batch_size) * cumulative[:, -1]
+        results = np.minimum(np.sum(cumulative <= p[:, np.newaxis], axis=1), probs.shape[1] - 1)
+
+        rows = np.arange(self.batch_size)
+        mask = np.zeros(probs.shape, dtype=self._state_vectors.dtype)
+        mask[rows, results] = 1 / np.sqrt(probs[rows, results])
+        moved *= mask.reshape((self.batch_size, *meas_shape) + (1,) * (moved.ndim - len(axes) - 1))
+        return np.stack(np.unravel_index(results, meas_shape), axis=1)
+
+    def _swap_target_tensor_for(self, new_target_tensor: np.ndarray):
+        if new_target_tensor is self._buffer:
+            self._buffer = self._state_vectors
+        self._state_vectors = new_target_tensor
+
+
 class StateVectorSimulationState(SimulationState[_BufferedStateVector]):
     """State and context for an operation acting on a state vector.
 
@@ -327,6 +1189,8 @@ class StateVectorSimulationState(SimulationState[_BufferedStateVector]):
         initial_state: np.ndarray | cirq.STATE_VECTOR_LIKE = 0,
         dtype: type[np.complexfloating] | np.dtype[np.complexfloating] = np.complex64,
         classical_data: cirq.ClassicalDataStore | None = None,
+        memmap_dir: str | os.PathLike | None = None,
+        state_pool: cirq.SimulationStatePool | None = None,
     ):
         """Inits StateVectorSimulationState.
 
@@ -348,13 +1212,29 @@ class StateVectorSimulationState(SimulationState[_BufferedStateVector]):
                 `target_tenson` is None.
             classical_data: The shared classical data container for this
                 simulation.
+            memmap_dir: If given, the state vector is stored in a temporary
+                memory-mapped file in this directory instead of in memory, and
+                operations are applied to it in chunks. This allows simulating
+                states larger than the available memory. `available_buffer` is
+                ignored in this case.
+            state_pool: If given, the state vector and buffer are taken from
+                this pool, and so are those of copies and of merged states.
+                Ignored if `memmap_dir` is given.
         """
-        state = _BufferedStateVector.create(
-            initial_state=initial_state,
-            qid_shape=tuple(q.dimension for q in qubits) if qubits is not None else None,
-            dtype=dtype,
-            buffer=available_buffer,
-        )
+        qid_shape = tuple(q.dimension for q in qubits) if qubits is not None else None
+        state: _BufferedStateVector
+        if memmap_dir is not None:
+            state = _MemmapStateVector.create(
+                initial_state=initial_state, qid_shape=qid_shape, dtype=dtype, directory=memmap_dir
+            )
+        else:
+            state = _BufferedStateVector.create(
+                initial_state=initial_state,
+                qid_shape=qid_shape,
+                dtype=dtype,
+                buffer=available_buffer,
+                pool=state_pool,
+            )
         super().__init__(state=state, prng=prng, qubits=qubits, classical_data=classical_data)
 
     def add_qubits(self, qubits: Sequence[cirq.Qid]) -> Self:
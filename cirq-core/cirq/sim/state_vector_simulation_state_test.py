@@ -274,3 +274,243 @@ def test_measured_mixture() -> None:
 def test_qid_shape_error() -> None:
     with pytest.raises(ValueError, match="qid_shape must be provided"):
         cirq.sim.state_vector_simulation_state._BufferedStateVector.create(initial_state=0)
+
+
+def _memmap_and_buffered(qid_shape, initial_state, chunk_size, tmp_path):
+    from cirq.sim.state_vector_simulation_state import _BufferedStateVector, _MemmapStateVector
+
+    memmap = _MemmapStateVector.create(
+        initial_state=initial_state,
+        qid_shape=qid_shape,
+        dtype=np.complex128,
+        directory=tmp_path,
+        chunk_size=chunk_size,
+    )
+    buffered = _BufferedStateVector.create(
+        initial_state=initial_state, qid_shape=qid_shape, dtype=np.complex128
+    )
+    return memmap, buffered
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 1024])
+def test_memmap_state_vector_matches_buffered(chunk_size: int, tmp_path) -> None:
+    qid_shape = (2, 3, 2, 2, 2)
+    initial_state = cirq.testing.random_superposition(48, random_state=1).reshape(qid_shape)
+    memmap, buffered = _memmap_and_buffered(qid_shape, initial_state, chunk_size, tmp_path)
+    assert isinstance(memmap._state_vector, np.memmap)
+    actions = [
+        (cirq.H, [0]),
+        (cirq.Z**0.3, [4]),
+        (cirq.CNOT, [4, 0]),
+        (cirq.SWAP, [2, 3]),
+        (cirq.MatrixGate(cirq.testing.random_unitary(6, random_state=2), qid_shape=(3, 2)), [1, 3]),
+        (cirq.MatrixGate(cirq.testing.random_unitary(8, random_state=3)), [3, 0, 4]),
+    ]
+    for action, axes in actions:
+        assert memmap.apply_unitary(action, axes)
+        assert buffered.apply_unitary(action, axes)
+        np.testing.assert_allclose(memmap._state_vector, buffered._state_vector, atol=1e-8)
+    assert not memmap.apply_unitary(cirq.depolarize(0.1), [0])
+
+    assert memmap.apply_mixture(cirq.depolarize(0.5), [2], np.random.RandomState(4)) == (
+        buffered.apply_mixture(cirq.depolarize(0.5), [2], np.random.RandomState(4))
+    )
+    assert memmap.apply_channel(cirq.amplitude_damp(0.5), [0], np.random.RandomState(5)) == (
+        buffered.apply_channel(cirq.amplitude_damp(0.5), [0], np.random.RandomState(5))
+    )
+    np.testing.assert_allclose(memmap._state_vector, buffered._state_vector, atol=1e-8)
+
+    np.testing.assert_equal(
+        memmap.sample([1, 3], repetitions=10, seed=6),
+        buffered.sample([1, 3], repetitions=10, seed=6),
+    )
+    assert memmap.measure([3, 1], seed=7) == buffered.measure([3, 1], seed=7)
+    np.testing.assert_allclose(memmap._state_vector, buffered._state_vector, atol=1e-8)
+    assert memmap.sample([], repetitions=2).shape == (2, 0)
+
+
+def test_memmap_state_vector_copy_kron_reindex(tmp_path) -> None:
+    memmap, buffered = _memmap_and_buffered((2, 3, 2), 5, 2, tmp_path)
+    memmap.apply_unitary(cirq.H, [2])
+    buffered.apply_unitary(cirq.H, [2])
+    assert not memmap.supports_factor
+
+    copy = memmap.copy()
+    copy.apply_unitary(cirq.X, [0])
+    np.testing.assert_allclose(memmap._state_vector, buffered._state_vector)
+    assert not np.allclose(copy._state_vector, memmap._state_vector)
+
+    other = cirq.sim.state_vector_simulation_state._BufferedStateVector.create(
+        initial_state=1, qid_shape=(2, 2), dtype=np.complex128
+    )
+    np.testing.assert_allclose(
+        memmap.kron(other)._state_vector, buffered.kron(other)._state_vector, atol=1e-8
+    )
+    np.testing.assert_allclose(
+        memmap.reindex([2, 0, 1])._state_vector,
+        buffered.reindex([2, 0, 1])._state_vector,
+        atol=1e-8,
+    )
+    assert isinstance(memmap._buffer, np.memmap)
+    assert memmap._buffer.shape == (2, 3, 2)
+
+
+def test_memmap_state_vector_create_errors(tmp_path) -> None:
+    from cirq.sim.state_vector_simulation_state import _MemmapStateVector
+
+    with pytest.raises(ValueError, match='qid_shape'):
+        _MemmapStateVector.create(initial_state=0, directory=tmp_path)
+    with pytest.raises(ValueError, match='out of range'):
+        _MemmapStateVector.create(initial_state=4, qid_shape=(2, 2), directory=tmp_path)
+    state = _MemmapStateVector.create(
+        initial_state=cirq.KET_PLUS(cirq.LineQubit(0)), qid_shape=(2,), directory=tmp_path
+    )
+    np.testing.assert_allclose(state._state_vector, [np.sqrt(0.5)] * 2, atol=1e-6)
+    assert state._state_vector.dtype == np.complex64
+
+
+def test_memmap_simulation_state(tmp_path) -> None:
+    qubits = cirq.LineQubit.range(2)
+    args = cirq.StateVectorSimulationState(
+        qubits=qubits, initial_state=1, memmap_dir=tmp_path, prng=np.random.RandomState(0)
+    )
+    assert isinstance(args.target_tensor, np.memmap)
+    cirq.act_on(cirq.X(qubits[0]), args)
+    cirq.act_on(cirq.measure(*qubits, key='m'), args)
+    assert args.log_of_measurement_results == {'m': [1, 1]}
+
+
+@pytest.mark.parametrize(
+    'gate',
+    [
+        cirq.Z**0.3,
+        cirq.rz(0.4),
+        cirq.CZ**0.7,
+        cirq.CCZ,
+        cirq.DiagonalGate([0.1, 0.2, 0.3, 0.4]),
+        cirq.TwoQubitDiagonalGate([0.1, 0.2, 0.3, 0.4]),
+        cirq.X,
+        cirq.Y,
+        cirq.XPowGate(global_shift=0.25),
+        cirq.CNOT,
+        cirq.CCX,
+        cirq.SWAP,
+        cirq.QubitPermutationGate([2, 0, 1]),
+        cirq.H,
+        cirq.rx(0.3),
+        cirq.PhasedXZGate(x_exponent=0.3, z_exponent=0.2, axis_phase_exponent=0.1),
+        cirq.MatrixGate(cirq.testing.random_unitary(2, random_state=1)),
+        cirq.ZPowGate(exponent=0.5, dimension=3),
+    ],
+)
+def test_apply_unitary_in_place(gate: cirq.Gate) -> None:
+    qid_shape = cirq.qid_shape(gate)
+    num_qubits = 7 - len(qid_shape)
+    qids = [cirq.LineQid(i, dimension=d) for i, d in enumerate(qid_shape)] + [
+        cirq.LineQubit(len(qid_shape) + i) for i in range(num_qubits)
+    ]
+    initial_state = cirq.testing.random_superposition(
+        int(np.prod(cirq.qid_shape(qids))), random_state=2
+    )
+    for axes in [list(range(len(qid_shape))), list(range(6, 6 - len(qid_shape), -1))]:
+        if any(qids[axis].dimension != d for axis, d in zip(axes, qid_shape)):
+            continue
+        args = cirq.StateVectorSimulationState(
+            qubits=qids, initial_state=initial_state, dtype=np.complex128
+        )
+        cirq.act_on(gate.on(*[qids[axis] for axis in axes]), args)
+        assert args._state._lazy_buffer is None
+        expected = cirq.apply_unitary(
+            gate,
+            cirq.ApplyUnitaryArgs(
+                target_tensor=initial_state.reshape(cirq.qid_shape(qids)),
+                available_buffer=np.empty(cirq.qid_shape(qids), dtype=np.complex128),
+                axes=axes,
+            ),
+        )
+        np.testing.assert_allclose(args.target_tensor, expected, atol=1e-8)
+
+
+def test_apply_unitary_in_place_fallbacks() -> None:
+    qubits = cirq.LineQubit.range(3)
+    initial_state = cirq.testing.random_superposition(8, random_state=3)
+    args = cirq.StateVectorSimulationState(
+        qubits=qubits, initial_state=initial_state, dtype=np.complex128
+    )
+    expected = cirq.final_state_vector(
+        cirq.Circuit(cirq.ISWAP(*qubits[:2]) ** 0.5, cirq.CX(*qubits[1:]) ** 0.5),
+        initial_state=initial_state,
+        dtype=np.complex128,
+    )
+    cirq.act_on(cirq.ISWAP(*qubits[:2]) ** 0.5, args)
+    cirq.act_on(cirq.CX(*qubits[1:]) ** 0.5, args)
+    assert args._state._lazy_buffer is not None
+    np.testing.assert_allclose(args.target_tensor.reshape(-1), expected, atol=1e-8)
+
+    # Non-contiguous states are updated through the buffer.
+    state = cirq.sim.state_vector_simulation_state._BufferedStateVector.create(
+        initial_state=initial_state, qid_shape=(2, 2, 2), dtype=np.complex128
+    ).reindex([2, 0, 1])
+    assert not state._state_vector.flags.c_contiguous
+    expected = cirq.apply_unitary(
+        cirq.H,
+        cirq.ApplyUnitaryArgs(
+            target_tensor=state._state_vector.copy(),
+            available_buffer=np.empty((2, 2, 2), dtype=np.complex128),
+            axes=[1],
+        ),
+    )
+    assert state.apply_unitary(cirq.H(qubits[0]), [1])
+    assert state._lazy_buffer is not None
+    np.testing.assert_allclose(state._state_vector, expected, atol=1e-8)
+
+
+def test_apply_mixture_in_place() -> None:
+    qubits = cirq.LineQubit.range(2)
+    for seed in range(5):
+        args = cirq.StateVectorSimulationState(
+            qubits=qubits, initial_state=3, prng=np.random.RandomState(seed)
+        )
+        cirq.act_on(cirq.depolarize(0.9).on(qubits[1]), args)
+        assert args._state._lazy_buffer is None
+        probabilities = np.abs(args.target_tensor.reshape(-1)) ** 2
+        np.testing.assert_allclose(probabilities[[0, 1]], 0, atol=1e-8)
+        assert np.isclose(np.sum(probabilities), 1)
+
+
+def test_factor_validate_rejects_entangled_states() -> None:
+    create = cirq.sim.state_vector_simulation_state._BufferedStateVector.create
+    bell = cirq.final_state_vector(
+        cirq.Circuit(cirq.H(cirq.q(0)), cirq.CNOT(cirq.q(0), cirq.q(2))),
+        qubit_order=cirq.LineQubit.range(3),
+    )
+    state = create(initial_state=bell, qid_shape=(2, 2, 2), dtype=np.complex64)
+    with pytest.raises(cirq.linalg.transformations.EntangledStateError):
+        state.factor([0], validate=True)
+    extracted, remainder = state.factor([1], validate=True)
+    np.testing.assert_allclose(extracted._state_vector, [1, 0], atol=1e-6)
+    assert remainder._state_vector.shape == (2, 2)
+
+
+def test_state_pool() -> None:
+    pool = cirq.SimulationStatePool()
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    args = cirq.StateVectorSimulationState(qubits=[q0, q1], initial_state=2, state_pool=pool)
+    other = cirq.StateVectorSimulationState(
+        qubits=[q2], initial_state=np.array([0.6, 0.8]), state_pool=pool
+    )
+    assert pool.allocations == 2
+    merged = args.kronecker_product(other)
+    cirq.act_on(cirq.CNOT(q0, q2), merged)
+    assert pool.allocations == 3
+    copy = merged.copy(deep_copy_buffers=False)
+    cirq.act_on(cirq.ISWAP(q0, q1), copy)
+    assert pool.allocations == 5
+    np.testing.assert_allclose(
+        copy.target_tensor.reshape(-1),
+        cirq.final_state_vector(
+            cirq.Circuit(cirq.CNOT(q0, q2), cirq.ISWAP(q0, q1)),
+            initial_state=np.kron(cirq.one_hot(index=2, shape=4, dtype=np.complex64), [0.6, 0.8]),
+        ),
+        atol=1e-6,
+    )
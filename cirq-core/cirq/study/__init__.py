@@ -22,6 +22,7 @@ from cirq.study.flatten_expressions import (
 )
 
 from cirq.study.resolver import (
+    batch_value_of as batch_value_of,
     ParamDictType as ParamDictType,
     ParamMappingType as ParamMappingType,
     ParamResolver as ParamResolver,
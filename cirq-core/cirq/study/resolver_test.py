@@ -338,3 +338,55 @@ def test_repr() -> None:
     cirq.testing.assert_equivalent_repr(
         cirq.ParamResolver({sympy.Symbol('a'): sympy.Symbol('b') + 1})
     )
+
+
+def test_batch_value_of() -> None:
+    a, b = sympy.symbols('a b')
+    arrays: dict[cirq.TParamKey, np.ndarray] = {
+        'a': np.array([0.0, 0.5, 1.0]),
+        b: np.array([1, 2, 3]),
+    }
+    np.testing.assert_array_equal(cirq.batch_value_of('a', arrays), [0.0, 0.5, 1.0])
+    np.testing.assert_array_equal(cirq.batch_value_of(b, arrays), [1, 2, 3])
+    np.testing.assert_allclose(cirq.batch_value_of(2 * a + b, arrays), [1, 3, 5])
+    np.testing.assert_allclose(
+        cirq.batch_value_of(sympy.sin(a * sympy.pi) ** 2 / b, arrays), [0, 0.5, 0], atol=1e-12
+    )
+    np.testing.assert_allclose(
+        cirq.batch_value_of(sympy.exp(sympy.I * sympy.pi * a), arrays), [1, 1j, -1], atol=1e-12
+    )
+    for expression in [a, 2 * a + b, sympy.sin(a) * b]:
+        for i, resolver in enumerate(
+            cirq.to_resolvers(
+                cirq.ListSweep([{'a': x, 'b': y} for x, y in zip(arrays['a'], arrays[b])])
+            )
+        ):
+            np.testing.assert_allclose(
+                cirq.batch_value_of(expression, arrays)[i], resolver.value_of(expression)
+            )
+
+
+def test_batch_value_of_constants() -> None:
+    arrays = {'a': [1, 2]}
+    np.testing.assert_array_equal(cirq.batch_value_of(3, arrays), [3, 3])
+    np.testing.assert_array_equal(cirq.batch_value_of(sympy.Integer(4), arrays), [4, 4])
+    np.testing.assert_allclose(cirq.batch_value_of(sympy.sqrt(2), arrays), [np.sqrt(2)] * 2)
+    np.testing.assert_allclose(cirq.batch_value_of(sympy.sqrt(-1), arrays), [1j, 1j])
+    np.testing.assert_array_equal(cirq.batch_value_of(1.5, {}), [1.5])
+
+
+def test_batch_value_of_errors() -> None:
+    a, b = sympy.symbols('a b')
+    with pytest.raises(ValueError, match='same length'):
+        cirq.batch_value_of(a, {'a': [1, 2], 'b': [1]})
+    with pytest.raises(ValueError, match=r"\['b'\]"):
+        cirq.batch_value_of(a + b, {'a': [1, 2]})
+    with pytest.raises(ValueError, match=r"\['c'\]"):
+        cirq.batch_value_of('c', {'a': [1, 2]})
+
+
+def test_batch_value_of_sweep() -> None:
+    t = sympy.Symbol('t')
+    sweep = cirq.Linspace(t, 0, 1, 5) * cirq.Points('u', [1, 2])
+    values = cirq.batch_value_of(t * sympy.Symbol('u'), sweep.to_arrays())
+    np.testing.assert_allclose(values, [r.value_of(t * sympy.Symbol('u')) for r in sweep])
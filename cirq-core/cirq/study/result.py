@@ -19,7 +19,7 @@ from __future__ import annotations
 import abc
 import collections
 import io
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any, cast, TYPE_CHECKING, TypeVar, Union
 
 import numpy as np
@@ -85,6 +85,108 @@ def _key_to_str(key: TMeasurementKey) -> str:
     return ','.join(str(q) for q in key)
 
 
+class _PackedBits:
+    """Binary measurement records packed with `np.packbits` along the qubit axis."""
+
+    def __init__(self, bits: np.ndarray) -> None:
+        self.packed = np.packbits(bits, axis=-1)
+        self.shape = bits.shape
+        self.dtype = bits.dtype
+
+    def unpack(self) -> np.ndarray:
+        return np.unpackbits(self.packed, axis=-1, count=self.shape[-1]).astype(
+            self.dtype, copy=False
+        )
+
+
+_RecordChunk = np.ndarray | _PackedBits
+
+
+def _pack_if_binary(digits: np.ndarray) -> _RecordChunk:
+    if digits.dtype == np.bool_ or np.array_equal(digits, digits.astype(np.bool_)):
+        return _PackedBits(digits)
+    return digits
+
+
+class _ChunkedRecords(Mapping[str, np.ndarray]):
+    """Measurement records stored as chunks of repetitions, some of them packed.
+
+    The records of a key are only unpacked and concatenated when they are
+    first accessed.
+    """
+
+    def __init__(self, chunks: Mapping[str, Sequence[_RecordChunk]]) -> None:
+        self.chunks = {key: tuple(key_chunks) for key, key_chunks in chunks.items()}
+        self._records: dict[str, np.ndarray] = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._records:
+            parts = [
+                chunk.unpack() if isinstance(chunk, _PackedBits) else chunk
+                for chunk in self.chunks[key]
+            ]
+            self._records[key] = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return self._records[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.chunks)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def repetitions(self) -> int:
+        if not self.chunks:
+            return 0
+        return sum(chunk.shape[0] for chunk in next(iter(self.chunks.values())))
+
+
+def _big_endian_ints(chunk: _RecordChunk) -> np.ndarray:
+    """Returns the big-endian integer measured in each repetition of a chunk.
+
+    The chunk must have a single instance of a measurement of at most 63 qubits.
+    """
+    if isinstance(chunk, _PackedBits):
+        packed = chunk.packed
+    else:
+        packed = np.packbits(chunk != 0, axis=-1)
+    ints = np.zeros(len(packed), dtype=np.uint64)
+    for byte in packed[:, 0, :].T:
+        ints = (ints << 8) | byte
+    return (ints >> (8 * packed.shape[-1] - chunk.shape[-1])).astype(np.int64)
+
+
+def _data_ints(chunk: _RecordChunk) -> np.ndarray:
+    """Returns the integers of a chunk as they appear in `Result.data`."""
+    if isinstance(chunk, _PackedBits):
+        return _big_endian_ints(chunk)
+    basis = 2 ** np.arange(chunk.shape[-1], dtype=np.int64)[::-1]
+    return np.sum(basis * chunk[:, 0, :], axis=1)
+
+
+def _count_rows(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the distinct rows of `values`, in order of appearance, and their counts.
+
+    Single columns must be non-negative.
+    """
+    if values.shape[1] == 1 and len(values) and values.max() < max(len(values), 2**16):
+        # The values are non-negative and dense enough to count without sorting.
+        all_counts = np.bincount(values[:, 0])
+        all_first = np.full(len(all_counts), len(values))
+        np.minimum.at(all_first, values[:, 0], np.arange(len(values)))
+        unique = np.flatnonzero(all_counts)
+        counts, first = all_counts[unique], all_first[unique]
+        unique = unique[:, np.newaxis]
+    elif values.shape[1] == 1:
+        found = np.unique(values[:, 0], return_index=True, return_counts=True)
+        unique, first, counts = found[0][:, np.newaxis], found[1], found[2]
+    else:
+        found = np.unique(values, axis=0, return_index=True, return_counts=True)
+        unique, first, counts = found[0], found[1], found[2]
+    order = np.argsort(first)
+    return unique[order], counts[order]
+
+
 class Result(abc.ABC):
     """The results of multiple executions of a circuit with fixed parameters."""
 
@@ -205,6 +307,11 @@ class Result(abc.ABC):
             results.
         """
         fixed_keys = tuple(_key_to_str(key) for key in keys)
+        if fold_func is _tuple_of_big_endian_int and fixed_keys:
+            counted = self._count_big_endian_ints(fixed_keys)
+            if counted is not None:
+                values, counts = counted
+                return collections.Counter(dict(zip(map(tuple, values.tolist()), counts.tolist())))
         samples: Iterable[Any] = zip(*(self.measurements[sub_key] for sub_key in fixed_keys))
         if len(fixed_keys) == 0:
             samples = [()] * self.repetitions
@@ -255,8 +362,61 @@ class Result(abc.ABC):
             A counter indicating how often a measurement sampled various
             results.
         """
+        if fold_func is value.big_endian_bits_to_int:
+            counted = self._count_big_endian_ints((_key_to_str(key),))
+            if counted is not None:
+                values, counts = counted
+                return collections.Counter(dict(zip(values[:, 0].tolist(), counts.tolist())))
         return self.multi_measurement_histogram(keys=[key], fold_func=lambda e: fold_func(e[0]))
 
+    def _record_chunks(self) -> Mapping[str, Sequence[_RecordChunk]]:
+        """Returns the records of each key as a sequence of chunks of repetitions.
+
+        Subclasses that store records in chunks, or packed, can override this to let
+        histograms and concatenation work without unpacking them.
+        """
+        return {key: (records,) for key, records in self.records.items()}
+
+    def _count_big_endian_ints(self, keys: Sequence[str]) -> tuple[np.ndarray, np.ndarray] | None:
+        """Counts how often each combination of big-endian measurement results occurred.
+
+        Args:
+            keys: The measurement keys to combine.
+
+        Returns:
+            An array with a row of big-endian integers, one for each key, for each distinct
+            result, in order of first occurrence, and an array with the number of times each
+            one occurred. None if a measurement has more than 63 qubits.
+
+        Raises:
+            ValueError: If a key was measured more than once in the circuit.
+        """
+        chunks = self._record_chunks()
+        columns = []
+        widths = []
+        for key in keys:
+            key_chunks = chunks[key]
+            if any(chunk.shape[1] != 1 for chunk in key_chunks):
+                raise ValueError('Cannot extract 2D measurements for repeated keys')
+            width = key_chunks[0].shape[2]
+            if width > 63:
+                return None
+            columns.append(np.concatenate([_big_endian_ints(chunk) for chunk in key_chunks]))
+            widths.append(width)
+        if sum(widths) > 63:
+            return _count_rows(np.stack(columns, axis=1))
+        # Count all keys at once as a single integer.
+        combined = np.zeros(len(columns[0]), dtype=np.int64)
+        for column, width in zip(columns, widths):
+            combined = (combined << width) | column
+        combined_values, counts = _count_rows(combined[:, np.newaxis])
+        combined_values = combined_values[:, 0]
+        values = np.empty((len(combined_values), len(keys)), dtype=np.int64)
+        for i in reversed(range(len(keys))):
+            values[:, i] = combined_values & ((1 << widths[i]) - 1)
+            combined_values = combined_values >> widths[i]
+        return values, counts
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Result):
             return NotImplemented
@@ -273,16 +433,24 @@ class Result(abc.ABC):
             raise ValueError(
                 f'Cannot add results with different parameters: {self.params} != {other.params}'
             )
-        shape = {k: v.shape[1:] for k, v in self.records.items()}
-        other_shape = {k: v.shape[1:] for k, v in other.records.items()}
+        chunks = self._record_chunks()
+        other_chunks = other._record_chunks()
+        shape = {k: v[0].shape[1:] for k, v in chunks.items()}
+        other_shape = {k: v[0].shape[1:] for k, v in other_chunks.items()}
         if shape != other_shape:
             raise ValueError(
                 f'Cannot add results with different measurement shapes: {shape} != {other_shape}'
             )
-        all_records: dict[str, np.ndarray] = {}
-        for key in other.records:
-            all_records[key] = np.append(self.records[key], other.records[key], axis=0)
-        return ResultDict(params=self.params, records=all_records)
+        # The records are only concatenated when they are accessed. Unpacked chunks are
+        # copied so that the sum does not share its records with the operands.
+        all_chunks = {
+            key: tuple(
+                chunk.copy() if isinstance(chunk, np.ndarray) else chunk
+                for chunk in (*chunks[key], *other_chunks[key])
+            )
+            for key in other_chunks
+        }
+        return ResultDict(params=self.params, records=_ChunkedRecords(all_chunks))
 
 
 class ResultDict(Result):
@@ -303,6 +471,7 @@ class ResultDict(Result):
         params: resolver.ParamResolver | None = None,
         measurements: Mapping[str, np.ndarray] | None = None,
         records: Mapping[str, np.ndarray] | None = None,
+        pack_bits: bool = False,
     ) -> None:
         """Inits Result.
 
@@ -319,6 +488,10 @@ class ResultDict(Result):
                 index running over "instances" of that key in the circuit, and
                 the last index running over the qubits for the corresponding
                 measurements.
+            pack_bits: If True, binary measurement results are stored packed
+                eight to a byte with `np.packbits`, and only unpacked when the
+                records or measurements of a key are accessed. Histograms and
+                the `data` frame are computed from the packed bits directly.
         """
         if params is None:
             params = resolver.ParamResolver({})
@@ -326,6 +499,14 @@ class ResultDict(Result):
             # For backwards compatibility, allow constructing with None.
             measurements = {}
             records = {}
+        if pack_bits:
+            if records is None:
+                assert measurements is not None
+                records = {key: data[:, np.newaxis, :] for key, data in measurements.items()}
+            records = _ChunkedRecords(
+                {key: (_pack_if_binary(data),) for key, data in records.items()}
+            )
+            measurements = None
         self._params = params
         self._measurements = measurements
         self._records = records
@@ -358,6 +539,8 @@ class ResultDict(Result):
 
     @property
     def repetitions(self) -> int:
+        if isinstance(self._records, _ChunkedRecords):
+            return self._records.repetitions
         if self._records is not None:
             if not self._records:
                 return 0
@@ -372,9 +555,30 @@ class ResultDict(Result):
     @property
     def data(self) -> pd.DataFrame:
         if self._data is None:
-            self._data = self.dataframe_from_measurements(self.measurements)
+            chunks = self._record_chunks()
+            if isinstance(self._records, _ChunkedRecords) and all(
+                key_chunks[0].shape[2] <= 63 for key_chunks in chunks.values()
+            ):
+                # Avoid unpacking packed bits.
+                for key_chunks in chunks.values():
+                    if any(chunk.shape[1] != 1 for chunk in key_chunks):
+                        raise ValueError('Cannot extract 2D measurements for repeated keys')
+                self._data = pd.DataFrame(
+                    {
+                        key: np.concatenate([_data_ints(chunk) for chunk in key_chunks])
+                        for key, key_chunks in chunks.items()
+                    },
+                    dtype=np.int64,
+                )
+            else:
+                self._data = self.dataframe_from_measurements(self.measurements)
         return self._data
 
+    def _record_chunks(self) -> Mapping[str, Sequence[_RecordChunk]]:
+        if isinstance(self._records, _ChunkedRecords):
+            return self._records.chunks
+        return super()._record_chunks()
+
     def _record_dict_repr(self):
         """Helper function for use in __repr__ to display the records field."""
         return '{' + ', '.join(f'{k!r}: {proper_repr(v)}' for k, v in self.records.items()) + '}'
@@ -222,6 +222,100 @@ def test_multi_measurement_histogram() -> None:
     )
 
 
+def test_histogram_order_and_large_measurements() -> None:
+    result = cirq.ResultDict(
+        measurements={
+            'a': np.array([[1, 1], [0, 0], [1, 1], [0, 1]]),
+            'q': np.array([[1] * 70, [0] * 70, [1] * 70, [0] * 70], dtype=bool),
+            'd': np.array([[2], [0], [1], [2]]),
+        }
+    )
+    assert list(result.histogram(key='a').items()) == [(3, 2), (0, 1), (1, 1)]
+    assert list(result.multi_measurement_histogram(keys=['d', 'a']).items()) == [
+        ((1, 3), 2),
+        ((0, 0), 1),
+        ((1, 1), 1),
+    ]
+    assert result.histogram(key='q') == collections.Counter({2**70 - 1: 2, 0: 2})
+    assert result.multi_measurement_histogram(keys=['q', 'a']) == collections.Counter(
+        {(2**70 - 1, 3): 2, (0, 0): 1, (0, 1): 1}
+    )
+
+    repeated = cirq.ResultDict(records={'a': np.zeros((3, 2, 1), dtype=bool)})
+    with pytest.raises(ValueError, match='repeated keys'):
+        _ = repeated.histogram(key='a')
+    with pytest.raises(ValueError, match='repeated keys'):
+        _ = cirq.ResultDict(records={'a': np.zeros((3, 2, 1), dtype=bool)}, pack_bits=True).data
+
+
+def test_histogram_many_repetitions() -> None:
+    bits = np.random.default_rng(0).integers(0, 2, size=(1000, 20)).astype(bool)
+    result = cirq.ResultDict(measurements={'a': bits[:, :12], 'b': bits[:, 12:]})
+    expected = collections.Counter(
+        (cirq.big_endian_bits_to_int(a), cirq.big_endian_bits_to_int(b))
+        for a, b in zip(bits[:, :12], bits[:, 12:])
+    )
+    assert result.multi_measurement_histogram(keys=['a', 'b']) == expected
+    assert list(result.multi_measurement_histogram(keys=['a', 'b'])) == list(expected)
+
+
+@pytest.mark.parametrize('use_records', [False, True])
+def test_pack_bits(use_records: bool) -> None:
+    records = {
+        'ab': np.array([[[0, 1]], [[1, 1]], [[0, 1]]], dtype=bool),
+        'c': np.array([[[0, 0]], [[1, 1]], [[1, 0]]], dtype=np.uint8),
+        'd': np.array([[[2]], [[0]], [[1]]], dtype=np.int64),
+    }
+    measurements = None if use_records else {key: data[:, 0, :] for key, data in records.items()}
+    packed = cirq.ResultDict(
+        params=cirq.ParamResolver({'a': 1}),
+        measurements=measurements,
+        records=records if use_records else None,
+        pack_bits=True,
+    )
+    unpacked = cirq.ResultDict(
+        params=cirq.ParamResolver({'a': 1}),
+        measurements=measurements,
+        records=records if use_records else None,
+    )
+
+    assert packed.repetitions == 3
+    assert packed == unpacked
+    assert str(packed) == str(unpacked)
+    for key in records:
+        assert packed.records[key].dtype == records[key].dtype
+        assert packed.histogram(key=key) == unpacked.histogram(key=key)
+    assert packed.multi_measurement_histogram(keys=['ab', 'c', 'd']) == (
+        unpacked.multi_measurement_histogram(keys=['ab', 'c', 'd'])
+    )
+    pd.testing.assert_frame_equal(packed.data, unpacked.data)
+    assert cirq.read_json(json_text=cirq.to_json(packed)) == unpacked
+    assert cirq.ResultDict(pack_bits=True).repetitions == 0
+
+
+def test_result_addition_of_chunks() -> None:
+    a = cirq.ResultDict(measurements={'m': np.array([[0, 1], [1, 1]], dtype=bool)})
+    b = cirq.ResultDict(measurements={'m': np.array([[1, 0]], dtype=bool)}, pack_bits=True)
+    c = a + b + a
+    assert c.repetitions == 5
+    assert c.histogram(key='m') == collections.Counter({1: 2, 3: 2, 2: 1})
+    pd.testing.assert_frame_equal(c.data, pd.DataFrame({'m': [1, 3, 2, 1, 3]}, dtype=np.int64))
+    a.measurements['m'][0, 0] = 1
+    np.testing.assert_array_equal(c.records['m'][:, 0], [[0, 1], [1, 1], [1, 0], [0, 1], [1, 1]])
+
+
+def test_result_addition_does_not_share_records() -> None:
+    a = cirq.ResultDict(records={'m': np.array([[[0, 1]], [[2, 1]]])})
+    b = cirq.ResultDict(records={'m': np.array([[[1, 0]]])})
+    total = a + cirq.ResultDict(records={'m': np.zeros((0, 1, 2), dtype=int)})
+    total.records['m'][0, 0, 0] = 5
+    np.testing.assert_array_equal(a.records['m'][:, 0], [[0, 1], [2, 1]])
+    total = a + b
+    total.records['m'][...] = 7
+    np.testing.assert_array_equal(a.records['m'][:, 0], [[0, 1], [2, 1]])
+    np.testing.assert_array_equal(b.records['m'][:, 0], [[1, 0]])
+
+
 def test_result_equality() -> None:
     et = cirq.testing.EqualsTester()
     et.add_equality_group(
@@ -20,6 +20,7 @@ import itertools
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, cast, overload, TYPE_CHECKING, Union
 
+import numpy as np
 import sympy
 
 from cirq import protocols
@@ -145,6 +146,26 @@ class Sweep(metaclass=abc.ABCMeta):
     def param_tuples(self) -> Iterator[Params]:
         """An iterator over (key, value) pairs assigning Symbol key to value."""
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        """Returns the values of every key over the whole sweep as arrays.
+
+        This is a columnar alternative to iterating over `param_tuples` or
+        the `ParamResolver`s of the sweep: the i-th entry of each array is the
+        value assigned to that key by the i-th resolver. The built-in sweeps
+        build these arrays directly with NumPy, without creating a tuple per
+        sweep point. Use `cirq.batch_value_of` to evaluate expressions over
+        them.
+
+        Returns:
+            A dictionary from each key in `keys` to an array of length
+            `len(self)`.
+        """
+        columns: dict[cirq.TParamKey, list[Any]] = {key: [] for key in self.keys}
+        for params in self.param_tuples():
+            for key, value in params:
+                columns[key].append(value)
+        return {key: np.asarray(values) for key, values in columns.items()}
+
     def __str__(self) -> str:
         length = len(self)
         max_show = 10
@@ -185,6 +206,9 @@ class _Unit(Sweep):
     def param_tuples(self) -> Iterator[Params]:
         yield ()
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        return {}
+
     def __repr__(self) -> str:
         return 'cirq.UnitSweep'
 
@@ -238,6 +262,18 @@ class Product(Sweep):
             itertools.product(*(factor.param_tuples() for factor in self.factors)),
         )
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        lengths = [len(factor) for factor in self.factors]
+        arrays: dict[cirq.TParamKey, np.ndarray] = {}
+        for i, factor in enumerate(self.factors):
+            # Earlier factors are outer loops, so each value of this factor is
+            # repeated for every point of the later factors.
+            inner = int(np.prod(lengths[i + 1 :], dtype=np.int64))
+            outer = int(np.prod(lengths[:i], dtype=np.int64))
+            for key, values in factor.to_arrays().items():
+                arrays[key] = np.tile(np.repeat(values, inner), outer)
+        return arrays
+
     def __repr__(self) -> str:
         factors_repr = ', '.join(repr(f) for f in self.factors)
         return f'cirq.Product({factors_repr})'
@@ -302,6 +338,10 @@ class Concat(Sweep):
         for sweep in self.sweeps:
             yield from sweep.param_tuples()
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        sweep_arrays = [sweep.to_arrays() for sweep in self.sweeps]
+        return {key: np.concatenate([arrays[key] for arrays in sweep_arrays]) for key in self.keys}
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(sweep) for sweep in self.sweeps)
         return f'cirq.Concat({sweeps_repr})'
@@ -358,6 +398,14 @@ class Zip(Sweep):
         for values in zip(*iters):
             yield tuple(itertools.chain.from_iterable(values))
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        length = len(self)
+        return {
+            key: values[:length]
+            for sweep in self.sweeps
+            for key, values in sweep.to_arrays().items()
+        }
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(s) for s in self.sweeps)
         return f'cirq.Zip({sweeps_repr})'
@@ -429,6 +477,14 @@ class ZipLongest(Zip):
         for values in itertools.islice(zip(*iters), len(self)):
             yield tuple(item for value in values for item in value)
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        length = len(self)
+        return {
+            key: np.concatenate([values, np.repeat(values[-1:], length - len(values))])
+            for sweep in self.sweeps
+            for key, values in sweep.to_arrays().items()
+        }
+
 
 class SingleSweep(Sweep):
     """A simple sweep over one parameter with values from an iterator."""
@@ -493,6 +549,9 @@ class Points(SingleSweep):
     def _values(self) -> Iterator[float]:
         return iter(self.points)
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        return {self.key: np.asarray(self.points)}
+
     def __repr__(self) -> str:
         metadata_repr = f', metadata={self.metadata!r}' if self.metadata is not None else ""
         return f'cirq.Points({self.key!r}, {self.points!r}{metadata_repr})'
@@ -547,6 +606,12 @@ class Linspace(SingleSweep):
                 p = i / (self.length - 1)
                 yield self.start * (1 - p) + self.stop * p
 
+    def to_arrays(self) -> dict[cirq.TParamKey, np.ndarray]:
+        if self.length == 1:
+            return {self.key: np.array([self.start])}
+        p = np.arange(self.length) / (self.length - 1)
+        return {self.key: self.start * (1 - p) + self.stop * p}
+
     def __repr__(self) -> str:
         metadata_repr = f', metadata={self.metadata!r}' if self.metadata is not None else ""
         return (
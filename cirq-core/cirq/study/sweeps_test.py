@@ -553,3 +553,28 @@ def test_list_of_dicts_to_zip() -> None:
         cirq.Points('c', [10.0, 9.0, 8.0]),
     )
     assert cirq.list_of_dicts_to_zip(param_dict) == param_zip
+
+
+@pytest.mark.parametrize(
+    'sweep',
+    [
+        cirq.UnitSweep,
+        cirq.Points('a', [1, 2, 3]),
+        cirq.Points('a', []),
+        cirq.Linspace('a', 0.1, 0.9, 7),
+        cirq.Linspace('a', 2, 2, 1),
+        cirq.Linspace('a', 0, 1, 4) * cirq.Points('b', [5, 6]) * cirq.Linspace('c', -1, 1, 3),
+        cirq.Linspace('a', 0, 1, 4) + cirq.Points('b', [5, 6, 7]),
+        cirq.ZipLongest(cirq.Linspace('a', 0, 1, 4), cirq.Points('b', [5, 6])),
+        cirq.Concat(cirq.Points('a', [1, 2]), cirq.Linspace('a', 0, 1, 3)),
+        (cirq.Points('a', [1, 2]) + cirq.Points('b', [3, 4])) * cirq.Points('c', [5, 6, 7]),
+        cirq.ListSweep([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]),
+    ],
+)
+def test_to_arrays_matches_param_tuples(sweep: cirq.Sweep) -> None:
+    arrays = sweep.to_arrays()
+    assert list(arrays) == sweep.keys
+    assert all(len(values) == len(sweep) for values in arrays.values())
+    for i, params in enumerate(sweep.param_tuples()):
+        for key, value in params:
+            assert arrays[key][i] == value
@@ -111,6 +111,15 @@ from cirq.transformers.synchronize_terminal_measurements import (
     synchronize_terminal_measurements as synchronize_terminal_measurements,
 )
 
+from cirq.transformers.cached_transformer import (
+    CachedTransformer as CachedTransformer,
+    TransformerCache as TransformerCache,
+)
+
+from cirq.transformers.parallelize_over_components import (
+    parallelize_over_components as parallelize_over_components,
+)
+
 from cirq.transformers.transformer_api import (
     LogLevel as LogLevel,
     TRANSFORMER as TRANSFORMER,
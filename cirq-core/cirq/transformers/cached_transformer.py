@@ -0,0 +1,342 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memoization of transformer results, in memory and on disk."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+from collections.abc import Hashable
+from typing import Any, cast, TYPE_CHECKING
+
+from cirq import circuits, protocols
+from cirq.transformers import transformer_api, transformer_primitives
+
+if TYPE_CHECKING:
+    import cirq
+
+# Tags subcircuits whose bodies were already transformed, so that the transformer skips them.
+_DONE = object()
+
+
+class TransformerCache:
+    """Stores transformed circuits by the circuit and transformer that produced them.
+
+    Results are kept in an in-memory LRU and, if `directory` is given, also
+    written there as `cirq.to_json` files named by a SHA-256 digest of the
+    input circuit's JSON and the transformer key. The files outlive the
+    process, so other processes pointing at the same directory reuse them.
+    Circuits that cannot be serialized to JSON are only cached in memory.
+
+    One cache can be shared by several `cirq.CachedTransformer`s, since the
+    transformer is part of every key. It is safe to use from several threads.
+    """
+
+    def __init__(
+        self, maxsize: int | None = 128, directory: str | os.PathLike | None = None
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The number of results kept in memory, least recently
+                used first out. None means no limit.
+            directory: If given, a directory (created if missing) in which
+                results are also stored as JSON files.
+        """
+        self._maxsize = maxsize
+        self._directory = None if directory is None else os.fspath(directory)
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+        self._memory: collections.OrderedDict[Hashable, cirq.FrozenCircuit] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
+
+    @property
+    def directory(self) -> str | None:
+        return self._directory
+
+    def __len__(self) -> int:
+        """The number of results held in memory."""
+        return len(self._memory)
+
+    def clear(self) -> None:
+        """Empties the in-memory LRU. Files in `directory` are left in place."""
+        with self._lock:
+            self._memory.clear()
+
+    def _digest(self, circuit: cirq.FrozenCircuit, key: str | None) -> str | None:
+        """Returns the stable file name of a result, or None if it is not stored on disk."""
+        if self._directory is None or key is None:
+            return None
+        try:
+            circuit_json = protocols.to_json(circuit)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(f'{key}\n{circuit_json}'.encode()).hexdigest()
+
+    def _get(self, memory_key: Hashable) -> cirq.FrozenCircuit | None:
+        with self._lock:
+            result = self._memory.get(memory_key)
+            if result is not None:
+                self._memory.move_to_end(memory_key)
+            return result
+
+    def _load(self, memory_key: Hashable, digest: str | None) -> cirq.FrozenCircuit | None:
+        if digest is None:
+            return None
+        try:
+            result = protocols.read_json(os.path.join(cast(str, self._directory), digest + '.json'))
+        except (OSError, ValueError):
+            return None
+        self._remember(memory_key, result)
+        return result
+
+    def _put(self, memory_key: Hashable, digest: str | None, result: cirq.FrozenCircuit) -> None:
+        self._remember(memory_key, result)
+        if digest is None:
+            return
+        directory = cast(str, self._directory)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        os.close(fd)
+        try:
+            protocols.to_json(result, tmp_path)
+            # Rename into place so concurrent readers never see a partial file.
+            os.replace(tmp_path, os.path.join(directory, digest + '.json'))
+        except (TypeError, ValueError):
+            pass
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remember(self, memory_key: Hashable, result: cirq.FrozenCircuit) -> None:
+        if self._maxsize == 0:
+            return
+        with self._lock:
+            self._memory[memory_key] = result
+            self._memory.move_to_end(memory_key)
+            if self._maxsize is not None and len(self._memory) > self._maxsize:
+                self._memory.popitem(last=False)
+
+
+@transformer_api.transformer
+class CachedTransformer:
+    """Memoizes a transformer on the circuits it is applied to.
+
+    A result is reused when the same transformer is applied to an equal
+    circuit with the same `tags_to_ignore` and `deep` options and the same
+    keyword arguments. The transformer must be deterministic.
+
+    Keyword arguments are part of the in-memory cache key, so they must be
+    hashable, and are compared by equality. Results stored on disk are keyed
+    by the `cirq.to_json` of the keyword arguments, and are only cached in
+    memory if the keyword arguments cannot be serialized.
+
+    By default a circuit is cached as a whole, also with `context.deep`, so
+    the result is exactly that of the transformer. With `cache_subcircuits`
+    and `context.deep`, the bodies of `cirq.CircuitOperation`s are instead
+    transformed and cached one by one before the transformer runs on the top
+    level circuit, which sees the transformed subcircuits as ignored
+    operations. A subcircuit repeated within or across circuits is thus
+    compiled only once. The transformer can then no longer optimize across
+    the boundary of a subcircuit, e.g. merge its first gates with the ones
+    before it, so the result may differ from that of the transformer while
+    being equivalent to it. This relies on the transformer treating each
+    subcircuit on its own and honoring `tags_to_ignore`, as transformers
+    decorated with `add_deep_support=True` and the built-in compilation
+    transformers do.
+
+    >>> compile_to_cz = cirq.CachedTransformer(cirq.optimize_for_target_gateset)
+    >>> q0, q1 = cirq.LineQubit.range(2)
+    >>> circuit = cirq.Circuit(cirq.SWAP(q0, q1))
+    >>> gateset = cirq.CZTargetGateset()
+    >>> compiled = compile_to_cz(circuit, gateset=gateset)
+    >>> compile_to_cz(circuit, gateset=gateset) == compiled
+    True
+    >>> len(compile_to_cz.cache)
+    1
+    """
+
+    def __init__(
+        self,
+        transformer: cirq.TRANSFORMER,
+        *,
+        cache: TransformerCache | None = None,
+        key: str | None = None,
+        cache_subcircuits: bool = False,
+    ) -> None:
+        """Initializes the cached transformer.
+
+        Args:
+            transformer: The transformer to memoize.
+            cache: Where to store results. Defaults to a new in-memory
+                `cirq.TransformerCache`.
+            key: The name identifying `transformer` in cache keys. Defaults to
+                its qualified name, followed by the arguments of a
+                `functools.partial` or the repr of a callable object. Must be
+                given for closures and objects without a custom repr.
+            cache_subcircuits: Whether to transform and cache the bodies of
+                `cirq.CircuitOperation`s separately when `context.deep` is set.
+
+        Raises:
+            ValueError: If `key` is needed but missing.
+        """
+        self._transformer = transformer
+        self._cache = TransformerCache() if cache is None else cache
+        self._key = _transformer_key(transformer) if key is None else key
+        self._cache_subcircuits = cache_subcircuits
+
+    @property
+    def transformer(self) -> cirq.TRANSFORMER:
+        return self._transformer
+
+    @property
+    def cache(self) -> TransformerCache:
+        return self._cache
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def cache_subcircuits(self) -> bool:
+        return self._cache_subcircuits
+
+    def __call__(
+        self,
+        circuit: cirq.AbstractCircuit,
+        *,
+        context: cirq.TransformerContext | None = None,
+        **kwargs: Any,
+    ) -> cirq.AbstractCircuit:
+        """Returns the cached result of `transformer(circuit, context=context, **kwargs)`.
+
+        Raises:
+            TypeError: If a keyword argument is not hashable.
+        """
+        options = None if context is None else (context.deep, context.tags_to_ignore)
+        subcircuits = self._cache_subcircuits and context is not None and context.deep
+        # Keyword arguments are keyed by value in memory and by their JSON on disk, where the
+        # key must be stable across processes.
+        kwargs_key = tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+        try:
+            hash(kwargs_key)
+        except TypeError as e:
+            raise TypeError(
+                f'Cannot cache a transformer with unhashable keyword arguments: {kwargs!r}'
+            ) from e
+        try:
+            kwargs_json: str | None = protocols.to_json(dict(sorted(kwargs.items())))
+        except (TypeError, ValueError):
+            kwargs_json = None
+        key = (
+            None
+            if kwargs_json is None
+            else '|'.join(
+                [self._key, *(['subcircuits'] if subcircuits else []), repr(options), kwargs_json]
+            )
+        )
+        return self._transform(
+            circuit.freeze(), context, (self._key, subcircuits, options, kwargs_key), key, kwargs
+        )
+
+    def _transform(
+        self,
+        circuit: cirq.FrozenCircuit,
+        context: cirq.TransformerContext | None,
+        memory_key: Hashable,
+        key: str | None,
+        kwargs: dict[str, Any],
+    ) -> cirq.AbstractCircuit:
+        circuit_key = (circuit, memory_key)
+        cached = self._cache._get(circuit_key)
+        digest = None
+        if cached is None:
+            digest = self._cache._digest(circuit, key)
+            cached = self._cache._load(circuit_key, digest)
+        if cached is not None:
+            return cached.unfreeze()
+
+        batch_replace = []
+        if self._cache_subcircuits and context is not None and context.deep:
+            for i, op in circuit.findall_operations(
+                lambda o: isinstance(o.untagged, circuits.CircuitOperation)
+            ):
+                if not set(op.tags).isdisjoint(context.tags_to_ignore):
+                    continue
+                circuit_op = cast(circuits.CircuitOperation, op.untagged)
+                body = self._transform(
+                    circuit_op.circuit, context, memory_key, key, kwargs
+                ).freeze()
+                batch_replace.append(
+                    (i, op, circuit_op.replace(circuit=body).with_tags(*op.tags, _DONE))
+                )
+        if batch_replace:
+            assert context is not None
+            # Hide the transformed subcircuits from the transformer behind an ignored tag.
+            mutable_circuit = circuit.unfreeze()
+            mutable_circuit.batch_replace(batch_replace)
+            result = self._transformer(
+                mutable_circuit,
+                context=dataclasses.replace(
+                    context, tags_to_ignore=(*context.tags_to_ignore, _DONE)
+                ),
+                **kwargs,
+            )
+            result = transformer_primitives.map_operations(
+                result,
+                lambda op, _: (
+                    op.untagged.with_tags(*(t for t in op.tags if t is not _DONE))
+                    if _DONE in op.tags
+                    else op
+                ),
+            ).unfreeze(copy=False)
+        else:
+            result = self._transformer(circuit, context=context, **kwargs)
+        self._cache._put(circuit_key, digest, result.freeze())
+        return result
+
+    def __repr__(self) -> str:
+        subcircuits = ', cache_subcircuits=True' if self._cache_subcircuits else ''
+        return f'cirq.CachedTransformer({self._transformer!r}, key={self._key!r}{subcircuits})'
+
+
+def _transformer_key(transformer: Any) -> str:
+    if isinstance(transformer, functools.partial):
+        args = [repr(arg) for arg in transformer.args]
+        args += [f'{k}={v!r}' for k, v in sorted(transformer.keywords.items())]
+        return f'{_transformer_key(transformer.func)}({", ".join(args)})'
+    if inspect.isfunction(transformer):
+        name = f'{transformer.__module__}.{transformer.__qualname__}'
+        if '<locals>' not in name:
+            return name
+    elif not inspect.ismethod(transformer):
+        cls = type(transformer)
+        if cls.__repr__ is not object.__repr__ and '<locals>' not in cls.__qualname__:
+            return f'{cls.__module__}.{cls.__qualname__}:{transformer!r}'
+    raise ValueError(
+        f'Cannot derive a stable cache key for transformer {transformer!r}. '
+        'Pass one with the `key` argument.'
+    )
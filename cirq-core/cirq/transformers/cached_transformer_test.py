@@ -0,0 +1,298 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+import os
+
+import pytest
+
+import cirq
+
+_calls: list[cirq.AbstractCircuit] = []
+
+
+@cirq.transformer
+def _counting_transformer(
+    circuit: cirq.AbstractCircuit,
+    *,
+    context: cirq.TransformerContext | None = None,
+    exponent: float = 0.5,
+) -> cirq.Circuit:
+    _calls.append(circuit)
+    return cirq.map_operations(
+        circuit,
+        lambda op, _: op**exponent if op.gate == cirq.X else op,
+        tags_to_ignore=context.tags_to_ignore if context else (),
+    ).unfreeze(copy=False)
+
+
+class _TransformerWithoutRepr:
+    def __call__(self, circuit, *, context=None):
+        return circuit  # pragma: no cover
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _calls.clear()
+
+
+def test_caches_in_memory() -> None:
+    q = cirq.LineQubit(0)
+    cached = cirq.CachedTransformer(_counting_transformer)
+    circuit = cirq.Circuit(cirq.X(q))
+    result = cached(circuit)
+    assert result == cirq.Circuit(cirq.X(q) ** 0.5)
+    assert isinstance(result, cirq.Circuit)
+    result.append(cirq.Y(q))
+    assert cached(circuit) == cirq.Circuit(cirq.X(q) ** 0.5)
+    assert cached(circuit.freeze()) == cirq.Circuit(cirq.X(q) ** 0.5)
+    assert len(_calls) == 1
+
+    assert cached(circuit, exponent=0.25) == cirq.Circuit(cirq.X(q) ** 0.25)
+    tagged = cirq.Circuit(cirq.X(q).with_tags('t'))
+    context = cirq.TransformerContext(tags_to_ignore=('t',))
+    assert cached(tagged, context=context) == tagged
+    logged = cirq.TransformerContext(logger=cirq.TransformerLogger(), tags_to_ignore=('t',))
+    assert cached(tagged, context=logged) == tagged
+    assert len(_calls) == 3
+    assert len(cached.cache) == 3
+    cached.cache.clear()
+    assert len(cached.cache) == 0
+    _ = cached(circuit)
+    assert len(_calls) == 4
+
+
+class _SameRepr:
+    def __init__(self, exponent: float) -> None:
+        self.exponent = exponent
+
+    def __repr__(self) -> str:
+        return '_SameRepr()'
+
+
+@cirq.transformer
+def _exponent_transformer(
+    circuit: cirq.AbstractCircuit,
+    *,
+    context: cirq.TransformerContext | None = None,
+    exponent: _SameRepr | None = None,
+) -> cirq.Circuit:
+    assert exponent is not None
+    return _counting_transformer(circuit, context=context, exponent=exponent.exponent)
+
+
+def test_keyword_arguments_are_keyed_by_value() -> None:
+    q = cirq.LineQubit(0)
+    cached = cirq.CachedTransformer(_exponent_transformer)
+    circuit = cirq.Circuit(cirq.X(q))
+    assert cached(circuit, exponent=_SameRepr(0.5)) == cirq.Circuit(cirq.X(q) ** 0.5)
+    assert cached(circuit, exponent=_SameRepr(0.25)) == cirq.Circuit(cirq.X(q) ** 0.25)
+    assert len(_calls) == 2
+
+    with pytest.raises(TypeError, match='unhashable'):
+        _ = cirq.CachedTransformer(_counting_transformer)(circuit, exponent=[0.5])
+
+
+def test_lru_eviction() -> None:
+    a, b = cirq.LineQubit.range(2)
+    cached = cirq.CachedTransformer(_counting_transformer, cache=cirq.TransformerCache(maxsize=1))
+    assert cached.cache.maxsize == 1
+    _ = cached(cirq.Circuit(cirq.X(a)))
+    _ = cached(cirq.Circuit(cirq.X(b)))
+    _ = cached(cirq.Circuit(cirq.X(b)))
+    _ = cached(cirq.Circuit(cirq.X(a)))
+    assert len(_calls) == 3
+
+    uncached = cirq.CachedTransformer(_counting_transformer, cache=cirq.TransformerCache(maxsize=0))
+    _ = uncached(cirq.Circuit(cirq.X(a)))
+    _ = uncached(cirq.Circuit(cirq.X(a)))
+    assert len(_calls) == 5
+    assert len(uncached.cache) == 0
+
+
+def test_shared_disk_cache(tmp_path) -> None:
+    q = cirq.LineQubit(0)
+    directory = tmp_path / 'cache'
+    circuit = cirq.Circuit(cirq.X(q), cirq.CZ(q, q + 1))
+    first = cirq.CachedTransformer(
+        _counting_transformer, cache=cirq.TransformerCache(directory=directory)
+    )
+    assert first.cache.directory == str(directory)
+    expected = first(circuit)
+    assert len(os.listdir(directory)) == 1
+
+    second = cirq.CachedTransformer(
+        _counting_transformer, cache=cirq.TransformerCache(directory=directory)
+    )
+    assert second(circuit) == expected
+    assert second(circuit) == expected
+    assert len(_calls) == 1
+
+    other_key = cirq.CachedTransformer(
+        _counting_transformer, cache=cirq.TransformerCache(directory=directory), key='other'
+    )
+    assert other_key(circuit) == expected
+    assert len(_calls) == 2
+    assert len(os.listdir(directory)) == 2
+
+
+def test_disk_cache_keys_keyword_arguments_by_json(tmp_path) -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q))
+    first = cirq.CachedTransformer(
+        _counting_transformer, cache=cirq.TransformerCache(directory=tmp_path)
+    )
+    _ = first(circuit, exponent=0.25)
+    second = cirq.CachedTransformer(
+        _counting_transformer, cache=cirq.TransformerCache(directory=tmp_path)
+    )
+    assert second(circuit, exponent=0.25) == cirq.Circuit(cirq.X(q) ** 0.25)
+    assert len(_calls) == 1
+
+    # Keyword arguments without JSON are only cached in memory, since their repr may collide.
+    cached = cirq.CachedTransformer(
+        _exponent_transformer, cache=cirq.TransformerCache(directory=tmp_path)
+    )
+    exponent = _SameRepr(0.5)
+    _ = cached(circuit, exponent=exponent)
+    _ = cached(circuit, exponent=exponent)
+    assert len(_calls) == 2
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_disk_cache_skips_unserializable_and_corrupt_files(tmp_path) -> None:
+    q = cirq.LineQubit(0)
+    cache = cirq.TransformerCache(directory=tmp_path)
+    cached = cirq.CachedTransformer(_counting_transformer, cache=cache)
+    unserializable = cirq.Circuit(cirq.Y(q).with_tags(frozenset()), cirq.X(q))
+    _ = cached(unserializable)
+    _ = cached(unserializable)
+    assert len(_calls) == 1
+    assert os.listdir(tmp_path) == []
+
+    circuit = cirq.Circuit(cirq.X(q))
+    _ = cached(circuit)
+    (path,) = tmp_path.iterdir()
+    path.write_text('{')
+    cache.clear()
+    assert cached(circuit) == cirq.Circuit(cirq.X(q) ** 0.5)
+    assert len(_calls) == 3
+    assert [p.suffix for p in tmp_path.iterdir()] == ['.json']
+
+    unserializable_result = cirq.CachedTransformer(
+        lambda circuit, *, context=None: cirq.Circuit(cirq.Y(q).with_tags(frozenset())),
+        cache=cache,
+        key='unserializable result',
+    )
+    assert unserializable_result(circuit) == cirq.Circuit(cirq.Y(q).with_tags(frozenset()))
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_deep_caches_subcircuits() -> None:
+    a, b = cirq.LineQubit.range(2)
+    body = cirq.FrozenCircuit(cirq.X(a), cirq.CZ(a, b))
+    circuit = cirq.Circuit(
+        cirq.CircuitOperation(body),
+        cirq.CircuitOperation(body, repetitions=2),
+        cirq.CircuitOperation(body).with_tags('ignore'),
+        cirq.X(b),
+    )
+    context = cirq.TransformerContext(deep=True, tags_to_ignore=('ignore',))
+    cached = cirq.CachedTransformer(_counting_transformer, cache_subcircuits=True)
+    result = cached(circuit, context=context)
+    assert result == cirq.map_operations(
+        circuit,
+        lambda op, _: op**0.5 if op.gate == cirq.X else op,
+        deep=True,
+        tags_to_ignore=['ignore'],
+    )
+    assert len(_calls) == 2
+    assert _calls[0] == body
+
+    other = cirq.Circuit(cirq.CircuitOperation(body), cirq.Y(a))
+    _ = cached(other, context=context)
+    assert len(_calls) == 3
+    assert len(cached.cache) == 3
+
+
+def test_deep_matches_optimize_for_target_gateset() -> None:
+    a, b, c = cirq.LineQubit.range(3)
+    body = cirq.FrozenCircuit(cirq.SWAP(a, b), cirq.H(c), cirq.CCZ(a, b, c))
+    circuit = cirq.Circuit(
+        cirq.CircuitOperation(body), cirq.ISWAP(b, c), cirq.CircuitOperation(body)
+    )
+    context = cirq.TransformerContext(deep=True)
+    gateset = cirq.CZTargetGateset()
+    cached = cirq.CachedTransformer(cirq.optimize_for_target_gateset, cache_subcircuits=True)
+    expected = cirq.optimize_for_target_gateset(circuit, context=context, gateset=gateset)
+    assert cached(circuit, context=context, gateset=gateset) == expected
+    assert len(cached.cache) == 2
+
+
+def test_deep_subcircuits_merging_with_neighbors() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(a), cirq.CircuitOperation(cirq.FrozenCircuit(cirq.Y(a) ** 0.7)), cirq.CZ(a, b)
+    )
+    context = cirq.TransformerContext(deep=True)
+    gateset = cirq.CZTargetGateset()
+    expected = cirq.optimize_for_target_gateset(circuit, context=context, gateset=gateset)
+
+    cached = cirq.CachedTransformer(cirq.optimize_for_target_gateset)
+    assert cached(circuit, context=context, gateset=gateset) == expected
+    assert cached(circuit, context=context, gateset=gateset) == expected
+    assert len(cached.cache) == 1
+
+    # Compiling subcircuits separately prevents merging them with their neighbors.
+    by_subcircuit = cirq.CachedTransformer(cirq.optimize_for_target_gateset, cache_subcircuits=True)
+    result = by_subcircuit(circuit, context=context, gateset=gateset)
+    assert result != expected
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(result), cirq.unitary(expected), atol=1e-8
+    )
+    assert len(by_subcircuit.cache) == 2
+    assert repr(by_subcircuit).endswith('cache_subcircuits=True)')
+    assert by_subcircuit.cache_subcircuits
+
+
+def test_transformer_keys() -> None:
+    assert cirq.CachedTransformer(_counting_transformer).key == (
+        'cirq.transformers.cached_transformer_test._counting_transformer'
+    )
+    partial = functools.partial(_counting_transformer, exponent=0.25)
+    cached = cirq.CachedTransformer(partial)
+    assert cached.key.endswith('_counting_transformer(exponent=0.25)')
+    assert cached.transformer is partial
+
+    merge = cirq.CachedTransformer(cirq.CachedTransformer(_counting_transformer, key='inner'))
+    assert merge.key == (
+        "cirq.transformers.cached_transformer.CachedTransformer:"
+        "cirq.CachedTransformer("
+        f"{_counting_transformer!r}, key='inner')"
+    )
+
+    def closure(circuit, *, context=None):
+        return circuit  # pragma: no cover
+
+    with pytest.raises(ValueError, match='key'):
+        _ = cirq.CachedTransformer(closure)
+    assert cirq.CachedTransformer(closure, key='closure').key == 'closure'
+    with pytest.raises(ValueError, match='key'):
+        _ = cirq.CachedTransformer(
+            cirq.TransformerLogger().register_initial  # type: ignore[arg-type]
+        )
+    with pytest.raises(ValueError, match='key'):
+        _ = cirq.CachedTransformer(_TransformerWithoutRepr())
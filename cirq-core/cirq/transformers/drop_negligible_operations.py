@@ -18,7 +18,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from cirq import protocols
+from cirq import circuits, protocols
 from cirq.transformers import transformer_api, transformer_primitives
 
 if TYPE_CHECKING:
@@ -48,6 +48,13 @@ def drop_negligible_operations(
     """
     if context is None:
         context = transformer_api.TransformerContext()
+    if not context.deep:
+        # Negligibility only depends on the gate, so it is decided once per distinct gate.
+        return (
+            circuits.ColumnarCircuit(circuit)
+            .drop_negligible(atol, tags_to_ignore=context.tags_to_ignore)
+            .to_circuit()
+        )
 
     def map_func(op: cirq.Operation, _: int) -> cirq.OP_TREE:
         return (
@@ -0,0 +1,171 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs a transformer on independent parts of a circuit, optionally in parallel."""
+
+from __future__ import annotations
+
+import dataclasses
+import heapq
+from concurrent import futures
+from typing import TYPE_CHECKING
+
+from cirq import circuits, protocols
+from cirq.transformers import transformer_api
+
+if TYPE_CHECKING:
+    import cirq
+
+
+def parallelize_over_components(
+    transformer: cirq.TRANSFORMER,
+    *,
+    executor: futures.Executor | None = None,
+    num_parts: int | None = None,
+    window_size: int | None = None,
+) -> cirq.TRANSFORMER:
+    """Returns a transformer that applies `transformer` to independent parts of a circuit.
+
+    The circuit is split into the qubit components found by
+    `cirq.AbstractCircuit.get_independent_qubit_sets`, so that no operation
+    acts across two parts. Each part is transformed on its own, possibly in
+    parallel by `executor`, and the results are combined with
+    `cirq.Circuit.zip`. Wide circuits made of many disconnected blocks, such
+    as simultaneous benchmarks on a large device, then compile in time that
+    scales with the number of workers.
+
+    The result is equivalent to applying `transformer` to the whole circuit
+    only if the transformer acts locally on qubits, as decompositions, gate
+    merging and most compilation transformers do. Transformers that need to
+    see the whole circuit, like routing, should not be wrapped. Moment
+    alignment across parts is lost, since parts are stacked moment by moment.
+
+    Circuits with classically controlled or qubitless operations are not
+    split into components, as they couple parts through measurement keys or
+    would be dropped from every part.
+
+    >>> q = cirq.LineQubit.range(4)
+    >>> circuit = cirq.Circuit(cirq.SWAP(q[0], q[1]), cirq.SWAP(q[2], q[3]))
+    >>> to_cz = cirq.parallelize_over_components(
+    ...     cirq.create_transformer_with_kwargs(
+    ...         cirq.optimize_for_target_gateset, gateset=cirq.CZTargetGateset()
+    ...     )
+    ... )
+    >>> cirq.CZTargetGateset().validate(to_cz(circuit))
+    True
+
+    Args:
+        transformer: The transformer to apply to each part. It must only act
+            on the qubits of the part it is given. To run in a
+            `concurrent.futures.ProcessPoolExecutor` it must also be
+            picklable, e.g. a module-level function or a `functools.partial`
+            of one.
+        executor: Runs the parts concurrently. Defaults to running them one
+            after another in the calling thread.
+        num_parts: If given, components are grouped into at most this many
+            parts with similar numbers of operations, which bounds the
+            overhead of sending many small circuits to `executor`. Defaults
+            to one part per component.
+        window_size: If given, each part is further cut into windows of this
+            many moments, which are transformed separately and concatenated
+            in order. This also splits circuits that have a single component,
+            but the transformer cannot optimize across window boundaries.
+
+    Returns:
+        A `cirq.TRANSFORMER` that splits, transforms and stitches circuits.
+
+    Raises:
+        ValueError: If `num_parts` or `window_size` is not positive.
+    """
+    if num_parts is not None and num_parts < 1:
+        raise ValueError(f'num_parts must be positive, got {num_parts}.')
+    if window_size is not None and window_size < 1:
+        raise ValueError(f'window_size must be positive, got {window_size}.')
+
+    @transformer_api.transformer
+    def transformer_over_components(
+        circuit: cirq.AbstractCircuit, *, context: cirq.TransformerContext | None = None
+    ) -> cirq.Circuit:
+        parts = [_windows(part, window_size) for part in _split_into_components(circuit, num_parts)]
+        pieces = [window for windows in parts for window in windows]
+        if len(pieces) == 1:
+            return transformer(circuit, context=context).unfreeze(copy=False)
+
+        # Only the wrapper logs, as the parts run in any order and possibly in other processes.
+        piece_context = None
+        if context is not None:
+            piece_context = dataclasses.replace(
+                context, logger=transformer_api.NoOpTransformerLogger()
+            )
+        if executor is None:
+            results = [transformer(piece, context=piece_context) for piece in pieces]
+        else:
+            jobs = [executor.submit(transformer, piece, context=piece_context) for piece in pieces]
+            results = [job.result() for job in jobs]
+
+        transformed_parts = []
+        used_qubits: set[cirq.Qid] = set()
+        for windows in parts:
+            part = circuits.Circuit.from_moments(
+                *(moment for result in results[: len(windows)] for moment in result)
+            )
+            results = results[len(windows) :]
+            shared_qubits = used_qubits.intersection(part.all_qubits())
+            if shared_qubits:
+                raise ValueError(
+                    f'Transformed parts of the circuit share qubits {sorted(shared_qubits)}, '
+                    'so they cannot be combined. The transformer must only act on the qubits '
+                    'of the part it is given.'
+                )
+            used_qubits.update(part.all_qubits())
+            transformed_parts.append(part)
+        return circuits.Circuit.zip(*transformed_parts).with_tags(*circuit.tags)
+
+    return transformer_over_components
+
+
+def _split_into_components(
+    circuit: cirq.AbstractCircuit, num_parts: int | None
+) -> list[cirq.AbstractCircuit]:
+    """Splits `circuit` into circuits on disjoint qubits, balanced by operation count."""
+    if any(not op.qubits or protocols.control_keys(op) for op in circuit.all_operations()):
+        return [circuit]
+    qubit_sets = circuit.get_independent_qubit_sets()
+    if len(qubit_sets) <= 1:
+        return [circuit]
+
+    if num_parts is not None and num_parts < len(qubit_sets):
+        component_of = {q: i for i, qubits in enumerate(qubit_sets) for q in qubits}
+        sizes = [0] * len(qubit_sets)
+        for op in circuit.all_operations():
+            sizes[component_of[op.qubits[0]]] += 1
+        # Largest components first, each into the part with the fewest operations so far.
+        loads = [(0, i) for i in range(num_parts)]
+        grouped: list[set[cirq.Qid]] = [set() for _ in range(num_parts)]
+        for i in sorted(range(len(qubit_sets)), key=lambda i: -sizes[i]):
+            load, part = heapq.heappop(loads)
+            grouped[part].update(qubit_sets[i])
+            heapq.heappush(loads, (load + sizes[i], part))
+        qubit_sets = [qubits for qubits in grouped if qubits]
+
+    return [
+        circuits.Circuit.from_moments(*(moment[qubits] for moment in circuit))
+        for qubits in qubit_sets
+    ]
+
+
+def _windows(circuit: cirq.AbstractCircuit, window_size: int | None) -> list[cirq.AbstractCircuit]:
+    if window_size is None or len(circuit) <= window_size:
+        return [circuit]
+    return [circuit[i : i + window_size] for i in range(0, len(circuit), window_size)]
@@ -0,0 +1,129 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+from concurrent import futures
+
+import pytest
+
+import cirq
+
+_calls: list[cirq.AbstractCircuit] = []
+
+
+@cirq.transformer
+def _recording_transformer(
+    circuit: cirq.AbstractCircuit, *, context: cirq.TransformerContext | None = None
+) -> cirq.Circuit:
+    _calls.append(circuit)
+    return cirq.Circuit(circuit.all_operations())
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _calls.clear()
+
+
+def _pairs_circuit(num_pairs: int, depth: int) -> cirq.Circuit:
+    q = cirq.LineQubit.range(2 * num_pairs)
+    return cirq.Circuit(
+        [cirq.H(q[i]), cirq.SWAP(q[i], q[i + 1]), cirq.T(q[i + 1])]
+        for _ in range(depth)
+        for i in range(0, len(q), 2)
+    )
+
+
+def test_matches_serial_transformer() -> None:
+    circuit = _pairs_circuit(num_pairs=3, depth=2)
+    to_cz = functools.partial(cirq.optimize_for_target_gateset, gateset=cirq.CZTargetGateset())
+    context = cirq.TransformerContext(logger=cirq.TransformerLogger())
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = cirq.parallelize_over_components(to_cz, executor=executor)
+        result = parallel(circuit, context=context)
+    assert cirq.CZTargetGateset().validate(result)
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        result, to_cz(circuit), atol=1e-6
+    )
+    assert len(context.logger._stack) == 0
+
+
+def test_process_pool() -> None:
+    circuit = _pairs_circuit(num_pairs=2, depth=1)
+    merge = cirq.merge_single_qubit_gates_to_phxz
+    with futures.ProcessPoolExecutor(max_workers=2) as executor:
+        result = cirq.parallelize_over_components(merge, executor=executor)(circuit)
+    cirq.testing.assert_same_circuits(
+        result, cirq.Circuit.zip(*(merge(part) for part in circuit.factorize()))
+    )
+
+
+def test_splits_into_components() -> None:
+    circuit = _pairs_circuit(num_pairs=3, depth=1).with_tags('t')
+    result = cirq.parallelize_over_components(_recording_transformer)(circuit)
+    assert [c.all_qubits() for c in _calls] == circuit.get_independent_qubit_sets()
+    assert result.tags == ('t',)
+    assert sorted(map(str, result.all_operations())) == sorted(map(str, circuit.all_operations()))
+
+
+def test_num_parts_balances_operations() -> None:
+    q = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(
+        [cirq.X(q[0])] * 4, [cirq.X(q[1])] * 3, [cirq.X(q[2])] * 2, cirq.X(q[3]), cirq.X(q[4])
+    )
+    result = cirq.parallelize_over_components(_recording_transformer, num_parts=2)(circuit)
+    assert sorted(len(list(c.all_operations())) for c in _calls) == [5, 6]
+    assert len(result) == 4
+
+    _calls.clear()
+    _ = cirq.parallelize_over_components(_recording_transformer, num_parts=1)(circuit)
+    assert _calls == [circuit]
+
+
+def test_window_size() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.CZ(a, b), cirq.X(a), cirq.Y(a), cirq.Z(a), cirq.H(b))
+    result = cirq.parallelize_over_components(_recording_transformer, window_size=2)(circuit)
+    assert _calls == [circuit[:2], circuit[2:]]
+    assert result == cirq.Circuit.from_moments(*circuit)
+
+    merge = cirq.parallelize_over_components(cirq.merge_single_qubit_gates_to_phxz, window_size=2)
+    assert len(merge(circuit)) == 3
+
+
+def test_does_not_split_coupled_circuits() -> None:
+    a, b = cirq.LineQubit.range(2)
+    controlled = cirq.Circuit(cirq.measure(a, key='m'), cirq.X(b).with_classical_controls('m'))
+    parallel = cirq.parallelize_over_components(_recording_transformer)
+    assert parallel(controlled) == controlled
+    with_phase = cirq.Circuit(cirq.X(a), cirq.Y(b), cirq.global_phase_operation(1j))
+    assert parallel(with_phase) == with_phase
+    assert parallel(cirq.Circuit()) == cirq.Circuit()
+    assert _calls == [controlled, with_phase, cirq.Circuit()]
+
+
+def test_shared_qubits_raise() -> None:
+    a, b = cirq.LineQubit.range(2)
+    shared = cirq.NamedQubit('shared')
+
+    def add_shared_qubit(circuit, *, context=None):
+        return cirq.Circuit(circuit, cirq.X(shared))
+
+    with pytest.raises(ValueError, match='share qubits'):
+        _ = cirq.parallelize_over_components(add_shared_qubit)(cirq.Circuit(cirq.X(a), cirq.X(b)))
+    with pytest.raises(ValueError, match='num_parts'):
+        _ = cirq.parallelize_over_components(_recording_transformer, num_parts=0)
+    with pytest.raises(ValueError, match='window_size'):
+        _ = cirq.parallelize_over_components(_recording_transformer, window_size=0)
@@ -21,7 +21,12 @@ from cirq.work.observable_settings import (
     _MeasurementSpec as _MeasurementSpec,
     observables_to_settings as observables_to_settings,
 )
-from cirq.work.observable_grouping import group_settings_greedy as group_settings_greedy
+from cirq.work.observable_grouping import (
+    group_pauli_strings as group_pauli_strings,
+    group_settings_dsatur as group_settings_dsatur,
+    group_settings_greedy as group_settings_greedy,
+    group_settings_largest_first as group_settings_largest_first,
+)
 from cirq.work.observable_measurement_data import (
     ObservableMeasuredResult as ObservableMeasuredResult,
     BitstringAccumulator as BitstringAccumulator,
@@ -31,9 +36,11 @@ from cirq.work.observable_measurement import (
     VarianceStoppingCriteria as VarianceStoppingCriteria,
     RepetitionsStoppingCriteria as RepetitionsStoppingCriteria,
     measure_grouped_settings as measure_grouped_settings,
+    measure_grouped_settings_async as measure_grouped_settings_async,
 )
 from cirq.work.observable_readout_calibration import (
     calibrate_readout_error as calibrate_readout_error,
 )
 from cirq.work.sampler import Sampler as Sampler
+from cirq.work.parallel_sampler import ParallelSampler as ParallelSampler
 from cirq.work.zeros_sampler import ZerosSampler as ZerosSampler
@@ -14,7 +14,11 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 import cirq
+from cirq.work import observable_grouping
 
 
 def test_group_settings_greedy_one_group() -> None:
@@ -148,3 +152,89 @@ def test_group_settings_greedy_hydrogen() -> None:
     assert len(groups[2]) == 1
     assert len(groups[3]) == 1
     assert len(groups[4]) == len(terms) - 4
+
+
+def test_group_settings_greedy_tries_least_recently_changed_group_first(monkeypatch) -> None:
+    monkeypatch.setattr(observable_grouping, '_COMPATIBILITY_CHUNK', 2)
+    q0, q1, q2 = qubits = cirq.LineQubit.range(3)
+    terms = [cirq.X(q0), cirq.Z(q0), cirq.Y(q1), cirq.Z(q2), cirq.X(q2), cirq.X(q1)]
+    settings = list(cirq.work.observables_to_settings(terms, qubits))
+    grouped_settings = cirq.work.group_settings_greedy(settings)
+    assert list(grouped_settings.values()) == [
+        [settings[0], settings[2], settings[4]],
+        [settings[1], settings[3], settings[5]],
+    ]
+    assert list(grouped_settings.keys()) == list(
+        cirq.work.observables_to_settings(
+            [cirq.X(q0) * cirq.Y(q1) * cirq.X(q2), cirq.Z(q0) * cirq.X(q1) * cirq.Z(q2)], qubits
+        )
+    )
+
+
+def _hydrogen_settings() -> list[cirq.work.InitObsSetting]:
+    qubits = cirq.LineQubit.range(4)
+    q0, q1, q2, q3 = qubits
+    terms = [
+        cirq.Z(q0),
+        cirq.Z(q1),
+        cirq.Z(q0) * cirq.Z(q1),
+        cirq.Y(q0) * cirq.X(q1) * cirq.X(q2) * cirq.Y(q3),
+        cirq.Y(q0) * cirq.Y(q1) * cirq.X(q2) * cirq.X(q3),
+        cirq.X(q0) * cirq.X(q1) * cirq.Y(q2) * cirq.Y(q3),
+        cirq.X(q0) * cirq.Y(q1) * cirq.Y(q2) * cirq.X(q3),
+        cirq.Z(q2) * cirq.Z(q3),
+    ]
+    return list(cirq.work.observables_to_settings(terms, qubits))
+
+
+@pytest.mark.parametrize(
+    'grouper', [cirq.work.group_settings_largest_first, cirq.work.group_settings_dsatur]
+)
+def test_group_settings_by_coloring(grouper) -> None:
+    settings = _hydrogen_settings()
+    grouped_settings = grouper(settings)
+    assert len(grouped_settings) == 5
+    assert sorted(len(group) for group in grouped_settings.values()) == [1, 1, 1, 1, 4]
+    for max_setting, group in grouped_settings.items():
+        for setting in group:
+            assert all(max_setting.observable[q] == p for q, p in setting.observable.items())
+    assert grouper([]) == {}
+
+
+def test_group_settings_by_coloring_init_state_incompat() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    settings = [
+        cirq.work.InitObsSetting(init_state=cirq.KET_PLUS(q0), observable=cirq.X(q0)),
+        cirq.work.InitObsSetting(init_state=cirq.KET_ZERO(q1), observable=cirq.Z(q1)),
+        cirq.work.InitObsSetting(init_state=cirq.KET_ONE(q1), observable=cirq.Z(q1)),
+    ]
+    grouped_settings = cirq.work.group_settings_dsatur(settings)
+    assert list(grouped_settings.values()) == [[settings[0], settings[1]], [settings[2]]]
+
+
+def test_dsatur_uses_fewer_groups_than_largest_first() -> None:
+    # The crown graph on 4 + 4 vertices: largest-first colors the pairs (a_i, b_i)
+    # alternately, DSATUR finds the bipartition.
+    conflicts = ~np.eye(8, dtype=bool) & ~np.eye(8, k=4, dtype=bool) & ~np.eye(8, k=-4, dtype=bool)
+    conflicts[:4, :4] = conflicts[4:, 4:] = False
+    order = [0, 4, 1, 5, 2, 6, 3, 7]
+    conflicts = conflicts[np.ix_(order, order)]
+    assert len(observable_grouping._color(conflicts, 'largest_first')) == 4
+    assert observable_grouping._color(conflicts, 'dsatur') == [[0, 2, 4, 6], [1, 3, 5, 7]]
+    with pytest.raises(ValueError, match='Unknown coloring strategy'):
+        _ = observable_grouping._color(conflicts, 'random')
+
+
+def test_group_pauli_strings() -> None:
+    a, b = cirq.LineQubit.range(2)
+    strings = [cirq.X(a) * cirq.X(b), cirq.Z(a) * cirq.Z(b), 2 * cirq.Y(a) * cirq.Y(b), cirq.X(a)]
+    assert cirq.work.group_pauli_strings(strings) == [
+        [strings[1]],
+        [strings[2]],
+        [strings[0], strings[3]],
+    ]
+    assert cirq.work.group_pauli_strings(strings, qubit_wise=False) == [
+        [strings[0], strings[3]],
+        [strings[1], strings[2]],
+    ]
+    assert cirq.work.group_pauli_strings([]) == []
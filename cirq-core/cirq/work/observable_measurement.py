@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import dataclasses
 import itertools
 import os
@@ -23,13 +24,19 @@ import warnings
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TYPE_CHECKING
 
+import duet
 import numpy as np
 import pandas as pd
 import sympy
 
 from cirq import circuits, ops, protocols, study, value
 from cirq._doc import document
-from cirq.work.observable_grouping import group_settings_greedy, GROUPER_T
+from cirq.work.observable_grouping import (
+    group_settings_dsatur,
+    group_settings_greedy,
+    group_settings_largest_first,
+    GROUPER_T,
+)
 from cirq.work.observable_measurement_data import (
     BitstringAccumulator,
     flatten_grouped_results,
@@ -101,13 +108,13 @@ class VarianceStoppingCriteria(StoppingCriteria):
     repetitions_per_chunk: int = 10_000
 
     def more_repetitions(self, accumulator: BitstringAccumulator) -> int:
-        if len(accumulator.bitstrings) == 0:
+        if accumulator.n_repetitions == 0:
             return self.repetitions_per_chunk
 
         cov = accumulator.covariance()
         n_terms = cov.shape[0]
         sum_variance = np.sum(cov)
-        var_of_the_e = sum_variance / len(accumulator.bitstrings)
+        var_of_the_e = sum_variance / accumulator.n_repetitions
         vpt = var_of_the_e / n_terms
 
         if vpt <= self.variance_bound:
@@ -480,6 +487,7 @@ def measure_grouped_settings(
     circuit_sweep: cirq.Sweepable = None,
     readout_calibrations: BitstringAccumulator | None = None,
     checkpoint: CheckpointFileOptions = CheckpointFileOptions(),
+    streaming: bool = False,
 ) -> list[BitstringAccumulator]:
     """Measure a suite of grouped InitObsSetting settings.
 
@@ -512,39 +520,27 @@ def measure_grouped_settings(
             data for each iteration of the sampling loop. See the documentation
             for `CheckpointFileOptions` for more. Load in these results with
             `cirq.read_json`.
+        streaming: If True, the accumulators keep running statistics of the
+            settings instead of all sampled bitstrings, so memory does not
+            grow with the number of repetitions. See `BitstringAccumulator`.
 
     Raises:
         ValueError: If readout calibration is specified, but `readout_symmetrization
             is not True.
     """
-    if readout_calibrations is not None and not readout_symmetrization:
-        raise ValueError("Readout calibration only works if `readout_symmetrization` is enabled.")
-
-    qubits = sorted({q for ms in grouped_settings.keys() for q in ms.init_state.qubits})
-    qubit_to_index = {q: i for i, q in enumerate(qubits)}
-
-    needs_init_layer = _needs_init_layer(grouped_settings)
-    measurement_param_circuit = _with_parameterized_layers(circuit, qubits, needs_init_layer)
+    qubits, needs_init_layer, measurement_param_circuit, accumulators = _init_accumulators(
+        circuit=circuit,
+        grouped_settings=grouped_settings,
+        readout_symmetrization=readout_symmetrization,
+        circuit_sweep=circuit_sweep,
+        readout_calibrations=readout_calibrations,
+        streaming=streaming,
+    )
 
     # meas_spec provides a key for accumulators.
     # meas_specs_todo is a mutable list. We will pop things from it as various
     # specs are measured to the satisfaction of the stopping criteria
-    accumulators = {}
-    meas_specs_todo = []
-    for max_setting, param_resolver in itertools.product(
-        grouped_settings.keys(), study.to_resolvers(circuit_sweep)
-    ):
-        circuit_params = param_resolver.param_dict
-        meas_spec = _MeasurementSpec(max_setting=max_setting, circuit_params=circuit_params)
-        accumulator = BitstringAccumulator(
-            meas_spec=meas_spec,
-            simul_settings=grouped_settings[max_setting],
-            qubit_to_index=qubit_to_index,
-            readout_calibration=readout_calibrations,
-        )
-        accumulators[meas_spec] = accumulator
-        meas_specs_todo += [meas_spec]
-
+    meas_specs_todo = list(accumulators.keys())
     while True:
         meas_specs_todo, repetitions = _check_meas_specs_still_todo(
             meas_specs=meas_specs_todo,
@@ -571,21 +567,196 @@ def measure_grouped_settings(
             program=measurement_param_circuit, params=resolved_params, repetitions=repetitions
         )
 
-        assert len(results) == len(
-            flippy_meas_specs
-        ), 'Not as many results received as sweeps requested!'
+        _consume_sweep_results(flippy_meas_specs, results, accumulators)
+        checkpoint.maybe_to_json(list(accumulators.values()))
+
+    return list(accumulators.values())
 
-        for flippy_ms, result in zip(flippy_meas_specs, results):
-            accumulator = accumulators[flippy_ms.meas_spec]
-            bitstrings = np.logical_xor(flippy_ms.flips, result.measurements['z'])
-            accumulator.consume_results(bitstrings.astype(np.uint8, casting='safe'))
 
-        checkpoint.maybe_to_json(list(accumulators.values()))
+async def measure_grouped_settings_async(
+    circuit: cirq.AbstractCircuit,
+    grouped_settings: dict[InitObsSetting, list[InitObsSetting]],
+    sampler: cirq.Sampler,
+    stopping_criteria: StoppingCriteria,
+    *,
+    readout_symmetrization: bool = False,
+    circuit_sweep: cirq.Sweepable = None,
+    readout_calibrations: BitstringAccumulator | None = None,
+    checkpoint: CheckpointFileOptions = CheckpointFileOptions(),
+    streaming: bool = False,
+    concurrency: int = 2,
+) -> list[BitstringAccumulator]:
+    """Asynchronously measure a suite of grouped InitObsSetting settings.
+
+    `measure_grouped_settings` submits one sweep over all unfinished
+    measurement specs at a time and waits for it before checking the stopping
+    criteria again. Here each measurement spec is sampled by its own sequence
+    of `sampler.run_sweep_async` calls instead, and up to `concurrency` calls
+    over all specs are in flight at once. Results are accumulated as soon as
+    they arrive and the stopping criteria of that spec is checked right away,
+    so the latency of remote or threaded samplers overlaps with sampling other
+    groups and with analysis.
+
+    Since each spec asks the stopping criteria for its own next chunk size,
+    specs needing different numbers of repetitions are not padded to the
+    largest one.
+
+    Args:
+        circuit: The circuit. This can contain parameters, in which case
+            you should also specify `circuit_sweep`.
+        grouped_settings: A series of setting groups expressed as a dictionary.
+            See `measure_grouped_settings`.
+        sampler: A sampler.
+        stopping_criteria: A StoppingCriteria object that can report
+            whether enough samples have been sampled.
+        readout_symmetrization: If set to True, each `meas_spec` will be
+            split into a normal and a bit-flipped run. See
+            `measure_grouped_settings`.
+        circuit_sweep: Additional parameter sweeps for parameters contained
+            in `circuit`.
+        readout_calibrations: The result of `calibrate_readout_error`.
+        checkpoint: Options to set up optional checkpointing of intermediate
+            data, which is written after each chunk of results is consumed.
+        streaming: If True, the accumulators keep running statistics of the
+            settings instead of all sampled bitstrings.
+        concurrency: The maximum number of sampling jobs in flight at any
+            given time.
+
+    Raises:
+        ValueError: If readout calibration is specified, but `readout_symmetrization
+            is not True, or if `concurrency` is not positive.
+    """
+    if concurrency < 1:
+        raise ValueError(f"`concurrency` should be a positive integer, got {concurrency}.")
+
+    qubits, needs_init_layer, measurement_param_circuit, accumulators = _init_accumulators(
+        circuit=circuit,
+        grouped_settings=grouped_settings,
+        readout_symmetrization=readout_symmetrization,
+        circuit_sweep=circuit_sweep,
+        readout_calibrations=readout_calibrations,
+        streaming=streaming,
+    )
+    completed: duet.AsyncCollector[tuple[list[_FlippyMeasSpec], Sequence[cirq.Result]]] = (
+        duet.AsyncCollector()
+    )
+
+    async def run_sweep(flippy_meas_specs, resolved_params, repetitions):
+        try:
+            results = await sampler.run_sweep_async(
+                program=measurement_param_circuit, params=resolved_params, repetitions=repetitions
+            )
+        except Exception as error:
+            completed.error(error)
+        else:
+            completed.add((flippy_meas_specs, results))
+
+    # Specs whose next chunk can be submitted. A spec is re-queued when its chunk comes back,
+    # so the stopping criteria always sees all results of that spec.
+    ready = collections.deque(accumulators.keys())
+    running_sweeps = 0
+    async with duet.new_scope() as scope:
+        while True:
+            # Fill up the pipeline.
+            while ready and running_sweeps < concurrency:
+                meas_specs_todo, repetitions = _check_meas_specs_still_todo(
+                    meas_specs=[ready.popleft()],
+                    accumulators=accumulators,
+                    stopping_criteria=stopping_criteria,
+                )
+                if len(meas_specs_todo) == 0:
+                    continue
+
+                flippy_meas_specs, repetitions = _subdivide_meas_specs(
+                    meas_specs=meas_specs_todo,
+                    repetitions=repetitions,
+                    qubits=qubits,
+                    readout_symmetrization=readout_symmetrization,
+                )
+                resolved_params = _to_sweep(
+                    flippy_ms.param_tuples(needs_init_layer=needs_init_layer)
+                    for flippy_ms in flippy_meas_specs
+                )
+                running_sweeps += 1
+                scope.spawn(run_sweep, flippy_meas_specs, resolved_params, repetitions)
+
+            if not running_sweeps:
+                break
+
+            flippy_meas_specs, results = await completed.__anext__()
+            running_sweeps -= 1
+            _consume_sweep_results(flippy_meas_specs, results, accumulators)
+            checkpoint.maybe_to_json(list(accumulators.values()))
+            ready.append(flippy_meas_specs[0].meas_spec)
 
     return list(accumulators.values())
 
 
-_GROUPING_FUNCS: dict[str, GROUPER_T] = {'greedy': group_settings_greedy}
+def _init_accumulators(
+    circuit: cirq.AbstractCircuit,
+    grouped_settings: dict[InitObsSetting, list[InitObsSetting]],
+    readout_symmetrization: bool,
+    circuit_sweep: cirq.Sweepable,
+    readout_calibrations: BitstringAccumulator | None,
+    streaming: bool,
+) -> tuple[list[cirq.Qid], bool, cirq.Circuit, dict[_MeasurementSpec, BitstringAccumulator]]:
+    """Set up the measurement circuit and an empty accumulator for each measurement spec.
+
+    Returns:
+        The measured qubits, whether an initialization layer is needed, the circuit with
+        parameterized basis-change layers and a dictionary of accumulators keyed by
+        measurement spec.
+
+    Raises:
+        ValueError: If readout calibration is specified, but `readout_symmetrization
+            is not True.
+    """
+    if readout_calibrations is not None and not readout_symmetrization:
+        raise ValueError("Readout calibration only works if `readout_symmetrization` is enabled.")
+
+    qubits = sorted({q for ms in grouped_settings.keys() for q in ms.init_state.qubits})
+    qubit_to_index = {q: i for i, q in enumerate(qubits)}
+
+    needs_init_layer = _needs_init_layer(grouped_settings)
+    measurement_param_circuit = _with_parameterized_layers(circuit, qubits, needs_init_layer)
+
+    accumulators = {}
+    for max_setting, param_resolver in itertools.product(
+        grouped_settings.keys(), study.to_resolvers(circuit_sweep)
+    ):
+        circuit_params = param_resolver.param_dict
+        meas_spec = _MeasurementSpec(max_setting=max_setting, circuit_params=circuit_params)
+        accumulators[meas_spec] = BitstringAccumulator(
+            meas_spec=meas_spec,
+            simul_settings=grouped_settings[max_setting],
+            qubit_to_index=qubit_to_index,
+            readout_calibration=readout_calibrations,
+            streaming=streaming,
+        )
+    return qubits, needs_init_layer, measurement_param_circuit, accumulators
+
+
+def _consume_sweep_results(
+    flippy_meas_specs: list[_FlippyMeasSpec],
+    results: Sequence[cirq.Result],
+    accumulators: Mapping[_MeasurementSpec, BitstringAccumulator],
+) -> None:
+    """Un-flip the bitstrings of each sweep result and feed them to their accumulators."""
+    assert len(results) == len(
+        flippy_meas_specs
+    ), 'Not as many results received as sweeps requested!'
+
+    for flippy_ms, result in zip(flippy_meas_specs, results):
+        accumulator = accumulators[flippy_ms.meas_spec]
+        bitstrings = np.logical_xor(flippy_ms.flips, result.measurements['z'])
+        accumulator.consume_results(bitstrings.astype(np.uint8, casting='safe'))
+
+
+_GROUPING_FUNCS: dict[str, GROUPER_T] = {
+    'greedy': group_settings_greedy,
+    'largest_first': group_settings_largest_first,
+    'dsatur': group_settings_dsatur,
+}
 
 
 def _parse_grouper(grouper: str | GROUPER_T = group_settings_greedy) -> GROUPER_T:
@@ -622,6 +793,7 @@ def measure_observables(
     grouper: str | GROUPER_T = group_settings_greedy,
     readout_calibrations: BitstringAccumulator | None = None,
     checkpoint: CheckpointFileOptions = CheckpointFileOptions(),
+    streaming: bool = False,
 ) -> list[ObservableMeasuredResult]:
     """Measure a collection of PauliString observables for a state prepared by a Circuit.
 
@@ -644,13 +816,15 @@ def measure_observables(
         circuit_sweep: Additional parameter sweeps for parameters contained in `circuit`. The
             total sweep is the product of the circuit sweep with parameter settings for the
             single-qubit basis-change rotations.
-        grouper: Either "greedy" or a function that groups lists of `InitObsSetting`. See the
-            documentation for the `grouped_settings` argument of `measure_grouped_settings` for
-            full details.
+        grouper: Either "greedy", "largest_first", "dsatur" or a function that groups lists of
+            `InitObsSetting`. See the documentation for the `grouped_settings` argument of
+            `measure_grouped_settings` for full details.
         readout_calibrations: The result of `calibrate_readout_error`.
         checkpoint: Options to set up optional checkpointing of intermediate data for each
             iteration of the sampling loop. See the documentation for `CheckpointFileOptions` for
             more. Load in these results with `cirq.read_json`.
+        streaming: If True, keep only running statistics instead of all sampled bitstrings. See
+            `measure_grouped_settings`.
 
     Returns:
         A list of ObservableMeasuredResult; one for each input PauliString.
@@ -669,6 +843,7 @@ def measure_observables(
         readout_symmetrization=readout_symmetrization,
         readout_calibrations=readout_calibrations,
         checkpoint=checkpoint,
+        streaming=streaming,
     )
     return flatten_grouped_results(accumulators)
 
@@ -684,6 +859,7 @@ def measure_observables_df(
     grouper: str | GROUPER_T = group_settings_greedy,
     readout_calibrations: BitstringAccumulator | None = None,
     checkpoint: CheckpointFileOptions = CheckpointFileOptions(),
+    streaming: bool = False,
 ):
     """Measure observables and return resulting data as a Pandas dataframe.
 
@@ -699,6 +875,7 @@ def measure_observables_df(
         grouper=grouper,
         readout_calibrations=readout_calibrations,
         checkpoint=checkpoint,
+        streaming=streaming,
     )
     df = pd.DataFrame(res.as_dict() for res in results)
     return df
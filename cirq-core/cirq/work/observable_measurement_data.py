@@ -159,6 +159,10 @@ class ObservableMeasuredResult:
         return protocols.dataclass_json_dict(self)
 
 
+# Number of bitstrings whose eigenvalues are computed at once in streaming mode.
+_STREAMING_CHUNK = 1 << 16
+
+
 def _setting_to_z_observable(setting: InitObsSetting):
     qubits = setting.observable.qubits
     return InitObsSetting(
@@ -211,6 +215,22 @@ class BitstringAccumulator:
             does *not* validate that both this parameter and the
             `BitstringAccumulator` under construction contain measurements taken
             with readout symmetrization turned on.
+        streaming: If True, bitstrings are not stored. Instead, each chunk
+            updates running sums of the +1/-1 eigenvalues of the settings in
+            `simul_settings`, and of their pairwise products, which is all
+            that means, variances and covariances need. Memory then grows
+            with the square of the number of settings instead of with the
+            number of repetitions. Only settings acting on the same qubits
+            as one of `simul_settings` can be queried.
+        reservoir_size: In streaming mode, the number of bitstrings to keep as
+            a uniform random sample of all repetitions, for debugging. The
+            sample is available as `bitstrings`.
+        random_state: The random state or seed used for the reservoir sample.
+        sign_sums: In streaming mode, the running sums of the eigenvalues of
+            previously consumed bitstrings, as kept by this class. Must be given
+            together with `sign_products` when `chunksizes` is not empty.
+        sign_products: In streaming mode, the running sums of the pairwise
+            products of eigenvalues, matching `sign_sums`.
     """
 
     def __init__(
@@ -222,6 +242,12 @@ class BitstringAccumulator:
         chunksizes: np.ndarray | None = None,
         timestamps: np.ndarray | None = None,
         readout_calibration: BitstringAccumulator | None = None,
+        *,
+        streaming: bool = False,
+        reservoir_size: int = 0,
+        random_state: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+        sign_sums: np.ndarray | None = None,
+        sign_products: np.ndarray | None = None,
     ):
         self._meas_spec = meas_spec
         self._simul_settings = simul_settings
@@ -253,10 +279,49 @@ class BitstringAccumulator:
                 "`chunksizes` and `timestamps` must have the same length."
             )
 
-        if np.sum(self.chunksizes) != len(self.bitstrings):
+        self._streaming = streaming
+        self._reservoir_size = reservoir_size
+        if not streaming:
+            if np.sum(self.chunksizes) != len(self.bitstrings):
+                raise ValueError(
+                    "Invalid BitstringAccumulator state. "
+                    "`chunksizes` must sum to the number of bitstrings."
+                )
+            return
+
+        if len(self.bitstrings) > min(reservoir_size, int(np.sum(self.chunksizes))):
             raise ValueError(
-                "Invalid BitstringAccumulator state. "
-                "`chunksizes` must sum to the number of bitstrings."
+                "Invalid BitstringAccumulator state. A streaming accumulator keeps at most "
+                "`reservoir_size` bitstrings, and no more than the number of repetitions."
+            )
+        self._prng = value.parse_random_state(random_state)
+        # Each distinct set of measured qubits gets a row of indicator bits; the eigenvalue of
+        # an observable is its coefficient times the parity of the bits in its row.
+        supports = {
+            tuple(sorted(qubit_to_index[q] for q in setting.observable.qubits)): None
+            for setting in simul_settings
+        }
+        self._support_rows = {support: k for k, support in enumerate(supports)}
+        self._supports = np.zeros((len(supports), len(qubit_to_index)), dtype=np.float32)
+        for support, k in self._support_rows.items():
+            self._supports[k, list(support)] = 1
+        if sign_sums is None and sign_products is None:
+            if np.sum(self.chunksizes):
+                raise ValueError(
+                    "Invalid BitstringAccumulator state. A streaming accumulator with "
+                    "repetitions needs their `sign_sums` and `sign_products`."
+                )
+            sign_sums = np.zeros(len(supports))
+            sign_products = np.zeros((len(supports), len(supports)))
+        self._sign_sums = np.asarray(sign_sums, dtype=float)
+        self._sign_products = np.asarray(sign_products, dtype=float)
+        if self._sign_sums.shape != (len(supports),) or self._sign_products.shape != (
+            len(supports),
+            len(supports),
+        ):
+            raise ValueError(
+                "Invalid BitstringAccumulator state. `sign_sums` and `sign_products` must "
+                "have one entry and one row and column per distinct support of `simul_settings`."
             )
 
     @property
@@ -289,13 +354,47 @@ class BitstringAccumulator:
         if bitstrings.dtype != np.uint8:
             raise ValueError("`bitstrings` should be of type np.uint8")
 
-        self.bitstrings = np.append(self.bitstrings, bitstrings, axis=0)
+        if self._streaming:
+            for start in range(0, len(bitstrings), _STREAMING_CHUNK):
+                chunk = bitstrings[start : start + _STREAMING_CHUNK]
+                # float32 products are exact here since chunks are shorter than 2**24.
+                parities = (chunk.astype(np.float32) @ self._supports.T).astype(np.int32) & 1
+                signs = (1 - 2 * parities).astype(np.float32)
+                self._sign_sums += np.sum(signs, axis=0)
+                self._sign_products += signs.T @ signs
+            self._sample_reservoir(bitstrings)
+        else:
+            self.bitstrings = np.append(self.bitstrings, bitstrings, axis=0)
         self.chunksizes = np.append(self.chunksizes, [len(bitstrings)], axis=0)
         self.timestamps = np.append(self.timestamps, [np.datetime64(datetime.datetime.now())])
 
+    def _sample_reservoir(self, bitstrings: np.ndarray) -> None:
+        """Keeps a uniform sample of all bitstrings seen so far, by reservoir sampling."""
+        if self._reservoir_size == 0:
+            return
+        seen = self.n_repetitions + np.arange(len(bitstrings))
+        slots = np.where(seen < self._reservoir_size, seen, self._prng.randint(0, seen + 1))
+        # Later bitstrings replace earlier ones drawn into the same slot.
+        kept = np.flatnonzero(slots < self._reservoir_size)[::-1]
+        slots, last = np.unique(slots[kept], return_index=True)
+        size = min(self._reservoir_size, seen[-1] + 1 if len(seen) else 0)
+        if len(self.bitstrings) < size:
+            self.bitstrings = np.concatenate(
+                [
+                    self.bitstrings,
+                    np.zeros((size - len(self.bitstrings), len(self._qubit_to_index)), np.uint8),
+                ]
+            )
+        self.bitstrings[slots] = bitstrings[kept[last]]
+
+    @property
+    def streaming(self) -> bool:
+        """Whether only running statistics are kept instead of all bitstrings."""
+        return self._streaming
+
     @property
     def n_repetitions(self):
-        return len(self.bitstrings)
+        return int(np.sum(self.chunksizes))
 
     @property
     def results(self) -> Iterable[ObservableMeasuredResult]:
@@ -306,7 +405,7 @@ class BitstringAccumulator:
                 setting=setting,
                 mean=self.mean(setting),
                 variance=self.variance(setting),
-                repetitions=len(self.bitstrings),
+                repetitions=self.n_repetitions,
                 circuit_params=self._meas_spec.circuit_params,
             )
 
@@ -326,7 +425,7 @@ class BitstringAccumulator:
         def ndarray_to_hex_str(a):
             return _pack_digits(a, pack_bits='never')[0]
 
-        return {
+        json_dict = {
             'meas_spec': self.meas_spec,
             'simul_settings': self.simul_settings,
             'qubit_to_index': list(self.qubit_to_index.items()),
@@ -334,6 +433,11 @@ class BitstringAccumulator:
             'chunksizes': ndarray_to_hex_str(self.chunksizes),
             'timestamps': ndarray_to_hex_str(self.timestamps),
         }
+        if self._streaming:
+            json_dict['reservoir_size'] = self._reservoir_size
+            json_dict['sign_sums'] = self._sign_sums.tolist()
+            json_dict['sign_products'] = self._sign_products.tolist()
+        return json_dict
 
     @classmethod
     def _from_json_dict_(
@@ -345,6 +449,9 @@ class BitstringAccumulator:
         bitstrings,
         chunksizes,
         timestamps,
+        reservoir_size=None,
+        sign_sums=None,
+        sign_products=None,
         **kwargs,
     ):
         from cirq.study.result import _unpack_digits
@@ -360,6 +467,10 @@ class BitstringAccumulator:
             bitstrings=hex_str_to_ndarray(bitstrings),
             chunksizes=hex_str_to_ndarray(chunksizes),
             timestamps=hex_str_to_ndarray(timestamps),
+            streaming=reservoir_size is not None,
+            reservoir_size=reservoir_size or 0,
+            sign_sums=sign_sums,
+            sign_products=sign_products,
         )
 
     def __eq__(self, other):
@@ -383,6 +494,16 @@ class BitstringAccumulator:
         if not np.array_equal(self.timestamps, other.timestamps):
             return False
 
+        if self._streaming != other._streaming:
+            return False
+
+        if self._streaming and not (
+            self._reservoir_size == other._reservoir_size
+            and np.array_equal(self._sign_sums, other._sign_sums)
+            and np.array_equal(self._sign_products, other._sign_products)
+        ):
+            return False
+
         return True
 
     def summary_string(self, setting: InitObsSetting, number_fmt='.3f'):
@@ -391,6 +512,9 @@ class BitstringAccumulator:
         )
 
     def __repr__(self):
+        streaming = (
+            f', streaming=True, reservoir_size={self._reservoir_size!r}' if self._streaming else ''
+        )
         return (
             f'cirq.work.BitstringAccumulator('
             f'meas_spec={self.meas_spec!r}, '
@@ -399,7 +523,7 @@ class BitstringAccumulator:
             f'bitstrings={proper_repr(self.bitstrings)}, '
             f'chunksizes={proper_repr(self.chunksizes)}, '
             f'timestamps={proper_repr(self.timestamps)}, '
-            f'readout_calibration={self._readout_calibration!r})'
+            f'readout_calibration={self._readout_calibration!r}{streaming})'
         )
 
     def __str__(self):
@@ -420,9 +544,22 @@ class BitstringAccumulator:
         Raises:
             ValueError: If there are no measurements.
         """
-        if len(self.bitstrings) == 0:
+        if self.n_repetitions == 0:
             raise ValueError("No measurements")
 
+        if self._streaming:
+            rows = [self._support_row(setting, 'covariance') for setting in self._simul_settings]
+            coefs = np.array(
+                [_check_and_get_real_coef(s.observable, atol=atol) for s in self._simul_settings]
+            )
+            n = self.n_repetitions
+            sums = self._sign_sums[rows]
+            products = self._sign_products[np.ix_(rows, rows)]
+            cov = np.outer(coefs, coefs) * (products - np.outer(sums, sums) / n) / (n - 1)
+            if len(rows) == 1:
+                return cov
+            return cov / n
+
         all_obs_vals = np.array(
             [
                 _obs_vals_from_measurements(
@@ -452,6 +589,34 @@ class BitstringAccumulator:
                 f"with this BitstringAccumulator's meas_spec."
             )
 
+    def _support_row(self, setting: InitObsSetting, what: str) -> int:
+        """The row of running statistics for the qubits measured by `setting`."""
+        support = tuple(sorted(self._qubit_to_index[q] for q in setting.observable.qubits))
+        if support not in self._support_rows:
+            raise ValueError(
+                f"You requested the {what} for a setting on qubits that this streaming "
+                f"BitstringAccumulator does not track. Only the qubits of its simul_settings "
+                f"are tracked."
+            )
+        return self._support_rows[support]
+
+    def _stats(self, setting: InitObsSetting, what: str, atol: float) -> tuple[float, float]:
+        """Returns the mean and squared standard error of the mean of `setting`."""
+        if not self._streaming:
+            return _stats_from_measurements(
+                bitstrings=self.bitstrings,
+                qubit_to_index=self._qubit_to_index,
+                observable=setting.observable,
+                atol=atol,
+            )
+        row = self._support_row(setting, what)
+        coef = _check_and_get_real_coef(setting.observable, atol=atol)
+        n = self.n_repetitions
+        sign_sum = self._sign_sums[row]
+        # The squared eigenvalues are all coef**2.
+        obs_var = coef**2 * (n - sign_sum**2 / n) / np.float64(n - 1)
+        return float(coef * sign_sum / n), float(obs_var / n)
+
     def variance(self, setting: InitObsSetting, *, atol: float = 1e-8):
         """Compute the variance of the estimators of the given setting.
 
@@ -471,16 +636,11 @@ class BitstringAccumulator:
         Raises:
             ValueError: If there were no measurements.
         """
-        if len(self.bitstrings) == 0:
+        if self.n_repetitions == 0:
             raise ValueError("No measurements")
         self._validate_setting(setting, what='variance')
 
-        mean, var = _stats_from_measurements(
-            bitstrings=self.bitstrings,
-            qubit_to_index=self._qubit_to_index,
-            observable=setting.observable,
-            atol=atol,
-        )
+        mean, var = self._stats(setting, 'variance', atol)
 
         if self._readout_calibration is not None:
             a = mean
@@ -510,16 +670,11 @@ class BitstringAccumulator:
 
     def mean(self, setting: InitObsSetting, *, atol: float = 1e-8):
         """Estimates of the mean of `setting`."""
-        if len(self.bitstrings) == 0:
+        if self.n_repetitions == 0:
             raise ValueError("No measurements")
         self._validate_setting(setting, what='mean')
 
-        mean, _ = _stats_from_measurements(
-            bitstrings=self.bitstrings,
-            qubit_to_index=self._qubit_to_index,
-            observable=setting.observable,
-            atol=atol,
-        )
+        mean, _ = self._stats(setting, 'mean', atol)
 
         if self._readout_calibration is not None:
             ro_setting = _setting_to_z_observable(setting)
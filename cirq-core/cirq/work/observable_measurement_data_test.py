@@ -562,3 +562,151 @@ def test_readout_correction_errors():
     # Variance becomes singular as the estimated value approaches zero
     np.testing.assert_allclose(bsa.means(), [0, 0, 0])
     assert bsa.variance(settings[0]) == np.inf
+
+
+def _get_streaming_bsa_pair(**streaming_kwargs):
+    a, b, c = cirq.LineQubit.range(3)
+    qubit_to_index = {a: 0, b: 1, c: 2}
+    settings = list(
+        cw.observables_to_settings(
+            [cirq.X(a) * cirq.Y(b) * 2, cirq.X(a), cirq.Z(c) * -3, cirq.X(a) * 0.5],
+            qubits=[a, b, c],
+        )
+    )
+    meas_spec = _MeasurementSpec(
+        cw.InitObsSetting(settings[0].init_state, cirq.X(a) * cirq.Y(b) * cirq.Z(c)), {}
+    )
+    stored = cw.BitstringAccumulator(meas_spec, settings, qubit_to_index)
+    streaming = cw.BitstringAccumulator(
+        meas_spec, settings, qubit_to_index, streaming=True, **streaming_kwargs
+    )
+    return stored, streaming, settings
+
+
+def test_streaming_bitstring_accumulator_matches_stored(monkeypatch):
+    monkeypatch.setattr(cirq.work.observable_measurement_data, '_STREAMING_CHUNK', 7)
+    stored, streaming, settings = _get_streaming_bsa_pair()
+    assert streaming.streaming and not stored.streaming
+    prng = np.random.RandomState(3)
+    for chunksize in [5, 20, 1]:
+        bitstrings = (prng.rand(chunksize, 3) < [0.2, 0.5, 0.9]).astype(np.uint8)
+        stored.consume_results(bitstrings)
+        streaming.consume_results(bitstrings)
+
+    assert streaming.n_repetitions == 26
+    assert streaming.bitstrings.shape == (0, 3)
+    np.testing.assert_allclose(streaming.means(), stored.means())
+    np.testing.assert_allclose(streaming.covariance(), stored.covariance())
+    for setting in settings:
+        assert streaming.variance(setting) == pytest.approx(stored.variance(setting))
+        assert streaming.summary_string(setting) == stored.summary_string(setting)
+    assert [r.repetitions for r in streaming.results] == [26] * 4
+
+    # Settings on tracked qubits can be queried even if they were not requested.
+    a, b, _ = cirq.LineQubit.range(3)
+    other = cw.InitObsSetting(settings[0].init_state, cirq.X(a) * cirq.Y(b) * -1)
+    assert streaming.mean(other) == pytest.approx(stored.mean(other))
+    untracked = cw.InitObsSetting(settings[0].init_state, cirq.Y(b))
+    with pytest.raises(ValueError, match='does not track'):
+        streaming.mean(untracked)
+
+
+def test_streaming_bitstring_accumulator_single_setting_covariance():
+    stored, streaming, settings = _get_streaming_bsa_pair()
+    stored._simul_settings = streaming._simul_settings = settings[2:3]
+    bitstrings = np.array([[0, 0, 0], [0, 0, 1], [0, 1, 1]], dtype=np.uint8)
+    stored.consume_results(bitstrings)
+    streaming.consume_results(bitstrings)
+    np.testing.assert_allclose(streaming.covariance(), stored.covariance())
+    with pytest.raises(ValueError, match='No measurements'):
+        _get_streaming_bsa_pair()[1].covariance()
+
+
+def test_streaming_bitstring_accumulator_reservoir():
+    qubits = cirq.LineQubit.range(5)
+    settings = list(cw.observables_to_settings([cirq.Z(qubits[0])], qubits=qubits))
+    meas_spec = _MeasurementSpec(settings[0], {})
+    bits = 1 << np.arange(5)
+    counts = np.zeros(20)
+    for seed in range(1000):
+        bsa = cw.BitstringAccumulator(
+            meas_spec,
+            settings,
+            {q: i for i, q in enumerate(qubits)},
+            streaming=True,
+            reservoir_size=5,
+            random_state=seed,
+        )
+        # The bits of each repetition hold its index.
+        for start in range(0, 20, 3):
+            ids = np.arange(start, min(start + 3, 20))
+            bsa.consume_results(((ids[:, np.newaxis] & bits) != 0).astype(np.uint8))
+        assert bsa.bitstrings.shape == (5, 5)
+        kept = bsa.bitstrings @ bits
+        assert len(set(kept)) == 5
+        counts[kept] += 1
+    # Each repetition is kept with probability 5 / 20.
+    np.testing.assert_allclose(counts / 1000, 0.25, atol=0.05)
+
+    _, streaming, _ = _get_streaming_bsa_pair(reservoir_size=5, random_state=0)
+    streaming.consume_results(np.ones((2, 3), dtype=np.uint8))
+    np.testing.assert_array_equal(streaming.bitstrings, np.ones((2, 3)))
+
+
+def test_streaming_bitstring_accumulator_json_and_repr():
+    _, streaming, _ = _get_streaming_bsa_pair(reservoir_size=2, random_state=1)
+    streaming.consume_results(np.array([[0, 1, 0], [1, 1, 1], [0, 0, 1]], dtype=np.uint8))
+    restored = cirq.read_json(json_text=cirq.to_json(streaming))
+    assert restored == streaming
+    np.testing.assert_allclose(restored.covariance(), streaming.covariance())
+    stored = cw.BitstringAccumulator(
+        streaming.meas_spec, streaming.simul_settings, streaming.qubit_to_index
+    )
+    stored.consume_results(np.zeros((1, 3), dtype=np.uint8))
+    assert stored != streaming
+    assert repr(streaming).endswith('readout_calibration=None, streaming=True, reservoir_size=2)')
+
+    with pytest.raises(ValueError, match='at most'):
+        cw.BitstringAccumulator(
+            streaming.meas_spec,
+            streaming.simul_settings,
+            streaming.qubit_to_index,
+            bitstrings=np.zeros((2, 3), dtype=np.uint8),
+            chunksizes=np.array([2]),
+            timestamps=np.array([datetime.datetime.now()]),
+            streaming=True,
+            reservoir_size=1,
+        )
+
+    with pytest.raises(ValueError, match='sign_sums'):
+        cw.BitstringAccumulator(
+            streaming.meas_spec,
+            streaming.simul_settings,
+            streaming.qubit_to_index,
+            bitstrings=np.zeros((0, 3), dtype=np.uint8),
+            chunksizes=np.array([5]),
+            timestamps=np.array([datetime.datetime.now()]),
+            streaming=True,
+        )
+    with pytest.raises(ValueError, match='one entry'):
+        cw.BitstringAccumulator(
+            streaming.meas_spec,
+            streaming.simul_settings,
+            streaming.qubit_to_index,
+            streaming=True,
+            sign_sums=np.zeros(1),
+            sign_products=np.zeros((1, 1)),
+        )
+    copied = cw.BitstringAccumulator(
+        streaming.meas_spec,
+        streaming.simul_settings,
+        streaming.qubit_to_index,
+        bitstrings=streaming.bitstrings,
+        chunksizes=streaming.chunksizes,
+        timestamps=streaming.timestamps,
+        streaming=True,
+        reservoir_size=2,
+        sign_sums=streaming._sign_sums,
+        sign_products=streaming._sign_products,
+    )
+    assert copied == streaming
@@ -16,7 +16,9 @@ from __future__ import annotations
 
 import tempfile
 from collections.abc import Iterable
+from typing import Any
 
+import duet
 import numpy as np
 import pytest
 import sympy
@@ -441,6 +443,80 @@ def test_measure_grouped_settings(with_circuit_sweep, checkpoint, tmpdir) -> Non
             assert result.means() == [coef]
 
 
+class _SlowSampler(cirq.Sampler):
+    """Wraps a sampler, recording how many sweeps are in flight at once."""
+
+    def __init__(self, sampler: cirq.Sampler) -> None:
+        self.sampler = sampler
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.num_sweeps = 0
+
+    async def run_sweep_async(self, program, params, repetitions=1):
+        self.in_flight += 1
+        self.num_sweeps += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await duet.sleep(0.001)
+        self.in_flight -= 1
+        return self.sampler.run_sweep(program, params, repetitions)
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_measure_grouped_settings_async(concurrency, tmpdir) -> None:
+    qubits = cirq.LineQubit.range(3)
+    observables = [cirq.Z(qubits[0]), cirq.X(qubits[1]), cirq.Y(qubits[2]), cirq.X(qubits[0])]
+    settings = cw.observables_to_settings(observables, qubits)
+    grouped_settings = {setting: [setting] for setting in settings}
+    sampler = _SlowSampler(cirq.Simulator(seed=52))
+    checkpoint_fn = f'{tmpdir}/obs.json'
+    results = duet.run(
+        cw.measure_grouped_settings_async,
+        circuit=cirq.Circuit(cirq.X(qubits[0])),
+        grouped_settings=grouped_settings,
+        sampler=sampler,
+        stopping_criteria=cw.RepetitionsStoppingCriteria(1_000, repetitions_per_chunk=400),
+        readout_symmetrization=True,
+        checkpoint=CheckpointFileOptions(checkpoint=True, checkpoint_fn=checkpoint_fn),
+        concurrency=concurrency,
+    )
+    assert sampler.max_in_flight == concurrency
+    assert sampler.num_sweeps == 4 * 3
+    assert [result.meas_spec.max_setting for result in results] == list(grouped_settings)
+    assert [result.n_repetitions for result in results] == [1_000] * 4
+    assert results[0].means() == [-1]
+    np.testing.assert_allclose([r.means()[0] for r in results[1:]], 0, atol=0.15)
+    assert cirq.read_json(checkpoint_fn) == results
+
+
+def test_measure_grouped_settings_async_validation() -> None:
+    grouped_settings, qubits = _get_some_grouped_settings()
+    with pytest.raises(ValueError, match='concurrency'):
+        duet.run(
+            cw.measure_grouped_settings_async,
+            circuit=cirq.Circuit(cirq.I.on_each(*qubits)),
+            grouped_settings=grouped_settings,
+            sampler=cirq.Simulator(),
+            stopping_criteria=cw.RepetitionsStoppingCriteria(1_000),
+            concurrency=0,
+        )
+
+
+def test_measure_grouped_settings_async_sampler_error() -> None:
+    class FailingSampler(cirq.Sampler):
+        async def run_sweep_async(self, program, params, repetitions=1):
+            raise RuntimeError('sampler is down')
+
+    grouped_settings, qubits = _get_some_grouped_settings()
+    with pytest.raises(RuntimeError, match='sampler is down'):
+        duet.run(
+            cw.measure_grouped_settings_async,
+            circuit=cirq.Circuit(cirq.I.on_each(*qubits)),
+            grouped_settings=grouped_settings,
+            sampler=FailingSampler(),
+            stopping_criteria=cw.RepetitionsStoppingCriteria(1_000),
+        )
+
+
 def _get_some_grouped_settings():
     qubits = cirq.LineQubit.range(2)
     q0, q1 = qubits
@@ -534,7 +610,8 @@ def _each_in_its_own_group_grouper(
 
 
 @pytest.mark.parametrize(
-    'grouper', ['greedy', group_settings_greedy, _each_in_its_own_group_grouper]
+    'grouper',
+    ['greedy', 'largest_first', 'DSATUR', group_settings_greedy, _each_in_its_own_group_grouper],
 )
 def test_measure_observable_grouper(grouper) -> None:
     circuit = cirq.Circuit(cirq.X(Q) ** 0.2)
@@ -551,6 +628,25 @@ def test_measure_observable_grouper(grouper) -> None:
     np.testing.assert_allclose(1, results[1].mean, atol=1e-9)
 
 
+def test_measure_observables_streaming() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q1) ** 0.2)
+    observables = [cirq.Z(q0) * cirq.Z(q1), cirq.X(q0) * cirq.X(q1), cirq.Z(q0)]
+    kwargs: dict[str, Any] = dict(
+        circuit=circuit,
+        observables=observables,
+        stopping_criteria=cw.VarianceStoppingCriteria(1e-4, repetitions_per_chunk=2_000),
+        readout_symmetrization=True,
+    )
+    stored = measure_observables(sampler=cirq.Simulator(seed=52), **kwargs)
+    streaming = measure_observables(sampler=cirq.Simulator(seed=52), streaming=True, **kwargs)
+    assert [r.repetitions for r in streaming] == [r.repetitions for r in stored]
+    for a, b in zip(streaming, stored):
+        assert a.setting == b.setting
+        assert a.mean == pytest.approx(b.mean)
+        assert a.variance == pytest.approx(b.variance)
+
+
 def test_measure_observable_bad_grouper() -> None:
     circuit = cirq.Circuit(cirq.X(Q) ** 0.2)
     observables = [cirq.Z(Q), cirq.Z(cirq.NamedQubit('q2'))]
@@ -0,0 +1,205 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A sampler that spreads independent runs over an executor."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import duet
+import numpy as np
+
+from cirq import study, work
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    import cirq
+
+
+class ParallelSampler(work.Sampler):
+    """Runs the sweep points and batch entries of another sampler concurrently.
+
+    Every parameter resolver of every circuit passed to `run_sweep` or
+    `run_batch` is an independent task, submitted to the given
+    `concurrent.futures.Executor`. Results are reassembled in the order in which
+    the wrapped sampler would have returned them.
+
+    If the wrapped sampler draws randomness from a `_prng` attribute, as the
+    built-in simulators do, each task runs on a copy of the sampler with its own
+    generator, seeded from that one. `np.random.RandomState` and
+    `np.random.Generator` are supported. Results are therefore reproducible for
+    a seeded sampler regardless of the executor used or its number of workers,
+    although they differ from the results of running the wrapped sampler
+    serially.
+
+    When a `concurrent.futures.ProcessPoolExecutor` is used, the wrapped sampler
+    and the circuits must be picklable.
+    """
+
+    def __init__(self, sampler: cirq.Sampler, executor: concurrent.futures.Executor):
+        """Inits ParallelSampler.
+
+        Args:
+            sampler: The sampler used to run each task.
+            executor: The executor to which tasks are submitted. It is not shut
+                down by this sampler.
+        """
+        self._sampler = sampler
+        self._executor = executor
+
+    @property
+    def sampler(self) -> cirq.Sampler:
+        return self._sampler
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        return self._executor
+
+    def run_sweep(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
+    ) -> Sequence[cirq.Result]:
+        """Samples from the given Circuit, running sweep points concurrently.
+
+        Args:
+            program: The circuit to sample from.
+            params: Parameters to run with the program.
+            repetitions: The number of times to sample.
+
+        Returns:
+            Result list for this run; one for each possible parameter resolver.
+        """
+        return self.run_batch([program], [params], repetitions)[0]
+
+    def run_batch(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None = None,
+        repetitions: int | Sequence[int] = 1,
+    ) -> Sequence[Sequence[cirq.Result]]:
+        """Runs the supplied circuits, running all of their sweep points concurrently.
+
+        See `cirq.Sampler.run_batch` for the meaning of the arguments.
+
+        Returns:
+            A list of lists of TrialResults. The outer list corresponds to
+            the circuits, while each inner list contains the TrialResults
+            for the corresponding circuit, in the order imposed by the
+            associated parameter sweep.
+
+        Raises:
+            ValueError: If length of `programs` is not equal to the length
+                of `params_list` or the length of `repetitions`.
+            TypeError: If the `_prng` of the wrapped sampler is of an
+                unsupported type.
+        """
+        futures, resolver_lists = self._submit_batch(programs, params_list, repetitions)
+        results = iter([future.result() for future in futures])
+        return [[next(results) for _ in resolvers] for resolvers in resolver_lists]
+
+    async def run_sweep_async(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
+    ) -> Sequence[cirq.Result]:
+        """Asynchronously samples from the given Circuit, running sweep points concurrently.
+
+        Args:
+            program: The circuit to sample from.
+            params: Parameters to run with the program.
+            repetitions: The number of times to sample.
+
+        Returns:
+            Result list for this run; one for each possible parameter resolver.
+        """
+        return (await self.run_batch_async([program], [params], repetitions))[0]
+
+    async def run_batch_async(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None = None,
+        repetitions: int | Sequence[int] = 1,
+    ) -> Sequence[Sequence[cirq.Result]]:
+        """Runs the supplied circuits asynchronously, with all sweep points run concurrently.
+
+        See `run_batch` for the meaning of the arguments and the return value.
+        """
+        futures, resolver_lists = self._submit_batch(programs, params_list, repetitions)
+        results = iter([await duet.AwaitableFuture.wrap(future) for future in futures])
+        return [[next(results) for _ in resolvers] for resolvers in resolver_lists]
+
+    def _submit_batch(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None,
+        repetitions: int | Sequence[int],
+    ) -> tuple[list[concurrent.futures.Future], list[list[cirq.ParamResolver]]]:
+        """Submits one task per sweep point, returning their futures and the resolvers."""
+        params_list, repetitions = self._normalize_batch_args(programs, params_list, repetitions)
+        resolver_lists = [list(study.to_resolvers(params)) for params in params_list]
+        tasks = [
+            (program, resolver, reps)
+            for program, resolvers, reps in zip(programs, resolver_lists, repetitions)
+            for resolver in resolvers
+        ]
+        futures = [
+            self._executor.submit(_run_task, sampler, program, resolver, reps)
+            for sampler, (program, resolver, reps) in zip(self._task_samplers(len(tasks)), tasks)
+        ]
+        return futures, resolver_lists
+
+    def _task_samplers(self, count: int) -> list[cirq.Sampler]:
+        """Returns one sampler per task, each with its own random number generator.
+
+        Samplers without a `_prng` attribute are stateless and shared by all tasks.
+
+        Raises:
+            TypeError: If `_prng` is neither a `np.random.RandomState` nor a
+                `np.random.Generator`, since sharing it between threads is unsafe.
+        """
+        prng = getattr(self._sampler, '_prng', None)
+        if prng is None:
+            return [self._sampler] * count
+        prngs: list[np.random.RandomState] | list[np.random.Generator]
+        if isinstance(prng, np.random.RandomState) or prng is np.random:
+            # Unseeded simulators draw from the global `np.random` generator.
+            prngs = [
+                np.random.RandomState(seed)
+                for seed in prng.randint(2**32, size=count, dtype=np.int64)
+            ]
+        elif isinstance(prng, np.random.Generator):
+            prngs = prng.spawn(count)
+        else:
+            raise TypeError(
+                f'Cannot give each task its own random number generator of type {type(prng)}.'
+            )
+        samplers = []
+        for task_prng in prngs:
+            sampler = copy.copy(self._sampler)
+            setattr(sampler, '_prng', task_prng)
+            samplers.append(sampler)
+        return samplers
+
+    def __repr__(self) -> str:
+        return f'cirq.ParallelSampler({self._sampler!r}, {self._executor!r})'
+
+
+def _run_task(
+    sampler: cirq.Sampler,
+    program: cirq.AbstractCircuit,
+    resolver: cirq.ParamResolver,
+    repetitions: int,
+) -> cirq.Result:
+    return sampler.run_sweep(program, resolver, repetitions)[0]
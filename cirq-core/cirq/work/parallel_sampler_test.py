@@ -0,0 +1,177 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+
+import duet
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def _parameterized_circuit() -> cirq.Circuit:
+    q0, q1 = cirq.LineQubit.range(2)
+    return cirq.Circuit(
+        cirq.X(q0) ** sympy.Symbol('t'), cirq.H(q1), cirq.measure(q0, key='a'), cirq.measure(q1)
+    )
+
+
+def test_run_sweep_preserves_order() -> None:
+    circuit = _parameterized_circuit()
+    params = cirq.Points('t', [0, 1, 0, 1, 1])
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        sampler = cirq.ParallelSampler(cirq.Simulator(), executor)
+        results = sampler.run_sweep(circuit, params, repetitions=10)
+    assert [r.params for r in results] == list(cirq.to_resolvers(params))
+    for result, t in zip(results, [0, 1, 0, 1, 1]):
+        np.testing.assert_equal(result.measurements['a'], np.full((10, 1), t))
+
+
+@pytest.mark.parametrize(
+    'simulator_type', [cirq.Simulator, cirq.DensityMatrixSimulator, cirq.StabilizerSampler]
+)
+def test_seeded_results_do_not_depend_on_workers(simulator_type) -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+    params: list[dict] = [{}] * 8
+
+    def run(max_workers: int) -> list[cirq.Result]:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sampler = cirq.ParallelSampler(simulator_type(seed=1234), executor)
+            return list(sampler.run_sweep(circuit, params, repetitions=20))
+
+    serial, parallel = run(1), run(4)
+    assert serial == parallel
+    # Tasks are seeded independently rather than sharing one seed.
+    assert len({r.measurements['m'].tobytes() for r in serial}) > 1
+
+
+def test_run_batch() -> None:
+    circuit = _parameterized_circuit()
+    single = cirq.Circuit(
+        cirq.X(cirq.LineQubit(0)) ** sympy.Symbol('t'), cirq.measure(cirq.LineQubit(0), key='a')
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        sampler = cirq.ParallelSampler(cirq.Simulator(seed=1), executor)
+        results = sampler.run_batch(
+            [circuit, single, circuit],
+            [cirq.Points('t', [0, 1]), {'t': 1}, cirq.Points('t', [1, 0, 1])],
+            repetitions=[3, 4, 5],
+        )
+        async_results = duet.run(sampler.run_batch_async, [circuit], [{'t': 1}], 2)
+    assert [len(r) for r in results] == [2, 1, 3]
+    assert [r.repetitions for rs in results for r in rs] == [3, 3, 4, 5, 5, 5]
+    assert [r.params['t'] for rs in results for r in rs] == [0, 1, 1, 1, 0, 1]
+    np.testing.assert_equal(results[1][0].measurements['a'], np.ones((4, 1)))
+    assert async_results[0][0].repetitions == 2
+
+    with pytest.raises(ValueError, match='params_list'):
+        sampler.run_batch([circuit], [{'t': 0}, {'t': 1}])
+
+
+def test_sampler_without_prng_is_shared() -> None:
+    zeros = cirq.ZerosSampler()
+    circuit = _parameterized_circuit()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(zeros, executor)
+        assert sampler.sampler is zeros
+        assert sampler.executor is executor
+        assert sampler._task_samplers(3) == [zeros] * 3
+        results = sampler.run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=2)
+    assert all(np.all(r.measurements['a'] == 0) for r in results)
+
+
+def test_generator_prng_is_spawned() -> None:
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+    simulator = cirq.Simulator()
+    simulator._prng = np.random.default_rng(5)  # type: ignore[assignment]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(simulator, executor)
+        task_samplers = sampler._task_samplers(3)
+    prngs = [getattr(s, '_prng') for s in task_samplers]
+    assert all(isinstance(prng, np.random.Generator) for prng in prngs)
+    assert len({id(prng) for prng in prngs} | {id(simulator._prng)}) == 4
+    assert len({prng.integers(2**62) for prng in prngs}) == 3
+    assert task_samplers[0].run(circuit, repetitions=5).repetitions == 5
+
+
+def test_unsupported_prng_raises() -> None:
+    simulator = cirq.Simulator()
+    simulator._prng = object()  # type: ignore[assignment]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(simulator, executor)
+        with pytest.raises(TypeError, match='random number generator'):
+            sampler.run(_parameterized_circuit(), {'t': 0})
+
+
+class _BlockingSampler(cirq.ZerosSampler):
+    def __init__(self, event: threading.Event) -> None:
+        super().__init__()
+        self.event = event
+
+    def run_sweep(self, program, params, repetitions=1):
+        assert self.event.wait(timeout=10)
+        return super().run_sweep(program, params, repetitions)
+
+
+def test_run_batch_async_does_not_block() -> None:
+    event = threading.Event()
+    circuit = _parameterized_circuit()
+
+    results: list[cirq.Result] = []
+
+    async def run(sampler):
+        results.extend(await sampler.run_sweep_async(circuit, cirq.Points('t', [0, 1]), 3))
+
+    async def release():
+        event.set()
+
+    async def run_and_release(sampler):
+        # If running the sweep blocked, the event would never be set.
+        async with duet.new_scope() as scope:
+            scope.spawn(run, sampler)
+            scope.spawn(release)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(_BlockingSampler(event), executor)
+        duet.run(run_and_release, sampler)
+    assert [r.repetitions for r in results] == [3, 3]
+
+
+def test_errors_propagate() -> None:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(cirq.Simulator(), executor)
+        with pytest.raises(ValueError, match='no measurements'):
+            sampler.run(cirq.Circuit(cirq.X(cirq.LineQubit(0))))
+
+
+def test_process_pool() -> None:
+    circuit = _parameterized_circuit()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(cirq.Simulator(seed=3), executor)
+        results = sampler.run_sweep(circuit, cirq.Points('t', [1, 0]), repetitions=5)
+    np.testing.assert_equal(results[0].measurements['a'], np.ones((5, 1)))
+    np.testing.assert_equal(results[1].measurements['a'], np.zeros((5, 1)))
+
+
+def test_repr() -> None:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        sampler = cirq.ParallelSampler(cirq.ZerosSampler(), executor)
+        assert repr(sampler).startswith('cirq.ParallelSampler(')